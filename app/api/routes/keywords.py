@@ -1,9 +1,16 @@
 from typing import Annotated
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from app.api.deps import get_token
-from app.models.keyword import KeywordExtractRequest, KeywordExtractResponse
-from app.services.extract_paper_concept_service import extract_keywords
+from app.models.keyword import (
+    KeywordExtractRequest,
+    KeywordExtractResponse,
+    KeywordBatchExtractRequest
+)
+from app.services import extract_paper_concept_service
+from app.services.extract_paper_concept_service import extract_keywords, extract_keywords_batch
 from app.core.exceptions import (
+    BatchTooLargeException,
     MissingSourceDataException,
     InvalidFormatException,
     InternalServerErrorException
@@ -39,3 +46,30 @@ async def extract_keywords_endpoint(
         raise
     except Exception as e:
         raise InternalServerErrorException(f"서버 오류가 발생했습니다: {str(e)}")
+
+
+@router.post("/extract/batch")
+async def extract_keywords_batch_endpoint(
+    request: KeywordBatchExtractRequest,
+    _token: Annotated[str, Depends(get_token)]
+):
+    """
+    API-CURR-KWORD-02: 배치 키워드 추출 엔드포인트
+
+    여러 논문을 한 번에 받아 키 슬롯별로 제한된 동시성으로 키워드를 추출합니다.
+    응답은 NDJSON 스트림이며, 논문별 결과가 완료되는 순서대로 전송되고
+    마지막 줄에 전체 처리량(summary)이 전송됩니다.
+    - papers: /extract 요청 스키마의 리스트 (최대 KEYWORD_BATCH_MAX_PAPERS개, 넘으면 413)
+    - max_concurrency_per_slot: 키 슬롯당 동시 실행 수 (기본 2)
+    """
+    if not request.papers:
+        raise MissingSourceDataException("papers is empty")
+    max_papers = extract_paper_concept_service.KEYWORD_BATCH_MAX_PAPERS
+    if len(request.papers) > max_papers:
+        raise BatchTooLargeException(f"papers는 최대 {max_papers}개까지 요청할 수 있습니다. (요청: {len(request.papers)}개)")
+
+    async def stream_results():
+        async for item in extract_keywords_batch(request):
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
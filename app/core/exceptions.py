@@ -28,6 +28,16 @@ class InvalidFormatException(APIException):
         )
 
 
+class BatchTooLargeException(APIException):
+    """배치 요청 크기 초과 예외"""
+    def __init__(self, message: str = "한 번에 처리할 수 있는 개수를 초과했습니다."):
+        super().__init__(
+            error_code="BATCH_TOO_LARGE",
+            message=message,
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE
+        )
+
+
 class MissingTraitsException(APIException):
     """사용자 특성 정보 누락 예외"""
     def __init__(self, message: str = "user_traits의 필수항목들을 입력해야 합니다."):
@@ -1,13 +1,25 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from app.core.exceptions import APIException
 from app.api.main import api_router
+from app.services.backend_client import backend_client
+from core.utils.circuit_breaker import circuit_breakers
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 종료 시 남은 백엔드 전송을 보내고 공용 세션 정리
+    await backend_client.close()
 
 
 app = FastAPI(
     title="PTMT-Agent API",
     description="Paper-based Teaching Material Agent API",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
 )
 
 # API 라우터 등록
@@ -30,4 +42,5 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    # 외부 API가 죽어 있어도 이 서버는 동작하므로 status는 유지하고 breaker 상태만 노출
+    return {"status": "healthy", "circuit_breakers": circuit_breakers.snapshot()}
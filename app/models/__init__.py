@@ -1,6 +1,12 @@
 # Re-export all models for backward compatibility
 from app.models.base import ErrorResponse
-from app.models.keyword import KeywordExtractRequest, KeywordExtractResponse
+from app.models.keyword import (
+    KeywordExtractRequest,
+    KeywordExtractResponse,
+    KeywordBatchExtractRequest,
+    KeywordBatchItemResult,
+    KeywordBatchSummary
+)
 from app.models.curriculum import (
     UserTraits,
     CurriculumGenerateRequest,
@@ -12,6 +18,9 @@ __all__ = [
     "ErrorResponse",
     "KeywordExtractRequest",
     "KeywordExtractResponse",
+    "KeywordBatchExtractRequest",
+    "KeywordBatchItemResult",
+    "KeywordBatchSummary",
     "UserTraits",
     "CurriculumGenerateRequest",
     "CurriculumGenerateResponse",
@@ -27,6 +27,15 @@ class PaperContent(BaseModel):
     abstract: str
     body: List[PaperContentPart]
 
+class GenerationBudget(BaseModel):
+    """요청 단위 생성 예산 (비어 있는 항목은 서버 환경 변수 기본값 사용)"""
+    max_wall_time_sec: Optional[float] = Field(None, gt=0)
+    max_llm_calls: Optional[int] = Field(None, gt=0)
+    max_tokens: Optional[int] = Field(None, gt=0)
+    max_search_calls: Optional[int] = Field(None, gt=0)
+    max_iterations: Optional[int] = Field(None, gt=0)
+
+
 class CurriculumGenerateRequest(BaseModel):
     curriculum_id: str
     paper_id: str
@@ -35,6 +44,8 @@ class CurriculumGenerateRequest(BaseModel):
     paper_content: PaperContent
     user_traits: UserTraits = Field(alias="user_info")
     assigned_key_slot: Optional[int] = None
+    debug_artifacts: Optional[bool] = False # True면 DEBUG_ARTIFACT_DIR/<curriculum_id>/ 에 중간 결과 저장
+    generation_budget: Optional[GenerationBudget] = None # 없으면 BUDGET_* 환경 변수 기본값
     paper_title: Optional[str] = None # Deprecated, keep for compatibility or remove
     keywords: Optional[List[str]] = None # Deprecated
 
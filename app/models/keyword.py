@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Literal
 from pydantic import BaseModel, Field
 from app.models.curriculum import PaperContent
 
@@ -16,3 +16,31 @@ class KeywordExtractResponse(BaseModel):
     summary: Optional[str] = None
     extracted_at: str
     extracted_by: str
+
+
+# Batch Keywords API Models
+class KeywordBatchExtractRequest(BaseModel):
+    papers: List[KeywordExtractRequest]
+    max_concurrency_per_slot: int = Field(2, ge=1, le=10)
+
+
+class KeywordBatchItemResult(BaseModel):
+    event: Literal["result"] = "result"
+    index: int
+    paper_id: str
+    assigned_key_slot: Optional[int] = None
+    status: Literal["success", "failed"]
+    result: Optional[KeywordExtractResponse] = None
+    error: Optional[str] = None
+    elapsed_sec: float
+
+
+class KeywordBatchSummary(BaseModel):
+    event: Literal["summary"] = "summary"
+    total: int
+    succeeded: int
+    failed: int
+    elapsed_sec: float
+    papers_per_sec: float
+    max_concurrency_per_slot: int
+    slots_used: List[int]
@@ -0,0 +1,286 @@
+# app/services/backend_client.py
+"""
+메인 백엔드 클라이언트 (프로세스 공용)
+
+기존에는 커리큘럼 하나가 끝날 때마다(실패 시에도) 새 aiohttp.ClientSession + 로그인 요청 +
+또 다른 세션으로 결과 POST를 했다.
+- ClientSession 하나를 계속 사용 (keep-alive, 연결 수는 BACKEND_MAX_CONNECTIONS로 제한)
+- access token 캐시: JWT exp(없으면 expires_in, 그것도 없으면 BACKEND_TOKEN_TTL_SEC) 기준으로
+  만료 BACKEND_TOKEN_REFRESH_MARGIN_SEC 전에 다시 로그인, 동시에 만료되면 로그인은 한 번만
+- 401이면 토큰을 버리고 한 번 다시 로그인 후 재요청
+- 실패 시 backoff(+jitter) 후 BACKEND_MAX_RETRIES번까지 재시도
+  로그인은 5xx/연결 실패/timeout 모두 재시도, import처럼 멱등이 아닌 POST는 연결 자체가 안 된 경우만
+  (timeout/5xx는 서버가 이미 저장했을 수 있어 다시 보내면 커리큘럼이 중복 저장됨)
+- 매 시도는 main_backend circuit breaker를 거침 (open이면 요청 없이 CircuitOpenError)
+- submit(): 여러 job이 비슷한 때 끝나면 BACKEND_BATCH_WINDOW_SEC 동안 모아 한 번에 flush
+  (import API가 커리큘럼 단위라 요청 본문은 합치지 않고, 토큰 확인 1번 + 같은 세션으로 동시 전송)
+- 앱 종료 시 close()로 남은 전송을 flush하고 세션 정리
+"""
+
+import asyncio
+import base64
+import json
+import os
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+from dotenv import load_dotenv
+
+from core.utils.circuit_breaker import BREAKER_MAIN_BACKEND, CircuitOpenError, get_circuit_breaker
+from core.utils.serialization import dumps as json_dumps
+
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+LOGIN_PATH = "/api/auth/login"
+
+BACKEND_MAX_RETRIES = _env_int("BACKEND_MAX_RETRIES", 3)
+BACKEND_RETRY_BACKOFF_SEC = _env_float("BACKEND_RETRY_BACKOFF_SEC", 0.5)
+BACKEND_REQUEST_TIMEOUT_SEC = _env_float("BACKEND_REQUEST_TIMEOUT_SEC", 30.0)
+BACKEND_MAX_CONNECTIONS = _env_int("BACKEND_MAX_CONNECTIONS", 8)
+# 토큰에 만료 정보가 없을 때 사용할 유효 시간, 만료 몇 초 전에 갱신할지
+BACKEND_TOKEN_TTL_SEC = _env_float("BACKEND_TOKEN_TTL_SEC", 600.0)
+BACKEND_TOKEN_REFRESH_MARGIN_SEC = _env_float("BACKEND_TOKEN_REFRESH_MARGIN_SEC", 30.0)
+BACKEND_BATCH_WINDOW_SEC = _env_float("BACKEND_BATCH_WINDOW_SEC", 0.05)
+MAX_BACKOFF_SEC = 10.0
+
+
+def _jwt_exp(token: str) -> Optional[float]:
+    """JWT payload의 exp(epoch 초), JWT가 아니거나 exp가 없으면 None"""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        return float(exp) if exp is not None else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+
+class BackendClient:
+    def __init__(
+        self,
+        base_url: Optional[str],
+        email: str = "",
+        password: str = "",
+        max_retries: int = BACKEND_MAX_RETRIES,
+        backoff_sec: float = BACKEND_RETRY_BACKOFF_SEC,
+        batch_window_sec: float = BACKEND_BATCH_WINDOW_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.base_url = (base_url or "").rstrip("/")
+        self.email = email
+        self.password = password
+        self.max_retries = max_retries
+        self.backoff_sec = backoff_sec
+        self.batch_window_sec = batch_window_sec
+        self._clock = clock
+        self.breaker = get_circuit_breaker(BREAKER_MAIN_BACKEND)
+
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+
+        # 이벤트 루프에 묶이는 상태 (루프가 바뀌면 새로 만듦)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._login_lock: Optional[asyncio.Lock] = None
+        self._pending: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.logins = 0
+        self.token_hits = 0
+        self.requests = 0
+        self.retries = 0
+        self.batches = 0
+        self.max_batch_size = 0
+
+    @classmethod
+    def from_env(cls) -> "BackendClient":
+        return cls(
+            base_url=os.getenv("MAIN_BACKEND_SERVER_PATH"),
+            email=os.getenv("MAIN_BACKEND_SERVER_EMAIL", ""),
+            password=os.getenv("MAIN_BACKEND_SERVER_PASSWORD", ""),
+        )
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.base_url)
+
+    # ---- 세션/루프 ----
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._session = None
+        self._login_lock = asyncio.Lock()
+        self._pending = []
+        self._flush_task = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        self._bind_loop()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=BACKEND_MAX_CONNECTIONS),
+                timeout=aiohttp.ClientTimeout(total=BACKEND_REQUEST_TIMEOUT_SEC),
+                json_serialize=json_dumps,
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """남은 submit을 보내고 세션 종료 (앱 종료 시)"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        if self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    # ---- 토큰 ----
+    def _token_valid(self) -> bool:
+        return self._token is not None and self._clock() < self._token_expires_at
+
+    async def _get_token(self, stale: Optional[str] = None) -> Optional[str]:
+        """
+        캐시된 토큰 (없거나 만료 임박이면 로그인)
+        - stale: 401을 받은 토큰, 아직 그 토큰이면 버리고 다시 로그인 (다른 요청이 이미 갱신했으면 그대로 사용)
+        """
+        if stale is None and self._token_valid():
+            self.token_hits += 1
+            return self._token
+        self._bind_loop()
+        async with self._login_lock:
+            if stale is not None and self._token == stale:
+                self._token = None
+            if self._token_valid():
+                self.token_hits += 1
+                return self._token
+            return await self._login()
+
+    async def _login(self) -> Optional[str]:
+        self.logins += 1
+        status, text = await self._request(
+            LOGIN_PATH, {"email": self.email, "password": self.password}, token=None, idempotent=True
+        )
+        if status != 200:
+            print(f"❌ 로그인 실패: {status}, {text}")
+            return None
+
+        data = json.loads(text).get("data", {})
+        token = data["access_token"]
+        exp = _jwt_exp(token)
+        if exp is not None:
+            ttl = exp - time.time()
+        else:
+            ttl = float(data.get("expires_in") or BACKEND_TOKEN_TTL_SEC)
+        self._token = token
+        self._token_expires_at = self._clock() + max(ttl - BACKEND_TOKEN_REFRESH_MARGIN_SEC, 0.0)
+        return token
+
+    # ---- 요청 ----
+    async def _request(
+        self, path: str, payload: Dict[str, Any], token: Optional[str], idempotent: bool = False
+    ) -> Tuple[int, str]:
+        """
+        POST 한 건 (backoff 후 재시도, 마지막 응답/예외를 그대로 반환)
+        - idempotent: 5xx/timeout도 재시도, False면 요청이 서버에 닿지 않은 연결 실패만 재시도
+        """
+        session = self._get_session()
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                raise CircuitOpenError(BREAKER_MAIN_BACKEND, self.breaker.retry_in())
+            self.requests += 1
+            try:
+                async with session.post(f"{self.base_url}{path}", json=payload, headers=headers) as resp:
+                    status, text = resp.status, await resp.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.breaker.record_failure()
+                retryable = idempotent or isinstance(e, aiohttp.ClientConnectorError)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                status, text = None, str(e)
+            else:
+                self.breaker.record_status(status)
+                if status < 500 or not idempotent or attempt >= self.max_retries:
+                    return status, text
+
+            self.retries += 1
+            wait_s = min(self.backoff_sec * 2 ** attempt, MAX_BACKOFF_SEC) + random.random() * self.backoff_sec
+            print(f"[Backend] {path} {status or text}, retry in {wait_s:.1f}s ({attempt + 1}/{self.max_retries})")
+            await asyncio.sleep(wait_s)
+            attempt += 1
+
+    async def post(self, path: str, payload: Dict[str, Any]) -> Tuple[int, str]:
+        """인증이 필요한 POST -> (status, body), 401이면 한 번 다시 로그인 후 재요청"""
+        token = await self._get_token()
+        status, text = await self._request(path, payload, token)
+        if status == 401:
+            token = await self._get_token(stale=token)
+            status, text = await self._request(path, payload, token)
+        return status, text
+
+    # ---- batch ----
+    async def submit(self, path: str, payload: Dict[str, Any]) -> Tuple[int, str]:
+        """post()와 같지만 batch_window 동안 들어온 전송과 묶어서 flush"""
+        self._bind_loop()
+        future = self._loop.create_future()
+        self._pending.append((path, payload, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._loop.create_task(self._flush_later())
+        return await future
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.batch_window_sec)
+        while self._pending:
+            batch, self._pending = self._pending, []
+            self.batches += 1
+            self.max_batch_size = max(self.max_batch_size, len(batch))
+            # 토큰은 batch당 한 번만 확인하고, 전송은 같은 세션으로 동시에
+            try:
+                await self._get_token()
+            except Exception:
+                pass  # 개별 post()에서 다시 시도하고 에러를 각 future로 전달
+            results = await asyncio.gather(
+                *(self.post(path, payload) for path, payload, _ in batch), return_exceptions=True
+            )
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "logins": self.logins,
+            "token_hits": self.token_hits,
+            "requests": self.requests,
+            "retries": self.retries,
+            "batches": self.batches,
+            "max_batch_size": self.max_batch_size,
+        }
+
+
+backend_client = BackendClient.from_env()
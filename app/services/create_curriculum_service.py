@@ -1,9 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Optional
-import os
-import aiohttp
 import asyncio
-import json
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,18 +9,33 @@ from app.models.curriculum import (
     CurriculumGenerateResponse
 )
 from app.models.graph import Graph, GraphNode, GraphEdge
+from app.services.backend_client import backend_client
 import uuid
 
 # Core Imports
+from core.agents.agent_pool import agent_pool
 from core.agents.keyword_graph_agent import KeywordGraphAgent
+from core.llm.model_router import routing_metrics
 from core.llm.solar_pro_2_llm import (
     bind_assigned_key_slot,
     get_solar_model,
     reset_assigned_key_slot,
 )
+from core.tools.web_search_failover import web_search_failover
+from core.utils.budget import RequestBudget, bind_request_budget, reset_request_budget
+from core.utils.structured_output import parse_metrics
+from core.utils.debug_artifacts import (
+    bind_debug_artifacts,
+    reset_debug_artifacts,
+    save_debug_artifact,
+)
 from core.graphs.parallel.graph_parallel import create_initial_state, run_langgraph_workflow
+from core.graphs.parallel.speculation import bind_speculation_scope, reset_speculation_scope
 from core.contracts.keywordgraph import KeywordGraphInput
 
+IMPORT_PATH = "/api/curriculums/import"
+IMPORT_FAILED_PATH = "/api/curriculums/import_failed"
+
 async def generate_curriculum(request: CurriculumGenerateRequest) -> CurriculumGenerateResponse:
     """
     커리큘럼 생성 서비스 (스텁)
@@ -54,6 +65,16 @@ async def _generate_curriculum_graph(
     3. 결과 JSON을 메인 백엔드 서버로 POST 전송
     """
     slot_token = bind_assigned_key_slot(assigned_key_slot)
+    # debug_artifacts 요청일 때만 curriculum_id 단위로 중간 결과 저장
+    debug_token = bind_debug_artifacts(
+        request.curriculum_id if request.debug_artifacts else None
+    )
+    # 요청 단위 지연시간/비용 예산 (그래프 안의 라우터, 타임아웃, 검색이 공유)
+    budget_overrides = request.generation_budget.model_dump() if request.generation_budget else {}
+    budget = RequestBudget.from_env(**budget_overrides)
+    budget_token = bind_request_budget(budget)
+    # 워크플로우가 compose 전에 실패/취소되면 남은 추측 확장 작업을 여기서 취소
+    speculation_token = bind_speculation_scope()
     try:
         try:
             author_data = request.paper_content.author
@@ -128,20 +149,36 @@ async def _generate_curriculum_graph(
 
             # 워크플로우 실행
             final_state = await app_workflow.ainvoke(initial_state)
+            print(f"📊 LLM 응답 파싱 지표 (프로세스 누적)\n{parse_metrics.summary()}")
+            print(
+                f"📊 orchestrator 라운드: {final_state.get('current_iteration_count', 0)}, "
+                f"수렴 조기 종료: {final_state.get('converged', False)}, "
+                f"절약한 라운드: {final_state.get('rounds_saved', 0)}"
+            )
+            if final_state.get("resource_check_stats"):
+                print(f"📊 리소스 충분성 판단: {final_state['resource_check_stats']}")
+            if final_state.get("speculation"):
+                print(f"📊 추측 확장: {final_state['speculation']}")
+            if final_state.get("scheduler_stats"):
+                print(f"📊 dataflow 스케줄러: {final_state['scheduler_stats']}")
+            print(f"📊 요청 예산 사용량: {budget.snapshot()}")
+            print(f"📊 agent 풀 (워커 누적): {agent_pool.stats()}")
+            print(f"📊 모델 라우팅 (프로세스 누적): {routing_metrics.snapshot()}")
+            print(f"📊 웹 검색 provider (프로세스 누적): {web_search_failover.snapshot()}")
             final_curriculum = final_state.get("final_curriculum")
 
             if not final_curriculum:
                 print("❌ 커리큘럼 생성 실패 (LangGraph)")
                 return
 
-            # 3. 메인 백엔드로 전송
-            backend_url = os.getenv("MAIN_BACKEND_SERVER_PATH")
-            if not backend_url:
+            await save_debug_artifact("final_curriculum", final_curriculum)
+
+            # 3. 메인 백엔드로 전송 (공용 세션/토큰, 동시에 끝난 job과 묶어서 전송)
+            if not backend_client.configured:
                 print("⚠️ MAIN_BACKEND_SERVER_PATH not set")
                 return
 
-            target_url = f"{backend_url}/api/curriculums/import"
-            print(f"🚀 Sending results to {target_url}...")
+            print(f"🚀 Sending results to {backend_client.base_url}{IMPORT_PATH}...")
 
             # Payload 구성
             # 422 Error Fix: Title must be a string (not None). Ensure fallback.
@@ -154,74 +191,38 @@ async def _generate_curriculum_graph(
                 "created_at": datetime.now(timezone.utc).isoformat()
             }
 
-            token = await _login_to_backend(backend_url)
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(target_url, json=payload, headers=headers) as resp:
-                    if resp.status == 201:
-                        print(f"✅ 커리큘럼 전송 성공 (slot={assigned_key_slot})")
-                    else:
-                        error_text = await resp.text()
-                        print(
-                            f"❌ 전송 실패 (slot={assigned_key_slot}): "
-                            f"{resp.status}, {error_text}"
-                        )
-                        raise RuntimeError(
-                            f"curriculum import failed with status={resp.status}: {error_text}"
-                        )
+            status, error_text = await backend_client.submit(IMPORT_PATH, payload)
+            if status == 201:
+                print(f"✅ 커리큘럼 전송 성공 (slot={assigned_key_slot})")
+            else:
+                print(
+                    f"❌ 전송 실패 (slot={assigned_key_slot}): "
+                    f"{status}, {error_text}"
+                )
+                raise RuntimeError(
+                    f"curriculum import failed with status={status}: {error_text}"
+                )
 
         except Exception as e:
-            backend_url = os.getenv("MAIN_BACKEND_SERVER_PATH")
-            if not backend_url:
+            if not backend_client.configured:
                 print("⚠️ MAIN_BACKEND_SERVER_PATH not set")
                 return
 
-            target_url = f"{backend_url}/api/curriculums/import_failed"
-            token = await _login_to_backend(backend_url=backend_url)
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-
             payload = {
                 "curriculum_id": request.curriculum_id,
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(target_url, json=payload, headers=headers) as resp:
-                    if resp.status in {200, 201}:
-                        print(f"커리큘럼 실패 전송 성공 (slot={assigned_key_slot})")
-                    else:
-                        print(
-                            f"커리큘럼 실패 전송 실패 (slot={assigned_key_slot}): "
-                            f"{resp.status}, {await resp.text()}"
-                        )
+            status, error_text = await backend_client.submit(IMPORT_FAILED_PATH, payload)
+            if status in {200, 201}:
+                print(f"커리큘럼 실패 전송 성공 (slot={assigned_key_slot})")
+            else:
+                print(
+                    f"커리큘럼 실패 전송 실패 (slot={assigned_key_slot}): "
+                    f"{status}, {error_text}"
+                )
             print(f"Background Task Error (slot={assigned_key_slot}): {e}")
     finally:
+        reset_speculation_scope(speculation_token)
+        reset_request_budget(budget_token)
+        reset_debug_artifacts(debug_token)
         reset_assigned_key_slot(slot_token)
-
-    
-
-    
-    
-async def _login_to_backend(backend_url: str) -> Optional[str]: 
-        email = os.getenv("MAIN_BACKEND_SERVER_EMAIL", "") 
-        password = os.getenv("MAIN_BACKEND_SERVER_PASSWORD", "") 
-
-        login_payload = {
-            "email": email,
-            "password": password
-        }
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{backend_url}/api/auth/login", json=login_payload) as resp:
-                if resp.status == 200:
-                    resp_json = await resp.json()
-                    return resp_json["data"]["access_token"]
-                else:
-                    print(f"❌ 로그인 실패: {resp.status}, {await resp.text()}")
-                    return None
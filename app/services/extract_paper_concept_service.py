@@ -1,46 +1,42 @@
-import uuid
+import asyncio
+import os
+import time
 from datetime import datetime, timezone
-from app.models.keyword import KeywordExtractRequest, KeywordExtractResponse
+from itertools import cycle
+from typing import AsyncIterator, Dict, List, Union
+
+from app.models.keyword import (
+    KeywordExtractRequest,
+    KeywordExtractResponse,
+    KeywordBatchExtractRequest,
+    KeywordBatchItemResult,
+    KeywordBatchSummary
+)
 from core.agents.concept_extraction_agent import ConceptExtractionAgent
-from core.llm.solar_pro_2_llm import get_solar_model
+from core.llm.solar_pro_2_llm import UPSTAGE_KEY_SLOTS, get_solar_model
 from dotenv import load_dotenv
 load_dotenv()
 
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# 배치 요청 한 번에 받을 수 있는 최대 논문 수 (넘으면 413)
+KEYWORD_BATCH_MAX_PAPERS = _env_int("KEYWORD_BATCH_MAX_PAPERS", 50)
+
 async def extract_keywords(request: KeywordExtractRequest) -> KeywordExtractResponse:
     """
     키워드 추출 서비스
-    
+
     ConceptExtractionAgent를 사용하여 논문의 개념(키워드)과 요약을 추출합니다.
     """
     try:
-        # 1. LLM 및 Agent 초기화
-        llm = get_solar_model(assigned_key_slot=request.assigned_key_slot)
-        agent = ConceptExtractionAgent(llm=llm)
-        
-        # 2. 입력 데이터 구성
-        # request.paper_content를 바로 활용
-        
-        paper_input = {
-            "paper_id": request.paper_id,
-            "paper_name": request.paper_content.title,
-            "paper_content": request.paper_content.model_dump()
-        }
-        
-        # 3. Agent 실행
-        # ConceptExtractionAgent.run 비동기 실행
-        result = await agent.run(paper_input)
-        
-        # analysis_id = f"ext-{uuid.uuid4().hex[:12]}" # Deprecated but might be needed for internal tracking
-        analysis_id = f"ext-{uuid.uuid4().hex[:12]}"
+        return await _run_keyword_extraction(request)
 
-        return KeywordExtractResponse(
-            paper_id=result["paper_id"],
-            keywords=result["paper_concepts"],
-            summary=result["paper_summary"],
-            extracted_at=datetime.now(timezone.utc).isoformat(),
-            extracted_by="Solar_2_pro"
-        )
-        
     except Exception as e:
         print(f"❌ Keyword Extraction Failed: {e}")
         # 실패 시 에러를 던지거나 Mock/Error Response 반환
@@ -52,3 +48,117 @@ async def extract_keywords(request: KeywordExtractRequest) -> KeywordExtractResp
             extracted_at=datetime.now(timezone.utc).isoformat(),
             extracted_by="System"
         )
+
+
+async def _run_keyword_extraction(request: KeywordExtractRequest) -> KeywordExtractResponse:
+    """키워드 추출 실행 (실패 시 예외를 그대로 전달)"""
+    # 1. LLM 및 Agent 초기화
+    llm = get_solar_model(assigned_key_slot=request.assigned_key_slot)
+    agent = ConceptExtractionAgent(llm=llm)
+
+    # 2. 입력 데이터 구성
+    # request.paper_content를 바로 활용
+
+    paper_input = {
+        "paper_id": request.paper_id,
+        "paper_name": request.paper_content.title,
+        "paper_content": request.paper_content.model_dump()
+    }
+
+    # 3. Agent 실행
+    # ConceptExtractionAgent.run 비동기 실행
+    result = await agent.run(paper_input)
+
+    return KeywordExtractResponse(
+        paper_id=result["paper_id"],
+        keywords=result["paper_concepts"],
+        summary=result["paper_summary"],
+        extracted_at=datetime.now(timezone.utc).isoformat(),
+        extracted_by="Solar_2_pro"
+    )
+
+
+def assign_key_slots(papers: List[KeywordExtractRequest]) -> List[int]:
+    """
+    논문별 키 슬롯 배정
+    - assigned_key_slot이 유효하면 그대로 사용
+    - 없으면 UPSTAGE_KEY_SLOTS를 round-robin으로 분배
+    """
+    slot_cycle = cycle(UPSTAGE_KEY_SLOTS)
+    slots = []
+    for paper in papers:
+        if paper.assigned_key_slot in UPSTAGE_KEY_SLOTS:
+            slots.append(paper.assigned_key_slot)
+        else:
+            slots.append(next(slot_cycle))
+    return slots
+
+
+async def extract_keywords_batch(
+    request: KeywordBatchExtractRequest,
+) -> AsyncIterator[Union[KeywordBatchItemResult, KeywordBatchSummary]]:
+    """
+    여러 논문의 키워드 추출을 키 슬롯별로 분산 실행
+
+    - 슬롯마다 max_concurrency_per_slot 개까지만 동시에 실행
+    - 완료되는 순서대로 논문별 결과를 yield
+    - 마지막에 전체 처리량(summary)을 yield
+    """
+    papers = request.papers
+    slots = assign_key_slots(papers)
+    slot_sems: Dict[int, asyncio.Semaphore] = {
+        slot: asyncio.Semaphore(request.max_concurrency_per_slot)
+        for slot in set(slots)
+    }
+
+    async def run_one(index: int, paper: KeywordExtractRequest, slot: int) -> KeywordBatchItemResult:
+        async with slot_sems[slot]:
+            started = time.perf_counter()
+            try:
+                result = await _run_keyword_extraction(
+                    paper.model_copy(update={"assigned_key_slot": slot})
+                )
+                status, error = "success", None
+            except Exception as e:
+                print(f"❌ [Batch] Keyword Extraction Failed (paper_id={paper.paper_id}, slot={slot}): {e}")
+                result, status, error = None, "failed", str(e)
+
+            return KeywordBatchItemResult(
+                index=index,
+                paper_id=paper.paper_id,
+                assigned_key_slot=slot,
+                status=status,
+                result=result,
+                error=error,
+                elapsed_sec=round(time.perf_counter() - started, 3),
+            )
+
+    batch_started = time.perf_counter()
+    tasks = [
+        asyncio.create_task(run_one(i, paper, slot))
+        for i, (paper, slot) in enumerate(zip(papers, slots))
+    ]
+
+    succeeded = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            item = await next_done
+            if item.status == "success":
+                succeeded += 1
+            yield item
+    finally:
+        # 클라이언트가 스트림을 끊은 경우 남은 작업 정리
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    elapsed = time.perf_counter() - batch_started
+    yield KeywordBatchSummary(
+        total=len(papers),
+        succeeded=succeeded,
+        failed=len(papers) - succeeded,
+        elapsed_sec=round(elapsed, 3),
+        papers_per_sec=round(len(papers) / elapsed, 3) if elapsed > 0 else 0.0,
+        max_concurrency_per_slot=request.max_concurrency_per_slot,
+        slots_used=sorted(slot_sems),
+    )
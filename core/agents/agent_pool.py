@@ -0,0 +1,94 @@
+# core/agents/agent_pool.py
+"""
+워커 단위 agent 인스턴스 풀
+
+노드가 실행될 때마다 ChatUpstage/프롬프트 체인/agent를 새로 만드는 대신
+(이벤트 루프, 이름, 키 슬롯)마다 한 번만 만들고 재사용한다.
+- 워커(uvicorn 프로세스)당 이벤트 루프가 하나이므로 사실상 워커 단위 캐시
+- 이벤트 루프를 키로 두는 이유: agent가 가진 asyncio.Semaphore, http 클라이언트는 루프에 묶임
+- 키 슬롯은 현재 컨텍스트(assigned_key_slot_context)에서 읽으므로 build 안의
+  get_solar_model()은 같은 슬롯 키를 사용
+- 풀에 넣는 agent는 run 사이에 요청별 상태를 인스턴스에 남기지 않아야 함
+  (KeywordGraphAgent처럼 run 중 self에 상태를 쓰는 agent는 넣지 않음)
+- 같은 슬롯의 동시 요청이 agent를 공유하므로, agent 내부 세마포어는
+  요청 단위가 아니라 (워커, 키 슬롯) 단위 동시 실행 제한이 됨
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from core.llm.solar_pro_2_llm import get_assigned_key_slot
+
+T = TypeVar("T")
+
+
+class AgentPool:
+    def __init__(self):
+        self._agents: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Hashable, Optional[int]], Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.hits = 0
+        self.build_time_sec = 0.0
+
+    def get(self, name: Hashable, build: Callable[[], T]) -> T:
+        """
+        (현재 이벤트 루프, name, 현재 키 슬롯)에 해당하는 agent 반환, 없으면 build()로 생성
+        - name: 같은 agent 클래스라도 LLM 설정이 다르면 다른 이름 사용
+        - 실행 중인 이벤트 루프가 없으면 캐시하지 않고 매번 생성
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return build()
+
+        key = (name, get_assigned_key_slot())
+        with self._lock:
+            agents = self._agents.setdefault(loop, {})
+            agent = agents.get(key)
+            if agent is not None:
+                self.hits += 1
+                return agent
+
+        started = time.perf_counter()
+        agent = build()
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            # build 중 다른 스레드가 먼저 넣었으면 그쪽을 사용
+            agent = agents.setdefault(key, agent)
+            self.builds += 1
+            self.build_time_sec += elapsed
+        return agent
+
+    def clear(self) -> None:
+        with self._lock:
+            self._agents.clear()
+
+    def __len__(self) -> int:
+        return sum(len(agents) for agents in self._agents.values())
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self),
+            "builds": self.builds,
+            "hits": self.hits,
+            "build_time_ms": round(self.build_time_sec * 1000, 2),
+            # 재사용으로 아낀 생성 시간 추정 (평균 생성 시간 x hit 수)
+            "saved_ms_est": round(self.build_time_sec / self.builds * self.hits * 1000, 2) if self.builds else 0.0,
+        }
+
+
+agent_pool = AgentPool()
+
+
+def get_agent(name: Hashable, build: Callable[[], T]) -> T:
+    return agent_pool.get(name, build)
+
+
+def clear_agent_pool() -> None:
+    agent_pool.clear()
@@ -1,32 +1,84 @@
-import json
+import asyncio
+import os
 import re
-from typing import Any, Dict, List, Tuple
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
 from core.prompts.concept_expansion.v4 import CONCEPT_EXPANSION_PROMPT_V4
-from langchain.agents import create_agent
-from langchain_tavily import TavilySearch
+from langchain_core.messages import BaseMessage, HumanMessage, ToolMessage
+from langchain_core.tools import tool
 
 from core.contracts.concept_expansion import ConceptExpansionInput, ConceptExpansionOutput
 from core.contracts.types.curriculum import CurriculumGraph, KeywordNode
+from core.tools.web_search_failover import search_web_with_failover
+from core.utils.budget import clamp_timeout, record_search_call, search_allowed
 from core.utils.get_message import get_last_ai_message
+from core.utils.json_extract import extract_json
+from core.utils.serialization import to_prompt_json
 
 load_dotenv()
 
 KEYWORD_ID_PATTERN = re.compile(r"^key-(\d{3})$")
 
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# 한 번 실행에서 허용하는 웹 검색(tool call) 총 횟수
+MAX_TOOL_CALLS = _env_int("CONCEPT_EXPANSION_MAX_TOOL_CALLS", 4)
+# tool을 쓸 수 있는 LLM 단계 수 (이후에는 tool 없이 최종 답변만 요청)
+MAX_TOOL_STEPS = _env_int("CONCEPT_EXPANSION_MAX_STEPS", 3)
+# tool 단계 전체 wall-clock 상한(초), 요청 예산이 있으면 남은 시간으로 잘림
+TOOL_LOOP_TIMEOUT_SEC = _env_int("CONCEPT_EXPANSION_TIMEOUT_SEC", 90)
+# 검색 1회당 결과 수
+SEARCH_RESULTS_PER_CALL = _env_int("CONCEPT_EXPANSION_SEARCH_RESULTS", 3)
+
+FINAL_ANSWER_NUDGE = (
+    "Tool use is finished. Using the information gathered so far, "
+    "respond now with the final JSON answer only, in the required output format."
+)
+
+SearchFn = Callable[[str, int], Awaitable[List[Dict[str, Any]]]]
+
+
+@tool
+async def web_search(query: str) -> List[Dict[str, Any]]:
+    """Search the web to verify concepts and prerequisite relationships between concepts."""
+    return await search_web_with_failover(query, max_results=SEARCH_RESULTS_PER_CALL)
+
+
 class ConceptExpansionAgent:
-    def __init__(self, llm):
+    """
+    부족한 선수 개념을 찾아 keyword 그래프를 확장하는 agent
+
+    기존 create_agent(ReAct) 루프 대신 tool 사용량이 제한된 루프를 직접 돈다.
+    - 한 단계에서 LLM이 요청한 검색들은 병렬 실행
+    - 총 검색 횟수(max_tool_calls)와 tool 단계 수(max_steps), wall-clock(timeout_sec) 상한
+    - 상한에 닿으면 남은 검색은 건너뛰고 모은 정보로 최종 답변만 요청
+    - 검색은 search_web_with_failover를 거치므로 search_cache 사용 (primary 없이 부르는 호출끼리 공유)
+    """
+
+    def __init__(
+        self,
+        llm,
+        max_tool_calls: Optional[int] = None,
+        max_steps: Optional[int] = None,
+        timeout_sec: Optional[float] = None,
+        search: Optional[SearchFn] = None,
+    ):
         self.llm = llm
-        
-        self.tools = [
-            TavilySearch(max_results=3, topic="general")
-        ]
-        
-        self.agent = create_agent(
-            model=self.llm,
-            tools=self.tools
-        )
+        self.max_tool_calls = MAX_TOOL_CALLS if max_tool_calls is None else max_tool_calls
+        self.max_steps = MAX_TOOL_STEPS if max_steps is None else max_steps
+        self.timeout_sec = TOOL_LOOP_TIMEOUT_SEC if timeout_sec is None else timeout_sec
+        self.search = search or (lambda query, n: search_web_with_failover(query, max_results=n))
+
+        self.tools = [web_search]
+        self.last_stats: Dict[str, Any] = {}
     
     async def run(self, input: ConceptExpansionInput) -> ConceptExpansionOutput:
         # Input 추출
@@ -36,20 +88,16 @@ class ConceptExpansionAgent:
         # 프롬프트 적용
         messages = CONCEPT_EXPANSION_PROMPT_V4.format_messages(
             paper_info = paper_info,
-            keyword_graph=json.dumps(
-                keyword_graph, ensure_ascii=False
-            ),
+            keyword_graph=to_prompt_json(keyword_graph),
             reason=input["keyword_expand_reason"],
             keyword_ids = input["missing_concepts"],
             user_level = input["user_info"]["level"],
             known_concept=input["user_info"]["known_concept"]
         )
 
-        # agent 실행
-        response = await self.agent.ainvoke(
-            {
-                "messages": messages
-            },
+        # tool 사용량이 제한된 루프 실행
+        response = await self._run_tool_loop(
+            messages,
             config={
                 "max_tokens": 1024,
                 "tags": [
@@ -87,14 +135,106 @@ class ConceptExpansionAgent:
 
         return result
 
+    async def _run_tool_loop(self, messages: List[BaseMessage], config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        LLM -> (병렬 검색) -> LLM ... 을 상한 안에서 반복하고 {"messages": [...]} 반환
+        - tool call이 없는 AIMessage가 나오면 그게 최종 답변
+        - 상한에 닿으면 FINAL_ANSWER_NUDGE를 붙여 tool 없이 한 번 더 호출
+          (이 마지막 호출은 노드 timeout(async_timeout)으로만 제한됨)
+        """
+        messages = list(messages)
+        started = time.monotonic()
+        deadline = started + clamp_timeout(self.timeout_sec)
+        llm_with_tools = self.llm.bind_tools(self.tools)
+        # agent 풀에서 인스턴스를 공유하므로 실행별 집계는 지역 변수로 두고 끝날 때만 기록
+        stats = {"steps": 0, "tool_calls": 0, "skipped_tool_calls": 0, "timed_out": False}
+
+        for _ in range(self.max_steps):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                stats["timed_out"] = True
+                break
+            try:
+                ai_message = await asyncio.wait_for(
+                    llm_with_tools.ainvoke(messages, config=config), timeout=remaining
+                )
+            except asyncio.TimeoutError:
+                stats["timed_out"] = True
+                break
+
+            stats["steps"] += 1
+            messages.append(ai_message)
+            if not getattr(ai_message, "tool_calls", None):
+                self._log_stats(stats, started)
+                return {"messages": messages}
+
+            messages.extend(await self._execute_tool_calls(ai_message.tool_calls, deadline, stats))
+
+        messages.append(HumanMessage(content=FINAL_ANSWER_NUDGE))
+        ai_message = await self.llm.ainvoke(messages, config=config)
+        messages.append(ai_message)
+        self._log_stats(stats, started)
+        return {"messages": messages}
+
+    async def _execute_tool_calls(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        deadline: float,
+        stats: Dict[str, Any],
+    ) -> List[ToolMessage]:
+        """
+        한 단계의 tool call들을 병렬 실행
+        - 검색 횟수/요청 예산을 넘는 call은 실행하지 않고 안내 메시지로 응답
+          (모든 tool call에 ToolMessage가 있어야 다음 LLM 호출이 가능)
+        """
+        async def call_one(call: Dict[str, Any]) -> str:
+            query = (call.get("args") or {}).get("query", "")
+            try:
+                results = await asyncio.wait_for(
+                    self.search(query, SEARCH_RESULTS_PER_CALL),
+                    timeout=max(deadline - time.monotonic(), 0),
+                )
+            except asyncio.TimeoutError:
+                stats["timed_out"] = True
+                return "Search timed out. Answer with the information you already have."
+            return to_prompt_json(results)
+
+        pending = []
+        outputs: Dict[int, str] = {}
+        for i, call in enumerate(tool_calls):
+            if call.get("name") != web_search.name:
+                outputs[i] = f"Unknown tool: {call.get('name')}"
+            elif stats["tool_calls"] >= self.max_tool_calls or not search_allowed():
+                stats["skipped_tool_calls"] += 1
+                outputs[i] = "Search budget exhausted. Answer with the information you already have."
+            else:
+                stats["tool_calls"] += 1
+                record_search_call()
+                pending.append(i)
+
+        results = await asyncio.gather(*(call_one(tool_calls[i]) for i in pending))
+        outputs.update(zip(pending, results))
+
+        return [
+            ToolMessage(content=outputs[i], tool_call_id=call.get("id") or f"call-{i}", name=call.get("name"))
+            for i, call in enumerate(tool_calls)
+        ]
+
+    def _log_stats(self, stats: Dict[str, Any], started: float) -> None:
+        self.last_stats = stats
+        print(
+            f"🔎 [ConceptExpansion] steps={stats['steps']} tool_calls={stats['tool_calls']} "
+            f"skipped={stats['skipped_tool_calls']} timed_out={stats['timed_out']} "
+            f"({time.monotonic() - started:.1f}s)"
+        )
+
     def _parse_response(self, response) -> Dict[str, Any]:
         ai_message = get_last_ai_message(response)
         
-        try:
-            parsed = json.loads(ai_message.content)
-            expanded_graph = parsed.get("expanded_graph")
-        except Exception:
+        parsed = extract_json(ai_message.content, expect=dict)
+        if parsed is None:
             return {"nodes": [], "edges": []}
+        expanded_graph = parsed.get("expanded_graph")
 
         if not self._is_valid_expanded_graph(expanded_graph):
             return {"nodes": [], "edges": []}
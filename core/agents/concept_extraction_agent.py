@@ -1,5 +1,4 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import json
 import os
 import re
 from typing import Optional
@@ -8,10 +7,15 @@ import requests
 
 from core.contracts.concept_extraction import ConceptExtractionInput, ConceptExtractionOutput
 from core.prompts.concept_extraction.v2 import FINAL_CONCEPT_EXTRACTION_PROMPT, FIRST_CONCEPT_EXTRACTION_PROMPT
+from core.utils.circuit_breaker import BREAKER_WIKIPEDIA, get_circuit_breaker
+from core.utils.json_extract import extract_json
 from core.utils.timeout import async_timeout
 
 load_dotenv()
 
+WIKI_TIMEOUT_SEC = 10
+wiki_breaker = get_circuit_breaker(BREAKER_WIKIPEDIA)
+
 class ConceptExtractionAgent:
     def __init__(self, llm):
         self.llm = llm
@@ -46,7 +50,8 @@ class ConceptExtractionAgent:
         
         with ThreadPoolExecutor(max_workers=5) as executor:
             futures = {
-                executor.submit(self._search_wikipedia, concept): concept
+                # Wikipedia 장애가 반복되면 breaker가 open되어 바로 CircuitOpenError (wiki 단어 없이 진행)
+                executor.submit(wiki_breaker.call_sync, self._search_wikipedia, concept): concept
                 for concept in first_concepts
             }
 
@@ -101,10 +106,9 @@ class ConceptExtractionAgent:
         최종 ConceptExtractionOutput을 생성한다.
         """
 
-        try:
-            parsed = json.loads(text)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"LLM output is not valid JSON: {text}") from e
+        parsed = extract_json(text, expect=dict)
+        if parsed is None:
+            raise ValueError(f"LLM output is not valid JSON: {text}")
 
         return {
             "paper_id": paper_id,
@@ -128,7 +132,8 @@ class ConceptExtractionAgent:
             "format": "json",
             "srlimit": 3  # 상위 3개 결과
         }
-        response = session.get(url, params=params)
+        response = session.get(url, params=params, timeout=WIKI_TIMEOUT_SEC)
+        response.raise_for_status()
         data = response.json()
         return data['query']['search']
 
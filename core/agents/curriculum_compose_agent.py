@@ -1,5 +1,3 @@
-import json
-import re
 from typing import Dict, Any, List, Tuple
 from core.contracts.curriculum_compose import (
     CurriculumComposeInput,
@@ -8,6 +6,7 @@ from core.contracts.curriculum_compose import (
     KeywordEdge
 )
 from core.prompts.curriculum_compose.v2 import CURRICULUM_COMPOSE_PROMPT_V2
+from core.utils.json_extract import extract_json
 from core.utils.timeout import async_timeout
 
 
@@ -74,7 +73,11 @@ class CurriculumComposeAgent:
             return {"curriculum": curriculum}
 
         # 3. 결과 매핑 (resource_id -> action)
-        action_map = {item["resource_id"]: item["action"] for item in classifications}
+        action_map = {
+            item["resource_id"]: item["action"]
+            for item in classifications
+            if isinstance(item, dict) and "resource_id" in item and "action" in item
+        }
 
         # 4. 커리큘럼 업데이트 (Resources 필터링 및 업데이트)
         new_nodes = []
@@ -144,9 +147,5 @@ class CurriculumComposeAgent:
         return "\n".join(lines), total_load
 
     def _parse_json(self, text: str) -> Dict[str, Any]:
-        try:
-            match = re.search(r'\{.*\}', text, re.DOTALL)
-            json_str = match.group() if match else text
-            return json.loads(json_str)
-        except Exception:
-            return {}
+        # 잘린 응답이어도 분류가 빠진 리소스는 PRESERVE로 남으므로 앞부분만 사용
+        return extract_json(text, expect=dict, default={}, allow_partial=True)
@@ -1,20 +1,88 @@
-import json, re, asyncio
-from typing import Dict, Any, List
+import asyncio, os
+from typing import Dict, Any, List, Optional, Tuple
+from dotenv import load_dotenv
 from core.contracts.types.curriculum import CurriculumGraph, KeywordNode, Resource
 from core.contracts.types.paper_info import PaperInfo
 from core.contracts.curriculum_orchestrator import (
     CurriculumOrchestratorInput, 
-    CurriculumOrchestratorOutput
+    CurriculumOrchestratorOutput,
+    KeywordCheckResult,
+    ResourceBatchCheckItem,
+    ResourceCheckResult,
 )
 from core.prompts.curriculum_orchestrator.v1 import KEYWORD_CHECK_PROMPT_V1, RESOURCE_CHECK_PROMPT_V1
 from core.prompts.curriculum_orchestrator.v2 import KEYWORD_CHECK_PROMPT_V2, RESOURCE_CHECK_PROMPT_V2
 from core.prompts.curriculum_orchestrator.v3 import KEYWORD_CHECK_PROMPT_V3, RESOURCE_CHECK_PROMPT_V3
 from core.prompts.curriculum_orchestrator.v4 import KEYWORD_CHECK_PROMPT_V4, RESOURCE_CHECK_PROMPT_V4
+from core.prompts.curriculum_orchestrator.v5 import RESOURCE_BATCH_CHECK_PROMPT_V5
+from core.utils.budget import get_max_iterations
+from core.utils.json_extract import extract_json
+from core.utils.serialization import to_prompt_json
+from core.utils.structured_output import invoke_structured
+
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# 리소스 충분성 판단 방식: batch(기본, 여러 노드를 한 호출로) | single(노드별 호출)
+RESOURCE_CHECK_MODE = os.getenv("ORCH_RESOURCE_CHECK_MODE", "batch").strip().lower()
+# batch 한 호출에 담을 노드 입력의 최대 토큰(추정)과 최대 노드 수
+RESOURCE_CHECK_BATCH_TOKENS = _env_int("ORCH_RESOURCE_CHECK_BATCH_TOKENS", 6000)
+RESOURCE_CHECK_BATCH_MAX_NODES = _env_int("ORCH_RESOURCE_CHECK_BATCH_MAX_NODES", 8)
+
+# 토큰 수 추정 (한글이 섞여도 넉넉하도록 3글자 = 1토큰)
+_CHARS_PER_TOKEN = 3
+
+RESOURCE_CHECK_STAT_FIELDS = (
+    "nodes",                    # 판단한 노드 수
+    "batch_calls",              # batch 호출 수
+    "single_calls",             # 노드별 호출 수 (노드 1개짜리 batch, fallback 포함)
+    "fallback_nodes",           # batch 파싱 실패/누락으로 노드별 호출로 다시 판단한 노드 수
+    "calls_saved",              # 노드별 호출 대비 줄어든 호출 수
+    "prompt_tokens_est",        # 실제 입력 토큰 (추정)
+    "prompt_tokens_saved_est",  # 노드별 호출 대비 줄어든 입력 토큰 (추정)
+)
+
+
+def _approx_tokens(text: str) -> int:
+    return max(1, len(text) // _CHARS_PER_TOKEN)
+
+
+def _template_tokens(prompt) -> int:
+    """프롬프트 템플릿(시스템 프롬프트 등 고정 부분)의 토큰 수 추정"""
+    return _approx_tokens("".join(
+        getattr(getattr(m, "prompt", None), "template", "") for m in prompt.messages
+    ))
+
+
+def _has_dict_item(value: List[Any]) -> bool:
+    return any(isinstance(x, dict) for x in value)
+
+
 class CurriculumOrchestrator:
-    def __init__(self, llm):
+    def __init__(
+        self,
+        llm,
+        resource_check_mode: Optional[str] = None,
+        batch_token_budget: Optional[int] = None,
+        batch_max_nodes: Optional[int] = None,
+    ):
         self.llm = llm
-        self.kw_chain = KEYWORD_CHECK_PROMPT_V4 | llm
-        self.res_chain = RESOURCE_CHECK_PROMPT_V4 | llm
+        self.kw_prompt = KEYWORD_CHECK_PROMPT_V4
+        self.res_prompt = RESOURCE_CHECK_PROMPT_V4
+        self.res_batch_prompt = RESOURCE_BATCH_CHECK_PROMPT_V5
+        self.prompt_version = "v4"
+        self.batch_prompt_version = "v5"
+
+        self.resource_check_mode = resource_check_mode or RESOURCE_CHECK_MODE
+        self.batch_token_budget = batch_token_budget or RESOURCE_CHECK_BATCH_TOKENS
+        self.batch_max_nodes = batch_max_nodes or RESOURCE_CHECK_BATCH_MAX_NODES
 
     async def run(self, input_data: CurriculumOrchestratorInput) -> CurriculumOrchestratorOutput:
         paper_content = input_data["paper_content"]
@@ -26,7 +94,7 @@ class CurriculumOrchestrator:
         user_level = user_info.get("level", "unknown")
         user_purpose = user_info.get("purpose", "simple_study")
         current_count= input_data.get("current_iteration_count", 0)
-        MAX_ITERATIONS = 6
+        max_iterations = get_max_iterations()
         
         # Rule-based 분기 
         tasks = []
@@ -45,7 +113,7 @@ class CurriculumOrchestrator:
                 current_res_sufficient=input_data.get("is_resource_sufficient", True)
             )
 
-        if current_count+1>=MAX_ITERATIONS:
+        if current_count+1>=max_iterations:
             print(f"🛑 [Orchestrator] 반복 횟수({current_count+1}) 초과. LLM 미호출.")
             return self.format_rule_base_result(
                 tasks=tasks, 
@@ -57,36 +125,15 @@ class CurriculumOrchestrator:
 
         # Keyword Check + Resource Checks
         nodes_to_check = [n for n in nodes if not n.get("is_resource_sufficient", False)]
-        resource_tasks = [
-            self.check_single_resource(
-                node=node, 
-                level=user_level, 
-                purpose=user_purpose
-            )
-            for node in nodes_to_check
-        ]
 
-        # 키워드 충분성 체크 + 각 노드별 리소스 체크를 병렬 실행
-        results = await asyncio.gather(
+        # 키워드 충분성 체크 + 노드별 리소스 체크(batch)를 병렬 실행
+        kw_decision, (res_decisions, res_check_stats) = await asyncio.gather(
             self.check_keyword_sufficiency(paper_content, curriculum, user_level, user_purpose),
-            *resource_tasks
+            self.check_resources(nodes_to_check, level=user_level, purpose=user_purpose),
         )
 
-        kw_decision = results[0]  # 키워드 체크 결과
-        res_decisions = results[1:] # 각 노드별 리소스 체크 결과들
-
-        existing_keywords = {n.get("keyword_id") for n in nodes if n.get("keyword_id")}
-        
-        raw_missing_concepts = kw_decision.get("missing_concepts", [])
-        
         # 개념 필터링
-        filtered_missing_concepts = [
-            concept for concept in raw_missing_concepts 
-            if concept in existing_keywords or concept == paper_id
-        ]
-
-        print(f"거르기전:{raw_missing_concepts}")
-        print(f"거른 후:{filtered_missing_concepts}")
+        filtered_missing_concepts = self.filter_missing_concepts(kw_decision, nodes, paper_id)
 
         insufficient_res_ids = [
             nodes_to_check[i]["keyword_id"] for i, dec in enumerate(res_decisions) 
@@ -118,7 +165,9 @@ class CurriculumOrchestrator:
             "missing_concepts": filtered_missing_concepts,
             "insufficient_resource_ids": insufficient_res_ids,
             "keyword_reasoning": kw_decision.get("reasoning", "No keyword gaps found."),
-            "resource_reasoning": res_reasoning_map 
+            "resource_reasoning": res_reasoning_map,
+            "resource_check_stats": res_check_stats,
+            "keyword_checked": True,
         }
 
 
@@ -140,35 +189,190 @@ class CurriculumOrchestrator:
             "edges": edges
         }
             
-        response = await self.kw_chain.ainvoke({
-            "paper_id": curr["graph_meta"]["paper_id"],
-            "paper_content": paper,
-            "curriculum_json": simplified_curr,
-            "user_level": level,
-            "user_purpose": purpose
-        }, config={"tags": ["orch-kw-check"]})
-        return self.parse_json(response.content)
+        result = await invoke_structured(
+            agent="orchestrator_keyword_check",
+            prompt_version=self.prompt_version,
+            prompt=self.kw_prompt,
+            llm=self.llm,
+            inputs={
+                "paper_id": curr["graph_meta"]["paper_id"],
+                "paper_content": paper,
+                "curriculum_json": to_prompt_json(simplified_curr),
+                "user_level": level,
+                "user_purpose": purpose
+            },
+            schema=KeywordCheckResult,
+            config={"tags": ["orch-kw-check"]},
+        )
+        return result or {}
 
     async def check_single_resource(self, node: KeywordNode, level: str, purpose: str) -> Dict[str, Any]:
         """
         단일 키워드의 리소스만 충분한지 판단
         """
-        response = await self.res_chain.ainvoke({
-            "keyword_id": node["keyword_id"],
-            "keyword": node["keyword"],
-            "description": node["description"],
-            "resources": node["resources"], 
-            "user_level": level,
-            "user_purpose": purpose
-        }, config={"tags": ["orch-res-check"]})
-        return self.parse_json(response.content)
+        result = await invoke_structured(
+            agent="orchestrator_resource_check",
+            prompt_version=self.prompt_version,
+            prompt=self.res_prompt,
+            llm=self.llm,
+            inputs={
+                "keyword_id": node["keyword_id"],
+                "keyword": node["keyword"],
+                "description": node["description"],
+                "resources": to_prompt_json(node["resources"]),
+                "user_level": level,
+                "user_purpose": purpose
+            },
+            schema=ResourceCheckResult,
+            config={"tags": ["orch-res-check"]},
+        )
+        return result or {}
+
+    async def check_resources(
+        self, nodes: List[KeywordNode], level: str, purpose: str
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        여러 노드의 리소스 충분성 판단 (결과는 nodes 순서와 동일)
+        - batch 모드: 노드 입력 토큰 합이 batch_token_budget 이하가 되도록 나눠 한 호출에 여러 노드
+          응답 파싱 실패/누락 노드만 check_single_resource로 다시 판단
+        - single 모드: 노드별 호출 (기존 방식)
+        """
+        stats = dict.fromkeys(RESOURCE_CHECK_STAT_FIELDS, 0)
+        if not nodes:
+            return [], stats
+
+        entries = []
+        for node in nodes:
+            payload = {
+                "keyword_id": node["keyword_id"],
+                "keyword": node["keyword"],
+                "description": node["description"],
+                "resources": node["resources"],
+            }
+            entries.append((node, payload, _approx_tokens(to_prompt_json(payload))))
+
+        single_overhead = _template_tokens(self.res_prompt)
+        stats["nodes"] = len(nodes)
+        single_equivalent = sum(single_overhead + tokens for _, _, tokens in entries)
+
+        if self.resource_check_mode == "single":
+            decisions = await asyncio.gather(*(
+                self.check_single_resource(node=node, level=level, purpose=purpose)
+                for node, _, _ in entries
+            ))
+            stats["single_calls"] = len(nodes)
+            stats["prompt_tokens_est"] = single_equivalent
+            return list(decisions), stats
+
+        batch_results = await asyncio.gather(*(
+            self._check_resource_batch(batch, level, purpose, stats)
+            for batch in self._shard_resource_checks(entries)
+        ))
+        decision_map: Dict[str, Dict[str, Any]] = {}
+        for decisions in batch_results:
+            decision_map.update(decisions)
+
+        stats["calls_saved"] = len(nodes) - stats["batch_calls"] - stats["single_calls"]
+        stats["prompt_tokens_saved_est"] = single_equivalent - stats["prompt_tokens_est"]
+        print(
+            f"📦 [Orchestrator] 리소스 판단 {len(nodes)}개 노드 -> "
+            f"batch {stats['batch_calls']}회 + 단일 {stats['single_calls']}회 "
+            f"(절약: 호출 {stats['calls_saved']}회, 입력 토큰 약 {stats['prompt_tokens_saved_est']})"
+        )
+        return [decision_map[node["keyword_id"]] for node in nodes], stats
+
+    def _shard_resource_checks(self, entries):
+        """입력 순서대로 토큰 예산/최대 노드 수를 넘지 않게 묶음 (예산보다 큰 노드는 단독)"""
+        batches, current, current_tokens = [], [], 0
+        for entry in entries:
+            tokens = entry[2]
+            if tokens > self.batch_token_budget:
+                batches.append([entry])
+                continue
+            if current and (
+                current_tokens + tokens > self.batch_token_budget
+                or len(current) >= self.batch_max_nodes
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(entry)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _check_resource_batch(self, batch, level: str, purpose: str, stats: Dict[str, int]) -> Dict[str, Dict[str, Any]]:
+        single_overhead = _template_tokens(self.res_prompt)
+
+        if len(batch) == 1:
+            node, _, tokens = batch[0]
+            stats["single_calls"] += 1
+            stats["prompt_tokens_est"] += single_overhead + tokens
+            return {node["keyword_id"]: await self.check_single_resource(node=node, level=level, purpose=purpose)}
+
+        stats["batch_calls"] += 1
+        stats["prompt_tokens_est"] += _template_tokens(self.res_batch_prompt) + sum(t for _, _, t in batch)
+        try:
+            items = await invoke_structured(
+                agent="orchestrator_resource_batch_check",
+                prompt_version=self.batch_prompt_version,
+                prompt=self.res_batch_prompt,
+                llm=self.llm,
+                inputs={
+                    "keywords_json": to_prompt_json([payload for _, payload, _ in batch]),
+                    "user_level": level,
+                },
+                schema=List[ResourceBatchCheckItem],
+                expect=list,
+                validate=_has_dict_item,
+                config={"tags": ["orch-res-batch-check"]},
+            )
+        except Exception as e:
+            print(f"⚠️ [Orchestrator] batch 리소스 판단 실패: {e}")
+            items = None
+
+        # keyword_id 기준으로 노드에 매핑 (판단 값이 bool이 아닌 원소는 버림)
+        batch_ids = {node["keyword_id"] for node, _, _ in batch}
+        decisions: Dict[str, Dict[str, Any]] = {}
+        for item in items or []:
+            if not isinstance(item, dict):
+                continue
+            kid = item.get("keyword_id")
+            sufficient = item.get("is_resource_sufficient")
+            if kid in batch_ids and isinstance(sufficient, bool):
+                decisions[kid] = {"is_resource_sufficient": sufficient, "reasoning": item.get("reasoning", "")}
+
+        missing = [(node, tokens) for node, _, tokens in batch if node["keyword_id"] not in decisions]
+        if missing:
+            print(f"⚠️ [Orchestrator] batch 응답에서 {len(missing)}/{len(batch)}개 노드 누락 -> 노드별 호출로 다시 판단")
+            stats["fallback_nodes"] += len(missing)
+            stats["single_calls"] += len(missing)
+            stats["prompt_tokens_est"] += sum(single_overhead + tokens for _, tokens in missing)
+            singles = await asyncio.gather(*(
+                self.check_single_resource(node=node, level=level, purpose=purpose)
+                for node, _ in missing
+            ))
+            for (node, _), decision in zip(missing, singles):
+                decisions[node["keyword_id"]] = decision
+        return decisions
+
+    def filter_missing_concepts(self, kw_decision: Dict[str, Any], nodes: List[KeywordNode], paper_id: str) -> List[str]:
+        """키워드 체크 결과의 missing_concepts 중 실제 노드 id(또는 논문 id)만 남김"""
+        existing_keywords = {n.get("keyword_id") for n in nodes if n.get("keyword_id")}
+        
+        raw_missing_concepts = kw_decision.get("missing_concepts", [])
+        
+        filtered_missing_concepts = [
+            concept for concept in raw_missing_concepts 
+            if concept in existing_keywords or concept == paper_id
+        ]
+
+        print(f"거르기전:{raw_missing_concepts}")
+        print(f"거른 후:{filtered_missing_concepts}")
+        return filtered_missing_concepts
 
     def parse_json(self, text: str) -> Dict[str, Any]:
-        match = re.search(r'\{.*\}', text, re.DOTALL)
-        if match:
-            try: return json.loads(match.group())
-            except: return {}
-        return {}
+        return extract_json(text, expect=dict, default={})
 
     def format_rule_base_result(
         self, 
@@ -187,4 +391,5 @@ class CurriculumOrchestrator:
             "missing_concepts": [],
             "keyword_reasoning": "Rule-base: No missing keywords detected (pre-check).",
             "resource_reasoning": {},
+            "keyword_checked": False,
         }
\ No newline at end of file
@@ -1,4 +1,4 @@
-import json, re, asyncio
+import asyncio
 from typing import Dict, Any, List
 from core.contracts.types.curriculum import CurriculumGraph, KeywordNode, Resource
 from core.contracts.types.paper_info import PaperInfo
@@ -9,6 +9,8 @@ from core.contracts.first_node_order_agent import (
 # from core.prompts.first_node_order.v1 import FIRST_ORDER_PROMPT_V1
 from core.prompts.first_node_order.v2 import FIRST_ORDER_PROMPT_V2
 from core.utils.timeout import async_timeout
+from core.utils.json_extract import extract_json
+from core.utils.serialization import to_prompt_json
 
 class FirstNodeOrderAgent:
     def __init__(self, llm):
@@ -27,14 +29,14 @@ class FirstNodeOrderAgent:
         first_nodes=self._get_first_nodes(curriculum)
         
         chain_input = {
-            "first_nodes": json.dumps(first_nodes, ensure_ascii=False),
+            "first_nodes": to_prompt_json(first_nodes),
             "paper_content": curriculum["graph_meta"]["summarize"], 
-            "keyword_graph": json.dumps(curriculum, ensure_ascii=False),
+            "keyword_graph": to_prompt_json(curriculum),
             "user_level": user_level,
             "user_purpose": user_purpose
         }
 
-        response = await self.order_chain.ainvoke(chain_input)
+        response = await self.order_chain.ainvoke(chain_input, config={"tags": ["first-node-order"]})
 
         ordered_first_nodes = self._parse_response(response.content)
 
@@ -70,27 +72,25 @@ class FirstNodeOrderAgent:
     
     def _parse_response(self, content: str) -> List[str]:
         """문자열을 JSON으로 파싱하여 {"reason": "...", "results": [...]} 형식에서 results 리스트 추출. reason은 출력만 하고 반환하지 않음."""
-        try:
-            cleaned_content = re.sub(r"```(json|list)?", "", content).replace("```", "").strip()
-            parsed = json.loads(cleaned_content)
-
-            if isinstance(parsed, dict) and "results" in parsed:
-                reason = parsed.get("reason")
-                if reason is not None and isinstance(reason, str) and reason.strip():
-                    print(f"📋 [FirstNodeOrder] reason: {reason.strip()}")
-                results = parsed["results"]
-                if isinstance(results, list):
-                    return results
-                print(f"⚠️ [FirstNodeOrder] 'results'가 리스트가 아님: {type(results)}")
-                return []
-            if isinstance(parsed, list):
-                # 이전 형식 호환: 리스트만 반환한 경우
-                return parsed
-            print(f"⚠️ [FirstNodeOrder] 기대한 JSON 형식이 아님 (reason/results 또는 list): {type(parsed)}")
-            return []
-        except json.JSONDecodeError:
+        parsed = extract_json(content)
+        if parsed is None:
             print(f"⚠️ [FirstNodeOrder] JSON 파싱 실패. 원본: {content}")
             return []
+
+        if isinstance(parsed, dict) and "results" in parsed:
+            reason = parsed.get("reason")
+            if reason is not None and isinstance(reason, str) and reason.strip():
+                print(f"📋 [FirstNodeOrder] reason: {reason.strip()}")
+            results = parsed["results"]
+            if isinstance(results, list):
+                return results
+            print(f"⚠️ [FirstNodeOrder] 'results'가 리스트가 아님: {type(results)}")
+            return []
+        if isinstance(parsed, list):
+            # 이전 형식 호환: 리스트만 반환한 경우
+            return parsed
+        print(f"⚠️ [FirstNodeOrder] 기대한 JSON 형식이 아님 (reason/results 또는 list): {type(parsed)}")
+        return []
     
     def _validate_and_fix_order(self, original_list: List[str], llm_output_list: List[str]) -> List[str]:
         """
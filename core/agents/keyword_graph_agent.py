@@ -1,16 +1,19 @@
 # core/agents/keyword_graph_agent.py
 
 import os
-import re
-import ast
 import copy
 import json
 
-from core.tools.gdb_search import get_subgraph_1
+from core.tools.graph_store import get_graph_store
 from core.prompts.keyword_graph import KEYWORD_GRAPH_PROMPT_V10
 from core.contracts.keywordgraph import KeywordGraphInput, KeywordGraphOutput
-from core.utils.kg_agent_preprocessing import preprocess_graph, build_keyword_name_to_property
-from core.utils.kg_agent_postprocessing import transform_graph_data
+from core.utils.kg_agent_preprocessing import preprocess_graph
+from core.utils.kg_agent_pruning import KG_PRUNE_ENABLED, prune_agent_input, prune_stats
+from core.utils.kg_subgraph_index import SubgraphIndex
+from core.utils.kg_agent_postprocessing import postprocess_agent_output
+from core.utils.debug_artifacts import save_debug_artifact
+from core.utils.json_extract import extract_json
+from core.utils.serialization import to_prompt_json
 from core.utils.timeout import async_timeout
 
 class KeywordGraphAgent:
@@ -23,6 +26,7 @@ class KeywordGraphAgent:
         self.llm = llm
         self.chain = KEYWORD_GRAPH_PROMPT_V10 | llm
         self.init_subgraph = None
+        self.subgraph_index = None
 
     @async_timeout(90)
     async def run(self, input_data: KeywordGraphInput) -> KeywordGraphOutput:
@@ -42,7 +46,8 @@ class KeywordGraphAgent:
         print(f"paper_name = {paper_name}")
         print(f'initial_keyword = {initial_keyword}')
         
-        self.init_subgraph = get_subgraph_1(paper_name, initial_keyword)
+        # GRAPH_STORE_BACKEND(neo4j | sqlite)에 따라 1차 Subgraph 조회
+        self.init_subgraph = get_graph_store().get_subgraph_1(paper_name, initial_keyword)
 
         # 만약 init_subgraph가 빈칸인 경우 초기값으로 채우기 -> RDB의 ID, NAME
         if self.init_subgraph['graph']['target_paper'] == None:
@@ -55,11 +60,11 @@ class KeywordGraphAgent:
             }
             self.init_subgraph['graph']['target_paper'] = target_paper
 
-        # 디버깅 -> json으로 저장
-        with open("debug_1차_서브그래프.json", "w", encoding="utf-8") as f:
-            json.dump(self.init_subgraph, f, ensure_ascii=False, indent=2)
+        # 디버깅 -> opt-in 요청에서만 job별 디렉토리에 비동기 저장
+        await save_debug_artifact("subgraph_1", self.init_subgraph)
 
-        # 2. 생성된 1차 Subgraph를 LLM Input에 맞춰 처리
+        # 2. 생성된 1차 Subgraph를 LLM Input에 맞춰 처리 (정수 인덱스는 subgraph당 한 번만 생성)
+        self.subgraph_index = SubgraphIndex.from_raw(self.init_subgraph)
         subgraph = self._preprocess_graph(self.init_subgraph)
 
         # 3. LLM 실행
@@ -82,7 +87,7 @@ class KeywordGraphAgent:
                 "target_paper_title": target_paper.get("name", ""),
                 "target_paper_id": target_paper.get("id", ""),
                 "target_paper_description": target_paper.get("description", ""),
-                "graph_json": subgraph
+                "graph_json": to_prompt_json(subgraph)
             }, 
             config={
                 "tags": ["keyword-graph-agent"]
@@ -96,96 +101,43 @@ class KeywordGraphAgent:
             text=response.content
         )
 
+        await save_debug_artifact("subgraph_2", subgraph)
+
         return {"subgraph": subgraph}
 
 
     def _preprocess_graph(self, raw_subgraph):
-        return preprocess_graph(raw_subgraph=raw_subgraph)
+        agent_input = preprocess_graph(raw_subgraph=raw_subgraph, index=self.subgraph_index)
+        if not KG_PRUNE_ENABLED:
+            return agent_input
+
+        # 프롬프트 크기를 줄이기 위한 가지치기 (target과 연결된 구조는 유지)
+        target_node = self.subgraph_index.target_title or "__TARGET_PAPER__"
+        pruned = prune_agent_input(agent_input, target_node=target_node)
+
+        stats = prune_stats(agent_input, pruned)
+        print(
+            f"[KeywordGraphAgent] prune: nodes {stats['nodes'][0]} -> {stats['nodes'][1]}, "
+            f"edges {stats['edges'][0]} -> {stats['edges'][1]}, "
+            f"~tokens {stats['tokens'][0]} -> {stats['tokens'][1]}"
+        )
+        return pruned
 
 
     def _postprocess_graph(self, paper_id, initial_keyword, text):
-        try:
-            json_pattern = r'```json\s*(.*?)\s*```'
-            match = re.search(json_pattern, text, re.DOTALL)
-
-            if match:
-                json_str = match.group(1)
-                parsed_dict = ast.literal_eval(json_str)
-                agent_output = json.loads(json.dumps(parsed_dict, ensure_ascii=True))
-            else:
-                parsed_dict = ast.literal_eval(text)
-                agent_output = json.loads(json.dumps(parsed_dict, ensure_ascii=True))
-        
-            print("\n===== RAW AGENT OUTPUT (BEFORE POSTPROCESS) =====")
-            print(json.dumps(agent_output, indent=2, ensure_ascii=False))
-            print("================================================\n")
-        
-        except json.JSONDecodeError as e:
-            raise ValueError(f"LLM output is not valid JSON: {text}") from e
-        except Exception as e:
-            raise RuntimeError(f"Unknown Error: {e}")
-
-        # 1. 삭제된 Node를 참고하고 있는 Edge 존재시 삭제
-        tp_name = self.init_subgraph.get('graph', {}).get('target_paper', {}).get('name', '')
-        tp_id = self.init_subgraph.get('graph', {}).get('target_paper', {}).get('id', '')
-        valid_keywords = set(agent_output.get('nodes', []) + [tp_name, tp_id])
-        agent_output['edges'] = [
-            edge for edge in agent_output['edges']
-            if edge['start'] in valid_keywords and edge['end'] in valid_keywords
-        ]
-
-        # 2. 최종 출력 형식 변환
-        keyword_name_to_property = build_keyword_name_to_property(self.init_subgraph)
-        subgraph = transform_graph_data(self.init_subgraph, agent_output, keyword_name_to_property, paper_id)
-
-        # 3. Agent의 출력 Keyword의 GraphDB 상 name, alias 뽑기
-        valid_keywords = set([keyword['keyword'] for keyword in subgraph['nodes']])
-        all_keyword_alias = {}
-        for db_keyword in self.init_subgraph['graph']['nodes']['keywords']:
-            if db_keyword['name'] in valid_keywords:
-                all_keyword_alias[db_keyword['name'].lower()] = db_keyword['name'] 
-                for alias in db_keyword['alias']:
-                    all_keyword_alias[alias.lower()] = db_keyword['name']
-
-        # 4. Initial Keyword 처리
-        for keyword in initial_keyword:
-            if keyword.lower() in all_keyword_alias:
-                # 4-1. Agent 생성에 포함된 Initial Keyword 처리
-                original_keyword_name = all_keyword_alias[keyword.lower()].lower()
-                original_keyword_property = keyword_name_to_property[original_keyword_name]
-                
-                for edge in subgraph['edges']:
-                    if edge['start'] == original_keyword_property['id'] and edge['end'] == paper_id:
-                        break
-                else:
-                    subgraph['edges'].append({
-                        'start': original_keyword_property['id'],
-                        'end': paper_id,
-                        'type': "IN",
-                        'reason': "",
-                        'strength': ""
-                    })
-            else:
-                # 4-2. Agent 생성에 포함되지 않았던 Initial Keyword 추가
-                subgraph['nodes'].append({
-                    "keyword_id": None,
-                    "keyword": keyword,
-                    "resources": []
-                })
-
-        # 5. Subgraph Keyword 이름 수정
-        for nodes in subgraph['nodes']:
-            nodes['keyword'] = nodes['keyword'].split("(")[0].strip().title()
-
-        # 6. 없는 Node를 참조하고 있는 모든 Edge 삭제
-        valid_ids = [subgraph['paper_id']] + [keyword['keyword_id'] for keyword in subgraph['nodes'] if keyword['keyword_id']]
-        for edge in subgraph['edges']:
-            start_id = edge['start']
-            end_id = edge['end']
-
-            if start_id in valid_ids and end_id in valid_ids:
-                continue
-            else:
-                subgraph['edges'].remove(edge)
-
-        return subgraph
\ No newline at end of file
+        # 코드 펜스 / Python 리터럴 / 잘린 출력까지 처리
+        agent_output = extract_json(text, expect=dict)
+        if agent_output is None:
+            raise ValueError(f"LLM output is not valid JSON: {text}")
+
+        print("\n===== RAW AGENT OUTPUT (BEFORE POSTPROCESS) =====")
+        print(json.dumps(agent_output, indent=2, ensure_ascii=False))
+        print("================================================\n")
+
+        # 후처리 파이프라인 (edge 정리 -> 형식 변환 -> Initial Keyword 처리 -> 이름 정리)
+        return postprocess_agent_output(
+            raw_subgraph=self.init_subgraph,
+            agent_output=agent_output,
+            initial_keyword=initial_keyword,
+            paper_id=paper_id,
+        )
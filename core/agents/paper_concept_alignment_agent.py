@@ -1,4 +1,3 @@
-import json
 from typing import Dict, List
 
 from core.contracts.paper_concept_alignment import (
@@ -9,6 +8,7 @@ from core.contracts.types.curriculum import KeywordNode, KeywordEdge
 from core.contracts.types.paper_info import PaperInfo
 # from core.prompts.paper_concept_alignment.v1 import PAPER_CONCEPT_ALIGNMENT_PROMPT_V1
 from core.prompts.paper_concept_alignment.v2 import PAPER_CONCEPT_ALIGNMENT_PROMPT_V2
+from core.utils.json_extract import extract_json
 
 
 
@@ -41,6 +41,10 @@ class PaperConceptAlignmentAgent:
 
         # description이 없거나 빈 노드 필터링
         nodes_without_desc = self._filter_nodes_without_description(nodes)
+        target_ids = input_data.get("target_keyword_ids")
+        if target_ids is not None:
+            target_ids = set(target_ids)
+            nodes_without_desc = [n for n in nodes_without_desc if n.get("keyword_id") in target_ids]
 
         if not nodes_without_desc:
             print("✅ 모든 노드에 description이 이미 존재합니다.")
@@ -169,19 +173,9 @@ class PaperConceptAlignmentAgent:
 
     def _parse_response(self, text: str) -> Dict[str, str]:
         """LLM 응답에서 JSON 추출 및 파싱"""
-        try:
-            # 중첩된 JSON 객체 처리를 위해 더 정교한 패턴 사용
-            # 가장 바깥쪽 중괄호 찾기
-            start_idx = text.find('{')
-            end_idx = text.rfind('}')
-            
-            if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
-                clean_json = text[start_idx:end_idx + 1]
-                return json.loads(clean_json)
-            
-            # 전체 텍스트를 JSON으로 파싱 시도
-            return json.loads(text)
-        except json.JSONDecodeError as e:
-            print(f"⚠️ JSON 파싱 오류: {e}")
+        parsed = extract_json(text, expect=dict)
+        if parsed is None:
+            print("⚠️ JSON 파싱 오류")
             print(f"원본 응답: {text[:500]}...")
             return {}
+        return parsed
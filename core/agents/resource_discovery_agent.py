@@ -1,7 +1,6 @@
 # core/agents/resource_discovery_agent.py
 
 import asyncio
-import json
 import re
 import time
 from typing import List, Dict, Any, Optional
@@ -10,31 +9,35 @@ from langsmith import traceable
 from core.contracts.resource_discovery import ResourceDiscoveryAgentInput, ResourceDiscoveryAgentOutput
 from core.prompts.resource_discovery.v6 import QUERY_GEN_PROMPT_V6
 
-from core.tools.tavily_search import search_web_resources
-from core.tools.serper_web_search import search_web_resources_serper
+from core.tools.web_search_failover import PROVIDER_SERPER, PROVIDER_TAVILY, search_web_with_failover
 from core.tools.serper_video_search import search_video_resources
 from core.tools.semantic_scholar_paper_search import search_paper_resources
 
 from core.agents.study_load_estimation_agent import StudyLoadEstimationAgent
 from core.utils.resource_planner import plan_tools
 from core.utils.resource_ranker import select_top_resources
+from core.utils.json_extract import extract_json
+from core.utils.query_builder import QUERY_MODE_RULE, build_search_query, get_query_mode
+from core.utils.budget import LEVEL_TIGHT, get_budget_level, record_search_call, search_allowed
 
 
 class ResourceDiscoveryAgent:
     """
     목표:
     - 키워드별로:
-      1) 쿼리 생성(기존 v3 유지: web/video용 1개)
+      1) 쿼리 생성(web/video용 1개, 규칙 기반 우선 + 모호한 키워드만 LLM)
       2) paper_query는 f"{keyword} survey"
       3) pref_types에 따라 planner가 tool 조합/분배
       4) tool 실행 -> 후보 수집 -> url dedupe
       5) 키워드 단위 배치 평가(StudyLoadEstimationAgent)
       6) 랭킹/리랭킹 -> 최종 N=3, min_pref=1
     """
-    def __init__(self, llm_discovery, llm_estimation):
+    def __init__(self, llm_discovery, llm_estimation, query_mode: Optional[str] = None):
         # 검색용 LLM (쿼리 재생성)
         self.llm_discovery = llm_discovery
         self.query_chain = QUERY_GEN_PROMPT_V6 | llm_discovery
+        # rule: 규칙 기반 쿼리 우선 / llm: 항상 LLM (QUERY_GEN_MODE)
+        self.query_mode = query_mode or get_query_mode()
         
         # 평가용 LLM 
         self.llm_estimation = llm_estimation
@@ -87,9 +90,11 @@ class ResourceDiscoveryAgent:
         user_level: str,
         pref_types: List[str],
         excluded_urls: set,
+        web_query: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         단일 키워드에 대해:
+        - 쿼리 생성 (web_query가 주어지면 그대로 사용)
         - tool plan 생성
         - 후보 수집 및 dedupe
         - 키워드 단위 배치 평가
@@ -104,12 +109,14 @@ class ResourceDiscoveryAgent:
             time.sleep(1)
 
             # web/video 공용 쿼리 생성
-            web_query = await self._generate_web_query(
-                paper_name=paper_name,
-                keyword=keyword,
-                description=description,
-                search_direction=search_direction,
-            )
+            if web_query is None:
+                web_query = await self._generate_web_query(
+                    paper_name=paper_name,
+                    keyword=keyword,
+                    description=description,
+                    search_direction=search_direction,
+                    user_level=user_level,
+                )
 
             # paper 쿼리: keyword + survey (고정)
             paper_query = f"{keyword} survey".strip()
@@ -117,6 +124,9 @@ class ResourceDiscoveryAgent:
             # Rule-based tool plan
             tool_plan = plan_tools(pref_types)
 
+            # 요청 예산이 빠듯하면 tool당 결과 수와 최종 자료 수를 줄임
+            tight = get_budget_level() == LEVEL_TIGHT
+
             # tool별 검색 실행 -> candidate 수집
             candidates: List[Dict[str, Any]] = []
             seen_urls = set()
@@ -124,10 +134,17 @@ class ResourceDiscoveryAgent:
             for step in tool_plan:
                 tool = step["tool"]
                 max_results = int(step["max_results"])
+                if tight:
+                    max_results = min(max_results, 1)
+
+                if not search_allowed():
+                    print(f"💸 [ResourceDiscovery] 검색 예산 소진 -> {keyword_id} 남은 tool 생략")
+                    break
+                record_search_call()
 
                 if tool == "tavily":
-                    # Tavily는 공통: web_query 사용
-                    results = await search_web_resources(web_query, max_results=max_results)
+                    # Tavily는 공통: web_query 사용 (느리거나 실패하면 다른 provider로 hedge/failover)
+                    results = await search_web_with_failover(web_query, max_results=max_results, primary=PROVIDER_TAVILY)
                     candidates.extend(
                         self._normalize_generic_results(
                             results=results,
@@ -140,7 +157,7 @@ class ResourceDiscoveryAgent:
                     )
 
                 elif tool == "serper_web":
-                    results = await search_web_resources_serper(web_query, max_results=max_results)
+                    results = await search_web_with_failover(web_query, max_results=max_results, primary=PROVIDER_SERPER)
                     candidates.extend(
                         self._normalize_generic_results(
                             results=results,
@@ -203,58 +220,30 @@ class ResourceDiscoveryAgent:
             estimation_result = await estimation_agent.run(estimation_input)
             evaluated = estimation_result.get("evaluated_resources", [])
 
-            # 리소스 랭킹 및 top3 (기본값: N=3, min_pref=1)
-            top3 = select_top_resources(evaluated, pref_types=pref_types, top_n=3, min_pref=1)
+            # 리소스 랭킹 및 top3 (기본값: N=3, min_pref=1, 예산이 빠듯하면 N=2)
+            top3 = select_top_resources(evaluated, pref_types=pref_types, top_n=2 if tight else 3, min_pref=1)
 
             return top3
 
-    @staticmethod
-    def _extract_first_json_object(text: str) -> Optional[str]:
-        """응답에서 첫 번째 완전한 JSON 객체만 추출 (JSON 뒤에 Explanation 등이 붙은 경우 대비)."""
-        if not text or "{" not in text:
-            return None
-        start = text.index("{")
-        depth = 0
-        in_string = False
-        escape = False
-        quote_char = None
-        i = start
-        while i < len(text):
-            c = text[i]
-            if escape:
-                escape = False
-                i += 1
-                continue
-            if c == "\\" and in_string:
-                escape = True
-                i += 1
-                continue
-            if in_string:
-                if c == quote_char:
-                    in_string = False
-                i += 1
-                continue
-            if c in ('"', "'"):
-                in_string = True
-                quote_char = c
-                i += 1
-                continue
-            if c == "{":
-                depth += 1
-            elif c == "}":
-                depth -= 1
-                if depth == 0:
-                    return text[start : i + 1]
-            i += 1
-        return None
-
     async def _generate_web_query(
         self,
         paper_name: str,
         keyword: str,
         description: str,
         search_direction: str,
+        user_level: str = "",
     ) -> str:
+        # 규칙으로 만들 수 있으면 LLM 호출 생략
+        if self.query_mode == QUERY_MODE_RULE:
+            query = build_search_query(
+                keyword=keyword,
+                paper_name=paper_name,
+                search_direction=search_direction,
+                user_level=user_level,
+            )
+            if query:
+                return query
+
         response = await self.query_chain.ainvoke(
             {
                 "paper_name": paper_name,
@@ -265,20 +254,12 @@ class ResourceDiscoveryAgent:
         )
 
         raw = (response.content or "").strip()
-        # v5 프롬프트: JSON {"query": "..."} 형식 파싱
-        cleaned = re.sub(r"^```(?:json)?\s*", "", raw)
-        cleaned = re.sub(r"\s*```\s*$", "", cleaned).strip()
-        # LLM이 JSON 뒤에 Explanation 등 부가 설명을 붙이는 경우 대비: 첫 번째 완전한 JSON 객체만 추출
-        json_str = self._extract_first_json_object(cleaned)
-        if json_str is None:
-            json_str = cleaned
-        try:
-            data = json.loads(json_str)
-            if isinstance(data, dict) and data.get("query"):
-                return data["query"].strip() or keyword
-        except (json.JSONDecodeError, TypeError):
-            print(f"⚠️ [ResourceDiscoveryAgent] JSON 파싱 실패: {cleaned[:500]}")
-            pass
+        # v5 프롬프트: JSON {"query": "..."} 형식 파싱 (코드 펜스, 뒤에 붙은 Explanation 등은 무시)
+        data = extract_json(raw, expect=dict)
+        if data is None:
+            print(f"⚠️ [ResourceDiscoveryAgent] JSON 파싱 실패: {raw[:500]}")
+        elif isinstance(data.get("query"), str) and data["query"]:
+            return data["query"].strip() or keyword
         # JSON 파싱 실패 시 첫 줄에서 쿼리 추출 (폴백)
         lines = [ln.strip() for ln in raw.split("\n") if ln.strip()][:1]
         if lines:
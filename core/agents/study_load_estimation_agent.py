@@ -1,17 +1,27 @@
 # core/agents/study_load_estimation_agent.py
 
-import json
-import re
 import asyncio
 from typing import List, Dict, Any
-from core.contracts.study_load_estimation import StudyLoadEstimationInput, StudyLoadEstimationOutput
+from core.contracts.study_load_estimation import (
+    ResourceEstimate,
+    StudyLoadEstimationInput,
+    StudyLoadEstimationOutput,
+)
 from core.contracts.types.curriculum import Resource
 from core.prompts.study_load_estimation.v4 import STUDY_LOAD_ESTIMATION_PROMPT_V4
+from core.utils.serialization import to_prompt_json
+from core.utils.structured_output import invoke_structured
+
+
+def _has_dict_item(value: List[Any]) -> bool:
+    return any(isinstance(x, dict) for x in value)
+
 
 class StudyLoadEstimationAgent:
     def __init__(self, llm):
         self.llm = llm
-        self.chain = STUDY_LOAD_ESTIMATION_PROMPT_V4 | llm
+        self.prompt = STUDY_LOAD_ESTIMATION_PROMPT_V4
+        self.prompt_version = "v4"
         self.sem = asyncio.Semaphore(5)  # 병렬 실행 제한
 
     async def run(self, input_data: StudyLoadEstimationInput) -> StudyLoadEstimationOutput:
@@ -61,16 +71,23 @@ class StudyLoadEstimationAgent:
                         "citationCount": r.get("citationCount"),
                     })
 
-                response = await self.chain.ainvoke(
-                    {
+                parsed = await invoke_structured(
+                    agent="study_load_estimation",
+                    prompt_version=self.prompt_version,
+                    prompt=self.prompt,
+                    llm=self.llm,
+                    inputs={
                         "keyword": keyword,
                         "user_level": user_level,
-                        "resources_json": json.dumps(resources_payload, ensure_ascii=False)
+                        "resources_json": to_prompt_json(resources_payload)
                     },
+                    schema=List[ResourceEstimate],
+                    expect=list,
+                    validate=_has_dict_item,
                     config={"tags": ["load-estimation-batch"]}
                 )
-
-                parsed_list = self.parse_response_list(response.content)
+                # list 내부가 dict가 아닐 수 있으니 정리 (legacy 모드는 검증 전 값)
+                parsed_list = [x for x in (parsed or []) if isinstance(x, dict)]
 
                 # url -> 평가 결과 매핑
                 eval_map: Dict[str, Dict[str, Any]] = {}
@@ -116,24 +133,6 @@ class StudyLoadEstimationAgent:
                 return resources
 
         
-    def parse_response_list(self, text: str) -> List[Dict[str, Any]]:
-        """
-        JSON 배열 추출 및 파싱
-        - 모델이 앞뒤 텍스트를 섞어도 최대한 JSON array만 뽑아냄
-        """
-        try:
-            # 가장 바깥 array만 추출 시도
-            match = re.search(r'\[\s*\{.*\}\s*\]', text, re.DOTALL)
-            clean_json = match.group() if match else text
-            data = json.loads(clean_json)
-
-            if isinstance(data, list):
-                # list 내부가 dict가 아닐 수 있으니 정리
-                return [x for x in data if isinstance(x, dict)]
-            return []
-        except Exception:
-            return []
-        
     def _safe_int(self, val: Any, default: int, lo: int, hi: int) -> int:
         try:
             n = int(float(val))
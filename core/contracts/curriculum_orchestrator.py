@@ -1,4 +1,4 @@
-from typing import List, TypedDict, Optional
+from typing import Dict, List, NotRequired, TypedDict, Optional
 from core.contracts.types.paper_info import PaperInfo
 from core.contracts.types.curriculum import CurriculumGraph
 from core.contracts.types.user_info import UserInfo
@@ -21,11 +21,25 @@ class CurriculumOrchestratorOutput(TypedDict):
     keyword_reasoning: str            # 키워드 판단 근거
     resource_reasoning: str           # 리소스 판단 근거
 
-           
+    resource_check_stats: NotRequired[Dict[str, int]]  # 리소스 충분성 판단 호출/토큰 통계 (LLM 판단 라운드만)
+    keyword_checked: NotRequired[bool]                 # 이번 라운드에 LLM으로 키워드 충분성을 판단했는지
 
 
+class KeywordCheckResult(TypedDict):
+    """키워드 충분성 판단 LLM 응답"""
+    is_keyword_sufficient: bool
+    missing_concepts: List[str]
+    reasoning: str
 
 
-    
-    
-    
\ No newline at end of file
+class ResourceCheckResult(TypedDict):
+    """노드별 리소스 충분성 판단 LLM 응답"""
+    is_resource_sufficient: bool
+    reasoning: str
+
+
+class ResourceBatchCheckItem(TypedDict):
+    """여러 노드를 한 번에 판단하는 리소스 충분성 LLM 응답의 원소"""
+    keyword_id: str
+    is_resource_sufficient: bool
+    reasoning: str
@@ -1,4 +1,4 @@
-from typing import Dict, TypedDict
+from typing import Dict, List, NotRequired, TypedDict
 from core.contracts.types.paper_info import PaperInfo
 from core.contracts.types.curriculum import CurriculumGraph
 
@@ -6,6 +6,7 @@ class PaperConceptAlignmentInput(TypedDict):
     """Paper Concept Alignment Agent 입력"""
     paper_info: PaperInfo
     curriculum: CurriculumGraph
+    target_keyword_ids: NotRequired[List[str]]  # 지정하면 이 노드들만 설명 생성 (dataflow 스케줄러)
 
 
 class PaperConceptAlignmentOutput(TypedDict):
@@ -1,6 +1,6 @@
 # core/contracts/study_load_estimation.py
 
-from typing import List, TypedDict
+from typing import List, Required, TypedDict
 from core.contracts.types.curriculum import Resource
 
 class StudyLoadEstimationInput(TypedDict):
@@ -10,3 +10,14 @@ class StudyLoadEstimationInput(TypedDict):
 
 class StudyLoadEstimationOutput(TypedDict):
     evaluated_resources: List[Resource]
+
+
+class ResourceEstimate(TypedDict, total=False):
+    """LLM 응답(JSON 배열)의 원소 - url 기준으로 원본 리소스에 병합"""
+    url: Required[str]
+    difficulty: float
+    importance: float
+    quality: float
+    study_load: float
+    type: str
+    resource_description: str
@@ -0,0 +1,102 @@
+"""
+Orchestrator 루프 수렴(더 돌아도 변화 없음) 판정
+
+매 orchestrator 라운드마다
+- progress_signature: 직전 라운드 작업 결과가 반영된 커리큘럼의 진척도
+  (노드 수, 엣지 수, 리소스 수, 설명이 있는 노드 수)
+- insufficiency_signature: 이번 라운드 판단 결과 (부족 리소스 id, 부족 개념 id, task 목록)
+두 값이 모두 직전 라운드와 같으면 정체(stalled)로 보고,
+CONVERGENCE_PATIENCE 라운드 연속 정체면 수렴으로 판단해 curriculum_compose로 조기 종료한다.
+(LLM reasoning 문장은 매번 달라지므로 비교하지 않음)
+"""
+
+import os
+from typing import Any, Dict, List
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# 연속 정체 라운드가 이 값 이상이면 수렴
+CONVERGENCE_PATIENCE = _env_int("CONVERGENCE_PATIENCE", 1)
+
+
+def progress_signature(curriculum: Dict[str, Any]) -> List[int]:
+    nodes = curriculum.get("nodes", [])
+    return [
+        len(nodes),
+        len(curriculum.get("edges", [])),
+        sum(len(n.get("resources") or []) for n in nodes),
+        sum(1 for n in nodes if n.get("description")),
+    ]
+
+
+def insufficiency_signature(result: Dict[str, Any]) -> List[List[str]]:
+    return [
+        sorted(result.get("insufficient_resource_ids") or []),
+        sorted(result.get("missing_concepts") or []),
+        sorted(result.get("tasks") or []),
+    ]
+
+
+def initial_convergence_state() -> Dict[str, Any]:
+    return {
+        "progress_signature": [],
+        "insufficiency_signature": [],
+        "stalled_rounds": 0,
+        "converged": False,
+        "rounds_saved": 0,
+    }
+
+
+def update_convergence(
+    state: Dict[str, Any],
+    result: Dict[str, Any],
+    max_iterations: int,
+    patience: int = CONVERGENCE_PATIENCE,
+) -> Dict[str, Any]:
+    """
+    orchestrator 노드에서 호출, state 업데이트 dict 반환
+    - state: 이번 라운드 시작 시점의 state (직전 라운드 결과가 반영된 curriculum 포함)
+    - result: 이번 라운드 orchestrator 판단 결과
+    """
+    progress = progress_signature(state.get("curriculum", {}))
+    insufficiency = insufficiency_signature(result)
+    current_count = state.get("current_iteration_count", 0)
+
+    tasks = result.get("tasks") or []
+    finishing = not tasks or tasks == ["curriculum_compose"]
+
+    stalled = (
+        not finishing
+        and progress == state.get("progress_signature")
+        and insufficiency == state.get("insufficiency_signature")
+    )
+    stalled_rounds = state.get("stalled_rounds", 0) + 1 if stalled else 0
+    converged = stalled_rounds >= patience
+
+    rounds_saved = 0
+    if converged:
+        # 이번 라운드 이후 남아 있던 orchestrator 라운드 수
+        rounds_saved = max(0, max_iterations - (current_count + 1))
+        print(
+            f"🧊 [Convergence] {stalled_rounds}라운드 연속 변화 없음 "
+            f"(progress={progress}, insufficient={len(insufficiency[0])}, missing={len(insufficiency[1])}) "
+            f"-> 조기 종료, 절약한 라운드: {rounds_saved}"
+        )
+
+    return {
+        "progress_signature": progress,
+        "insufficiency_signature": insufficiency,
+        "stalled_rounds": stalled_rounds,
+        "converged": converged,
+        "rounds_saved": rounds_saved,
+    }
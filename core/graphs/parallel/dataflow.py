@@ -0,0 +1,404 @@
+"""
+Dataflow 스케줄러 (CURRICULUM_SCHEDULER_MODE=dataflow)
+
+rounds 모드(기본)는 orchestrator -> 병렬 작업 -> join_results -> orchestrator 라운드 단위라
+- 느린 resource_discovery가 끝날 때까지 빠른 paper_concept_alignment 결과도 다음 라운드를 기다리고
+- concept_expansion으로 생긴 새 노드는 한 라운드가 통째로 지나야 설명/자료를 얻는다.
+
+dataflow 모드는 키워드 단위 작업을 입력이 준비되는 즉시 실행한다.
+- describe: 설명 없는 노드 (진행 중이 아닌 노드끼리 묶어서 한 번에)
+- search: 설명이 생긴 노드의 자료 검색 + 평가 + 랭킹 (키워드별)
+- check_resource: 검색이 끝난 노드의 자료 충분성 판단 -> 부족하면 이유를 붙여 다시 search
+- check_keywords: 모든 노드에 설명이 있고 노드 구성이 바뀌었으면 키워드 충분성 판단
+- expand: 부족한 개념이 있으면 확장 -> 새 노드는 바로 describe부터
+- estimate: 처음부터 있던 자료 중 점수가 없는 자료 재평가 (시작 시 1회)
+작업 결과는 끝나는 순서대로 merge_curriculum으로 반영하고, 반영할 때마다 실행 가능한 작업을 다시 찾는다.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from dotenv import load_dotenv
+
+from core.agents.agent_pool import get_agent
+from core.agents.curriculum_orchestrator import CurriculumOrchestrator
+from core.agents.paper_concept_alignment_agent import PaperConceptAlignmentAgent
+from core.agents.resource_discovery_agent import ResourceDiscoveryAgent
+from core.agents.study_load_estimation_agent import StudyLoadEstimationAgent
+from core.graphs.parallel.nodes_parallel import (
+    concept_expansion_node,
+    description_updates,
+    format_discovered_resources,
+    reestimate_existing_resources,
+)
+from core.graphs.parallel.state_parallel import CreateCurriculumOverallState, merge_curriculum
+from core.llm.model_router import get_routed_model
+from core.llm.solar_pro_2_llm import get_solar_model
+from core.utils.budget import LEVEL_EXHAUSTED, LEVEL_NORMAL, get_budget_level, get_max_iterations, search_allowed
+
+load_dotenv()
+
+SCHEDULER_ROUNDS = "rounds"
+SCHEDULER_DATAFLOW = "dataflow"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# 키워드당 describe / search 최대 시도 횟수
+MAX_ATTEMPTS_PER_KEYWORD = _env_int("DATAFLOW_MAX_ATTEMPTS", 2)
+
+# 노드별 자료 단계
+_SEARCH = "search"
+_CHECK = "check"
+_DONE = "done"
+
+
+def scheduler_mode() -> str:
+    """CURRICULUM_SCHEDULER_MODE: rounds(기본) | dataflow"""
+    mode = os.getenv("CURRICULUM_SCHEDULER_MODE", SCHEDULER_ROUNDS).strip().lower()
+    return mode if mode in (SCHEDULER_ROUNDS, SCHEDULER_DATAFLOW) else SCHEDULER_ROUNDS
+
+
+def _needs_estimate(resource: Dict[str, Any]) -> bool:
+    return (
+        resource.get("difficulty") is None
+        or resource.get("importance") is None
+        or resource.get("study_load") is None
+    )
+
+
+class AgentDataflowOps:
+    """스케줄러 작업을 실제 에이전트로 실행 (LLM 설정은 rounds 모드 노드 함수들과 동일)"""
+
+    def __init__(self, state: CreateCurriculumOverallState):
+        self.paper_content = state["paper_content"]
+        self.user_info = state.get("user_info", {})
+
+        # rounds 모드 노드와 같은 이름으로 agent 풀을 공유
+        self.orchestrator = get_agent(
+            "curriculum_orchestrator",
+            lambda: CurriculumOrchestrator(get_routed_model(temperature=0.1)),
+        )
+        self.alignment = get_agent(
+            "paper_concept_alignment",
+            lambda: PaperConceptAlignmentAgent(get_solar_model(temperature=0.1)),
+        )
+        # 한 인스턴스를 공유해야 키워드별 search 동시 실행 수가 agent 세마포어로 제한됨
+        self.discovery = get_agent(
+            "resource_discovery",
+            lambda: ResourceDiscoveryAgent(
+                llm_discovery=get_routed_model(temperature=0.7, reasoning_effort='low'),
+                llm_estimation=get_routed_model(temperature=0.1),
+            ),
+        )
+        self.estimation = get_agent(
+            "study_load_estimation",
+            lambda: StudyLoadEstimationAgent(llm=get_routed_model(temperature=0.1)),
+        )
+
+    async def describe(self, curriculum, keyword_ids: List[str]) -> List[Dict[str, Any]]:
+        result = await self.alignment.run({
+            "paper_info": self.paper_content,
+            "curriculum": curriculum,
+            "target_keyword_ids": keyword_ids,
+        })
+        targets = set(keyword_ids)
+        updates = description_updates(curriculum.get("nodes", []), result.get("response", {}))
+        return [u for u in updates if u["keyword_id"] in targets]
+
+    async def search(self, curriculum, node) -> List[Dict[str, Any]]:
+        result = await self.discovery.run({
+            "paper_name": curriculum["graph_meta"]["title"],
+            "nodes": [node],
+            "user_level": self.user_info.get("level"),
+            "purpose": self.user_info.get("purpose"),
+            "pref_types": self.user_info.get("resource_type_preference", []),
+        })
+        return result.get("evaluated_resources", [])
+
+    async def check_resource(self, node) -> Dict[str, Any]:
+        return await self.orchestrator.check_single_resource(
+            node={**node, "description": node.get("description") or ""},
+            level=self.user_info.get("level", "unknown"),
+            purpose=self.user_info.get("purpose", "simple_study"),
+        )
+
+    async def check_keywords(self, curriculum):
+        decision = await self.orchestrator.check_keyword_sufficiency(
+            self.paper_content,
+            curriculum,
+            self.user_info.get("level", "unknown"),
+            self.user_info.get("purpose", "simple_study"),
+        )
+        missing = self.orchestrator.filter_missing_concepts(
+            decision, curriculum.get("nodes", []), curriculum["graph_meta"]["paper_id"]
+        )
+        return missing, decision.get("reasoning", "No keyword gaps found.")
+
+    async def expand(self, curriculum, missing_concepts: List[str], reason: str) -> Dict[str, Any]:
+        update = await concept_expansion_node({
+            "curriculum": curriculum,
+            "keyword_expand_reason": reason,
+            "missing_concepts": missing_concepts,
+            "user_info": self.user_info,
+        })
+        return update["curriculum"]
+
+    async def estimate(self, curriculum) -> Dict[str, Any]:
+        # 진행 중인 다른 작업이 보는 자료 dict를 건드리지 않도록 복사본에 반영 후 delta로 반환
+        nodes = [
+            {**n, "resources": [dict(r) for r in n.get("resources") or []]}
+            for n in curriculum.get("nodes", [])
+        ]
+        await reestimate_existing_resources(nodes, self.user_info, self.estimation)
+        return {
+            "nodes": [
+                {"keyword_id": n["keyword_id"], "resources": n["resources"]}
+                for n in nodes if n["resources"]
+            ]
+        }
+
+
+class DataflowScheduler:
+    """
+    키워드 단위 작업 큐 스케줄러
+
+    - ops: describe/search/check_resource/check_keywords/expand/estimate 코루틴을 제공 (AgentDataflowOps)
+    - 작업이 하나 끝날 때마다 결과를 커리큘럼에 반영하고 입력이 준비된 작업을 바로 실행
+    - 요청 예산이 tight면 키워드 체크/확장 생략, exhausted면 새 작업을 더 시작하지 않음
+    """
+
+    def __init__(
+        self,
+        curriculum,
+        ops,
+        max_attempts: int = MAX_ATTEMPTS_PER_KEYWORD,
+        max_keyword_checks: Optional[int] = None,
+    ):
+        self.curriculum = curriculum
+        self.ops = ops
+        self.max_attempts = max_attempts
+        self.max_keyword_checks = get_max_iterations() if max_keyword_checks is None else max_keyword_checks
+
+        self._tasks: Dict[asyncio.Future, tuple] = {}
+        self._busy: Set[str] = set()   # describe/search/check 진행 중인 keyword_id
+        self._phase: Dict[str, str] = {}
+        self._describe_attempts: Dict[str, int] = {}
+        self._search_attempts: Dict[str, int] = {}
+        self._keyword_busy = False
+        self._keyword_done = False
+        self._checked_ids: Optional[frozenset] = None
+        self._estimated = False
+        self._stopped = False
+        self._next_resource_num = sum(len(n.get("resources") or []) for n in self._nodes()) + 1
+
+        self.keyword_checks = 0
+        self.is_keyword_sufficient = False
+        self.missing_concepts: List[str] = []
+        self.keyword_reasoning = ""
+        self.stats: Dict[str, Any] = {"dispatched": {}, "failed": {}, "max_in_flight": 0, "elapsed_sec": 0.0}
+
+    def _nodes(self) -> List[Dict[str, Any]]:
+        return self.curriculum.get("nodes", [])
+
+    def _count(self, field: str, kind: str) -> None:
+        self.stats[field][kind] = self.stats[field].get(kind, 0) + 1
+
+    def _apply(self, delta: Optional[Dict[str, Any]]) -> None:
+        if delta and (delta.get("nodes") or delta.get("edges")):
+            self.curriculum = merge_curriculum(self.curriculum, delta)
+
+    def _describe_settled(self, node: Dict[str, Any]) -> bool:
+        """설명이 있거나 설명 생성을 더 시도하지 않을 노드"""
+        if node.get("description"):
+            return True
+        return self._describe_attempts.get(node["keyword_id"], 0) >= self.max_attempts
+
+    def _start(self, kind: str, arg: Any, coro) -> None:
+        task = asyncio.ensure_future(coro)
+        self._tasks[task] = (kind, arg)
+        self._count("dispatched", kind)
+        self.stats["max_in_flight"] = max(self.stats["max_in_flight"], len(self._tasks))
+
+    async def run(self):
+        started = time.monotonic()
+        self._dispatch_ready()
+        while self._tasks:
+            done, _ = await asyncio.wait(set(self._tasks), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                kind, arg = self._tasks.pop(task)
+                try:
+                    result = task.result()
+                except Exception as e:
+                    print(f"❌ [Dataflow] {kind}({arg}) 실패: {e}")
+                    self._count("failed", kind)
+                    result = None
+                self._complete(kind, arg, result)
+            self._dispatch_ready()
+        self.stats["elapsed_sec"] = round(time.monotonic() - started, 2)
+        self.stats["keyword_checks"] = self.keyword_checks
+        return self.curriculum
+
+    def _dispatch_ready(self) -> None:
+        level = get_budget_level()
+        if level == LEVEL_EXHAUSTED:
+            if not self._stopped:
+                self._stopped = True
+                print(f"💸 [Dataflow] 요청 예산 소진 -> 새 작업 중단 (진행 중 {len(self._tasks)}개만 마무리)")
+            return
+
+        nodes = self._nodes()
+
+        if not self._estimated:
+            self._estimated = True
+            if any(_needs_estimate(r) for n in nodes for r in n.get("resources") or []):
+                self._start("estimate", None, self.ops.estimate(self.curriculum))
+
+        # 설명 없는 노드는 진행 중이 아닌 것끼리 묶어서 한 번에
+        to_describe = [
+            n["keyword_id"] for n in nodes
+            if n["keyword_id"] not in self._busy and not self._describe_settled(n)
+        ]
+        if to_describe:
+            for kid in to_describe:
+                self._describe_attempts[kid] = self._describe_attempts.get(kid, 0) + 1
+                self._busy.add(kid)
+            self._start("describe", to_describe, self.ops.describe(self.curriculum, to_describe))
+
+        # 설명이 준비된 노드부터 자료 검색 / 충분성 판단
+        for node in nodes:
+            kid = node["keyword_id"]
+            if kid in self._busy or not self._describe_settled(node):
+                continue
+            phase = self._phase.get(kid)
+            if phase is None:
+                if node.get("is_resource_sufficient"):
+                    phase = _DONE
+                else:
+                    phase = _CHECK if node.get("resources") else _SEARCH
+
+            if phase == _SEARCH:
+                if self._search_attempts.get(kid, 0) >= self.max_attempts or not search_allowed():
+                    phase = _DONE
+                else:
+                    self._search_attempts[kid] = self._search_attempts.get(kid, 0) + 1
+                    self._busy.add(kid)
+                    self._start("search", kid, self.ops.search(self.curriculum, node))
+            elif phase == _CHECK:
+                self._busy.add(kid)
+                self._start("check_resource", kid, self.ops.check_resource(node))
+            self._phase[kid] = phase
+
+        # 키워드 충분성은 설명만 있으면 판단 가능 (자료 검색과 병행)
+        if (
+            level == LEVEL_NORMAL
+            and not self._keyword_busy
+            and not self._keyword_done
+            and self.keyword_checks < self.max_keyword_checks
+            and all(self._describe_settled(n) for n in nodes)
+        ):
+            node_ids = frozenset(n["keyword_id"] for n in nodes)
+            if node_ids != self._checked_ids:
+                self._checked_ids = node_ids
+                self.keyword_checks += 1
+                self._keyword_busy = True
+                self._start("check_keywords", None, self.ops.check_keywords(self.curriculum))
+
+    def _complete(self, kind: str, arg: Any, result: Any) -> None:
+        if kind == "estimate":
+            self._apply(result)
+
+        elif kind == "describe":
+            self._busy.difference_update(arg)
+            self._apply({"nodes": result or []})
+
+        elif kind == "search":
+            kid = arg
+            self._busy.discard(kid)
+            resources = result or []
+            if resources:
+                resource_map = format_discovered_resources(resources, first_id_num=self._next_resource_num)
+                self._next_resource_num += len(resources)
+                self._apply({
+                    "nodes": [{"keyword_id": k, "resources": v} for k, v in resource_map.items()]
+                })
+            node = next((n for n in self._nodes() if n["keyword_id"] == kid), {})
+            if not node.get("resources"):
+                self._phase[kid] = _SEARCH
+            elif self._search_attempts.get(kid, 0) >= self.max_attempts:
+                # 마지막 검색 결과는 다시 판단하지 않음 (판단해도 더 검색할 수 없음)
+                self._phase[kid] = _DONE
+            else:
+                self._phase[kid] = _CHECK
+
+        elif kind == "check_resource":
+            kid = arg
+            self._busy.discard(kid)
+            if result is None:
+                self._phase[kid] = _DONE
+                return
+            sufficient = result.get("is_resource_sufficient", True)
+            delta_node = {"keyword_id": kid, "is_resource_sufficient": sufficient}
+            if not sufficient and result.get("reasoning"):
+                delta_node["resource_reason"] = result["reasoning"]
+            self._apply({"nodes": [delta_node]})
+            self._phase[kid] = _DONE if sufficient else _SEARCH
+
+        elif kind == "check_keywords":
+            self._keyword_busy = False
+            if result is None:
+                self._keyword_done = True
+                return
+            missing, reasoning = result
+            self.missing_concepts = list(missing)
+            self.keyword_reasoning = reasoning
+            if not missing:
+                self.is_keyword_sufficient = True
+                self._keyword_done = True
+            elif get_budget_level() != LEVEL_NORMAL:
+                print("💸 [Dataflow] 요청 예산 빠듯함 -> concept_expansion 생략")
+                self._keyword_done = True
+            else:
+                self._keyword_busy = True
+                self._start("expand", tuple(missing), self.ops.expand(self.curriculum, list(missing), reasoning))
+
+        elif kind == "expand":
+            self._keyword_busy = False
+            self._apply(result)
+
+    def state_update(self) -> Dict[str, Any]:
+        """그래프 state 업데이트 (curriculum은 전체를 넘겨도 리듀서가 변경분만 반영)"""
+        nodes = self._nodes()
+        insufficient = [
+            n["keyword_id"] for n in nodes
+            if not n.get("resources") or n.get("is_resource_sufficient") is False
+        ]
+        return {
+            "curriculum": self.curriculum,
+            "tasks": [],
+            "current_iteration_count": self.keyword_checks,
+            "is_keyword_sufficient": self.is_keyword_sufficient,
+            "is_resource_sufficient": not insufficient,
+            "insufficient_resource_ids": insufficient,
+            "needs_description_ids": [n["keyword_id"] for n in nodes if not n.get("description")],
+            "missing_concepts": self.missing_concepts,
+            "keyword_expand_reason": self.keyword_reasoning,
+            "scheduler_stats": self.stats,
+        }
+
+
+async def dataflow_scheduler_node(state: CreateCurriculumOverallState):
+    """
+    orchestrator 라운드 루프 대신 키워드 단위 작업 큐로 설명/자료/확장을 채움
+    """
+    scheduler = DataflowScheduler(state["curriculum"], AgentDataflowOps(state))
+    await scheduler.run()
+    print(f"🌊 [Dataflow] 완료: {scheduler.stats}")
+    return scheduler.state_update()
@@ -16,7 +16,10 @@ from core.graphs.parallel.nodes_parallel import (
     paper_concept_alignment_node,
     first_node_order_node
 )
+from core.graphs.parallel.convergence import initial_convergence_state
+from core.graphs.parallel.dataflow import SCHEDULER_DATAFLOW, dataflow_scheduler_node, scheduler_mode
 from core.graphs.parallel.state_parallel import CreateCurriculumOverallState
+from core.utils.budget import LEVEL_EXHAUSTED, LEVEL_TIGHT, get_budget_level, get_max_iterations
 
 def create_initial_state(
     subgraph_data: Dict[str, Any],
@@ -49,7 +52,11 @@ def create_initial_state(
         "missing_concepts": [],
         "keyword_reasoning": "Init",
         "resource_reasoning": "Init",
-        "keyword_expand_reason": ""
+        "keyword_expand_reason": "",
+        **initial_convergence_state(),
+        "resource_check_stats": {},
+        "speculation_id": None,
+        "speculation": {},
     }
 
     return CreateCurriculumOverallState(**initial_state)
@@ -58,11 +65,20 @@ def create_initial_state(
 def orchestrator_router(state: CreateCurriculumOverallState) -> List[str]:
     tasks = state.get("tasks", [])
     current_count = state.get("current_iteration_count", 0)
-    MAX_ITERATIONS = 6
+
+    if state.get("converged"):
+        print(f"🧊 [Router] 수렴하여 조기 종료 (Loop: {current_count}, 절약: {state.get('rounds_saved', 0)}라운드)")
+        return ["curriculum_compose"]
+
+    # 요청 예산 소진 -> 지금까지 결과로 바로 마무리
+    budget_level = get_budget_level()
+    if budget_level == LEVEL_EXHAUSTED:
+        print(f"💸 [Router] 요청 예산 소진 -> 바로 Compose (Loop: {current_count})")
+        return ["curriculum_compose"]
 
     # 병렬 실행할 노드 리스트 
     next_nodes = []
-    is_over_limit = current_count >= MAX_ITERATIONS
+    is_over_limit = current_count >= get_max_iterations()
 
     has_desc = "generate_description" in tasks
     has_res = "resource_search" in tasks
@@ -83,7 +99,11 @@ def orchestrator_router(state: CreateCurriculumOverallState) -> List[str]:
         # 제한 안 넘었으면 있는 태스크 다 담기
         if has_desc: next_nodes.append("paper_concept_alignment")
         if has_res: next_nodes.append("resource_discovery")
-        if has_exp: next_nodes.append("concept_expansion")
+        # 예산이 빠듯하면 비용이 큰 개념 확장은 생략 (설명/자료 보충만)
+        if has_exp and budget_level == LEVEL_TIGHT:
+            print(f"💸 [Router] 요청 예산 빠듯함 -> concept_expansion 생략")
+        elif has_exp:
+            next_nodes.append("concept_expansion")
 
     if next_nodes:
         print(f"🔀 [Parallel] 동시 실행: {next_nodes} (Loop: {current_count})")
@@ -106,7 +126,29 @@ async def join_parallel_results_node(state: CreateCurriculumOverallState):
     }
 
 
-def run_langgraph_workflow():
+def run_langgraph_dataflow_workflow():
+    """
+    dataflow 모드: orchestrator 라운드/join 배리어 없이 키워드 단위 작업 큐로 커리큘럼을 채운 뒤 compose
+    """
+    workflow = StateGraph(CreateCurriculumOverallState)
+
+    workflow.add_node("dataflow_scheduler", dataflow_scheduler_node)
+    workflow.add_node("curriculum_compose", curriculum_compose_node)
+    workflow.add_node("first_node_order", first_node_order_node)
+
+    workflow.add_edge(START, "dataflow_scheduler")
+    workflow.add_edge("dataflow_scheduler", "curriculum_compose")
+    workflow.add_edge("curriculum_compose", "first_node_order")
+    workflow.add_edge("first_node_order", END)
+
+    return workflow.compile()
+
+
+def run_langgraph_workflow(mode: str | None = None):
+    # mode 미지정 시 CURRICULUM_SCHEDULER_MODE (rounds | dataflow)
+    if (mode or scheduler_mode()) == SCHEDULER_DATAFLOW:
+        return run_langgraph_dataflow_workflow()
+
     # StateGraph 구성
     workflow = StateGraph(CreateCurriculumOverallState)
 
@@ -1,9 +1,22 @@
 import json
 from core.contracts.concept_expansion import ConceptExpansionInput
+from core.graphs.parallel.convergence import update_convergence
+from core.graphs.parallel.speculation import (
+    STATUS_ADOPTED,
+    STATUS_RUNNING,
+    cancel_speculation,
+    is_pending,
+    resolve_speculation,
+    speculative_expansion_enabled,
+    start_speculation,
+)
 from core.graphs.parallel.state_parallel import CreateCurriculumOverallState
+from core.llm.model_router import get_routed_model
 from core.llm.solar_pro_2_llm import get_solar_model
+from core.utils.budget import get_max_iterations
 
 
+from core.agents.agent_pool import get_agent
 from core.agents.curriculum_orchestrator import CurriculumOrchestrator
 from core.agents.resource_discovery_agent import ResourceDiscoveryAgent
 from core.agents.study_load_estimation_agent import StudyLoadEstimationAgent
@@ -12,12 +25,134 @@ from core.agents.paper_concept_alignment_agent import PaperConceptAlignmentAgent
 from core.agents.concept_expansion_agent import ConceptExpansionAgent
 from core.agents.first_node_order_agent import FirstNodeOrderAgent
 
+async def reestimate_existing_resources(nodes_list, user_info, estimation_agent) -> None:
+    """
+    점수(difficulty/importance/study_load)가 비어 있는 기존 자료를 다시 평가해 자료 dict에 바로 반영
+    """
+    estimation_inputs = []   # Agent에게 보낼 입력용
+    resources_to_update = [] # 실제 업데이트할 원본 객체 참조
+    
+    for node in nodes_list:
+        node_keyword = node.get("keyword", "")
+        existing_res = node.get("resources", [])
+        
+        for res in existing_res:
+            # 평가가 필요한지 검사 
+            if (res.get("difficulty") is None or 
+                res.get("importance") is None or 
+                res.get("study_load") is None):
+                
+                temp_input = res.copy()
+                
+                temp_input["keyword"] = node_keyword
+                # resource_description을 raw_content로 매핑하여 에이전트가 읽을 수 있게 함
+                temp_input["raw_content"] = res.get("resource_description", "")
+                
+                estimation_inputs.append(temp_input)
+                resources_to_update.append(res) # 원본은 여기에 따로 저장
+
+    # 에이전트 실행 및 결과 반영
+    if not estimation_inputs:
+        return
+
+    print(f"🔄 Re-estimating {len(estimation_inputs)} resources...")
+
+    estimation_input_data = {
+        "resources": estimation_inputs, # 복사본 전달
+        "user_level": user_info.get("level"),
+        "purpose": user_info.get("purpose")
+    }
+
+    # 에이전트 실행
+    estimation_result = await estimation_agent.run(estimation_input_data)
+    evaluated_updates = estimation_result.get("evaluated_resources", [])
+
+    # 결과 반영 (원본 리스트 + 결과 리스트)
+    if len(resources_to_update) == len(evaluated_updates):
+        for original, updated in zip(resources_to_update, evaluated_updates):
+            
+            # Pydantic 모델인 경우 딕셔너리로 변환
+            if hasattr(updated, 'dict'):
+                updated_dict = updated.dict()
+            else:
+                updated_dict = updated
+
+            if "difficulty" in updated_dict:
+                original["difficulty"] = updated_dict["difficulty"]
+            if "importance" in updated_dict:
+                original["importance"] = updated_dict["importance"]
+            if "study_load" in updated_dict:
+                original["study_load"] = updated_dict["study_load"]
+            if "type" in updated_dict:
+                original["type"] = updated_dict["type"]
+    else:
+        print("⚠️ Warning: Estimation count mismatch. Updates might be inaccurate.")
+
+
+def format_discovered_resources(new_resources, first_id_num: int):
+    """
+    ResourceDiscoveryAgent 결과를 커리큘럼 자료 형식으로 변환, keyword_id별로 묶어서 반환
+    resource_id는 first_id_num부터 순서대로 부여 (res-001 형태)
+    """
+    resource_map = {}
+
+    def get_value(data, key, default):
+        val = data.get(key)
+        return val if val is not None else default
+
+    for i, res in enumerate(new_resources):
+        kid = res["keyword_id"]
+        if kid not in resource_map:
+            resource_map[kid] = []
+
+        res_id_num = first_id_num + i
+        
+        try:
+            # None이 들어오면 바로 기본값(5)으로 치환 후 변환
+            difficulty = int(float(get_value(res, "difficulty", 5)))
+            importance = int(float(get_value(res, "importance", 5)))
+            study_load = float(get_value(res, "study_load", 1)) 
+        except (ValueError, TypeError):
+            difficulty, importance, study_load = 5, 5, 1
+
+
+        formatted_res = {
+            "resource_id": f"res-{res_id_num:03d}", # res-001 형태
+            "resource_name": res.get("resource_name"),
+            "url": res.get("url"),
+            "type": res.get("type", "web_doc"),
+            "resource_description": res.get("resource_description"),
+            "difficulty": difficulty,  
+            "importance": importance,  
+            "study_load": study_load,
+            "is_necessary": None                    
+        }
+        resource_map[kid].append(formatted_res)
+    return resource_map
+
+
+def description_updates(nodes, response):
+    """PaperConceptAlignmentAgent 응답 중 새로 생성된 설명이 있는 노드만 delta로"""
+    updated_nodes = []
+    for node in nodes:
+        kw_id = node.get("keyword_id")
+        if kw_id in response:
+            updated_nodes.append({
+                "keyword_id": kw_id,
+                "description": response[kw_id].get("description", ""),
+                "keyword_importance": response[kw_id].get("importance"),
+            })
+    return updated_nodes
+
+
 async def curriculum_orchestrator_node(state: CreateCurriculumOverallState):
     """
     curriculum_orchestrator를 호출하여 curriculum의 상태를 진단하고 다음 task를 결정
     """
-    llm = get_solar_model(temperature=0.1) 
-    agent = CurriculumOrchestrator(llm)
+    agent = get_agent(
+        "curriculum_orchestrator",
+        lambda: CurriculumOrchestrator(get_routed_model(temperature=0.1)),
+    )
 
     # 에이전트 실행 
     result = await agent.run({
@@ -35,34 +170,73 @@ async def curriculum_orchestrator_node(state: CreateCurriculumOverallState):
     resource_reason_map = result.get("resource_reasoning", {})
 
 
-    updated_nodes = []
+    # 바뀐 노드만 delta로 전달 (리듀서는 None 값은 반영하지 않음)
+    changed_nodes = []
     for node in nodes:
-        new_node = node.copy() 
-        kid = new_node["keyword_id"]
-        
-        # sufficiency 업데이트
-        new_node["is_resource_sufficient"] = (kid not in insufficient_ids)
+        kid = node["keyword_id"]
+        is_sufficient = (kid not in insufficient_ids)
+        resource_reason = resource_reason_map.get(kid)
 
-        # resource_reason 업데이트
-        # 사전에 키가 있으면 이유를 넣고, 없으면 None을 넣음
-        new_node["resource_reason"] = resource_reason_map.get(kid)
-        
-        updated_nodes.append(new_node)
+        delta_node = {"keyword_id": kid}
+        if node.get("is_resource_sufficient") != is_sufficient:
+            delta_node["is_resource_sufficient"] = is_sufficient
+        if resource_reason is not None and node.get("resource_reason") != resource_reason:
+            delta_node["resource_reason"] = resource_reason
 
-    # 새로운 curriculum 객체 생성
-    updated_curriculum = {
-        **current_curriculum,
-        "nodes": updated_nodes
-    }
+        if len(delta_node) > 1:
+            changed_nodes.append(delta_node)
+
+    updated_curriculum = {"nodes": changed_nodes}
 
     current_count = state.get("current_iteration_count", 0)
+    tasks = result.get("tasks", [])
+
+    # 추측 확장: 첫 라운드에 백그라운드로 시작, 실제 키워드 판단이 나온 라운드에 채택/취소
+    speculation_update = {}
+    spec_id = state.get("speculation_id")
+    if (
+        spec_id is None
+        and current_count == 0
+        and not result.get("keyword_checked")
+        and speculative_expansion_enabled()
+    ):
+        speculation_update = {
+            "speculation_id": start_speculation(state, expand=concept_expansion_node),
+            "speculation": {"status": STATUS_RUNNING},
+        }
+    elif is_pending(spec_id) and result.get("keyword_checked"):
+        missing = result.get("missing_concepts", []) if "keyword_expansion" in tasks else []
+        delta, status = await resolve_speculation(spec_id, missing)
+        new_nodes = (delta or {}).get("nodes", [])
+        speculation_update = {"speculation": {"status": status, "new_nodes": len(new_nodes)}}
+        if status == STATUS_ADOPTED and new_nodes:
+            # 확장 라운드를 건너뛰고 새 노드의 설명/자료를 이번 라운드에 바로 채움
+            print(f"🔮 [Speculation] 추측 확장 채택: 새 노드 {len(new_nodes)}개")
+            updated_curriculum = {
+                "nodes": changed_nodes + new_nodes,
+                "edges": delta.get("edges", []),
+            }
+            tasks = [t for t in tasks if t != "keyword_expansion"]
+            for task in ("generate_description", "resource_search"):
+                if task not in tasks:
+                    tasks.append(task)
 
+    # 직전 라운드와 비교해 변화가 없으면 수렴 (라우터가 curriculum_compose로 보냄)
+    convergence = update_convergence(state, result, max_iterations=get_max_iterations())
+
+    # 리소스 충분성 판단 호출/토큰 통계를 커리큘럼 단위로 누적
+    resource_check_stats = dict(state.get("resource_check_stats") or {})
+    for key, value in (result.get("resource_check_stats") or {}).items():
+        resource_check_stats[key] = resource_check_stats.get(key, 0) + value
 
     # state 업데이트
     return {
         "curriculum": updated_curriculum,
+        **convergence,
+        "resource_check_stats": resource_check_stats,
+        **speculation_update,
 
-        "tasks": result.get("tasks", []),
+        "tasks": tasks,
         "is_keyword_sufficient": result.get("is_keyword_sufficient", True),
         "is_resource_sufficient": result.get("is_resource_sufficient", True),
         
@@ -81,15 +255,18 @@ async def resource_discovery_agent_node(state: CreateCurriculumOverallState):
     Resource Discovery Agent를 호출하여 웹 서치를 통해 자료를 탐색하고 자료를 평가
     """
 
-    llm_for_search = get_solar_model(temperature=0.7, reasoning_effort='low')
-    llm_for_eval = get_solar_model(temperature=0.1)
-
-    agent = ResourceDiscoveryAgent(
-        llm_discovery=llm_for_search, 
-        llm_estimation=llm_for_eval
+    agent = get_agent(
+        "resource_discovery",
+        lambda: ResourceDiscoveryAgent(
+            llm_discovery=get_routed_model(temperature=0.7, reasoning_effort='low'),
+            llm_estimation=get_routed_model(temperature=0.1),
+        ),
     )
 
-    estimation_agent = StudyLoadEstimationAgent(llm=llm_for_eval)
+    estimation_agent = get_agent(
+        "study_load_estimation",
+        lambda: StudyLoadEstimationAgent(llm=get_routed_model(temperature=0.1)),
+    )
 
     curriculum = state.get("curriculum", {})
     nodes_list = curriculum.get("nodes", [])
@@ -105,115 +282,20 @@ async def resource_discovery_agent_node(state: CreateCurriculumOverallState):
     })
 
     new_resources = result.get("evaluated_resources", [])
-    resources_to_estimate = []
 
     current_count = state.get("current_iteration_count", 0)
     if current_count <= 2:
-        estimation_inputs = []   # Agent에게 보낼 입력용
-        resources_to_update = [] # 실제 업데이트할 원본 객체 참조
-        
-        for node in nodes_list:
-            node_keyword = node.get("keyword", "")
-            existing_res = node.get("resources", [])
-            
-            for res in existing_res:
-                # 평가가 필요한지 검사 
-                if (res.get("difficulty") is None or 
-                    res.get("importance") is None or 
-                    res.get("study_load") is None):
-                    
-                    temp_input = res.copy()
-                    
-                    temp_input["keyword"] = node_keyword
-                    # resource_description을 raw_content로 매핑하여 에이전트가 읽을 수 있게 함
-                    temp_input["raw_content"] = res.get("resource_description", "")
-                    
-                    estimation_inputs.append(temp_input)
-                    resources_to_update.append(res) # 원본은 여기에 따로 저장
-
-        # 에이전트 실행 및 결과 반영
-        if estimation_inputs:
-            print(f"🔄 Re-estimating {len(estimation_inputs)} resources...")
-        
-            estimation_input_data = {
-                "resources": estimation_inputs, # 복사본 전달
-                "user_level": user_info.get("level"),
-                "purpose": user_info.get("purpose")
-            }
-
-            # 에이전트 실행
-            estimation_result = await estimation_agent.run(estimation_input_data)
-            evaluated_updates = estimation_result.get("evaluated_resources", [])
-
-            # 결과 반영 (원본 리스트 + 결과 리스트)
-            if len(resources_to_update) == len(evaluated_updates):
-                for original, updated in zip(resources_to_update, evaluated_updates):
-                    
-                    # Pydantic 모델인 경우 딕셔너리로 변환
-                    if hasattr(updated, 'dict'):
-                        updated_dict = updated.dict()
-                    else:
-                        updated_dict = updated
-
-                    if "difficulty" in updated_dict:
-                        original["difficulty"] = updated_dict["difficulty"]
-                    if "importance" in updated_dict:
-                        original["importance"] = updated_dict["importance"]
-                    if "study_load" in updated_dict:
-                        original["study_load"] = updated_dict["study_load"]
-                    if "type" in updated_dict:
-                        original["type"] = updated_dict["type"]
-            else:
-                print("⚠️ Warning: Estimation count mismatch. Updates might be inaccurate.")
+        await reestimate_existing_resources(nodes_list, user_info, estimation_agent)
 
-    resource_map = {}
     all_current_res_count = sum(len(n.get("resources", [])) for n in nodes_list)
+    resource_map = format_discovered_resources(new_resources, first_id_num=all_current_res_count + 1)
 
-    for i, res in enumerate(new_resources):
-        kid = res["keyword_id"]
-        if kid not in resource_map:
-            resource_map[kid] = []
-        
-        def get_value(data, key, default):
-            val = data.get(key)
-            return val if val is not None else default
-
-        res_id_num = all_current_res_count + i + 1
-        
-        try:
-            # None이 들어오면 바로 기본값(5)으로 치환 후 변환
-            difficulty = int(float(get_value(res, "difficulty", 5)))
-            importance = int(float(get_value(res, "importance", 5)))
-            study_load = float(get_value(res, "study_load", 1)) 
-        except (ValueError, TypeError):
-            difficulty, importance, study_load = 5, 5, 1
-
-
-        formatted_res = {
-            "resource_id": f"res-{res_id_num:03d}", # res-001 형태
-            "resource_name": res.get("resource_name"),
-            "url": res.get("url"),
-            "type": res.get("type", "web_doc"),
-            "resource_description": res.get("resource_description"),
-            "difficulty": difficulty,  
-            "importance": importance,  
-            "study_load": study_load,
-            "is_necessary": None                    
-        }
-        resource_map[kid].append(formatted_res)
-
-    updated_nodes = []
-    for node in nodes_list:
-        new_node = node.copy()
-        kid = node["keyword_id"]
-        
-        if kid in resource_map:
-            # 기존 리소스 유지 + 새 리소스 추가
-            current_res = new_node.get("resources", [])
-            new_node["resources"] = current_res + resource_map[kid]
-
-        updated_nodes.append(new_node)
-    
+    # 새 리소스가 생긴 노드만 delta로 전달 (리듀서가 resource_id 기준으로 병합)
+    updated_nodes = [
+        {"keyword_id": node["keyword_id"], "resources": resource_map[node["keyword_id"]]}
+        for node in nodes_list
+        if node["keyword_id"] in resource_map
+    ]
 
     # state 업데이트
     return {
@@ -225,8 +307,13 @@ async def curriculum_compose_node(state: CreateCurriculumOverallState):
     """
     Curriculum Compose Agent를 호출하여 커리큘럼 리소스를 최적화(삭제/보존/강조)
     """
-    llm = get_solar_model(temperature=0.1)
-    agent = CurriculumComposeAgent(llm)
+    # 끝까지 채택되지 않은 추측 확장은 정리
+    cancel_speculation(state.get("speculation_id"))
+
+    agent = get_agent(
+        "curriculum_compose",
+        lambda: CurriculumComposeAgent(get_solar_model(temperature=0.1)),
+    )
 
     curriculum = state.get("curriculum", {})
     user_info = state.get("user_info", {})
@@ -247,9 +334,10 @@ async def concept_expansion_node(state: CreateCurriculumOverallState):
     """
     Concept Expansion Agent를 호출하여 추가 키워드를 생성 및 연결
     """
-    llm = get_solar_model(model_name="solar-pro2", temperature=0.5)
-    
-    agent = ConceptExpansionAgent(llm)
+    agent = get_agent(
+        "concept_expansion",
+        lambda: ConceptExpansionAgent(get_solar_model(model_name="solar-pro2", temperature=0.5)),
+    )
     
     input: ConceptExpansionInput = {
         "curriculum": state["curriculum"],
@@ -266,9 +354,9 @@ async def concept_expansion_node(state: CreateCurriculumOverallState):
                  if n["keyword_id"] not in existing_node_ids]
     
     # 엣지도 새로운 연결만 추출 (ID 조합 등으로 체크)
-    existing_edge_keys = {f"{e['start']}->{e['end']}" for e in state["curriculum"].get("edges", [])}
+    existing_edge_keys = {(e["start"], e["end"]) for e in state["curriculum"].get("edges", [])}
     new_edges = [e for e in updated_full_curriculum.get("edges", []) 
-                 if f"{e['start']}->{e['end']}" not in existing_edge_keys]
+                 if (e["start"], e["end"]) not in existing_edge_keys]
     
     return {
         "curriculum": {"nodes": new_nodes, "edges": new_edges}
@@ -278,8 +366,10 @@ async def paper_concept_alignment_node(state: CreateCurriculumOverallState):
     """
     Paper Concept Alignment Agent를 호출하여 노드별 설명(description)을 생성 및 보강
     """
-    llm = get_solar_model(temperature=0.1)
-    agent = PaperConceptAlignmentAgent(llm)
+    agent = get_agent(
+        "paper_concept_alignment",
+        lambda: PaperConceptAlignmentAgent(get_solar_model(temperature=0.1)),
+    )
 
     curriculum = state.get("curriculum", {})
     paper_info = state.get("paper_content", {})
@@ -292,21 +382,8 @@ async def paper_concept_alignment_node(state: CreateCurriculumOverallState):
     result = await agent.run(agent_input)
     response = result.get("response", {})
 
-    # 커리큘럼 노드에 설명 업데이트
-    current_nodes = curriculum.get("nodes", [])
-    updated_nodes = []
-    
-    for node in current_nodes:
-        new_node = node.copy()
-        kw_id = new_node.get("keyword_id")
-        
-        # 새로 생성된 설명이 있으면 업데이트
-        if kw_id in response:
-            new_node["description"] = response[kw_id].get("description", "")
-            new_node["keyword_importance"] = response[kw_id].get("importance")
-            
-        updated_nodes.append(new_node)
-    
+    # 새로 생성된 설명이 있는 노드만 delta로 전달
+    updated_nodes = description_updates(curriculum.get("nodes", []), response)
 
     return {
         "curriculum": {"nodes": updated_nodes},
@@ -318,8 +395,10 @@ async def first_node_order_node(state: CreateCurriculumOverallState):
     """
     First Node Order Agent를 호출하여 시작 노드의 순서를 결정
     """
-    llm = get_solar_model(temperature=0.1)
-    agent = FirstNodeOrderAgent(llm)
+    agent = get_agent(
+        "first_node_order",
+        lambda: FirstNodeOrderAgent(get_routed_model(temperature=0.1)),
+    )
 
     curriculum = state.get("final_curriculum", {})
     paper_info = state.get("paper_content", {})
@@ -0,0 +1,173 @@
+"""
+추측(speculative) 개념 확장 (SPECULATIVE_EXPANSION=1, rounds 모드 전용)
+
+기본 흐름에서는 첫 라운드(설명 생성 + 자료 검색)가 끝난 뒤 orchestrator가 부족한 개념을 찾아야
+concept_expansion이 돌고, 새 노드는 다시 한 라운드를 더 기다려 설명/자료를 얻는다.
+
+추측 모드는 첫 orchestrator 라운드에서 백그라운드 작업을 시작한다.
+- 가벼운 LLM(reasoning_effort=low)으로 키워드 충분성을 먼저 판단하고, 부족하면 바로 확장까지 실행
+- 첫 라운드의 설명 생성/자료 검색과 겹쳐서 실행 (join 배리어를 막지 않음)
+- 이후 orchestrator가 실제로 키워드를 판단한 라운드에서
+  - 충분하다고 판단 -> 작업 취소/결과 폐기
+  - 부족하다고 판단하고 부족 개념이 겹침 -> 확장 결과를 그대로 반영하고
+    keyword_expansion 대신 새 노드의 설명 생성/자료 검색을 같은 라운드에 실행
+작업은 state에 넣지 않고 모듈 레지스트리에 두며 state에는 speculation_id만 저장한다.
+compose 전에 워크플로우가 실패/취소되어도 작업이 남지 않도록, 요청 단위로
+bind_speculation_scope() / reset_speculation_scope()를 감싸면 그 요청에서 시작한 작업을 모두 취소한다.
+"""
+
+import asyncio
+import os
+import uuid
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+
+from core.agents.agent_pool import get_agent
+from core.agents.curriculum_orchestrator import CurriculumOrchestrator
+from core.llm.solar_pro_2_llm import get_solar_model
+
+load_dotenv()
+
+STATUS_RUNNING = "running"
+STATUS_ADOPTED = "adopted"
+STATUS_CANCELLED = "cancelled"
+STATUS_EMPTY = "empty"          # 가벼운 판단에서 부족한 개념이 없었음
+STATUS_MISMATCH = "mismatch"    # 실제 판단과 부족 개념이 겹치지 않음
+STATUS_FAILED = "failed"
+
+# speculation_id -> 백그라운드 작업
+_SPECULATIONS: Dict[str, asyncio.Task] = {}
+# 현재 요청에서 시작한 speculation_id (요청 단위 정리용)
+_SCOPE: ContextVar[Optional[Set[str]]] = ContextVar("speculation_scope", default=None)
+
+
+def bind_speculation_scope() -> Token:
+    return _SCOPE.set(set())
+
+
+def reset_speculation_scope(token: Token) -> int:
+    """scope에서 시작한 작업 중 남아 있는 것을 모두 취소하고 scope 해제 (취소한 개수 반환)"""
+    spec_ids = _SCOPE.get() or set()
+    cancelled = sum(cancel_speculation(spec_id) for spec_id in list(spec_ids))
+    _SCOPE.reset(token)
+    if cancelled:
+        print(f"🔮 [Speculation] 요청 종료 -> 남은 추측 작업 {cancelled}개 취소")
+    return cancelled
+
+
+def speculative_expansion_enabled() -> bool:
+    return os.getenv("SPECULATIVE_EXPANSION", "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+async def cheap_keyword_check(state: Dict[str, Any]) -> Tuple[List[str], str]:
+    """가벼운 LLM으로 키워드 충분성 판단 -> (부족 개념 id 목록, 판단 근거)"""
+    agent = get_agent(
+        "speculation_keyword_check",
+        lambda: CurriculumOrchestrator(get_solar_model(temperature=0.1, reasoning_effort="low")),
+    )
+    curriculum = state["curriculum"]
+    user_info = state.get("user_info", {})
+
+    decision = await agent.check_keyword_sufficiency(
+        state["paper_content"],
+        curriculum,
+        user_info.get("level", "unknown"),
+        user_info.get("purpose", "simple_study"),
+    )
+    missing = agent.filter_missing_concepts(
+        decision, curriculum.get("nodes", []), curriculum["graph_meta"]["paper_id"]
+    )
+    return missing, decision.get("reasoning", "")
+
+
+async def _speculate(
+    state: Dict[str, Any],
+    expand: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    check: Callable[[Dict[str, Any]], Awaitable[Tuple[List[str], str]]],
+) -> Optional[Dict[str, Any]]:
+    missing, reasoning = await check(state)
+    if not missing:
+        print("🔮 [Speculation] 가벼운 키워드 판단: 부족한 개념 없음 -> 확장 생략")
+        return None
+
+    print(f"🔮 [Speculation] 부족 개념 {missing} -> 확장을 미리 실행")
+    update = await expand({
+        "curriculum": state["curriculum"],
+        "keyword_expand_reason": reasoning,
+        "missing_concepts": missing,
+        "user_info": state.get("user_info", {}),
+    })
+    return {"missing_concepts": missing, "curriculum": update.get("curriculum", {})}
+
+
+def start_speculation(
+    state: Dict[str, Any],
+    expand: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    check: Optional[Callable[[Dict[str, Any]], Awaitable[Tuple[List[str], str]]]] = None,
+) -> str:
+    """
+    백그라운드로 가벼운 키워드 판단 + 확장을 시작하고 speculation_id 반환
+    - expand: concept_expansion_node와 같은 형태 (state -> {"curriculum": delta})
+    - check: 기본값 cheap_keyword_check
+    - 현재 컨텍스트(키 슬롯, 요청 예산)를 그대로 물려받음
+    """
+    spec_id = uuid.uuid4().hex
+    _SPECULATIONS[spec_id] = asyncio.create_task(
+        _speculate(dict(state), expand, check or cheap_keyword_check)
+    )
+    scope = _SCOPE.get()
+    if scope is not None:
+        scope.add(spec_id)
+    return spec_id
+
+
+def is_pending(spec_id: Optional[str]) -> bool:
+    return spec_id is not None and spec_id in _SPECULATIONS
+
+
+def cancel_speculation(spec_id: Optional[str]) -> bool:
+    """진행 중인 추측 작업 취소 (없으면 False)"""
+    task = _SPECULATIONS.pop(spec_id, None) if spec_id else None
+    if task is None:
+        return False
+    task.cancel()
+    return True
+
+
+async def resolve_speculation(
+    spec_id: Optional[str],
+    missing_concepts: List[str],
+) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    orchestrator가 실제로 키워드를 판단한 뒤 호출
+    - missing_concepts: 실제 판단의 부족 개념 (비어 있으면 충분 -> 취소)
+    반환: (반영할 curriculum delta 또는 None, 상태)
+    """
+    if not missing_concepts:
+        cancel_speculation(spec_id)
+        print("🔮 [Speculation] 키워드 충분 -> 추측 확장 취소")
+        return None, STATUS_CANCELLED
+
+    task = _SPECULATIONS.pop(spec_id, None) if spec_id else None
+    if task is None:
+        return None, STATUS_FAILED
+
+    try:
+        outcome = await task
+    except asyncio.CancelledError:
+        return None, STATUS_CANCELLED
+    except Exception as e:
+        print(f"❌ [Speculation] 추측 확장 실패: {e}")
+        return None, STATUS_FAILED
+
+    if outcome is None:
+        return None, STATUS_EMPTY
+    if not set(outcome["missing_concepts"]) & set(missing_concepts):
+        print(
+            f"🔮 [Speculation] 부족 개념 불일치 (추측 {outcome['missing_concepts']} / 실제 {missing_concepts}) "
+            "-> 결과 폐기"
+        )
+        return None, STATUS_MISMATCH
+    return outcome["curriculum"], STATUS_ADOPTED
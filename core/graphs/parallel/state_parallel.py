@@ -1,13 +1,168 @@
 import operator
-from typing import Annotated, Any, Dict, List, TypedDict
+from typing import Annotated, Any, Dict, List, Optional, TypedDict
 from core.contracts.types.curriculum import CurriculumGraph
 from core.contracts.types.paper_info import PaperInfo
 from core.contracts.types.user_info import UserInfo
 
+
 # 리듀서 정의
+class IndexedCurriculum(dict):
+    """
+    CurriculumGraph dict에 리듀서용 인덱스를 붙인 형태 (JSON 직렬화 결과는 일반 dict와 동일)
+
+    - _node_pos: keyword_id -> nodes 리스트 위치
+    - _edge_keys: (start, end) 집합
+    리듀서가 새 상태를 만들 때 인덱스를 새 상태로 넘겨주고(이전 상태에서는 떼어냄)
+    변경분만 반영하므로 전체 노드/엣지를 다시 훑지 않는다.
+    인덱스가 없는 일반 dict가 들어오면 한 번만 새로 만든다.
+    """
+
+    __slots__ = ("_node_pos", "_edge_keys")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._node_pos = None
+        self._edge_keys = None
+
+    def take_index(self):
+        """인덱스를 꺼내고 이 객체에서는 제거 (이후 이 객체를 다시 병합하면 재생성)"""
+        node_pos, edge_keys = self._node_pos, self._edge_keys
+        self._node_pos = self._edge_keys = None
+        return node_pos, edge_keys
+
+
+def _build_index(curriculum):
+    node_pos = {n["keyword_id"]: i for i, n in enumerate(curriculum.get("nodes", []))}
+    edge_keys = {(e["start"], e["end"]) for e in curriculum.get("edges", [])}
+    return node_pos, edge_keys
+
+
+def _take_or_build_index(curriculum):
+    if isinstance(curriculum, IndexedCurriculum):
+        node_pos, edge_keys = curriculum.take_index()
+        if node_pos is not None and edge_keys is not None:
+            return node_pos, edge_keys
+    return _build_index(curriculum)
+
+
+def _is_sorted_by_id(resources) -> bool:
+    return all(
+        resources[i].get("resource_id", "") <= resources[i + 1].get("resource_id", "")
+        for i in range(len(resources) - 1)
+    )
+
+
+def _merge_resources(current_list, new_list):
+    """
+    Resource ID 기준 중복 제거/병합 (ID가 같으면 최신 정보로 덮어씀, ID 없는 자료는 제외)
+    결과가 기존 리스트와 같으면 기존 리스트 객체를 그대로 돌려준다.
+    """
+    res_dict = {r["resource_id"]: r for r in current_list if r.get("resource_id")}
+    changed = len(res_dict) != len(current_list)
+
+    for res in new_list:
+        rid = res.get("resource_id")
+        if not rid:
+            continue
+        prev = res_dict.get(rid)
+        if prev is None or (prev is not res and prev != res):
+            changed = True
+        res_dict[rid] = res
+
+    if not changed and _is_sorted_by_id(current_list):
+        return current_list
+
+    merged_resources = list(res_dict.values())
+    if not _is_sorted_by_id(merged_resources):
+        merged_resources.sort(key=lambda x: x.get("resource_id", ""))
+    return merged_resources
+
+
+def _merge_node(current, d_node):
+    """변경된 필드가 있을 때만 노드를 복사, 없으면 None"""
+    updated = None
+    for key, val in d_node.items():
+        if val is None or val == "":
+            continue
+
+        if key == "resources":
+            current_list = current.get("resources", [])
+            val = _merge_resources(current_list, val)
+            if val is current_list and "resources" in current:
+                continue
+        elif key in current and (current[key] is val or current[key] == val):
+            continue
+
+        if updated is None:
+            updated = current.copy()
+        updated[key] = val
+    return updated
+
+
 def merge_curriculum(existing: CurriculumGraph, delta: CurriculumGraph) -> CurriculumGraph:
     """
     병렬 노드들의 결과를 합쳐주는 리듀서
+
+    delta에는 바뀐 노드/새 엣지만 담으면 된다.
+    - 바뀐 노드만 복사, 나머지 노드/자료 리스트는 기존 객체를 공유
+    - keyword_id 위치 인덱스와 (start, end) 엣지 집합은 상태 간에 넘겨받아 재사용
+    결과는 merge_curriculum_reference와 같다 (delta 내부의 중복 엣지는 한 번만 추가).
+    """
+    node_pos, edge_keys = _take_or_build_index(existing)
+
+    # 노드 정보 병합
+    existing_nodes = existing.get("nodes", [])
+    nodes = existing_nodes
+    for d_node in delta.get("nodes", []):
+        kid = d_node["keyword_id"]
+        pos = node_pos.get(kid)
+        if pos is not None:
+            # 기존 노드 업데이트 (바뀐 경우에만 복사)
+            updated = _merge_node(nodes[pos], d_node)
+            if updated is None:
+                continue
+            if nodes is existing_nodes:
+                nodes = list(existing_nodes)
+            nodes[pos] = updated
+        else:
+            if nodes is existing_nodes:
+                nodes = list(existing_nodes)
+            node_pos[kid] = len(nodes)
+            nodes.append(d_node)
+
+    # 엣지 병합
+    existing_edges = existing.get("edges", [])
+    edges = existing_edges
+    for n_edge in delta.get("edges", []):
+        key = (n_edge["start"], n_edge["end"])
+        if key in edge_keys:
+            continue
+        if edges is existing_edges:
+            edges = list(existing_edges)
+        edge_keys.add(key)
+        edges.append(n_edge)
+
+    preserved_meta = delta.get("graph_meta") or existing.get("graph_meta") or {}
+
+    new_first_node_order = delta.get("first_node_order")
+    if new_first_node_order is None:
+        new_first_node_order = existing.get("first_node_order")
+
+    merged = IndexedCurriculum(
+        graph_meta=preserved_meta,
+        first_node_order=new_first_node_order,
+        nodes=nodes,
+        edges=edges,
+    )
+    merged._node_pos = node_pos
+    merged._edge_keys = edge_keys
+    return merged
+
+
+## 전체 복사 기반 참조 구현 (델타 리듀서 검증/벤치마크용)
+def merge_curriculum_reference(existing: CurriculumGraph, delta: CurriculumGraph) -> CurriculumGraph:
+    """
+    병렬 노드들의 결과를 합쳐주는 리듀서
     """
     # 기존 노드 맵핑
     node_map = {n["keyword_id"]: n.copy() for n in existing.get("nodes", [])}
@@ -94,4 +249,21 @@ class CreateCurriculumOverallState(CreateCurriculumInputState, CreateCurriculmOu
     insufficient_resource_ids: List[str] 
     missing_concepts: List[str]          
     keyword_reasoning:str
-    resource_reasoning:Dict[str, str]    
+    resource_reasoning:Dict[str, str]
+
+    # 수렴 판정 (core/graphs/parallel/convergence.py)
+    progress_signature: List[int]             # 노드/엣지/리소스/설명 수
+    insufficiency_signature: List[List[str]]  # 부족 리소스 id, 부족 개념 id, task 목록
+    stalled_rounds: int                       # 연속으로 변화가 없던 라운드 수
+    converged: bool                           # 수렴 -> curriculum_compose로 조기 종료
+    rounds_saved: int                         # 조기 종료로 생략한 orchestrator 라운드 수    
+
+    # dataflow 스케줄러 모드 실행 통계 (작업 종류별 실행/실패 수, 최대 동시 실행 수 등)
+    scheduler_stats: Dict[str, Any]
+
+    # orchestrator 리소스 충분성 판단 누적 통계 (batch/단일 호출 수, 절약한 호출/토큰 추정)
+    resource_check_stats: Dict[str, int]
+
+    # 추측 확장 (core/graphs/parallel/speculation.py)
+    speculation_id: Optional[str]             # 진행 중인 백그라운드 작업 id
+    speculation: Dict[str, Any]               # 상태(running/adopted/cancelled/...)와 채택한 새 노드 수
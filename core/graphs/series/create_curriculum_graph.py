@@ -7,6 +7,7 @@ from typing import Literal, Dict, Any
 from langgraph.graph import StateGraph, START, END
 
 from core.graphs.subgraph_to_curriculum import transform_subgraph_to_final_curriculum
+from core.utils.budget import get_max_iterations
 from core.graphs.series.nodes import (
     curriculum_orchestrator_node, 
     resource_discovery_agent_node,
@@ -77,7 +78,7 @@ def orchestrator_router(state: CreateCurriculumOverallState) -> Literal["resourc
     tasks = state.get("tasks", [])
     
     current_count = state.get("current_iteration_count", 0)
-    MAX_ITERATIONS = 6
+    max_iterations = get_max_iterations()
 
 
     if not tasks: 
@@ -90,7 +91,7 @@ def orchestrator_router(state: CreateCurriculumOverallState) -> Literal["resourc
         print("🏁 최종 단계(Compose)로 이동합니다.")
         return "curriculum_compose"
 
-    if current_count >= MAX_ITERATIONS:
+    if current_count >= max_iterations:
         print("⚠️ 반복 횟수 초과. 종료합니다.")
         return "curriculum_compose" 
 
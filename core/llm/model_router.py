@@ -0,0 +1,254 @@
+# core/llm/model_router.py
+"""
+chain tag 기반 모델 라우팅
+
+호출 config의 tags(예: "orch-res-check")로 모델 tier를 고르고,
+light tier 응답이 쓸 수 없으면 strong tier로 한 번 더 호출(escalation)한다.
+- tier: light(기본 solar-mini, reasoning_effort 없음) / strong(기본 solar-pro2, 원래 설정)
+- 라우팅 표: DEFAULT_ROUTES + 환경 변수 MODEL_ROUTES ("tag=tier,tag=tier")로 덮어쓰기
+- escalation 조건: light 호출 예외, 응답에서 JSON을 못 찾음, tag별 검증(ROUTE_VALIDATORS) 실패
+  (light 모델이 형식을 못 지키거나 판단 값을 비워 둔 경우를 "낮은 신뢰도"로 취급)
+- MODEL_ROUTING=0 이면 항상 strong tier만 사용
+- RoutedChatModel은 Runnable이므로 기존처럼 `PROMPT | llm`, `llm.bind(...)` 그대로 사용
+"""
+
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from dotenv import load_dotenv
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from core.llm.solar_pro_2_llm import get_assigned_key_slot, get_solar_model
+from core.utils.json_extract import extract_json
+
+load_dotenv()
+
+TIER_LIGHT = "light"
+TIER_STRONG = "strong"
+
+# 분류/평가처럼 호출 수가 많고 짧은 판단은 light, 나머지(생성)는 strong
+DEFAULT_ROUTES: Dict[str, str] = {
+    "orch-res-check": TIER_LIGHT,
+    "orch-res-batch-check": TIER_LIGHT,
+    "load-estimation-batch": TIER_LIGHT,
+    "rs-discovery-querygen": TIER_LIGHT,
+    "first-node-order": TIER_LIGHT,
+}
+
+
+def model_routing_enabled() -> bool:
+    return os.getenv("MODEL_ROUTING", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def light_model_name() -> str:
+    return os.getenv("MODEL_TIER_LIGHT", "solar-mini").strip() or "solar-mini"
+
+
+def load_routes(raw: Optional[str] = None) -> Dict[str, str]:
+    """DEFAULT_ROUTES에 MODEL_ROUTES("tag=tier,...")를 덮어쓴 라우팅 표"""
+    routes = dict(DEFAULT_ROUTES)
+    raw = os.getenv("MODEL_ROUTES", "") if raw is None else raw
+    for item in raw.split(","):
+        tag, sep, tier = item.partition("=")
+        tag, tier = tag.strip(), tier.strip().lower()
+        if sep and tag and tier in (TIER_LIGHT, TIER_STRONG):
+            routes[tag] = tier
+    return routes
+
+
+def _items(value: Any) -> Any:
+    # structured 모드에서는 list 응답이 {"items": [...]}로 감싸져 옴
+    if isinstance(value, dict) and isinstance(value.get("items"), list):
+        return value["items"]
+    return value
+
+
+def _is_decision(item: Any) -> bool:
+    return isinstance(item, dict) and isinstance(item.get("is_resource_sufficient"), bool)
+
+
+def _valid_resource_check(text: str) -> bool:
+    return _is_decision(extract_json(text, expect=dict))
+
+
+def _valid_resource_batch(text: str) -> bool:
+    items = _items(extract_json(text))
+    return isinstance(items, list) and bool(items) and all(_is_decision(x) for x in items)
+
+
+def _valid_estimation(text: str) -> bool:
+    items = _items(extract_json(text))
+    return isinstance(items, list) and any(isinstance(x, dict) and x.get("url") for x in items)
+
+
+def _valid_query(text: str) -> bool:
+    data = extract_json(text, expect=dict)
+    return isinstance(data, dict) and isinstance(data.get("query"), str) and bool(data["query"].strip())
+
+
+def _valid_first_node_order(text: str) -> bool:
+    data = extract_json(text, expect=dict)
+    return isinstance(data, dict) and isinstance(data.get("results"), list)
+
+
+# tag -> light 응답 검증 (없으면 JSON 추출 가능 여부만 확인)
+ROUTE_VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    "orch-res-check": _valid_resource_check,
+    "orch-res-batch-check": _valid_resource_batch,
+    "load-estimation-batch": _valid_estimation,
+    "rs-discovery-querygen": _valid_query,
+    "first-node-order": _valid_first_node_order,
+}
+
+
+class RoutingMetrics:
+    """tag별 tier 호출 수와 escalation 집계 (프로세스 누적)"""
+
+    _FIELDS = ("light_calls", "strong_calls", "escalations", "light_errors")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(self._FIELDS, 0))
+
+    def record(self, tag: str, **increments: int) -> None:
+        with self._lock:
+            counts = self._counts[tag]
+            for field, n in increments.items():
+                counts[field] += n
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            out = {}
+            for tag, counts in sorted(self._counts.items()):
+                row = dict(counts)
+                row["escalation_rate"] = (
+                    round(row["escalations"] / row["light_calls"], 4) if row["light_calls"] else 0.0
+                )
+                out[tag] = row
+            return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+routing_metrics = RoutingMetrics()
+
+
+class RoutedChatModel(Runnable[Any, BaseMessage]):
+    """
+    tag로 tier를 골라 호출하는 chat model 래퍼
+    - strong: 원래 쓰던 모델 (get_solar_model로 만든 것)
+    - light: 처음 필요할 때 light_factory()로 생성
+    - bind()로 붙인 kwargs(response_format 등)는 두 tier 모두에 그대로 전달
+    """
+
+    def __init__(
+        self,
+        strong,
+        light_factory: Callable[[], Any],
+        routes: Optional[Dict[str, str]] = None,
+        validators: Optional[Dict[str, Callable[[str], bool]]] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.strong = strong
+        self._light_factory = light_factory
+        self._light = None
+        self.routes = load_routes() if routes is None else routes
+        self.validators = ROUTE_VALIDATORS if validators is None else validators
+        self.enabled = model_routing_enabled() if enabled is None else enabled
+
+    @property
+    def light(self):
+        if self._light is None:
+            self._light = self._light_factory()
+        return self._light
+
+    def route(self, tags: Sequence[str]) -> tuple:
+        """(라우팅에 쓴 tag, tier) - 라우팅 표에 없는 tag면 strong"""
+        if self.enabled:
+            for tag in tags or ():
+                if self.routes.get(tag) == TIER_LIGHT:
+                    return tag, TIER_LIGHT
+        tag = next(iter(tags or ()), "untagged")
+        return tag, TIER_STRONG
+
+    def _usable(self, tag: str, response: Any) -> bool:
+        text = getattr(response, "content", None)
+        if not isinstance(text, str) or not text.strip():
+            return False
+        validator = self.validators.get(tag)
+        if validator is not None:
+            return validator(text)
+        return extract_json(text) is not None
+
+    def invoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> BaseMessage:
+        tag, tier = self.route((config or {}).get("tags", []))
+        if tier == TIER_LIGHT:
+            try:
+                response = self.light.invoke(input, config=config, **kwargs)
+            except Exception as e:
+                print(f"⚠️ [ModelRouter] {tag} light 호출 실패 -> strong: {e}")
+                routing_metrics.record(tag, light_calls=1, light_errors=1, escalations=1, strong_calls=1)
+                return self.strong.invoke(input, config=config, **kwargs)
+            if self._usable(tag, response):
+                routing_metrics.record(tag, light_calls=1)
+                return response
+            print(f"⚠️ [ModelRouter] {tag} light 응답을 쓸 수 없음 -> strong으로 재호출")
+            routing_metrics.record(tag, light_calls=1, escalations=1, strong_calls=1)
+            return self.strong.invoke(input, config=config, **kwargs)
+
+        routing_metrics.record(tag, strong_calls=1)
+        return self.strong.invoke(input, config=config, **kwargs)
+
+    async def ainvoke(self, input: Any, config: Optional[RunnableConfig] = None, **kwargs: Any) -> BaseMessage:
+        tag, tier = self.route((config or {}).get("tags", []))
+        if tier == TIER_LIGHT:
+            try:
+                response = await self.light.ainvoke(input, config=config, **kwargs)
+            except Exception as e:
+                print(f"⚠️ [ModelRouter] {tag} light 호출 실패 -> strong: {e}")
+                routing_metrics.record(tag, light_calls=1, light_errors=1, escalations=1, strong_calls=1)
+                return await self.strong.ainvoke(input, config=config, **kwargs)
+            if self._usable(tag, response):
+                routing_metrics.record(tag, light_calls=1)
+                return response
+            print(f"⚠️ [ModelRouter] {tag} light 응답을 쓸 수 없음 -> strong으로 재호출")
+            routing_metrics.record(tag, light_calls=1, escalations=1, strong_calls=1)
+            return await self.strong.ainvoke(input, config=config, **kwargs)
+
+        routing_metrics.record(tag, strong_calls=1)
+        return await self.strong.ainvoke(input, config=config, **kwargs)
+
+
+def get_routed_model(
+    model_name: str = "solar-pro2",
+    temperature: float = 0.7,
+    reasoning_effort: str = "medium",
+    assigned_key_slot: Optional[int] = None,
+) -> RoutedChatModel:
+    """
+    get_solar_model과 같은 인자로 strong tier를 만들고, light tier는 같은 temperature/키 슬롯의
+    MODEL_TIER_LIGHT 모델 (reasoning_effort 미지원 모델이므로 None)
+    """
+    # light는 처음 필요할 때 만들어지므로 키 슬롯을 지금 고정
+    if assigned_key_slot is None:
+        assigned_key_slot = get_assigned_key_slot()
+    strong = get_solar_model(
+        model_name=model_name,
+        temperature=temperature,
+        reasoning_effort=reasoning_effort,
+        assigned_key_slot=assigned_key_slot,
+    )
+    return RoutedChatModel(
+        strong=strong,
+        light_factory=lambda: get_solar_model(
+            model_name=light_model_name(),
+            temperature=temperature,
+            reasoning_effort=None,
+            assigned_key_slot=assigned_key_slot,
+        ),
+    )
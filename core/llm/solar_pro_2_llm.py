@@ -6,8 +6,13 @@ from typing import Mapping, Optional
 from dotenv import load_dotenv
 from langchain_upstage import ChatUpstage
 
+from core.utils.budget import budget_callback
+
 load_dotenv()
 
+# 환경 변수 UPSTAGE_API_KEY_{n} 으로 제공되는 키 슬롯 번호
+UPSTAGE_KEY_SLOTS = (1, 2, 3, 4, 5)
+
 _ASSIGNED_KEY_SLOT: ContextVar[Optional[int]] = ContextVar(
     "assigned_key_slot",
     default=None,
@@ -20,7 +25,7 @@ def resolve_upstage_api_key(
     """Resolve key by assigned slot, fallback to default key."""
 
     source = env or os.environ
-    if assigned_key_slot is not None and 1 <= assigned_key_slot <= 5:
+    if assigned_key_slot in UPSTAGE_KEY_SLOTS:
         slot_key = source.get(f"UPSTAGE_API_KEY_{assigned_key_slot}")
         if slot_key:
             return slot_key
@@ -50,6 +55,12 @@ def reset_assigned_key_slot(token: Token) -> None:
     _ASSIGNED_KEY_SLOT.reset(token)
 
 
+def get_assigned_key_slot() -> Optional[int]:
+    """Return slot bound to current context (None if unbound)."""
+
+    return _ASSIGNED_KEY_SLOT.get()
+
+
 def get_solar_model(
     model_name: str = "solar-pro2",
     temperature: float = 0.7,
@@ -65,5 +76,7 @@ def get_solar_model(
         model=model_name,
         temperature=temperature,
         upstage_api_key=api_key,
-        reasoning_effort=reasoning_effort
+        reasoning_effort=reasoning_effort,
+        # 요청 예산(LLM 호출/토큰) 집계
+        callbacks=[budget_callback],
     )
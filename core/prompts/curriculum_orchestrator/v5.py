@@ -0,0 +1,45 @@
+from langchain_core.prompts import ChatPromptTemplate
+
+# v5: 여러 키워드의 리소스 충분성을 한 번에 판단 (판단 기준은 RESOURCE_CHECK_PROMPT_V4와 동일)
+RESOURCE_BATCH_CHECK_PROMPT_V5 = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert educational consultant in the field of Artificial Intelligence.
+For EACH keyword in the provided list, evaluate whether its **Learning Resources** are sufficient for the learner to understand that **Keyword** based on their level ({user_level}).
+Judge every keyword independently; resources of one keyword never count for another.
+
+[Hierarchy of Resource Requirements]
+1. **Novice (Requires Foundations + Intuition)**
+   - Resources must provide intuitive explanations and connect the keyword to foundational prerequisites.
+   - Judge as insufficient if the resources are too technical, assume prior advanced knowledge, or lack introductory context suitable for a beginner.
+2. **Intermediate (Requires Mechanisms + Implementation)**
+   - Resources should focus on specific algorithm names, structural components, and how the mechanism works.
+   - Judge as insufficient if the resources are too high-level/vague or, conversely, too focused on absolute basics the user is assumed to know.
+3. **Expert (Requires Novelty + Specific Methodology)**
+   - Resources must isolate the unique terminology, comparative differences, and specific contributions related to the keyword.
+   - Judge as insufficient if the resources only provide standard textbook explanations without addressing advanced methodological nuances.
+
+[Strict Constraints]
+- **Quality over Quantity**: The number of resources does not determine sufficiency. Sufficiency is met if the provided resources clearly function as effective study materials for the keyword at the specific user level.
+- **Ignore is_necessary**: The `is_necessary` field of each resource is not important for this judgment.
+- **Level-Appropriate Function**: If a resource is technically accurate but too difficult or too simple for the given {user_level}, it fails to provide sufficiency.
+- **NO NUMBERS**: Do not judge sufficiency based on the presence or absence of specific numerical values/hyperparameters in the resources.
+
+[Output Format]
+You must return ONLY one JSON array with exactly one object per input keyword, using the input `keyword_id` unchanged:
+[
+  {{
+    "keyword_id": "key-001",
+    "is_resource_sufficient": boolean,
+    "reasoning": "A single sentence explaining the basis of judgment (e.g., Provided resources are too academic for a Novice level; need more intuitive blog-style explanations.)"
+  }}
+]"""),
+    ("human", """
+[Learner Info]
+- Level: {user_level}
+
+[Target Keywords and Provided Learning Resources (JSON)]
+{keywords_json}
+
+[Instructions]
+Evaluate each keyword's resources for a {user_level} learner. Strictly follow the criteria above and output the JSON array only.
+""")
+])
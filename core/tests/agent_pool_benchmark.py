@@ -0,0 +1,73 @@
+# python -m core.tests.agent_pool_benchmark
+#
+# 노드 실행마다 agent를 새로 만드는 비용(ChatUpstage + 프롬프트 체인 + agent 생성)과
+# agent_pool에서 재사용하는 비용을 비교한다. (생성만 측정, LLM 호출 없음)
+# - per_call: 기존 방식, 라운드마다 노드별 agent 생성
+# - pooled  : get_agent()로 (이름, 키 슬롯)마다 한 번만 생성
+
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("UPSTAGE_API_KEY", "benchmark-dummy-key")
+
+from core.agents.agent_pool import AgentPool
+from core.agents.concept_expansion_agent import ConceptExpansionAgent
+from core.agents.curriculum_compose_agent import CurriculumComposeAgent
+from core.agents.curriculum_orchestrator import CurriculumOrchestrator
+from core.agents.paper_concept_alignment_agent import PaperConceptAlignmentAgent
+from core.agents.resource_discovery_agent import ResourceDiscoveryAgent
+from core.agents.study_load_estimation_agent import StudyLoadEstimationAgent
+from core.llm.solar_pro_2_llm import get_solar_model
+
+ROUNDS = 6          # orchestrator 루프 1회 = 한 라운드
+REQUESTS = 3
+REPEAT = 2
+
+# 한 라운드에서 실행되는 노드와 그 agent 생성 함수 (nodes_parallel과 같은 설정)
+ROUND_BUILDERS = {
+    "curriculum_orchestrator": lambda: CurriculumOrchestrator(get_solar_model(temperature=0.1)),
+    "resource_discovery": lambda: ResourceDiscoveryAgent(
+        llm_discovery=get_solar_model(temperature=0.7, reasoning_effort="low"),
+        llm_estimation=get_solar_model(temperature=0.1),
+    ),
+    "study_load_estimation": lambda: StudyLoadEstimationAgent(llm=get_solar_model(temperature=0.1)),
+    "paper_concept_alignment": lambda: PaperConceptAlignmentAgent(get_solar_model(temperature=0.1)),
+    "concept_expansion": lambda: ConceptExpansionAgent(get_solar_model(model_name="solar-pro2", temperature=0.5)),
+}
+FINAL_BUILDERS = {
+    "curriculum_compose": lambda: CurriculumComposeAgent(get_solar_model(temperature=0.1)),
+}
+
+
+def run_requests(get) -> float:
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        for _ in range(ROUNDS):
+            for name, build in ROUND_BUILDERS.items():
+                get(name, build)
+        for name, build in FINAL_BUILDERS.items():
+            get(name, build)
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    per_call, pooled = [], []
+    for _ in range(REPEAT):
+        per_call.append(run_requests(lambda name, build: build()))
+        pool = AgentPool()
+        pooled.append(run_requests(pool.get))
+
+    calls = REQUESTS * (ROUNDS * len(ROUND_BUILDERS) + len(FINAL_BUILDERS))
+    for name, times in (("per_call", per_call), ("pooled", pooled)):
+        best = min(times)
+        print(
+            f"{name:<9} total={best * 1000:8.1f}ms  per_node_call={best / calls * 1e6:8.1f}us "
+            f"(median of {REPEAT}: {statistics.median(times) * 1000:.1f}ms)"
+        )
+    print(f"pool stats (마지막 반복): {pool.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+# python -m core.tests.concept_expansion_benchmark
+#
+# ConceptExpansionAgent의 tool 루프 지연시간을 비교한다. (LLM/검색은 지연시간만 흉내내는 가짜)
+# - legacy : create_agent(ReAct) 루프, LLM이 그만둘 때까지 검색, 캐시 없음
+# - bounded: ConceptExpansionAgent._run_tool_loop, 검색 횟수/단계 상한 + 같은 단계 검색 병렬 + search_cache
+# 시나리오마다 LLM이 요청하는 검색 단계 수/쿼리는 seed로 고정되고, 쿼리는 작은 어휘에서 뽑아 중복이 생긴다.
+
+import asyncio
+import random
+import statistics
+import time
+from typing import Any, List
+
+from langchain.agents import create_agent
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import tool
+
+from core.agents.concept_expansion_agent import ConceptExpansionAgent
+from core.tools.search_cache import SearchCache, make_search_cache_key
+
+SCENARIOS = 30
+LLM_LATENCY_SEC = 0.05
+SEARCH_LATENCY_SEC = 0.08
+QUERY_VOCAB = [f"concept {i}" for i in range(12)]
+FINAL = '{"expanded_graph": {"nodes": [], "edges": []}}'
+
+
+class ScriptedChatModel(BaseChatModel):
+    """AIMessage 수(=진행한 단계)에 따라 정해진 tool call 또는 최종 답변을 반환"""
+
+    script: List[List[str]]
+    latency: float = LLM_LATENCY_SEC
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-benchmark"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _reply(self, messages: List[BaseMessage]) -> AIMessage:
+        step = sum(isinstance(m, AIMessage) for m in messages)
+        if step >= len(self.script) or (step and isinstance(messages[-1], HumanMessage)):
+            return AIMessage(content=FINAL)
+        return AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "web_search", "args": {"query": q}, "id": f"call-{step}-{i}"}
+                for i, q in enumerate(self.script[step])
+            ],
+        )
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+
+@tool
+async def web_search(query: str) -> List[Any]:
+    """Search the web."""
+    await asyncio.sleep(SEARCH_LATENCY_SEC)
+    return [{"title": query}]
+
+
+def make_script(rng: random.Random) -> List[List[str]]:
+    return [rng.sample(QUERY_VOCAB, rng.randint(1, 3)) for _ in range(rng.randint(2, 7))]
+
+
+async def run_legacy(script) -> int:
+    agent = create_agent(model=ScriptedChatModel(script=script), tools=[web_search])
+    await agent.ainvoke({"messages": [HumanMessage(content="expand")]})
+    return sum(len(step) for step in script)
+
+
+async def run_bounded(script, cache: SearchCache) -> int:
+    fetched = []
+
+    async def cached_search(query: str, max_results: int):
+        async def fetch():
+            fetched.append(query)
+            return await web_search.ainvoke({"query": query})
+        return await cache.get_or_fetch(make_search_cache_key("bench", query, max_results=max_results), fetch)
+
+    agent = ConceptExpansionAgent(ScriptedChatModel(script=script), search=cached_search)
+    await agent._run_tool_loop([HumanMessage(content="expand")], config={})
+    return len(fetched)
+
+
+def summarize(name: str, latencies: List[float], searches: List[int]) -> None:
+    q = statistics.quantiles(latencies, n=20)
+    print(
+        f"{name:<8} p50={statistics.median(latencies) * 1000:7.1f}ms "
+        f"p95={q[18] * 1000:7.1f}ms max={max(latencies) * 1000:7.1f}ms "
+        f"avg_searches={statistics.mean(searches):.2f}"
+    )
+
+
+async def main(seed: int = 0) -> None:
+    rng = random.Random(seed)
+    scripts = [make_script(rng) for _ in range(SCENARIOS)]
+    cache = SearchCache()
+    results = {"legacy": ([], []), "bounded": ([], [])}
+
+    for script in scripts:
+        for name in results:
+            started = time.perf_counter()
+            if name == "legacy":
+                n = await run_legacy(script)
+            else:
+                n = await run_bounded(script, cache)
+            results[name][0].append(time.perf_counter() - started)
+            results[name][1].append(n)
+
+    print(f"scenarios={SCENARIOS} llm={LLM_LATENCY_SEC * 1000:.0f}ms search={SEARCH_LATENCY_SEC * 1000:.0f}ms")
+    for name, (latencies, searches) in results.items():
+        summarize(name, latencies, searches)
+    print(f"search_cache={cache.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
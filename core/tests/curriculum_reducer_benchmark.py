@@ -0,0 +1,99 @@
+# python -m core.tests.curriculum_reducer_benchmark
+#
+# 200노드 커리큘럼에서 루프 6회(orchestrator -> resource_discovery + paper_concept_alignment)를
+# 흉내내어 리듀서 비용을 비교한다.
+# - legacy: 노드가 전체 노드를 복사해 반환 + 전체 복사 리듀서 (merge_curriculum_reference)
+# - delta : 노드가 바뀐 노드만 반환 + 구조 공유 리듀서 (merge_curriculum)
+
+import copy
+import random
+import time
+
+from core.graphs.parallel.state_parallel import merge_curriculum, merge_curriculum_reference
+
+N_NODES = 200
+RESOURCES_PER_NODE = 10
+LOOPS = 6
+REPEAT = 5
+
+
+def make_curriculum(seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    counter = 0
+    nodes = []
+    for i in range(N_NODES):
+        resources = []
+        for _ in range(RESOURCES_PER_NODE):
+            counter += 1
+            resources.append({
+                "resource_id": f"res-{counter:04d}", "resource_name": f"Resource {counter}",
+                "url": f"https://example.com/{counter}", "type": "web_doc",
+                "resource_description": "description " * 20,
+                "difficulty": 5, "importance": 5, "study_load": 1.0, "is_necessary": None,
+            })
+        nodes.append({
+            "keyword_id": f"key-{i:03d}", "keyword": f"Keyword {i}", "description": None,
+            "keyword_importance": None, "is_keyword_necessary": None,
+            "is_resource_sufficient": False, "resources": resources,
+        })
+    edges = [{"start": f"key-{rng.randrange(N_NODES):03d}", "end": f"key-{rng.randrange(N_NODES):03d}"}
+             for _ in range(N_NODES * 2)]
+    return {"graph_meta": {"paper_id": "p", "title": "T", "summarize": ""}, "first_node_order": [],
+            "nodes": nodes, "edges": edges}
+
+
+def make_round(state: dict, loop: int, rng: random.Random, full: bool):
+    """한 루프에서 병렬 노드들이 반환하는 curriculum delta 목록"""
+    nodes = state["nodes"]
+    insufficient = {n["keyword_id"] for n in rng.sample(nodes, 20)}
+    described = {n["keyword_id"] for n in rng.sample(nodes, 30)}
+    new_res = {}
+    for n in nodes:
+        if n["keyword_id"] in insufficient:
+            rid = 10_000 + loop * 100 + len(new_res)
+            new_res[n["keyword_id"]] = [dict(n["resources"][0], resource_id=f"res-{rid:05d}")]
+
+    # orchestrator
+    if full:
+        orch = {**state, "nodes": [dict(n, is_resource_sufficient=n["keyword_id"] not in insufficient) for n in nodes]}
+    else:
+        orch = {"nodes": [{"keyword_id": n["keyword_id"], "is_resource_sufficient": n["keyword_id"] not in insufficient}
+                          for n in nodes if n.get("is_resource_sufficient") != (n["keyword_id"] not in insufficient)]}
+
+    # resource_discovery + paper_concept_alignment (병렬)
+    if full:
+        res = {"nodes": [dict(n, resources=n["resources"] + new_res.get(n["keyword_id"], [])) for n in nodes]}
+        align = {"nodes": [dict(n, description=f"desc {loop}") if n["keyword_id"] in described else dict(n) for n in nodes]}
+    else:
+        res = {"nodes": [{"keyword_id": k, "resources": v} for k, v in new_res.items()]}
+        align = {"nodes": [{"keyword_id": k, "description": f"desc {loop}"} for k in described]}
+    return [orch], [res, align]
+
+
+def run(reducer, full: bool, base: dict) -> float:
+    rng = random.Random(42)
+    state = reducer({}, copy.deepcopy(base))
+    elapsed = 0.0
+    for loop in range(LOOPS):
+        for step in make_round(state, loop, rng, full):
+            started = time.perf_counter()
+            for delta in step:
+                state = reducer(state, delta)
+            elapsed += time.perf_counter() - started
+    return elapsed
+
+
+def main():
+    base = make_curriculum()
+    t_legacy = min(run(merge_curriculum_reference, True, base) for _ in range(REPEAT))
+    t_delta_full = min(run(merge_curriculum, True, base) for _ in range(REPEAT))
+    t_delta = min(run(merge_curriculum, False, base) for _ in range(REPEAT))
+
+    print(f"{N_NODES} nodes x {RESOURCES_PER_NODE} resources, {LOOPS} loops (reducer time only)")
+    print(f"  legacy reducer + full deltas : {t_legacy * 1000:8.2f} ms")
+    print(f"  delta reducer  + full deltas : {t_delta_full * 1000:8.2f} ms ({t_legacy / t_delta_full:.1f}x)")
+    print(f"  delta reducer  + node deltas : {t_delta * 1000:8.2f} ms ({t_legacy / t_delta:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
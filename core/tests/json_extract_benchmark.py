@@ -0,0 +1,90 @@
+# python -m core.tests.json_extract_benchmark
+#
+# 큰 LLM 응답(200노드 keyword graph 수준)에서 JSON 추출 시간과 성공 여부를 비교한다.
+# - regex   : re.search(r'\{.*\}', DOTALL) + json.loads (Orchestrator / Compose)
+# - findrfind: find('{') ~ rfind('}') + json.loads (PaperConceptAlignment)
+# - scanner : 문자 단위 괄호 스캐너 (ResourceDiscovery)
+# - literal : ```json 펜스 정규식 + ast.literal_eval (KeywordGraph)
+# - new     : core.utils.json_extract.extract_json
+
+import ast
+import json
+import re
+import time
+
+from core.tests.curriculum_reducer_benchmark import make_curriculum
+from core.utils.json_extract import extract_json
+
+REPEAT = 20
+
+
+def legacy_regex(text):
+    match = re.search(r'\{.*\}', text, re.DOTALL)
+    return json.loads(match.group()) if match else None
+
+
+def legacy_find_rfind(text):
+    start, end = text.find("{"), text.rfind("}")
+    return json.loads(text[start:end + 1])
+
+
+def legacy_scanner(text):
+    start = text.index("{")
+    depth, in_string, escape, quote = 0, False, False, None
+    for i in range(start, len(text)):
+        c = text[i]
+        if escape:
+            escape = False
+        elif c == "\\" and in_string:
+            escape = True
+        elif in_string:
+            if c == quote:
+                in_string = False
+        elif c in ('"', "'"):
+            in_string, quote = True, c
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return json.loads(text[start:i + 1])
+    return None
+
+
+def legacy_literal(text):
+    match = re.search(r'```json\s*(.*?)\s*```', text, re.DOTALL)
+    return ast.literal_eval(match.group(1) if match else text)
+
+
+def new(text):
+    return extract_json(text, expect=dict, allow_partial=True)
+
+
+def responses() -> dict:
+    body = json.dumps(make_curriculum(), ensure_ascii=False, indent=2)
+    return {
+        "fenced": f"Here is the graph:\n```json\n{body}\n```\n",
+        "trailing prose": f"{body}\nExplanation: nodes {{key-001}} and {{key-002}} were merged.",
+        "truncated": body[: len(body) * 2 // 3],
+    }
+
+
+def main():
+    parsers = [("regex", legacy_regex), ("findrfind", legacy_find_rfind), ("scanner", legacy_scanner),
+               ("literal", legacy_literal), ("new", new)]
+    for name, text in responses().items():
+        print(f"== {name} ({len(text) / 1024:.0f} KiB)")
+        for pname, fn in parsers:
+            start = time.perf_counter()
+            try:
+                for _ in range(REPEAT):
+                    result = fn(text)
+                ok = "ok" if isinstance(result, dict) and result.get("nodes") else "empty"
+            except Exception as e:
+                ok = f"fail ({type(e).__name__})"
+            elapsed = (time.perf_counter() - start) / REPEAT * 1000
+            print(f"  {pname:10s} {elapsed:8.2f} ms  {ok}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# python -m core.tests.kg_postprocessing_benchmark
+#
+# 큰 agent 출력(노드/엣지 수천~수만 개)에서 기존 list 기반 후처리 루프
+# (list 멤버십 검사 + 순회 중 remove)와 set 기반 후처리 헬퍼의 실행 시간을 비교한다.
+
+import copy
+import random
+import time
+
+from core.utils.kg_agent_postprocessing import connect_or_drop_isolated_nodes, filter_edges_by_node_ids
+
+SIZES = [(500, 2_000), (2_000, 10_000), (5_000, 30_000)]  # (nodes, edges)
+REPEAT = 3
+PAPER_ID = "paper-0"
+
+
+def make_transformed(n_nodes: int, n_edges: int, seed: int = 0):
+    """transform_graph_data 내부 4~5단계 직전 상태를 흉내낸 nodes/edges"""
+    rng = random.Random(seed)
+    nodes = [{"keyword_id": f"kw-{i}", "keyword": f"Keyword {i}", "resources": []} for i in range(n_nodes)]
+    # 일부 edge는 삭제된 노드(kw-<n_nodes 이상>)를 참조
+    id_pool = n_nodes + n_nodes // 5
+    edges = []
+    for _ in range(n_edges):
+        s = f"kw-{rng.randrange(id_pool)}"
+        t = PAPER_ID if rng.random() < 0.1 else f"kw-{rng.randrange(id_pool)}"
+        edges.append({"start": s, "end": t, "type": "PREREQ", "reason": "", "strength": 0.9})
+    return nodes, edges
+
+
+def legacy_postprocess(nodes, edges):
+    """기존 구현 (list 기반, 순회 중 remove)"""
+    all_node_id = [PAPER_ID]
+    for node in nodes:
+        all_node_id.append(node["keyword_id"])
+
+    for edge in edges:
+        if edge["start"] in all_node_id and edge["end"] in all_node_id:
+            continue
+        else:
+            edges.remove(edge)
+
+    all_start_id, all_end_id = [], []
+    for edge in edges:
+        all_start_id.append(edge["start"])
+        all_end_id.append(edge["end"])
+
+    for node in nodes:
+        node_id = node["keyword_id"]
+        if node_id in all_start_id:
+            continue
+        elif node_id in all_end_id:
+            edges.append({"start": node_id, "end": PAPER_ID, "type": "IN", "reason": "", "strength": ""})
+        else:
+            nodes.remove(node)
+    return nodes, edges
+
+
+def new_postprocess(nodes, edges):
+    valid_ids = {PAPER_ID}
+    valid_ids.update(node["keyword_id"] for node in nodes)
+    edges = filter_edges_by_node_ids(edges, valid_ids)
+    return connect_or_drop_isolated_nodes(nodes, edges, PAPER_ID)
+
+
+def best_of(fn, data, repeat: int = REPEAT) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        nodes, edges = copy.deepcopy(data)
+        started = time.perf_counter()
+        fn(nodes, edges)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    print(f"{'nodes':>6} | {'edges':>6} | {'legacy(ms)':>10} | {'set-based(ms)':>13} | {'speedup':>7}")
+    print("-" * 56)
+    for n_nodes, n_edges in SIZES:
+        data = make_transformed(n_nodes, n_edges)
+
+        t_legacy = best_of(legacy_postprocess, data)
+        t_new = best_of(new_postprocess, data)
+
+        print(
+            f"{n_nodes:>6} | {n_edges:>6} | {t_legacy * 1000:>10.1f} | "
+            f"{t_new * 1000:>13.1f} | {t_legacy / t_new:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# python -m core.tests.kg_preprocessing_benchmark
+#
+# 합성 subgraph(1k ~ 100k edges)에서 dict 기반 전처리(preprocess_graph_reference)와
+# 정수 인덱스 기반 전처리(SubgraphIndex)의 실행 시간을 비교한다.
+
+import random
+import time
+
+from core.utils.kg_agent_preprocessing import preprocess_graph, preprocess_graph_reference
+from core.utils.kg_subgraph_index import SubgraphIndex
+
+EDGE_SIZES = [1_000, 10_000, 100_000]
+REPEAT = 3
+
+
+def make_synthetic_subgraph(n_edges: int, seed: int = 0) -> dict:
+    """PREREQ 위주 + target paper ABOUT/IN + 주변 paper 연결을 섞은 합성 subgraph"""
+    rng = random.Random(seed)
+    n_keywords = max(50, n_edges // 4)
+    n_papers = max(5, n_edges // 200)
+
+    keywords = [{"id": f"kw-{i}", "name": f"Keyword {i}", "alias": []} for i in range(n_keywords)]
+    papers = [{"id": f"paper-{i}", "name": f"Paper {i}"} for i in range(n_papers)]
+    target_id = "paper-0"
+
+    prereq, about, in_edges, ref_by = [], [], [], []
+    for _ in range(n_edges):
+        r = rng.random()
+        if r < 0.85:
+            s, t = rng.randrange(n_keywords), rng.randrange(n_keywords)
+            prereq.append({
+                "source": f"kw-{s}", "target": f"kw-{t}",
+                "strength": rng.choice([0.9, 0.95, 1.0]),
+                "reason": "prerequisite relation " * rng.randint(1, 5),
+            })
+        elif r < 0.93:
+            paper = target_id if rng.random() < 0.3 else f"paper-{rng.randrange(n_papers)}"
+            about.append({"source": paper, "target": f"kw-{rng.randrange(n_keywords)}", "strength": 1.0, "reason": ""})
+        elif r < 0.98:
+            in_edges.append({"source": f"kw-{rng.randrange(n_keywords)}", "target": target_id, "strength": 0.8, "reason": ""})
+        else:
+            ref_by.append({"source": f"paper-{rng.randrange(n_papers)}", "target": target_id, "strength": 0.6})
+
+    return {"graph": {
+        "target_paper": {"id": target_id, "name": "Target Paper", "description": "", "abstract": ""},
+        "nodes": {"papers": papers, "keywords": keywords},
+        "edges": {"PREREQ": prereq, "ABOUT": about, "IN": in_edges, "REF_BY": ref_by},
+    }}
+
+
+def best_of(fn, repeat: int = REPEAT) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    print(f"{'edges':>8} | {'reference(ms)':>13} | {'index build(ms)':>15} | {'indexed total(ms)':>17} | {'speedup':>7}")
+    print("-" * 74)
+    for n_edges in EDGE_SIZES:
+        raw = make_synthetic_subgraph(n_edges)
+
+        assert preprocess_graph(raw) == preprocess_graph_reference(raw)
+
+        t_ref = best_of(lambda: preprocess_graph_reference(raw))
+        t_build = best_of(lambda: SubgraphIndex.from_raw(raw))
+        t_new = best_of(lambda: preprocess_graph(raw))
+
+        print(
+            f"{n_edges:>8} | {t_ref * 1000:>13.1f} | {t_build * 1000:>15.1f} | "
+            f"{t_new * 1000:>17.1f} | {t_ref / t_new:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
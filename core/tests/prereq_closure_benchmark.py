@@ -0,0 +1,117 @@
+# python -m core.tests.prereq_closure_benchmark [--neo4j --db data/prereq_closure.sqlite]
+#
+# 질의 시점 PREREQ*1..2 확장과 미리 계산한 closure 테이블 조회를 비교한다.
+# - 기본: 합성 그래프에서 SQLite 재귀 CTE(질의 시점 traversal) vs PrereqClosureStore.expand
+# - --neo4j: 실제 Neo4j 라이브 traversal vs 오프라인으로 만든 closure 파일 (NEO4J_* 환경변수 필요)
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from core.tools.prereq_closure import DEFAULT_PREREQ_CLOSURE_DB, PrereqClosureStore
+
+SIZES = [(2_000, 10_000), (20_000, 100_000)]  # (keywords, prereq edges)
+QUERIES = 200
+SEEDS_PER_QUERY = 5
+
+LIVE_TRAVERSAL_SQL = """
+WITH RECURSIVE walk(node, depth) AS (
+    SELECT idx, 0 FROM keywords WHERE id IN ({placeholders})
+    UNION
+    SELECT e.src, w.depth + 1
+    FROM prereq_edges e JOIN walk w ON e.dst = w.node
+    WHERE w.depth < 2 AND (e.strength IS NULL OR e.strength >= 0.9)
+)
+SELECT e.src, e.dst, e.strength
+FROM prereq_edges e JOIN walk w ON e.dst = w.node
+WHERE w.depth < 2 AND (e.strength IS NULL OR e.strength >= 0.9)
+"""
+
+NEO4J_TRAVERSAL_QUERY = """
+UNWIND $ids AS kid
+MATCH (k0:Keyword) WHERE elementId(k0) = kid
+OPTIONAL MATCH path = (kpre:Keyword)-[:PREREQ*1..2]->(k0)
+WHERE ALL(x IN relationships(path) WHERE x.strength IS NULL OR x.strength >= 0.9)
+RETURN count(DISTINCT path) AS paths
+"""
+
+
+def make_synthetic(n_keywords: int, n_edges: int, seed: int = 0):
+    rng = random.Random(seed)
+    keywords = [{"id": f"kw-{i}", "name": f"Keyword {i}", "alias": []} for i in range(n_keywords)]
+    edges = [
+        {"source": f"kw-{rng.randrange(n_keywords)}", "target": f"kw-{rng.randrange(n_keywords)}",
+         "strength": rng.choice([0.5, 0.9, 0.95, 1.0]), "reason": "prerequisite relation"}
+        for _ in range(n_edges)
+    ]
+    return keywords, edges
+
+
+def time_queries(fn, queries) -> float:
+    started = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - started) / len(queries)
+
+
+def run_synthetic():
+    print(f"{'keywords':>8} | {'edges':>7} | {'build(s)':>8} | {'live CTE(ms/q)':>14} | {'closure(ms/q)':>13} | {'speedup':>7}")
+    print("-" * 74)
+    rng = random.Random(1)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_keywords, n_edges in SIZES:
+            keywords, edges = make_synthetic(n_keywords, n_edges)
+
+            started = time.perf_counter()
+            store = PrereqClosureStore.build(os.path.join(tmp, f"closure_{n_edges}.sqlite"), keywords, edges)
+            t_build = time.perf_counter() - started
+
+            queries = [[f"kw-{rng.randrange(n_keywords)}" for _ in range(SEEDS_PER_QUERY)] for _ in range(QUERIES)]
+
+            def live(ids):
+                # closure 조회와 같은 결과(엣지 + keyword 속성)를 만들도록 맞춤
+                sql = LIVE_TRAVERSAL_SQL.format(placeholders=",".join("?" * len(ids)))
+                rows = store.conn.execute(sql, ids).fetchall()
+                return rows, store.keywords_by_idx({r[0] for r in rows} | {r[1] for r in rows})
+
+            t_live = time_queries(live, queries)
+            t_closure = time_queries(store.expand, queries)
+            store.close()
+
+            print(
+                f"{n_keywords:>8} | {n_edges:>7} | {t_build:>8.2f} | {t_live * 1000:>14.2f} | "
+                f"{t_closure * 1000:>13.2f} | {t_live / t_closure:>6.2f}x"
+            )
+
+
+def run_neo4j(db_path: str):
+    from core.tools.gdb_search import run_cypher
+
+    store = PrereqClosureStore(db_path)
+    ids = [r["id"] for r in store.conn.execute("SELECT id FROM keywords ORDER BY RANDOM() LIMIT ?", (QUERIES * SEEDS_PER_QUERY,))]
+    queries = [ids[i:i + SEEDS_PER_QUERY] for i in range(0, len(ids), SEEDS_PER_QUERY)]
+
+    t_live = time_queries(lambda q: run_cypher(NEO4J_TRAVERSAL_QUERY, {"ids": q}), queries)
+    t_closure = time_queries(store.expand, queries)
+    store.close()
+
+    print(f"neo4j live traversal: {t_live * 1000:.1f} ms/query")
+    print(f"closure store       : {t_closure * 1000:.2f} ms/query ({t_live / t_closure:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--neo4j", action="store_true")
+    parser.add_argument("--db", default=os.getenv("PREREQ_CLOSURE_DB", DEFAULT_PREREQ_CLOSURE_DB))
+    args = parser.parse_args()
+
+    if args.neo4j:
+        run_neo4j(args.db)
+    else:
+        run_synthetic()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# python -m core.tests.query_builder_ab                          # 기록된 fixture로 비교 (LLM/검색 호출 없음)
+# python -m core.tests.query_builder_ab --fixture path.json      # 다른 fixture로 비교
+# python -m core.tests.query_builder_ab --record cases.json --out path.json
+#                                                               # 실제 LLM/검색/평가를 돌려 fixture 기록
+#
+# 웹/영상 검색 쿼리 생성 A/B
+# - llm : 키워드마다 QUERY_GEN_PROMPT_V6 LLM 호출 (기존 방식)
+# - rule: build_search_query 규칙 기반, 모호한 키워드만 LLM
+# 두 방식으로 만든 쿼리로 실제 검색 -> 평가 -> 랭킹한 최종 자료를 fixture에 기록해 두고,
+# 최종 자료 점수(resource_ranker.compute_score)와 쿼리 생성/노드 전체 지연시간을 비교한다.
+# 규칙이 바뀌어 기록 당시와 다른 쿼리가 나오는 케이스는 stale로 표시 (다시 기록 필요).
+#
+# --record 입력(cases.json): [{"case_id", "paper_name", "keyword", "description",
+#                            "resource_reason", "user_level", "pref_types"}, ...]
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from core.utils.query_builder import QUERY_MODE_LLM, QUERY_MODE_RULE, build_search_query
+from core.utils.resource_ranker import compute_score
+
+DEFAULT_FIXTURE = Path(__file__).parent / "fixtures" / "query_ab_sample.json"
+ARMS = (QUERY_MODE_LLM, QUERY_MODE_RULE)
+# fixture에 남길 자료 필드 (본문 등은 제외)
+RESOURCE_FIELDS = ("url", "resource_name", "type", "quality", "importance", "difficulty", "study_load", "query")
+
+
+def rule_query(case: Dict[str, Any]):
+    return build_search_query(
+        keyword=case["keyword"],
+        paper_name=case.get("paper_name", ""),
+        search_direction=case.get("resource_reason", ""),
+        user_level=case.get("user_level", ""),
+    )
+
+
+def resource_score(resources: List[Dict[str, Any]], pref_types: List[str]) -> float:
+    """최종 자료 점수 합 (자료 수가 적으면 그만큼 낮게)"""
+    return sum(compute_score(r, pref_types)[0] for r in resources)
+
+
+def _pct(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def compare(cases: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """fixture 케이스들로 arm별 요약 (rule arm의 stale 케이스는 제외)"""
+    summary = {arm: {"scores": [], "query_ms": [], "total_ms": [], "llm_calls": 0, "stale": 0} for arm in ARMS}
+    for case in cases:
+        arms = case["arms"]
+        current = rule_query(case)
+        recorded = arms[QUERY_MODE_RULE]
+        if (current is None) != recorded["used_llm"] or (current is not None and current != recorded["query"]):
+            summary[QUERY_MODE_RULE]["stale"] += 1
+            continue
+
+        for arm in ARMS:
+            row = summary[arm]
+            rec = arms[arm]
+            row["scores"].append(resource_score(rec["resources"], case.get("pref_types", [])))
+            row["query_ms"].append(rec["query_latency_ms"])
+            row["total_ms"].append(rec["total_latency_ms"])
+            row["llm_calls"] += int(rec["used_llm"])
+
+    out = {}
+    for arm, row in summary.items():
+        n = len(row["scores"])
+        out[arm] = {
+            "cases": n,
+            "mean_score": round(statistics.mean(row["scores"]), 3) if n else 0.0,
+            "query_ms_p50": _pct(row["query_ms"], 0.5),
+            "query_ms_p95": _pct(row["query_ms"], 0.95),
+            "total_ms_p50": _pct(row["total_ms"], 0.5),
+            "total_ms_p95": _pct(row["total_ms"], 0.95),
+            "llm_rate": round(row["llm_calls"] / n, 3) if n else 0.0,
+            "stale": row["stale"],
+        }
+    return out
+
+
+def run_replay(path: Path) -> None:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("synthetic"):
+        print("⚠️ 합성 예시 fixture입니다 (형식 확인용, 실측 아님). --record로 기록한 fixture를 사용하세요.")
+
+    started = time.perf_counter()
+    for case in data["cases"]:
+        rule_query(case)
+    rule_us = (time.perf_counter() - started) / max(len(data["cases"]), 1) * 1e6
+
+    for arm, row in compare(data["cases"]).items():
+        print(
+            f"{arm:<4} cases={row['cases']} score={row['mean_score']:.2f} "
+            f"query_ms p50={row['query_ms_p50']:.0f} p95={row['query_ms_p95']:.0f} "
+            f"node_ms p50={row['total_ms_p50']:.0f} p95={row['total_ms_p95']:.0f} "
+            f"llm_calls={row['llm_rate'] * 100:.0f}% stale={row['stale']}"
+        )
+    print(f"rule query build (live): {rule_us:.1f}us/keyword")
+
+    for case in data["cases"]:
+        llm, rule = case["arms"][QUERY_MODE_LLM], case["arms"][QUERY_MODE_RULE]
+        pref = case.get("pref_types", [])
+        print(
+            f"  {case['case_id']:<24} llm={resource_score(llm['resources'], pref):5.1f} "
+            f"rule={resource_score(rule['resources'], pref):5.1f}  "
+            f"'{llm['query']}' | '{rule['query']}'"
+        )
+
+
+async def record(cases_path: Path, out_path: Path) -> None:
+    from core.agents.resource_discovery_agent import ResourceDiscoveryAgent
+    from core.llm.solar_pro_2_llm import get_solar_model
+    from core.tools.search_cache import invalidate_search_cache
+
+    cases = json.loads(cases_path.read_text(encoding="utf-8"))
+    llm_for_search = get_solar_model(temperature=0.7, reasoning_effort="low")
+    llm_for_eval = get_solar_model(temperature=0.1)
+    agents = {
+        arm: ResourceDiscoveryAgent(llm_discovery=llm_for_search, llm_estimation=llm_for_eval, query_mode=arm)
+        for arm in ARMS
+    }
+
+    recorded = []
+    for case in cases:
+        node = {
+            "keyword_id": case.get("keyword_id", "key-000"),
+            "keyword": case["keyword"],
+            "description": case.get("description", ""),
+            "resource_reason": case.get("resource_reason", ""),
+        }
+        arms = {}
+        for arm, agent in agents.items():
+            # 앞 arm의 검색 결과가 캐시돼 지연시간이 섞이지 않도록 비움
+            invalidate_search_cache()
+            started = time.perf_counter()
+            query = await agent._generate_web_query(
+                paper_name=case.get("paper_name", ""),
+                keyword=node["keyword"],
+                description=node["description"],
+                search_direction=node["resource_reason"],
+                user_level=case.get("user_level", ""),
+            )
+            query_ms = (time.perf_counter() - started) * 1000
+            resources = await agent.process_single_node(
+                paper_name=case.get("paper_name", ""),
+                node=node,
+                user_level=case.get("user_level", ""),
+                pref_types=case.get("pref_types", []),
+                excluded_urls=set(),
+                web_query=query,
+            )
+            arms[arm] = {
+                "query": query,
+                "used_llm": arm == QUERY_MODE_LLM or rule_query(case) is None,
+                "query_latency_ms": round(query_ms, 1),
+                "total_latency_ms": round((time.perf_counter() - started) * 1000, 1),
+                "resources": [{k: r.get(k) for k in RESOURCE_FIELDS} for r in resources],
+            }
+            print(f"🎯 {case['case_id']} [{arm}] '{query}' -> {len(resources)}개 ({arms[arm]['total_latency_ms']:.0f}ms)")
+        recorded.append({**case, "arms": arms})
+
+    out_path.write_text(json.dumps({"cases": recorded}, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"✅ fixture 저장: {out_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE)
+    parser.add_argument("--record", type=Path, help="기록할 케이스 목록(JSON)")
+    parser.add_argument("--out", type=Path, default=Path("query_ab_fixture.json"))
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record(args.record, args.out))
+    else:
+        run_replay(args.fixture)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# python -m core.tests.serialization_benchmark
+#
+# 200노드 커리큘럼 한 건(job)에서 일어나는 JSON 직렬화를 흉내내어 비교한다.
+# - legacy: json.dumps(..., ensure_ascii=False) (기본 구분자 ", " / ": ")
+# - new   : core.utils.serialization.dumps (orjson 또는 compact 표준 json)
+# 직렬화 시간과 프롬프트에 들어가는 문자 수를 함께 출력한다.
+
+import json
+import time
+
+from core.tests.curriculum_reducer_benchmark import LOOPS, make_curriculum
+from core.utils import serialization
+
+REPEAT = 20
+STUDY_LOAD_BATCH = 5
+
+
+def job_objects(curriculum: dict) -> list:
+    """한 job에서 직렬화되는 객체 목록"""
+    nodes = curriculum["nodes"]
+    objs = []
+    for _ in range(LOOPS):
+        # orchestrator: 키워드 충분성 + 노드별 리소스 충분성
+        objs.append({
+            "nodes": [{"keyword_id": n["keyword_id"], "keyword": n["keyword"], "description": n["description"]}
+                      for n in nodes],
+            "edges": curriculum["edges"],
+        })
+        objs.extend(n["resources"] for n in nodes)
+        # concept expansion: keyword graph
+        objs.append({
+            "nodes": [{"keyword_id": n["keyword_id"], "keyword": n["keyword"]} for n in nodes],
+            "edges": curriculum["edges"],
+        })
+    # study load estimation: 키워드별 배치
+    for n in nodes:
+        res = n["resources"]
+        for i in range(0, len(res), STUDY_LOAD_BATCH):
+            objs.append([{"url": r["url"], "title": r["resource_name"], "content": "본문 " * 400,
+                          "type_hint": r["type"], "duration": None, "citationCount": None}
+                         for r in res[i:i + STUDY_LOAD_BATCH]])
+    # first node order + 최종 payload
+    objs.append([n["keyword_id"] for n in nodes[:10]])
+    objs.append(curriculum)
+    objs.append({"curriculum_id": "c", "title": "T", "graph": curriculum, "created_at": "2026-01-01T00:00:00Z"})
+    return objs
+
+
+def run(objs: list, fn) -> tuple:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        total_chars = sum(len(fn(o)) for o in objs)
+    return (time.perf_counter() - start) / REPEAT * 1000, total_chars
+
+
+def main():
+    objs = job_objects(make_curriculum())
+    print(f"backend: {'orjson' if serialization.HAS_ORJSON else 'stdlib json (compact)'}, objects per job: {len(objs)}")
+
+    t_old, c_old = run(objs, lambda o: json.dumps(o, ensure_ascii=False))
+    t_new, c_new = run(objs, serialization.dumps)
+    print(f"legacy: {t_old:8.2f} ms/job, {c_old:,} chars")
+    print(f"new   : {t_new:8.2f} ms/job, {c_new:,} chars  ({t_old / t_new:.2f}x, chars -{(1 - c_new / c_old) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,13 @@ import logging
 
 from dotenv import load_dotenv
 
+from core.tools.subgraph_cache import (
+    DEFAULT_GRAPH_DB_VERSION_CHECK_SEC,
+    GraphVersionProbe,
+    make_subgraph_cache_key,
+    subgraph_cache,
+)
+
 logging.getLogger("neo4j").setLevel(logging.WARNING)
 
 # Wait 60 seconds before connecting using these details, or login to https://console.neo4j.io to validate the Aura Instance is available
@@ -48,7 +55,50 @@ min_prereq_strength = 0.9
 min_kw_strength = 0.0
 min_ref_strength = 0.5
 
-def get_subgraph_1(paper_name, initial_keywords): 
+# 그래프 DB 버전: 적재 스크립트가 남기는 (:GraphMeta {version}) 노드,
+# 없으면 전체 노드/관계 수 (count store에서 바로 읽으므로 가벼움)
+GRAPH_VERSION_QUERY = """
+CALL () { OPTIONAL MATCH (m:GraphMeta) RETURN m.version AS meta LIMIT 1 }
+CALL () { MATCH (n) RETURN count(n) AS nodes }
+CALL () { MATCH ()-[r]->() RETURN count(r) AS rels }
+RETURN meta, nodes, rels
+"""
+
+
+def fetch_graph_db_version() -> str:
+    row = run_cypher(GRAPH_VERSION_QUERY, limit=1)[0]
+    if row.get("meta") is not None:
+        return str(row["meta"])
+    return f"n{row['nodes']}-r{row['rels']}"
+
+
+# 데이터가 다시 적재되면 다음 확인 시점(GRAPH_DB_VERSION_CHECK_SEC)에 subgraph 캐시 전체 무효화
+graph_version_probe = GraphVersionProbe(
+    fetch_graph_db_version,
+    interval_sec=float(os.getenv("GRAPH_DB_VERSION_CHECK_SEC", DEFAULT_GRAPH_DB_VERSION_CHECK_SEC)),
+)
+
+def get_subgraph_1(paper_name, initial_keywords):
+    """
+    1차 subgraph 조회 (같은 논문 + 같은 initial keyword 조합은 캐시 사용)
+    """
+    cache_key = make_subgraph_cache_key(paper_name, initial_keywords)
+    graph_db_version = graph_version_probe.get()
+
+    cached = subgraph_cache.get(cache_key, graph_db_version=graph_db_version)
+    if cached is not None:
+        print(f"[gdb_search] subgraph cache hit: {cache_key[0]}")
+        return cached
+
+    result = _query_subgraph_1(paper_name, initial_keywords)
+
+    # target paper가 없는 결과는 논문 적재 직후 바로 반영되도록 캐시하지 않음
+    if result.get("graph", {}).get("target_paper") is not None:
+        subgraph_cache.set(cache_key, result, graph_db_version=graph_db_version)
+    return result
+
+
+def _query_subgraph_1(paper_name, initial_keywords):
 
     prereq_depth = 2  # depth 직접 박기: *1..2
     ref_limit = 5
@@ -0,0 +1,393 @@
+# core/tools/graph_store.py
+#
+# 1차 subgraph 조회용 그래프 저장소 인터페이스
+#   - neo4j : 원격 Neo4j (core.tools.gdb_search, 사용할 때 import)
+#   - sqlite: Neo4j export로 만든 로컬 SQLite 파일 (네트워크 없이 동일한 subgraph 계약)
+#
+# export 파일 생성:
+#   python -m core.tools.graph_store --out data/graph_store.sqlite
+
+import argparse
+import json
+from abc import ABC, abstractmethod
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from dotenv import load_dotenv
+
+from core.tools.prereq_closure import PrereqClosureStore, export_prereq_graph_from_neo4j
+
+load_dotenv()
+
+DEFAULT_GRAPH_STORE_BACKEND = "neo4j"
+DEFAULT_GRAPH_STORE_PATH = "data/graph_store.sqlite"
+
+# get_subgraph_1 Cypher와 같은 파라미터
+KW_PAPER_LIMIT = 3
+REF_LIMIT = 5
+MIN_KW_STRENGTH = 0.0
+MIN_REF_STRENGTH = 0.5
+
+
+def empty_subgraph() -> dict:
+    return {
+        "graph": {
+            "target_paper": None,
+            "nodes": {"papers": [], "keywords": []},
+            "edges": {"PREREQ": [], "ABOUT": [], "IN": [], "REF_BY": []},
+        }
+    }
+
+
+class GraphStore(ABC):
+    """
+    1차 subgraph 저장소 인터페이스
+
+    get_subgraph_1은 core.tools.gdb_search.get_subgraph_1과 같은 형태를 반환:
+      {"graph": {"target_paper": {...} | None,
+                 "nodes": {"papers": [...], "keywords": [...]},
+                 "edges": {"PREREQ": [...], "ABOUT": [...], "IN": [...], "REF_BY": [...]}}}
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def get_subgraph_1(self, paper_name: str, initial_keywords: List[str]) -> dict:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class Neo4jGraphStore(GraphStore):
+    """원격 Neo4j 백엔드 (드라이버 연결은 처음 조회할 때 생성)"""
+
+    name = "neo4j"
+
+    def get_subgraph_1(self, paper_name: str, initial_keywords: List[str]) -> dict:
+        from core.tools.gdb_search import get_subgraph_1
+
+        return get_subgraph_1(paper_name, initial_keywords)
+
+    def close(self) -> None:
+        import sys
+
+        gdb_search = sys.modules.get("core.tools.gdb_search")
+        if gdb_search is not None:
+            gdb_search.close_driver()
+
+
+def _passes(strength, min_strength: float) -> bool:
+    return strength is None or strength >= min_strength
+
+
+class SQLiteGraphStore(GraphStore):
+    """
+    Neo4j export(SQLite) 기반 로컬 백엔드
+
+    keyword / PREREQ closure 테이블은 PrereqClosureStore를 그대로 사용하고
+    papers / links(ABOUT, IN, REF_BY) 테이블을 추가로 둔다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str = DEFAULT_GRAPH_STORE_PATH):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"graph store export not found: {path}")
+        self.path = path
+        self.closure = PrereqClosureStore(path)
+        self.conn = self.closure.conn
+        # sqlite3 connection은 스레드 간 동시 사용이 안전하지 않으므로 직렬화
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self.closure.close()
+
+    # ---- 생성 ----
+    @classmethod
+    def build(
+        cls,
+        path: str,
+        papers: Iterable[dict],
+        keywords: Iterable[dict],
+        prereq_edges: Iterable[dict],
+        links: Iterable[dict],
+    ) -> "SQLiteGraphStore":
+        """
+        papers: [{id, name, description, url, abstract, citationCount}]
+        keywords: [{id, name, categories, link, alias}]
+        prereq_edges: [{source, target, strength, reason}]
+        links: [{type: ABOUT|IN|REF_BY, source, target, strength, reason, intents, isInfluential}]
+        """
+        PrereqClosureStore.build(path, keywords, prereq_edges).close()
+
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE papers(
+                id TEXT PRIMARY KEY, name TEXT, name_norm TEXT, description TEXT,
+                url TEXT, abstract TEXT, citation_count INTEGER
+            );
+            CREATE TABLE links(
+                type TEXT, source TEXT, target TEXT, strength REAL, reason TEXT,
+                intents TEXT, is_influential INTEGER
+            );
+            """
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO papers VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (p["id"], p.get("name"), (p.get("name") or "").strip().lower(), p.get("description"),
+                 p.get("url"), p.get("abstract"), p.get("citationCount"))
+                for p in papers
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO links VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (l["type"], l["source"], l["target"], l.get("strength"), l.get("reason"),
+                 json.dumps(l.get("intents"), ensure_ascii=False) if l.get("intents") is not None else None,
+                 None if l.get("isInfluential") is None else int(bool(l.get("isInfluential"))))
+                for l in links
+            ),
+        )
+        conn.executescript(
+            """
+            CREATE INDEX idx_papers_name ON papers(name_norm);
+            CREATE INDEX idx_links_source ON links(source, type);
+            CREATE INDEX idx_links_target ON links(target, type);
+            """
+        )
+        conn.commit()
+        conn.close()
+        return cls(path)
+
+    # ---- 조회 ----
+    def _target_paper(self, paper_name: str) -> Optional[sqlite3.Row]:
+        return self.conn.execute(
+            "SELECT * FROM papers WHERE name_norm = ? ORDER BY rowid LIMIT 1",
+            ((paper_name or "").strip().lower(),),
+        ).fetchone()
+
+    def _keyword_ids(self, ids: Iterable[str]) -> set:
+        ids = list(set(ids))
+        if not ids:
+            return set()
+        rows = self.conn.execute(
+            f"SELECT id FROM keywords WHERE id IN ({','.join('?' * len(ids))})", ids
+        )
+        return {r["id"] for r in rows}
+
+    def _papers(self, ids: List[str]) -> List[dict]:
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+        rows = {
+            r["id"]: r for r in self.conn.execute(
+                f"SELECT * FROM papers WHERE id IN ({','.join('?' * len(ids))})", ids
+            )
+        }
+        return [
+            {"id": pid, "name": rows[pid]["name"], "description": rows[pid]["description"], "url": rows[pid]["url"]}
+            for pid in ids if pid in rows
+        ]
+
+    @staticmethod
+    def _link_edge(row) -> dict:
+        return {"source": row["source"], "target": row["target"], "strength": row["strength"], "reason": row["reason"]}
+
+    def get_subgraph_1(self, paper_name: str, initial_keywords: List[str]) -> dict:
+        with self._lock:
+            return self._get_subgraph_1(paper_name, initial_keywords or [])
+
+    def _get_subgraph_1(self, paper_name: str, initial_keywords: List[str]) -> dict:
+        p = self._target_paper(paper_name)
+
+        # 1) target paper와 직접 연결된 keyword (ABOUT/IN, 방향 무관)
+        paper_kw_links = []
+        if p is not None:
+            rows = self.conn.execute(
+                """
+                SELECT rowid, * FROM links
+                WHERE type IN ('ABOUT', 'IN') AND (source = ? OR target = ?)
+                ORDER BY rowid
+                """,
+                (p["id"], p["id"]),
+            ).fetchall()
+            other = {r["rowid"]: (r["target"] if r["source"] == p["id"] else r["source"]) for r in rows}
+            kw_ids = self._keyword_ids(other.values())
+            paper_kw_links = [
+                (other[r["rowid"]], r) for r in rows
+                if other[r["rowid"]] in kw_ids and _passes(r["strength"], MIN_KW_STRENGTH)
+            ]
+        paper_kw_ids = [k for k, _ in paper_kw_links]
+
+        # 3) initial_keywords로 매칭된 seed keyword
+        seed_ids = self.closure.keyword_ids_by_names(initial_keywords)
+
+        # 2), 4) paper keyword / seed의 PREREQ*1..2 확장 (closure 테이블 사용)
+        expanded = self.closure.expand(list(dict.fromkeys(paper_kw_ids + seed_ids)))
+
+        # 5) seed를 ABOUT한 논문들 (전체에서 KW_PAPER_LIMIT개)
+        seed_about_links = []
+        if seed_ids:
+            rows = self.conn.execute(
+                f"""
+                SELECT l.* FROM links l JOIN papers pa ON pa.id = l.source
+                WHERE l.type = 'ABOUT' AND l.target IN ({','.join('?' * len(seed_ids))})
+                ORDER BY l.rowid
+                """,
+                seed_ids,
+            ).fetchall()
+            seen = set()
+            for r in rows:
+                if not _passes(r["strength"], MIN_KW_STRENGTH) or (r["source"], r["target"]) in seen:
+                    continue
+                seen.add((r["source"], r["target"]))
+                seed_about_links.append(r)
+            seed_about_links = seed_about_links[:KW_PAPER_LIMIT]
+
+        # 6) target paper를 참조한 논문 (REF_BY, REF_LIMIT개)
+        ref_links = []
+        if p is not None:
+            rows = self.conn.execute(
+                """
+                SELECT l.* FROM links l JOIN papers pa ON pa.id = l.source
+                WHERE l.type = 'REF_BY' AND l.target = ?
+                ORDER BY l.rowid
+                """,
+                (p["id"],),
+            ).fetchall()
+            ref_links = [r for r in rows if _passes(r["strength"], MIN_REF_STRENGTH)][:REF_LIMIT]
+
+        # ---- 정리 ----
+        paper_nodes = self._papers([r["source"] for r in seed_about_links] + [r["source"] for r in ref_links])
+
+        keyword_nodes = {k["id"]: k for k in expanded["keywords"]}
+        missing = [k for k in paper_kw_ids + seed_ids if k not in keyword_nodes]
+        if missing:
+            for k in self.closure.keywords_by_idx(
+                r["idx"] for r in self.conn.execute(
+                    f"SELECT idx FROM keywords WHERE id IN ({','.join('?' * len(missing))})", missing
+                )
+            ):
+                keyword_nodes[k["id"]] = k
+        for k in keyword_nodes.values():
+            k.pop("_idx", None)
+
+        # (source, target, type) 기준 dedup, strength 높은 것 유지
+        kw_link_edges = {"ABOUT": {}, "IN": {}}
+        for r in [r for _, r in paper_kw_links] + seed_about_links:
+            key = (r["source"], r["target"])
+            best = kw_link_edges[r["type"]].get(key)
+            if best is None or (r["strength"] or 0.0) > (best["strength"] or 0.0):
+                kw_link_edges[r["type"]][key] = self._link_edge(r)
+
+        ref_edges = {}
+        for r in ref_links:
+            ref_edges.setdefault((r["source"], r["target"]), {
+                "source": r["source"],
+                "target": r["target"],
+                "intents": json.loads(r["intents"]) if r["intents"] else None,
+                "isInfluential": None if r["is_influential"] is None else bool(r["is_influential"]),
+                "strength": r["strength"],
+            })
+
+        prereq_edges = {}
+        for e in expanded["edges"]:
+            key = (e["source"], e["target"])
+            if key not in prereq_edges or (e["strength"] or 0.0) > (prereq_edges[key]["strength"] or 0.0):
+                prereq_edges[key] = e
+
+        target_paper = None
+        if p is not None:
+            target_paper = {
+                "id": p["id"],
+                "name": p["name"],
+                "abstract": p["abstract"],
+                "description": p["description"],
+                "citationCount": p["citation_count"],
+            }
+
+        return {
+            "graph": {
+                "target_paper": target_paper,
+                "nodes": {"papers": paper_nodes, "keywords": list(keyword_nodes.values())},
+                "edges": {
+                    "PREREQ": list(prereq_edges.values()),
+                    "ABOUT": list(kw_link_edges["ABOUT"].values()),
+                    "IN": list(kw_link_edges["IN"].values()),
+                    "REF_BY": list(ref_edges.values()),
+                },
+            }
+        }
+
+
+_graph_store: Optional[GraphStore] = None
+_graph_store_lock = threading.Lock()
+
+
+def create_graph_store(backend: Optional[str] = None, path: Optional[str] = None) -> GraphStore:
+    backend = (backend or os.getenv("GRAPH_STORE_BACKEND", DEFAULT_GRAPH_STORE_BACKEND)).lower()
+    if backend == "neo4j":
+        return Neo4jGraphStore()
+    if backend == "sqlite":
+        return SQLiteGraphStore(path or os.getenv("GRAPH_STORE_PATH", DEFAULT_GRAPH_STORE_PATH))
+    raise ValueError(f"unknown GRAPH_STORE_BACKEND: {backend}")
+
+
+def get_graph_store() -> GraphStore:
+    """GRAPH_STORE_BACKEND(neo4j | sqlite) 설정에 따른 프로세스 공용 저장소"""
+    global _graph_store
+    if _graph_store is None:
+        with _graph_store_lock:
+            if _graph_store is None:
+                _graph_store = create_graph_store()
+    return _graph_store
+
+
+def set_graph_store(store: Optional[GraphStore]) -> None:
+    """테스트/로컬 배포에서 저장소를 직접 지정"""
+    global _graph_store
+    _graph_store = store
+
+
+# ---- Neo4j export ----
+EXPORT_PAPERS_QUERY = """
+MATCH (p:Paper)
+RETURN elementId(p) AS id, p.name AS name, p.description AS description, p.url AS url,
+       p.abstract AS abstract, p.citationCount AS citationCount
+"""
+
+EXPORT_LINKS_QUERY = """
+MATCH (a)-[r:ABOUT|IN|REF_BY]->(b)
+RETURN type(r) AS type, elementId(a) AS source, elementId(b) AS target,
+       r.strength AS strength, r.reason AS reason, r.intents AS intents, r.isInfluential AS isInfluential
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Neo4j -> SQLite graph store export")
+    parser.add_argument("--out", default=os.getenv("GRAPH_STORE_PATH", DEFAULT_GRAPH_STORE_PATH))
+    args = parser.parse_args()
+
+    from core.tools.gdb_search import run_cypher
+
+    started = time.perf_counter()
+    keywords, prereq_edges = export_prereq_graph_from_neo4j()
+    papers = run_cypher(EXPORT_PAPERS_QUERY, limit=None)
+    links = run_cypher(EXPORT_LINKS_QUERY, limit=None)
+    print(
+        f"exported: papers={len(papers)}, keywords={len(keywords)}, "
+        f"prereq_edges={len(prereq_edges)}, links={len(links)} ({time.perf_counter() - started:.1f}s)"
+    )
+
+    SQLiteGraphStore.build(args.out, papers, keywords, prereq_edges, links).close()
+    print(f"built {args.out}")
+
+
+if __name__ == "__main__":
+    main()
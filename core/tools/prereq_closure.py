@@ -0,0 +1,336 @@
+# core/tools/prereq_closure.py
+#
+# PREREQ closure 테이블 생성 (오프라인 작업)
+#   python -m core.tools.prereq_closure --out data/prereq_closure.sqlite --max-depth 2 --min-strength 0.9
+#
+# get_subgraph_1의 (kpre)-[:PREREQ*1..2]->(k) 확장을 keyword마다 미리 계산해서
+# SQLite 파일에 저장해 두고, Neo4j 없이 조회할 수 있게 한다.
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_PREREQ_CLOSURE_DB = "data/prereq_closure.sqlite"
+DEFAULT_MAX_DEPTH = 2
+DEFAULT_MIN_STRENGTH = 0.9
+
+
+def _passes(strength, min_strength: float) -> bool:
+    # Cypher 조건과 동일: x.strength IS NULL OR x.strength >= min_pr
+    return strength is None or strength >= min_strength
+
+
+def _score(strength) -> float:
+    # strength가 없는 관계는 필터를 통과하므로 최상 강도로 취급
+    return 1.0 if strength is None else float(strength)
+
+
+def build_prereq_closure(
+    edges: Iterable[dict],
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    min_strength: float = DEFAULT_MIN_STRENGTH,
+) -> dict:
+    """
+    keyword별 선수개념 closure 계산
+
+    입력:
+      - edges: [{"source": kpre_id, "target": k_id, "strength": ...}, ...] (PREREQ)
+    출력:
+      - { target_id: { ancestor_id: (distance, best_strength) } }
+        distance: ancestor -> target 최단 hop 수 (1..max_depth)
+        best_strength: 길이 max_depth 이하 경로들 중 경로 내 최소 strength의 최댓값
+    """
+    incoming = defaultdict(list)  # target -> [(source, score)]
+    for e in edges:
+        if not _passes(e.get("strength"), min_strength):
+            continue
+        incoming[e["target"]].append((e["source"], _score(e.get("strength"))))
+
+    closure = {}
+    for target in incoming:
+        found = {}
+        # frontier: 정확히 depth hop 만에 도달한 노드 -> 그 경로들의 최대 bottleneck
+        frontier = {target: float("inf")}
+        for depth in range(1, max_depth + 1):
+            next_frontier = {}
+            for node, bottleneck in frontier.items():
+                for source, score in incoming.get(node, []):
+                    b = min(bottleneck, score)
+                    if b > next_frontier.get(source, -1.0):
+                        next_frontier[source] = b
+
+            for source, b in next_frontier.items():
+                if source == target:
+                    continue
+                if source not in found:
+                    found[source] = (depth, b)
+                elif b > found[source][1]:
+                    found[source] = (found[source][0], b)
+
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        if found:
+            closure[target] = found
+    return closure
+
+
+class PrereqClosureStore:
+    """
+    SQLite 기반 PREREQ closure 저장소
+
+    테이블
+      - keywords(idx, id, name, name_lower, alias)
+      - prereq_edges(src, dst, strength, reason)       -- 정수 idx
+      - prereq_closure(target, ancestor, distance, strength)
+    """
+
+    def __init__(self, path: str = DEFAULT_PREREQ_CLOSURE_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._meta_cache: Optional[dict] = None
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ---- 생성 ----
+    @classmethod
+    def build(
+        cls,
+        path: str,
+        keywords: Iterable[dict],
+        edges: Iterable[dict],
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        min_strength: float = DEFAULT_MIN_STRENGTH,
+    ) -> "PrereqClosureStore":
+        keywords = list(keywords)
+        edges = list(edges)
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        conn = sqlite3.connect(tmp_path)
+        conn.executescript(
+            """
+            CREATE TABLE meta(key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE keywords(
+                idx INTEGER PRIMARY KEY, id TEXT UNIQUE NOT NULL,
+                name TEXT, name_lower TEXT, categories TEXT, link TEXT, alias TEXT
+            );
+            CREATE TABLE keyword_names(name_lower TEXT NOT NULL, idx INTEGER NOT NULL);
+            CREATE TABLE prereq_edges(src INTEGER, dst INTEGER, strength REAL, reason TEXT);
+            CREATE TABLE prereq_closure(target INTEGER, ancestor INTEGER, distance INTEGER, strength REAL);
+            """
+        )
+
+        index = {}
+        for kw in keywords:
+            if kw.get("id") in index:
+                continue
+            index[kw["id"]] = len(index)
+            alias = list(kw.get("alias") or [])
+            name = kw.get("name") or ""
+            conn.execute(
+                "INSERT INTO keywords VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (index[kw["id"]], kw["id"], name, name.lower(),
+                 json.dumps(kw.get("categories"), ensure_ascii=False), kw.get("link"),
+                 json.dumps(alias, ensure_ascii=False)),
+            )
+            for n in {name.lower(), *(a.lower() for a in alias)}:
+                conn.execute("INSERT INTO keyword_names VALUES (?, ?)", (n, index[kw["id"]]))
+
+        kept_edges = [e for e in edges if e["source"] in index and e["target"] in index]
+        conn.executemany(
+            "INSERT INTO prereq_edges VALUES (?, ?, ?, ?)",
+            ((index[e["source"]], index[e["target"]], e.get("strength"), e.get("reason"))
+             for e in kept_edges),
+        )
+
+        closure = build_prereq_closure(kept_edges, max_depth=max_depth, min_strength=min_strength)
+        conn.executemany(
+            "INSERT INTO prereq_closure VALUES (?, ?, ?, ?)",
+            ((index[t], index[a], d, s)
+             for t, ancestors in closure.items() for a, (d, s) in ancestors.items()),
+        )
+
+        conn.executescript(
+            """
+            CREATE INDEX idx_keyword_names ON keyword_names(name_lower);
+            CREATE INDEX idx_prereq_edges_dst ON prereq_edges(dst);
+            CREATE INDEX idx_prereq_closure_target ON prereq_closure(target, distance);
+            """
+        )
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [("max_depth", str(max_depth)), ("min_strength", str(min_strength)),
+             ("built_at", str(int(time.time())))],
+        )
+        conn.commit()
+        conn.close()
+        os.replace(tmp_path, path)
+        return cls(path)
+
+    # ---- 조회 ----
+    def meta(self) -> dict:
+        if self._meta_cache is None:
+            self._meta_cache = {r["key"]: r["value"] for r in self.conn.execute("SELECT key, value FROM meta")}
+        return self._meta_cache
+
+    def keyword_ids_by_names(self, names: Iterable[str]) -> list[str]:
+        """name/alias(소문자) 매칭 keyword id 목록 (Cypher seed 매칭과 동일 규칙)"""
+        lowered = sorted({n.lower() for n in names})
+        if not lowered:
+            return []
+        rows = self.conn.execute(
+            f"""
+            SELECT DISTINCT k.id FROM keyword_names n JOIN keywords k ON k.idx = n.idx
+            WHERE n.name_lower IN ({",".join("?" * len(lowered))})
+            """,
+            lowered,
+        )
+        return [r["id"] for r in rows]
+
+    def prerequisites(self, keyword_id: str, max_depth: Optional[int] = None) -> list[dict]:
+        """keyword_id의 선수개념 목록 (가까운 순, 같은 거리면 strength 높은 순)"""
+        max_depth = max_depth or int(self.meta().get("max_depth", DEFAULT_MAX_DEPTH))
+        rows = self.conn.execute(
+            """
+            SELECT a.id AS id, a.name AS name, c.distance AS distance, c.strength AS strength
+            FROM keywords t
+            JOIN prereq_closure c ON c.target = t.idx
+            JOIN keywords a ON a.idx = c.ancestor
+            WHERE t.id = ? AND c.distance <= ?
+            ORDER BY c.distance, c.strength DESC, a.id
+            """,
+            (keyword_id, max_depth),
+        )
+        return [dict(r) for r in rows]
+
+    def expand(self, keyword_ids: Iterable[str], max_depth: Optional[int] = None) -> dict:
+        """
+        keyword_ids 각각으로 들어오는 길이 max_depth 이하 PREREQ 경로의 노드/엣지
+        (get_subgraph_1의 PREREQ*1..N 확장 결과에 해당)
+
+        edge a->b 가 어떤 target으로 끝나는 길이 N 이하 경로 위에 있을 조건:
+          dist(b -> target) + 1 <= N   (b == target 이면 dist 0)
+        """
+        max_depth = max_depth or int(self.meta().get("max_depth", DEFAULT_MAX_DEPTH))
+        min_strength = float(self.meta().get("min_strength", DEFAULT_MIN_STRENGTH))
+        keyword_ids = list(dict.fromkeys(keyword_ids))
+        if not keyword_ids:
+            return {"keywords": [], "edges": []}
+
+        placeholders = ",".join("?" * len(keyword_ids))
+        # 각 노드의 target까지 최소 거리(target 자신은 0)가 max_depth - 1 이하인 노드로 들어오는 edge
+        rows = self.conn.execute(
+            f"""
+            WITH t AS (SELECT idx FROM keywords WHERE id IN ({placeholders})),
+            d AS (
+                SELECT idx AS node, 0 AS distance FROM t
+                UNION ALL
+                SELECT ancestor, distance FROM prereq_closure
+                WHERE target IN (SELECT idx FROM t) AND distance < ?
+            )
+            SELECT e.src AS src, e.dst AS dst, e.strength AS strength, e.reason AS reason
+            FROM prereq_edges e
+            WHERE e.dst IN (SELECT DISTINCT node FROM d)
+              AND (e.strength IS NULL OR e.strength >= ?)
+            """,
+            (*keyword_ids, max_depth, min_strength),
+        ).fetchall()
+
+        node_idx = {
+            r["idx"] for r in self.conn.execute(
+                f"SELECT idx FROM keywords WHERE id IN ({placeholders})", keyword_ids
+            )
+        }
+        for r in rows:
+            node_idx.add(r["src"])
+            node_idx.add(r["dst"])
+        keywords = self.keywords_by_idx(node_idx)
+        idx_to_id = {k.pop("_idx"): k["id"] for k in keywords}
+
+        edges = [
+            {"source": idx_to_id[r["src"]], "target": idx_to_id[r["dst"]],
+             "strength": r["strength"], "reason": r["reason"]}
+            for r in rows
+        ]
+        return {"keywords": keywords, "edges": edges}
+
+    def keywords_by_idx(self, idx_list: Iterable[int]) -> list[dict]:
+        idx_list = sorted(set(idx_list))
+        out = []
+        for start in range(0, len(idx_list), 500):
+            chunk = idx_list[start:start + 500]
+            for r in self.conn.execute(
+                f"SELECT * FROM keywords WHERE idx IN ({','.join('?' * len(chunk))}) ORDER BY idx",
+                chunk,
+            ):
+                out.append({
+                    "_idx": r["idx"],
+                    "id": r["id"],
+                    "name": r["name"],
+                    "categories": json.loads(r["categories"]) if r["categories"] else None,
+                    "link": r["link"],
+                    "alias": json.loads(r["alias"]) if r["alias"] else [],
+                })
+        return out
+
+
+# ---- Neo4j export ----
+EXPORT_KEYWORDS_QUERY = """
+MATCH (k:Keyword)
+RETURN elementId(k) AS id, k.name AS name, k.categories AS categories,
+       k.link AS link, coalesce(k.alias, []) AS alias
+"""
+
+EXPORT_PREREQ_QUERY = """
+MATCH (a:Keyword)-[r:PREREQ]->(b:Keyword)
+RETURN elementId(a) AS source, elementId(b) AS target, r.strength AS strength, r.reason AS reason
+"""
+
+
+def export_prereq_graph_from_neo4j():
+    """Neo4j에서 keyword / PREREQ 전체를 가져옴 (오프라인 작업에서만 import)"""
+    from core.tools.gdb_search import run_cypher
+
+    keywords = run_cypher(EXPORT_KEYWORDS_QUERY, limit=None)
+    edges = run_cypher(EXPORT_PREREQ_QUERY, limit=None)
+    return keywords, edges
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PREREQ closure 테이블 생성")
+    parser.add_argument("--out", default=os.getenv("PREREQ_CLOSURE_DB", DEFAULT_PREREQ_CLOSURE_DB))
+    parser.add_argument("--max-depth", type=int, default=DEFAULT_MAX_DEPTH)
+    parser.add_argument("--min-strength", type=float, default=DEFAULT_MIN_STRENGTH)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    keywords, edges = export_prereq_graph_from_neo4j()
+    print(f"exported: keywords={len(keywords)}, prereq_edges={len(edges)} ({time.perf_counter() - started:.1f}s)")
+
+    started = time.perf_counter()
+    store = PrereqClosureStore.build(
+        args.out, keywords, edges, max_depth=args.max_depth, min_strength=args.min_strength
+    )
+    rows = store.conn.execute("SELECT COUNT(*) FROM prereq_closure").fetchone()[0]
+    print(f"built {args.out}: closure_rows={rows} ({time.perf_counter() - started:.1f}s)")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+# core/tools/search_cache.py
+
+import asyncio
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_SEARCH_CACHE_TTL_SEC = 60 * 30
+DEFAULT_SEARCH_CACHE_MAX_ENTRIES = 1024
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def make_search_cache_key(tool: str, query: str, **params) -> tuple:
+    """tool 이름 + 정규화된 쿼리(공백 정리, 소문자) + 검색 옵션"""
+    query_key = " ".join((query or "").lower().split())
+    return (tool, query_key, tuple(sorted(params.items())))
+
+
+class _Inflight:
+    """진행 중인 검색 task와 그 결과를 기다리는 호출자 수"""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SearchCache:
+    """
+    웹/영상/논문 검색 결과 캐시 (프로세스 공용)
+
+    - key: (tool, 정규화된 쿼리, 검색 옵션)
+    - TTL 만료 + LRU 방식으로 최대 개수 유지
+    - 같은 key를 동시에 요청하면 검색은 한 번만 하고 결과를 나눠 씀 (single-flight)
+      (한 호출자가 취소돼도 나머지는 계속 기다리고, 모두 취소되면 검색도 취소)
+    - 빈 결과(검색 실패 포함)는 캐시하지 않음
+    - 호출자가 결과를 수정해도 캐시가 오염되지 않도록 저장/반환 시 deep copy
+    """
+
+    def __init__(
+        self,
+        ttl_sec: float = DEFAULT_SEARCH_CACHE_TTL_SEC,
+        max_entries: int = DEFAULT_SEARCH_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._inflight: Dict[tuple, _Inflight] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    def get(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_sec:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: tuple, value: List[Dict[str, Any]]) -> None:
+        if not value or self.max_entries <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get_or_fetch(
+        self,
+        key: tuple,
+        fetch: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """캐시에 있으면 바로 반환, 같은 key 검색이 진행 중이면 그 결과를 기다림, 아니면 fetch"""
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        leader = inflight is None
+        if leader:
+            # fetch는 별도 task로 돌려서 특정 호출자가 취소돼도 같은 검색을 기다리는 쪽에 취소가 퍼지지 않게 함
+            task = asyncio.get_running_loop().create_task(self._fetch_and_store(key, fetch))
+            inflight = self._inflight[key] = _Inflight(task)
+        else:
+            self.shared += 1
+
+        inflight.waiters += 1
+        try:
+            result = await asyncio.shield(inflight.task)
+        except asyncio.CancelledError:
+            # 이 호출자만 취소된 경우: 기다리는 쪽이 더 없을 때만 검색도 취소
+            if inflight.waiters == 1 and not inflight.task.done():
+                inflight.task.cancel()
+            raise
+        finally:
+            inflight.waiters -= 1
+        return result if leader else copy.deepcopy(result)
+
+    async def _fetch_and_store(
+        self,
+        key: tuple,
+        fetch: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        try:
+            result = await fetch()
+            self.set(key, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+        }
+
+
+search_cache = SearchCache(
+    ttl_sec=_env_number("SEARCH_CACHE_TTL_SEC", DEFAULT_SEARCH_CACHE_TTL_SEC, float),
+    max_entries=_env_number("SEARCH_CACHE_MAX_ENTRIES", DEFAULT_SEARCH_CACHE_MAX_ENTRIES, int),
+)
+
+
+def invalidate_search_cache() -> None:
+    search_cache.invalidate()
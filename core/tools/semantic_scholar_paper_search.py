@@ -9,10 +9,13 @@ import asyncio
 from dotenv import load_dotenv
 from langsmith import traceable
 
+from core.utils.circuit_breaker import BREAKER_SEMANTIC_SCHOLAR, get_circuit_breaker
+
 load_dotenv()
 
 S2_API_KEY = os.environ.get("S2_API_KEY")  # optional
 S2_ENDPOINT = "https://api.semanticscholar.org/graph/v1/paper/search"
+s2_breaker = get_circuit_breaker(BREAKER_SEMANTIC_SCHOLAR)
 
 
 def _paper_fallback_url(paper: Dict[str, Any]) -> Optional[str]:
@@ -81,6 +84,10 @@ async def search_paper_resources(
         headers["x-api-key"] = S2_API_KEY 
 
     for attempt in range(max_retries + 1):
+        # 다른 job에서 이미 장애(429/5xx 반복)로 판단했으면 기다리지 않고 빈 결과
+        if not s2_breaker.allow():
+            print(f"[Semantic Scholar] circuit open, skip (retry in {s2_breaker.retry_in():.0f}s)")
+            return []
         try:
             async with httpx.AsyncClient(timeout=timeout_sec) as client:
                 resp = await client.get(S2_ENDPOINT, params=params, headers=headers)
@@ -93,10 +100,14 @@ async def search_paper_resources(
                 else:
                     # exponential backoff + jitter
                     wait_s = min(2 ** attempt, 30) + random.random()
+                s2_breaker.record_status(429, retry_after=float(retry_after) if retry_after else None)
+                if attempt >= max_retries:
+                    break
                 print(f"[Semantic Scholar] 429 rate-limited. sleep {wait_s:.1f}s (attempt {attempt}/{max_retries})")
                 await asyncio.sleep(wait_s)
                 continue
 
+            s2_breaker.record_status(resp.status_code)
             resp.raise_for_status()
             data = resp.json()
 
@@ -126,6 +137,11 @@ async def search_paper_resources(
                 continue
             print(f"[Semantic Scholar Tool Error] {e}")
             return []
+        except httpx.TransportError as e:
+            # 연결 실패/timeout (응답 없음)
+            s2_breaker.record_failure()
+            print(f"[Semantic Scholar Tool Error] {e}")
+            return []
         except Exception as e:
             print(f"[Semantic Scholar Tool Error] {e}")
             return []
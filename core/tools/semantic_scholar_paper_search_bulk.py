@@ -7,10 +7,14 @@ import httpx
 from dotenv import load_dotenv
 from langsmith import traceable
 
+from core.utils.circuit_breaker import BREAKER_SEMANTIC_SCHOLAR, get_circuit_breaker
+
 load_dotenv()
 
 S2_API_KEY = os.environ.get("S2_API_KEY")
 S2_BULK_ENDPOINT = "https://api.semanticscholar.org/graph/v1/paper/search/bulk"
+# /paper/search와 같은 API key 한도를 쓰므로 breaker 공유
+s2_breaker = get_circuit_breaker(BREAKER_SEMANTIC_SCHOLAR)
 
 
 def _paper_fallback_url(paper: Dict[str, Any]) -> Optional[str]:
@@ -78,10 +82,13 @@ async def search_paper_resources(
         headers["x-api-key"] = S2_API_KEY
 
     try:
-        async with httpx.AsyncClient(timeout=timeout_sec) as client:
-            resp = await client.get(S2_BULK_ENDPOINT, params=params, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
+        async def _get() -> Dict[str, Any]:
+            async with httpx.AsyncClient(timeout=timeout_sec) as client:
+                resp = await client.get(S2_BULK_ENDPOINT, params=params, headers=headers)
+                resp.raise_for_status()
+                return resp.json()
+
+        data = await s2_breaker.call(_get)
 
         papers = data.get("data", [])
         if not isinstance(papers, list):
@@ -7,10 +7,13 @@ import httpx
 from dotenv import load_dotenv
 from langsmith import traceable
 
+from core.utils.circuit_breaker import BREAKER_SERPER, get_circuit_breaker
+
 load_dotenv()
 
 SERPER_API_KEY = os.environ.get("SERPER_API_KEY")
 SERPER_ENDPOINT = "https://google.serper.dev/videos"
+serper_breaker = get_circuit_breaker(BREAKER_SERPER)
 
 
 def _normalize_serper_video_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -46,11 +49,14 @@ async def search_video_resources(
     payload = {"q": query, "gl": gl, "hl": hl}
     headers = {"X-API-KEY": SERPER_API_KEY, "Content-Type": "application/json"}
 
-    try:
+    async def _post() -> Dict[str, Any]:
         async with httpx.AsyncClient(timeout=timeout_sec) as client:
             resp = await client.post(SERPER_ENDPOINT, json=payload, headers=headers)
             resp.raise_for_status()
-            data = resp.json()
+            return resp.json()
+
+    try:
+        data = await serper_breaker.call(_post)
 
         videos = data.get("videos", [])
         if not isinstance(videos, list):
@@ -7,10 +7,13 @@ import httpx
 from dotenv import load_dotenv
 from langsmith import traceable
 
+from core.utils.circuit_breaker import BREAKER_SERPER, get_circuit_breaker
+
 load_dotenv()
 
 SERPER_API_KEY = os.environ.get("SERPER_API_KEY")
 SERPER_ENDPOINT = "https://google.serper.dev/search"
+serper_breaker = get_circuit_breaker(BREAKER_SERPER)
 
 
 def _normalize_serper_web_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -25,44 +28,56 @@ def _normalize_serper_web_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]
     }
 
 
-@traceable(run_type="tool", name="Serper Web Search")
-async def search_web_resources_serper(
+async def serper_web_search_raw(
     query: str,
     max_results: int = 2,
     gl: str = "kr",
     hl: str = "ko",
     timeout_sec: float = 15.0,
 ) -> List[Dict[str, Any]]:
-
+    """Serper 웹 검색 (실패 시 예외를 그대로 올림, provider failover용)"""
     if not SERPER_API_KEY:
-        print("[Serper Tool Error] SERPER_API_KEY is missing")
-        return []
+        raise RuntimeError("SERPER_API_KEY is missing")
 
     payload = {"q": query, "gl": gl, "hl": hl}
     headers = {"X-API-KEY": SERPER_API_KEY, "Content-Type": "application/json"}
 
-    try:
+    async def _post() -> Dict[str, Any]:
         async with httpx.AsyncClient(timeout=timeout_sec) as client:
             resp = await client.post(SERPER_ENDPOINT, json=payload, headers=headers)
             resp.raise_for_status()
-            data = resp.json()
+            return resp.json()
+
+    data = await serper_breaker.call(_post)
 
-        organic = data.get("organic", [])
-        if not isinstance(organic, list):
-            return []
+    organic = data.get("organic", [])
+    if not isinstance(organic, list):
+        return []
 
-        normalized: List[Dict[str, Any]] = []
-        for item in organic:
-            if not isinstance(item, dict):
-                continue
-            n = _normalize_serper_web_item(item)
-            if n:
-                normalized.append(n)
-            if len(normalized) >= max_results:
-                break
+    normalized: List[Dict[str, Any]] = []
+    for item in organic:
+        if not isinstance(item, dict):
+            continue
+        n = _normalize_serper_web_item(item)
+        if n:
+            normalized.append(n)
+        if len(normalized) >= max_results:
+            break
 
-        return normalized
+    return normalized
 
+
+@traceable(run_type="tool", name="Serper Web Search")
+async def search_web_resources_serper(
+    query: str,
+    max_results: int = 2,
+    gl: str = "kr",
+    hl: str = "ko",
+    timeout_sec: float = 15.0,
+) -> List[Dict[str, Any]]:
+
+    try:
+        return await serper_web_search_raw(query, max_results, gl=gl, hl=hl, timeout_sec=timeout_sec)
     except Exception as e:
         print(f"[Serper Tool Error] {e}")
         return []
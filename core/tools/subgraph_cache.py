@@ -0,0 +1,149 @@
+# core/tools/subgraph_cache.py
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_SUBGRAPH_CACHE_TTL_SEC = 60 * 60
+DEFAULT_SUBGRAPH_CACHE_MAX_ENTRIES = 128
+DEFAULT_GRAPH_DB_VERSION_CHECK_SEC = 60
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def make_subgraph_cache_key(paper_name: str, initial_keywords: Iterable[str]) -> tuple:
+    """
+    get_subgraph_1 Cypher의 매칭 규칙과 같은 정규화
+    - paper_name: toLower(trim(...))
+    - initial_keywords: toLower(...) 후 중복 제거, 정렬
+    """
+    paper_key = (paper_name or "").strip().lower()
+    keyword_key = tuple(sorted({(k or "").lower() for k in (initial_keywords or [])}))
+    return (paper_key, keyword_key)
+
+
+class SubgraphCache:
+    """
+    1차 subgraph(raw Neo4j 결과) 캐시
+
+    - key: (정규화된 논문 이름, 정렬된 소문자 keyword 튜플)
+    - TTL 만료 + LRU 방식으로 최대 개수 유지
+    - graph_db_version이 바뀌면 전체 무효화
+    - 호출자가 결과를 수정해도 캐시가 오염되지 않도록 저장/반환 시 deep copy
+    """
+
+    def __init__(
+        self,
+        ttl_sec: float = DEFAULT_SUBGRAPH_CACHE_TTL_SEC,
+        max_entries: int = DEFAULT_SUBGRAPH_CACHE_MAX_ENTRIES,
+        graph_db_version: Optional[str] = None,
+    ):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self.graph_db_version = graph_db_version
+        self._entries: "OrderedDict[tuple, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _check_version(self, graph_db_version: Optional[str]) -> None:
+        if graph_db_version != self.graph_db_version:
+            self._entries.clear()
+            self.graph_db_version = graph_db_version
+
+    def get(self, key: tuple, graph_db_version: Optional[str] = None) -> Optional[dict]:
+        with self._lock:
+            self._check_version(graph_db_version)
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl_sec:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: tuple, value: dict, graph_db_version: Optional[str] = None) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._check_version(graph_db_version)
+
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "graph_db_version": self.graph_db_version,
+        }
+
+
+class GraphVersionProbe:
+    """
+    그래프 DB 버전을 주기적으로 조회
+
+    - interval_sec 동안은 마지막 값을 재사용 (subgraph 조회마다 DB를 두 번 치지 않도록)
+    - 조회가 실패하면 마지막으로 확인한 값을 유지 (DB 장애로 캐시가 비워지지 않도록)
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Optional[str]],
+        interval_sec: float = DEFAULT_GRAPH_DB_VERSION_CHECK_SEC,
+    ):
+        self.fetch = fetch
+        self.interval_sec = interval_sec
+        self.version: Optional[str] = None
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[str]:
+        with self._lock:
+            now = time.monotonic()
+            if self._checked_at is not None and now - self._checked_at < self.interval_sec:
+                return self.version
+            self._checked_at = now
+        try:
+            version = self.fetch()
+        except Exception as e:
+            print(f"[subgraph_cache] graph DB 버전 조회 실패: {e}")
+            return self.version
+        with self._lock:
+            self.version = version
+        return version
+
+
+subgraph_cache = SubgraphCache(
+    ttl_sec=_env_number("SUBGRAPH_CACHE_TTL_SEC", DEFAULT_SUBGRAPH_CACHE_TTL_SEC, float),
+    max_entries=_env_number("SUBGRAPH_CACHE_MAX_ENTRIES", DEFAULT_SUBGRAPH_CACHE_MAX_ENTRIES, int),
+)
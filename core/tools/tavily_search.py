@@ -7,25 +7,44 @@ from tavily import TavilyClient
 from dotenv import load_dotenv
 from langsmith import traceable
 
+from core.tools.search_cache import make_search_cache_key, search_cache
+from core.utils.circuit_breaker import BREAKER_TAVILY, get_circuit_breaker
+
 load_dotenv()
 
 TAVILY_KEY = os.environ.get("TAVILY_API_KEY")
 tavily_client = TavilyClient(api_key=TAVILY_KEY)
+tavily_breaker = get_circuit_breaker(BREAKER_TAVILY)
 
-@traceable(run_type="tool", name="Tavily Search")
-async def search_web_resources(query: str, max_results: int = 2,search_depth:str= "basic") -> List[Dict[str, Any]]:
-    """Tavily를 이용해 웹 서치"""
+async def tavily_search_raw(query: str, max_results: int = 2, search_depth: str = "basic") -> List[Dict[str, Any]]:
+    """Tavily 검색 (실패 시 예외를 그대로 올림, provider failover용)"""
+    # 동기 함수를 비동기 스레드에서 실행
+    result = await tavily_breaker.call(
+        asyncio.to_thread,
+        tavily_client.search, 
+        query=query, 
+        max_results=max_results, 
+        search_depth=search_depth, 
+        topic="general",
+        country="south korea",             
+    )
+    return result.get('results', [])
+
+
+async def _search_tavily(query: str, max_results: int, search_depth: str) -> List[Dict[str, Any]]:
     try:
-        # 동기 함수를 비동기 스레드에서 실행
-        result = await asyncio.to_thread(
-            tavily_client.search, 
-            query=query, 
-            max_results=max_results, 
-            search_depth=search_depth, 
-            topic="general",
-            country="south korea",             
-        )
-        return result.get('results', [])
+        return await tavily_search_raw(query, max_results, search_depth)
     except Exception as e:
         print(f"[Tavily Tool Error] {e}")
-        return []
\ No newline at end of file
+        return []
+
+
+@traceable(run_type="tool", name="Tavily Search")
+async def search_web_resources(query: str, max_results: int = 2,search_depth:str= "basic") -> List[Dict[str, Any]]:
+    """Tavily를 이용해 웹 서치 (같은 쿼리는 search_cache에서 재사용)"""
+    cache_key = make_search_cache_key(
+        "tavily", query, max_results=max_results, search_depth=search_depth
+    )
+    return await search_cache.get_or_fetch(
+        cache_key, lambda: _search_tavily(query, max_results, search_depth)
+    )
@@ -0,0 +1,256 @@
+# core/tools/web_search_failover.py
+"""
+웹 검색 provider failover + hedged request
+
+Tavily/Serper 중 하나가 느리거나 에러를 내면 기존에는 timeout(15초) 뒤 []가 되어
+해당 키워드에 자료가 없고 orchestrator 라운드가 한 번 더 돌았다.
+- provider별 지연시간/에러율 EWMA와 최근 지연시간(p95) 기록
+- 상태가 좋은 provider부터 요청하고, 첫 provider의 p95만큼 기다려도 결과가 없으면
+  두 번째 provider에 같은 쿼리를 보냄 (hedge) -> 먼저 온 비어 있지 않은 결과 사용, 나머지 취소
+- 첫 provider가 에러/빈 결과로 끝나면 기다리지 않고 바로 다음 provider
+- hedge 요청도 검색 1회로 요청 예산에 기록 (예산이 없으면 hedge 생략)
+- 결과는 search_cache에 저장 (provider와 무관하게 같은 쿼리면 재사용)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from core.tools.search_cache import make_search_cache_key, search_cache
+from core.tools.serper_web_search import SERPER_API_KEY, serper_web_search_raw
+from core.tools.tavily_search import TAVILY_KEY, tavily_search_raw
+from core.utils.budget import clamp_timeout, record_search_call, search_allowed
+
+load_dotenv()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+PROVIDER_TAVILY = "tavily"
+PROVIDER_SERPER = "serper"
+
+# 검색 전체 timeout (초), 요청 예산이 있으면 남은 시간으로 잘림
+WEB_SEARCH_TIMEOUT_SEC = _env_float("WEB_SEARCH_TIMEOUT_SEC", 15.0)
+# hedge 사용 여부와 지연시간 범위 (p95 표본이 부족하면 기본값)
+WEB_SEARCH_HEDGE = _env_flag("WEB_SEARCH_HEDGE", "1")
+HEDGE_DEFAULT_DELAY_SEC = _env_float("WEB_SEARCH_HEDGE_DEFAULT_DELAY_SEC", 2.0)
+HEDGE_MIN_DELAY_SEC = _env_float("WEB_SEARCH_HEDGE_MIN_DELAY_SEC", 0.3)
+HEDGE_MAX_DELAY_SEC = _env_float("WEB_SEARCH_HEDGE_MAX_DELAY_SEC", 5.0)
+
+EWMA_ALPHA = 0.2
+# 에러율 EWMA가 이 값 이상이면 primary로 지정돼도 뒤로 미룸
+UNHEALTHY_ERROR_EWMA = 0.5
+LATENCY_WINDOW = 100
+MIN_P95_SAMPLES = 20
+
+SearchFn = Callable[[str, int], Awaitable[List[Dict[str, Any]]]]
+
+
+class ProviderStats:
+    """provider 하나의 지연시간/에러율 EWMA와 최근 지연시간 창"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latency_ewma: Optional[float] = None
+        self.error_ewma = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.empties = 0
+        self.wins = 0
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, latency: float, ok: bool, empty: bool = False) -> None:
+        self.calls += 1
+        self.errors += int(not ok)
+        self.empties += int(ok and empty)
+        self.error_ewma = EWMA_ALPHA * (0.0 if ok else 1.0) + (1 - EWMA_ALPHA) * self.error_ewma
+        if ok:
+            self._latencies.append(latency)
+            self.latency_ewma = latency if self.latency_ewma is None else (
+                EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * self.latency_ewma
+            )
+
+    def p95(self) -> Optional[float]:
+        if len(self._latencies) < MIN_P95_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    def hedge_delay(self) -> float:
+        p95 = self.p95()
+        delay = HEDGE_DEFAULT_DELAY_SEC if p95 is None else p95
+        return min(max(delay, HEDGE_MIN_DELAY_SEC), HEDGE_MAX_DELAY_SEC)
+
+    def score(self) -> float:
+        """낮을수록 먼저 시도 (지연시간 EWMA에 에러율 가중)"""
+        latency = self.latency_ewma if self.latency_ewma is not None else HEDGE_DEFAULT_DELAY_SEC
+        return latency * (1 + 4 * self.error_ewma)
+
+    def snapshot(self) -> Dict[str, Any]:
+        p95 = self.p95()
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "empties": self.empties,
+            "wins": self.wins,
+            "latency_ewma_ms": round(self.latency_ewma * 1000, 1) if self.latency_ewma is not None else None,
+            "error_ewma": round(self.error_ewma, 3),
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+        }
+
+
+class WebSearchFailover:
+    def __init__(self, providers: Dict[str, SearchFn], hedge: bool = WEB_SEARCH_HEDGE):
+        self.providers = providers
+        self.hedge = hedge
+        self.stats = {name: ProviderStats(name) for name in providers}
+        self.hedges = 0
+        self.failovers = 0
+        self._lock = threading.Lock()
+
+    def order(self, primary: Optional[str] = None) -> List[str]:
+        """primary가 있고 에러가 잦지 않으면 맨 앞, 나머지는 상태 점수 순"""
+        names = sorted(self.providers, key=lambda n: self.stats[n].score())
+        if primary in self.providers and self.stats[primary].error_ewma < UNHEALTHY_ERROR_EWMA:
+            names.remove(primary)
+            names.insert(0, primary)
+        return names
+
+    async def _call(self, name: str, query: str, max_results: int) -> List[Dict[str, Any]]:
+        started = time.monotonic()
+        try:
+            results = await self.providers[name](query, max_results)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            with self._lock:
+                self.stats[name].record(time.monotonic() - started, ok=False)
+            print(f"[WebSearch] {name} 실패: {e}")
+            raise
+        with self._lock:
+            self.stats[name].record(time.monotonic() - started, ok=True, empty=not results)
+        return results or []
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 2,
+        primary: Optional[str] = None,
+        timeout_sec: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        provider 순서대로 시도하며 먼저 온 비어 있지 않은 결과 반환 (모두 실패/빈 결과면 [])
+        - 진행 중인 요청이 hedge_delay 안에 끝나지 않으면 다음 provider를 추가로 시작
+        """
+        queue = self.order(primary)
+        if not queue:
+            return []
+        started = time.monotonic()
+        deadline = started + clamp_timeout(WEB_SEARCH_TIMEOUT_SEC if timeout_sec is None else timeout_sec)
+        hedge_at = started + self.stats[queue[0]].hedge_delay() if self.hedge else None
+
+        pending: Dict[asyncio.Task, str] = {}
+
+        def launch() -> None:
+            name = queue.pop(0)
+            pending[asyncio.ensure_future(self._call(name, query, max_results))] = name
+
+        def launch_extra(kind: str) -> bool:
+            # 두 번째 이후 provider 요청도 검색 1회로 예산에 기록
+            if not queue or not search_allowed():
+                return False
+            record_search_call()
+            with self._lock:
+                if kind == "hedge":
+                    self.hedges += 1
+                else:
+                    self.failovers += 1
+            launch()
+            return True
+
+        launch()
+        try:
+            while pending:
+                now = time.monotonic()
+                if now >= deadline:
+                    print(f"[WebSearch] timeout: '{query}' ({', '.join(pending.values())})")
+                    return []
+
+                wait = deadline - now
+                if hedge_at is not None and queue:
+                    wait = min(wait, max(hedge_at - now, 0))
+
+                done, _ = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    if hedge_at is not None and time.monotonic() >= hedge_at:
+                        # p95 안에 응답이 없음 -> 다음 provider에 같은 쿼리 (hedge는 한 번만)
+                        launch_extra("hedge")
+                        hedge_at = None
+                    continue
+
+                for task in done:
+                    name = pending.pop(task)
+                    if task.exception() is None and task.result():
+                        with self._lock:
+                            self.stats[name].wins += 1
+                        return task.result()
+
+                # 끝난 요청이 모두 실패/빈 결과이고 진행 중인 게 없으면 바로 다음 provider (failover)
+                if not pending:
+                    launch_extra("failover")
+            return []
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hedges": self.hedges,
+                "failovers": self.failovers,
+                "providers": {name: s.snapshot() for name, s in self.stats.items()},
+            }
+
+
+def _default_providers() -> Dict[str, SearchFn]:
+    providers: Dict[str, SearchFn] = {}
+    if TAVILY_KEY:
+        providers[PROVIDER_TAVILY] = lambda q, n: tavily_search_raw(q, max_results=n)
+    if SERPER_API_KEY:
+        providers[PROVIDER_SERPER] = lambda q, n: serper_web_search_raw(q, max_results=n)
+    return providers
+
+
+web_search_failover = WebSearchFailover(_default_providers())
+
+
+async def search_web_with_failover(
+    query: str,
+    max_results: int = 2,
+    primary: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    웹 검색 (provider failover/hedge + search_cache)
+    - primary: 먼저 시도할 provider (tool plan에서 tavily/serper_web을 나눠 쓰는 경우)
+      tool plan의 두 단계가 서로의 캐시 결과를 받으면 URL dedupe에서 다 빠지므로 primary별로 캐시,
+      primary 없이 부르는 호출(개념 확장 tool)끼리만 provider와 상관없이 공유
+    """
+    cache_key = make_search_cache_key("web", query, max_results=max_results, primary=primary or "")
+    return await search_cache.get_or_fetch(
+        cache_key, lambda: web_search_failover.search(query, max_results=max_results, primary=primary)
+    )
+
@@ -0,0 +1,238 @@
+# core/utils/budget.py
+"""
+요청(커리큘럼 생성 job) 단위 지연시간/비용 예산
+
+- RequestBudget: 최대 실행 시간, LLM 호출 수, 토큰 수, 검색 호출 수, orchestrator 최대 반복
+- 요청 시작 시 bind_request_budget()으로 ContextVar에 바인딩하면 그래프 전체(병렬 노드 포함)에서 공유
+- LLM 호출/토큰은 BudgetCallbackHandler(get_solar_model이 붙임), 검색은 record_search_call()로 집계
+- 사용률에 따라 단계적으로 축소: normal -> tight(확장 생략, 자료 수 축소) -> exhausted(바로 compose)
+- async_timeout은 남은 시간으로 잘리되 마무리 단계가 돌 수 있도록 최소 시간은 보장
+"""
+
+import os
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from langchain_core.callbacks import BaseCallbackHandler
+
+load_dotenv()
+
+# orchestrator 루프 최대 반복 횟수 (예산에 max_iterations가 없을 때 기본값)
+DEFAULT_MAX_ITERATIONS = 6
+
+# 사용률이 이 값 이상이면 tight 단계
+DEFAULT_BUDGET_DEGRADE_AT = 0.7
+# 예산이 거의 끝나도 마무리 단계(compose, first_node_order)에 주는 최소 timeout
+DEFAULT_MIN_STAGE_TIMEOUT_SEC = 15.0
+
+LEVEL_NORMAL = "normal"
+LEVEL_TIGHT = "tight"
+LEVEL_EXHAUSTED = "exhausted"
+
+_LIMIT_ENV = {
+    "max_wall_time_sec": ("BUDGET_MAX_WALL_TIME_SEC", float),
+    "max_llm_calls": ("BUDGET_MAX_LLM_CALLS", int),
+    "max_tokens": ("BUDGET_MAX_TOKENS", int),
+    "max_search_calls": ("BUDGET_MAX_SEARCH_CALLS", int),
+}
+
+
+def _env_number(name: str, cast) -> Optional[Any]:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return None
+    try:
+        value = cast(raw)
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+class RequestBudget:
+    """한 요청의 예산과 사용량 (limit이 None이면 해당 항목은 제한 없음)"""
+
+    def __init__(
+        self,
+        max_wall_time_sec: Optional[float] = None,
+        max_llm_calls: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        max_search_calls: Optional[int] = None,
+        max_iterations: int = DEFAULT_MAX_ITERATIONS,
+        degrade_at: float = DEFAULT_BUDGET_DEGRADE_AT,
+    ):
+        self.max_wall_time_sec = max_wall_time_sec
+        self.max_llm_calls = max_llm_calls
+        self.max_tokens = max_tokens
+        self.max_search_calls = max_search_calls
+        self.max_iterations = max_iterations
+        self.degrade_at = degrade_at
+
+        self.started_at = time.monotonic()
+        self.llm_calls = 0
+        self.tokens = 0
+        self.search_calls = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, **overrides) -> "RequestBudget":
+        """환경 변수 기본값 + 요청별 override (None인 override는 무시)"""
+        kwargs: Dict[str, Any] = {key: _env_number(env, cast) for key, (env, cast) in _LIMIT_ENV.items()}
+        kwargs["max_iterations"] = _env_number("MAX_ITERATIONS", int) or DEFAULT_MAX_ITERATIONS
+        kwargs["degrade_at"] = _env_number("BUDGET_DEGRADE_AT", float) or DEFAULT_BUDGET_DEGRADE_AT
+        kwargs.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(**kwargs)
+
+    # ---- 사용량 기록 ----
+    def record_llm_call(self) -> None:
+        with self._lock:
+            self.llm_calls += 1
+
+    def record_tokens(self, n: int) -> None:
+        with self._lock:
+            self.tokens += n
+
+    def record_search_call(self, n: int = 1) -> None:
+        with self._lock:
+            self.search_calls += n
+
+    # ---- 조회 ----
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining_time(self) -> Optional[float]:
+        if self.max_wall_time_sec is None:
+            return None
+        return self.max_wall_time_sec - self.elapsed()
+
+    def fraction_used(self) -> float:
+        """제한이 있는 항목 중 가장 많이 쓴 비율"""
+        ratios = [0.0]
+        if self.max_wall_time_sec is not None:
+            ratios.append(self.elapsed() / self.max_wall_time_sec)
+        if self.max_llm_calls is not None:
+            ratios.append(self.llm_calls / self.max_llm_calls)
+        if self.max_tokens is not None:
+            ratios.append(self.tokens / self.max_tokens)
+        if self.max_search_calls is not None:
+            ratios.append(self.search_calls / self.max_search_calls)
+        return max(ratios)
+
+    def level(self) -> str:
+        used = self.fraction_used()
+        if used >= 1.0:
+            return LEVEL_EXHAUSTED
+        if used >= self.degrade_at:
+            return LEVEL_TIGHT
+        return LEVEL_NORMAL
+
+    def search_allowed(self) -> bool:
+        return self.max_search_calls is None or self.search_calls < self.max_search_calls
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "elapsed_sec": round(self.elapsed(), 2),
+            "llm_calls": self.llm_calls,
+            "tokens": self.tokens,
+            "search_calls": self.search_calls,
+            "fraction_used": round(self.fraction_used(), 3),
+            "level": self.level(),
+            "limits": {
+                "max_wall_time_sec": self.max_wall_time_sec,
+                "max_llm_calls": self.max_llm_calls,
+                "max_tokens": self.max_tokens,
+                "max_search_calls": self.max_search_calls,
+                "max_iterations": self.max_iterations,
+            },
+        }
+
+
+_REQUEST_BUDGET: ContextVar[Optional[RequestBudget]] = ContextVar(
+    "request_budget",
+    default=None,
+)
+
+
+def bind_request_budget(budget: Optional[RequestBudget]) -> Token:
+    """현재 컨텍스트에 예산 바인딩 (None이면 제한 없음)"""
+    return _REQUEST_BUDGET.set(budget)
+
+
+def reset_request_budget(token: Token) -> None:
+    _REQUEST_BUDGET.reset(token)
+
+
+def get_request_budget() -> Optional[RequestBudget]:
+    return _REQUEST_BUDGET.get()
+
+
+def get_max_iterations() -> int:
+    budget = _REQUEST_BUDGET.get()
+    return budget.max_iterations if budget is not None else DEFAULT_MAX_ITERATIONS
+
+
+def get_budget_level() -> str:
+    budget = _REQUEST_BUDGET.get()
+    return budget.level() if budget is not None else LEVEL_NORMAL
+
+
+def record_search_call(n: int = 1) -> None:
+    budget = _REQUEST_BUDGET.get()
+    if budget is not None:
+        budget.record_search_call(n)
+
+
+def search_allowed() -> bool:
+    budget = _REQUEST_BUDGET.get()
+    return budget is None or budget.search_allowed()
+
+
+def clamp_timeout(seconds: float) -> float:
+    """남은 예산 시간으로 timeout을 줄이되 최소 시간은 보장"""
+    budget = _REQUEST_BUDGET.get()
+    remaining = budget.remaining_time() if budget is not None else None
+    if remaining is None:
+        return seconds
+    floor = _env_number("BUDGET_MIN_STAGE_TIMEOUT_SEC", float) or DEFAULT_MIN_STAGE_TIMEOUT_SEC
+    return min(seconds, max(remaining, floor))
+
+
+def _usage_tokens(response) -> int:
+    """LLMResult에서 total_tokens 추출 (usage_metadata 우선, 없으면 llm_output.token_usage)"""
+    total = 0
+    for generations in response.generations or []:
+        for gen in generations:
+            usage = getattr(getattr(gen, "message", None), "usage_metadata", None)
+            if usage:
+                total += usage.get("total_tokens", 0)
+    if total:
+        return total
+    token_usage = (response.llm_output or {}).get("token_usage") or {}
+    return token_usage.get("total_tokens", 0) or 0
+
+
+class BudgetCallbackHandler(BaseCallbackHandler):
+    """현재 컨텍스트의 RequestBudget에 LLM 호출/토큰을 기록 (검색은 호출하는 쪽에서 record_search_call)"""
+
+    # 이벤트 루프에서 바로 실행해야 ContextVar(요청 예산)가 보임
+    run_inline = True
+
+    def on_chat_model_start(self, serialized, messages, **kwargs) -> None:
+        budget = _REQUEST_BUDGET.get()
+        if budget is not None:
+            budget.record_llm_call()
+
+    def on_llm_start(self, serialized, prompts, **kwargs) -> None:
+        budget = _REQUEST_BUDGET.get()
+        if budget is not None:
+            budget.record_llm_call()
+
+    def on_llm_end(self, response, **kwargs) -> None:
+        budget = _REQUEST_BUDGET.get()
+        if budget is not None:
+            budget.record_tokens(_usage_tokens(response))
+
+
+budget_callback = BudgetCallbackHandler()
@@ -0,0 +1,246 @@
+# core/utils/circuit_breaker.py
+"""
+외부 API circuit breaker (프로세스 공용)
+
+Serper/Tavily/Semantic Scholar/Wikipedia/메인 백엔드가 내려가 있으면 기존에는 호출마다
+timeout이나 재시도(429 backoff)를 다 기다린 뒤 실패했다. 같은 서비스에 대한 상태를
+프로세스 안의 모든 job이 공유해서
+- closed   : 정상 호출, 연속 실패가 CIRCUIT_BREAKER_FAILURE_THRESHOLD번이면 open
+- open     : 호출하지 않고 바로 실패 (CircuitOpenError / 호출부에서 빈 결과)
+             429의 Retry-After가 있으면 그 시간 동안 바로 open
+- half_open: recovery 시간이 지나면 probe 요청 1개만 통과, 성공하면 closed / 실패하면 다시 open
+실패로 치는 것은 네트워크 에러/timeout, 429, 5xx 뿐 (그 외 4xx는 서비스가 응답한 것으로 봄)
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+CIRCUIT_BREAKER_ENABLED = os.getenv("CIRCUIT_BREAKER", "1").strip().lower() in ("1", "true", "yes", "on")
+# 연속 실패 몇 번에 open할지, open 후 half-open probe까지 기다리는 시간(초)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = _env_int("CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5)
+CIRCUIT_BREAKER_RECOVERY_SEC = _env_float("CIRCUIT_BREAKER_RECOVERY_SEC", 30.0)
+# Retry-After가 너무 길어도 이 시간 뒤에는 probe
+MAX_RETRY_AFTER_SEC = 300.0
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# 외부 서비스 이름 (breaker key)
+BREAKER_SERPER = "serper"
+BREAKER_TAVILY = "tavily"
+BREAKER_SEMANTIC_SCHOLAR = "semantic_scholar"
+BREAKER_WIKIPEDIA = "wikipedia"
+BREAKER_MAIN_BACKEND = "main_backend"
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"circuit '{name}' is open (retry in {retry_in:.1f}s)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+def is_outage_status(status: Optional[int]) -> bool:
+    """서비스 장애로 볼 HTTP 상태 (None은 응답 없음)"""
+    return status is None or status == 429 or status >= 500
+
+
+def _exception_status(exc: BaseException) -> Optional[int]:
+    # httpx/requests: exc.response.status_code, aiohttp: exc.status
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None) if response is not None else None
+    if status is None:
+        status = getattr(exc, "status", None)
+    return status if isinstance(status, int) else None
+
+
+def counts_as_failure(exc: BaseException) -> bool:
+    return is_outage_status(_exception_status(exc))
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_sec: float = CIRCUIT_BREAKER_RECOVERY_SEC,
+        enabled: bool = CIRCUIT_BREAKER_ENABLED,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_sec = recovery_sec
+        self.enabled = enabled
+        self._clock = clock
+
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self._open_until = 0.0
+        self._probe_started_at: Optional[float] = None
+
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self, now: float, retry_after: Optional[float] = None) -> None:
+        wait = self.recovery_sec if retry_after is None else min(max(retry_after, 0.0), MAX_RETRY_AFTER_SEC)
+        if self.state != STATE_OPEN:
+            self.opened += 1
+            print(f"🔌 circuit open: {self.name} ({wait:.0f}s, 연속 실패 {self.consecutive_failures})")
+        self.state = STATE_OPEN
+        self._open_until = now + wait
+        self._probe_started_at = None
+
+    def allow(self) -> bool:
+        """호출해도 되는지 (half-open이면 probe 1개만 True)"""
+        if not self.enabled:
+            return True
+        with self._lock:
+            now = self._clock()
+            if self.state == STATE_OPEN and now >= self._open_until:
+                self.state = STATE_HALF_OPEN
+            if self.state == STATE_HALF_OPEN:
+                # probe가 결과를 남기지 못하고 끝난 경우(취소 등)를 대비해 recovery 시간 뒤 다시 probe
+                if self._probe_started_at is None or now - self._probe_started_at >= self.recovery_sec:
+                    self._probe_started_at = now
+                    return True
+            if self.state == STATE_CLOSED:
+                return True
+            self.rejected += 1
+            return False
+
+    def retry_in(self) -> float:
+        with self._lock:
+            return max(self._open_until - self._clock(), 0.0)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            if self.state != STATE_CLOSED:
+                print(f"🔌 circuit closed: {self.name}")
+            self.state = STATE_CLOSED
+            self._probe_started_at = None
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        """실패 기록 (retry_after가 있으면 연속 실패 수와 상관없이 그 시간 동안 open)"""
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if not self.enabled:
+                return
+            if (
+                retry_after is not None
+                or self.state == STATE_HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                self._open(self._clock(), retry_after)
+
+    def record_status(self, status: Optional[int], retry_after: Optional[float] = None) -> None:
+        if is_outage_status(status):
+            self.record_failure(retry_after if status == 429 else None)
+        else:
+            self.record_success()
+
+    def _check(self) -> None:
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+
+    def _record_exception(self, exc: BaseException) -> None:
+        if counts_as_failure(exc):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    async def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """async 함수 호출 (open이면 CircuitOpenError)"""
+        self._check()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            self._record_exception(e)
+            raise
+        self.record_success()
+        return result
+
+    def call_sync(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """동기 함수 호출 (스레드에서 호출하는 Wikipedia 검색용)"""
+        self._check()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self._record_exception(e)
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            state = self.state
+            if state == STATE_OPEN and now >= self._open_until:
+                state = STATE_HALF_OPEN
+            return {
+                "state": state,
+                "consecutive_failures": self.consecutive_failures,
+                "retry_in_sec": round(max(self._open_until - now, 0.0), 1) if state == STATE_OPEN else 0.0,
+                "successes": self.successes,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "opened": self.opened,
+            }
+
+
+class CircuitBreakerRegistry:
+    """서비스 이름별 breaker (처음 요청할 때 env 기본값으로 생성)"""
+
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name)
+            return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: b.snapshot() for name, b in sorted(breakers.items())}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._breakers.clear()
+
+
+circuit_breakers = CircuitBreakerRegistry()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    return circuit_breakers.get(name)
@@ -0,0 +1,104 @@
+# core/utils/debug_artifacts.py
+
+import asyncio
+import gzip
+import json
+import os
+import re
+import shutil
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Any, Optional
+
+# 요청 단위 opt-in: job_id가 바인딩된 컨텍스트에서만 디스크에 기록
+_DEBUG_JOB_ID: ContextVar[Optional[str]] = ContextVar(
+    "debug_artifact_job_id",
+    default=None,
+)
+
+DEFAULT_DEBUG_ARTIFACT_DIR = "debug_artifacts"
+DEFAULT_DEBUG_ARTIFACT_MAX_JOBS = 20
+
+_SAFE_NAME = re.compile(r"[^0-9A-Za-z가-힣._-]+")
+
+
+def get_debug_artifact_dir() -> Path:
+    return Path(os.getenv("DEBUG_ARTIFACT_DIR", DEFAULT_DEBUG_ARTIFACT_DIR))
+
+
+def get_debug_artifact_max_jobs() -> int:
+    try:
+        return max(1, int(os.getenv("DEBUG_ARTIFACT_MAX_JOBS", DEFAULT_DEBUG_ARTIFACT_MAX_JOBS)))
+    except ValueError:
+        return DEFAULT_DEBUG_ARTIFACT_MAX_JOBS
+
+
+def bind_debug_artifacts(job_id: Optional[str]) -> Token:
+    """현재 컨텍스트에 debug artifact job_id 바인딩 (None이면 비활성)"""
+    return _DEBUG_JOB_ID.set(job_id)
+
+
+def reset_debug_artifacts(token: Token) -> None:
+    _DEBUG_JOB_ID.reset(token)
+
+
+def debug_artifacts_enabled() -> bool:
+    return _DEBUG_JOB_ID.get() is not None
+
+
+def _safe_name(name: str) -> str:
+    return _SAFE_NAME.sub("_", name).strip("._") or "artifact"
+
+
+def _enforce_retention(base_dir: Path, keep_job_dir: Path, max_jobs: int) -> None:
+    """가장 오래된 job 디렉토리부터 삭제하여 max_jobs개만 유지 (현재 job은 유지)"""
+    job_dirs = [d for d in base_dir.iterdir() if d.is_dir()]
+    if len(job_dirs) <= max_jobs:
+        return
+
+    job_dirs.sort(key=lambda d: d.stat().st_mtime)
+    for d in job_dirs[: len(job_dirs) - max_jobs]:
+        if d == keep_job_dir:
+            continue
+        shutil.rmtree(d, ignore_errors=True)
+
+
+def _write_artifact(base_dir: Path, job_id: str, name: str, data: Any, max_jobs: int) -> Path:
+    job_dir = base_dir / _safe_name(job_id)
+    job_dir.mkdir(parents=True, exist_ok=True)
+
+    path = job_dir / f"{_safe_name(name)}.json.gz"
+    tmp_path = path.with_suffix(".gz.tmp")
+    payload = json.dumps(data, ensure_ascii=False, indent=2, default=str).encode("utf-8")
+    with gzip.open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+    _enforce_retention(base_dir, job_dir, max_jobs)
+    return path
+
+
+async def save_debug_artifact(name: str, data: Any) -> Optional[Path]:
+    """
+    debug artifact 저장 (opt-in 요청에서만 동작)
+
+    - 비활성 상태면 디스크 I/O 없이 바로 None 반환
+    - 활성 상태면 DEBUG_ARTIFACT_DIR/<job_id>/<name>.json.gz 로 별도 스레드에서 기록
+    - 기록 실패는 파이프라인을 멈추지 않도록 로그만 남김
+    """
+    job_id = _DEBUG_JOB_ID.get()
+    if job_id is None:
+        return None
+
+    try:
+        return await asyncio.to_thread(
+            _write_artifact,
+            get_debug_artifact_dir(),
+            job_id,
+            name,
+            data,
+            get_debug_artifact_max_jobs(),
+        )
+    except Exception as e:
+        print(f"⚠️ debug artifact 저장 실패 (job={job_id}, name={name}): {e}")
+        return None
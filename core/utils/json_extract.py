@@ -0,0 +1,215 @@
+# core/utils/json_extract.py
+"""
+LLM 응답에서 JSON 값 추출 (모든 에이전트 공용)
+
+- ```json ... ``` 코드 펜스 안을 먼저 보고, 없으면 전체 텍스트에서 탐색
+- JSON 앞뒤에 설명 문장이 붙어도 괄호 균형이 맞는 첫 번째 값만 사용
+- 올바른 JSON은 json.JSONDecoder.raw_decode로 바로 파싱 (C 구현, 선형 시간)
+- 그 외에는 정규식 토큰 단위로 괄호를 스캔 (문자열 안의 괄호/따옴표는 무시, 후보당 선형 시간)
+- json 파싱 실패 시 ast.literal_eval로 재시도 (작은따옴표, True/None 등 Python 리터럴)
+- 출력이 중간에 잘린 경우 마지막으로 완성된 원소까지 자르고 괄호를 닫아 복구
+"""
+
+import ast
+import json
+import re
+import warnings
+from typing import Any, Callable, Optional, Tuple
+
+# 한 응답에서 시도할 최대 후보 수 (설명 문장 속 괄호 등으로 인한 최악의 경우 방지)
+MAX_CANDIDATES = 32
+
+_OPENER_RE = re.compile(r"[\[{]")
+_TOKEN_RE = re.compile(
+    r'"[^"\\]*(?:\\.[^"\\]*)*(?P<dq>")?'
+    r"|'[^'\\]*(?:\\.[^'\\]*)*(?P<sq>')?"
+    r"|[{}\[\],:]",
+    re.S,
+)
+_CLOSER = {"{": "}", "[": "]"}
+_VALUE_START = frozenset("{[,:")
+_FENCE = "```"
+_FENCE_LANG_RE = re.compile(r"[\w-]*[ \t]*\n?")
+
+_NO_VALUE = object()
+_DECODER = json.JSONDecoder()
+
+
+def _scan(text: str, start: int) -> Tuple[Optional[int], Optional[str]]:
+    """
+    text[start]의 여는 괄호부터 균형이 맞는 위치까지 스캔
+    - 완성: (끝 인덱스, None)
+    - 잘림: (None, 복구한 문자열)
+    - 괄호 짝이 안 맞음: (None, None)
+    """
+    stack = []
+    cut = start
+    pos = start
+    # 문자열은 값이 올 수 있는 위치({ [ , : 바로 뒤, 공백만 허용)에서만 시작
+    value_pos = False
+    value_pos_from = start
+    search = _TOKEN_RE.search
+    while True:
+        m = search(text, pos)
+        if m is None:
+            break
+        tok = m.group()
+        c = tok[0]
+        if c == '"' or c == "'":
+            if value_pos and m.start() > value_pos_from and not text[value_pos_from:m.start()].isspace():
+                value_pos = False
+            if not value_pos:
+                # 설명 문장 속 따옴표 (it's 등) -> 문자열로 보지 않고 다음 글자부터
+                pos = m.start() + 1
+                continue
+            if m.group("dq") is None and m.group("sq") is None:
+                # 닫히지 않은 문자열 = 출력이 잘림
+                break
+            value_pos = False
+        elif c in _CLOSER:
+            stack.append(_CLOSER[c])
+            cut = m.end()
+        elif c in "}]":
+            if not stack or stack[-1] != c:
+                return None, None
+            stack.pop()
+            if not stack:
+                return m.end(), None
+            cut = m.end()
+        elif c == ",":
+            cut = m.start()
+
+        if c in _VALUE_START:
+            value_pos = True
+            value_pos_from = m.end()
+        pos = m.end()
+
+    if not stack:
+        return None, None
+    # 마지막으로 원소가 완성된 지점(cut) 이후 push/pop이 없으므로 stack이 곧 닫아야 할 괄호
+    return None, text[start:cut] + "".join(reversed(stack))
+
+
+def _find_fence(text: str, pos: int, closing: bool) -> int:
+    """
+    줄 맨 앞의 ```(닫는 펜스는 줄 끝도 허용) 위치
+    JSON 문자열 안의 ```는 줄바꿈이 이스케이프되어 있어 여기에 걸리지 않음
+    """
+    while True:
+        i = text.find(_FENCE, pos)
+        if i == -1:
+            return -1
+        line_start = text.rfind("\n", 0, i) + 1
+        if not text[line_start:i].strip(" \t"):
+            return i
+        if closing:
+            line_end = text.find("\n", i + len(_FENCE))
+            if not text[i + len(_FENCE):line_end if line_end != -1 else len(text)].strip(" \t"):
+                return i
+        pos = i + len(_FENCE)
+
+
+def _fenced_body(text: str) -> Optional[str]:
+    """첫 번째 코드 펜스 내용 (닫는 펜스가 없으면 끝까지)"""
+    open_idx = _find_fence(text, 0, closing=False)
+    if open_idx == -1:
+        return None
+    body_start = _FENCE_LANG_RE.match(text, open_idx + len(_FENCE)).end()
+    close_idx = _find_fence(text, body_start, closing=True)
+    return text[body_start:close_idx] if close_idx != -1 else text[body_start:]
+
+
+def _literal_eval(candidate: str) -> Any:
+    try:
+        with warnings.catch_warnings():
+            # 잘못된 이스케이프 등 literal_eval이 내는 SyntaxWarning 숨김
+            warnings.simplefilter("ignore")
+            return ast.literal_eval(candidate)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return _NO_VALUE
+
+
+def _parse(candidate: str) -> Any:
+    try:
+        return json.loads(candidate)
+    except ValueError:
+        return _literal_eval(candidate)
+
+
+def _matches(value: Any, expect: Optional[type], validate: Optional[Callable[[Any], bool]]) -> bool:
+    if expect is None:
+        ok = isinstance(value, (dict, list))
+    else:
+        ok = isinstance(value, expect)
+    return ok and (validate is None or bool(validate(value)))
+
+
+def _search(
+    text: str,
+    expect: Optional[type],
+    validate: Optional[Callable[[Any], bool]],
+    allow_partial: bool,
+) -> Any:
+    """여는 괄호 위치마다 후보를 만들어 등장 순서대로 시도"""
+    pos = 0
+    for _ in range(MAX_CANDIDATES):
+        m = _OPENER_RE.search(text, pos)
+        if m is None:
+            break
+        start = m.start()
+
+        # 1) 올바른 JSON이면 C 디코더가 끝 위치까지 한 번에 처리 (뒤에 붙은 설명은 무시)
+        try:
+            value, end = _DECODER.raw_decode(text, start)
+        except ValueError:
+            value = _NO_VALUE
+        else:
+            if _matches(value, expect, validate):
+                return value
+            # 올바른 JSON이지만 원하는 값이 아님 -> 내부 값은 건너뜀
+            pos = end
+            continue
+
+        # 2) Python 리터럴 / 잘린 출력 / 설명 문장 속 괄호 -> 토큰 스캔
+        end, repaired = _scan(text, start)
+        if end is not None:
+            value = _literal_eval(text[start:end])
+        elif repaired is not None and allow_partial:
+            value = _parse(repaired)
+        if value is not _NO_VALUE:
+            if _matches(value, expect, validate):
+                return value
+            if end is not None:
+                pos = end
+                continue
+        # 파싱 실패 -> 바로 다음 여는 괄호부터
+        pos = start + 1
+    return _NO_VALUE
+
+
+def extract_json(
+    text: Optional[str],
+    expect: Optional[type] = None,
+    default: Any = None,
+    allow_partial: bool = False,
+    validate: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    """
+    LLM 응답 text에서 JSON 값을 추출
+
+    - expect: dict 또는 list로 지정하면 해당 타입인 첫 번째 값만 반환 (None이면 둘 다 허용)
+    - validate: 추가 조건 (예: list 안에 dict가 있는지), False면 다음 후보로
+    - allow_partial: 잘린 응답을 닫아서 앞부분만이라도 반환 (누락돼도 괜찮은 호출부에서만 켬)
+    - 찾지 못하면 default 반환
+    """
+    if not text:
+        return default
+
+    body = _fenced_body(text)
+    if body is not None:
+        value = _search(body, expect, validate, allow_partial)
+        if value is not _NO_VALUE:
+            return value
+
+    value = _search(text, expect, validate, allow_partial)
+    return default if value is _NO_VALUE else value
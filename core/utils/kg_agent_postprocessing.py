@@ -1,5 +1,7 @@
 from collections import defaultdict
 
+from core.utils.kg_agent_preprocessing import build_keyword_name_to_property
+
 def transform_graph_data(
         raw_data,
         agent_output,
@@ -67,7 +69,7 @@ def transform_graph_data(
             })
 
     ## 2-2. Agent Ouput으로 나온 Edge를 2차 Sub-graph의 Edge로 변형
-    edges, about_node = [], []
+    edges, about_node = [], set()
     for agent_edge in agent_output['edges']:
         start_name = agent_edge['start']
         end_name = agent_edge['end']
@@ -83,7 +85,7 @@ def transform_graph_data(
             })
         elif type == "ABOUT":
             ## 2-3. ABOUT으로 연결된 Keyword-Paper를 분해
-            about_node.append(end_name.lower())
+            about_node.add(end_name.lower())
 
             for income_keyword_property in keyword_income_edge[end_name.lower()]:
                 income_keyword_name = income_keyword_property['name']
@@ -136,44 +138,143 @@ def transform_graph_data(
         })
 
     # 4. 최종적으로 삭제된 Node를 참고하고 있는 Edge 존재시 삭제
-    all_node_id = [target_paper_id]
-    for node in nodes:
-        all_node_id.append(node['keyword_id'])
+    all_node_id = {target_paper_id}
+    all_node_id.update(node['keyword_id'] for node in nodes)
+    edges = filter_edges_by_node_ids(edges, all_node_id)
 
-    for edge in edges:
-        start_id = edge['start']
-        end_id = edge['end']
+    # 5. 고립 노드 제거, Start로 한 번도 되지 않은 키워드 노드 페이퍼와 IN으로 엣지 연결
+    nodes, edges = connect_or_drop_isolated_nodes(nodes, edges, target_paper_id)
 
-        if start_id in all_node_id and end_id in all_node_id:
-            continue
-        else:
-            edges.remove(edge)
+    return {
+        "paper_id": target_paper_id,
+        "nodes": nodes,
+        "edges": edges
+    }
+
+
+def filter_edges_by_node_ids(edges, valid_ids):
+    """start/end가 모두 valid_ids(set)에 있는 edge만 한 번의 순회로 남김"""
+    return [
+        edge for edge in edges
+        if edge['start'] in valid_ids and edge['end'] in valid_ids
+    ]
 
-    # 5. 고립 노드 제거, Start로 한 번도 되지 않은 키워드 노드 페이퍼와 IN으로 엣지 연결
-    all_start_id = []
-    all_end_id = []
-    for edge in edges:
-        all_start_id.append(edge['start'])
-        all_end_id.append(edge['end'])
 
+def connect_or_drop_isolated_nodes(nodes, edges, target_paper_id):
+    """
+    - start로 등장하는 노드: 유지
+    - end로만 등장하는 노드: target paper로 IN edge 추가 후 유지
+    - 어떤 edge에도 등장하지 않는 노드: 제거
+    """
+    all_start_id = {edge['start'] for edge in edges}
+    all_end_id = {edge['end'] for edge in edges}
+
+    kept_nodes = []
+    new_edges = list(edges)
     for node in nodes:
         node_id = node['keyword_id']
 
         if node_id in all_start_id:
-            continue
+            kept_nodes.append(node)
         elif node_id in all_end_id:
-            edges.append({
+            new_edges.append({
                 'start': node_id,
                 'end': target_paper_id,
                 'type': "IN",
                 'reason': "",
                 'strength': ""
             })
+            kept_nodes.append(node)
+
+    return kept_nodes, new_edges
+
+
+def build_keyword_alias_map(raw_subgraph, keyword_names):
+    """
+    keyword_names(agent 출력 노드 이름)에 해당하는 GraphDB keyword의
+    name/alias(소문자) -> GraphDB name 매핑
+    """
+    keyword_names = set(keyword_names)
+    alias_map = {}
+    for db_keyword in raw_subgraph['graph']['nodes']['keywords']:
+        if db_keyword['name'] in keyword_names:
+            alias_map[db_keyword['name'].lower()] = db_keyword['name']
+            for alias in db_keyword['alias']:
+                alias_map[alias.lower()] = db_keyword['name']
+    return alias_map
+
+
+def attach_initial_keywords(subgraph, raw_subgraph, initial_keyword, keyword_name_to_property, paper_id):
+    """
+    Initial Keyword 처리
+    - agent 결과에 포함된 keyword: paper로 가는 IN edge가 없으면 추가
+    - 포함되지 않은 keyword: keyword_id 없는 노드로 추가
+    """
+    all_keyword_alias = build_keyword_alias_map(
+        raw_subgraph, (keyword['keyword'] for keyword in subgraph['nodes'])
+    )
+    edge_pairs = {(edge['start'], edge['end']) for edge in subgraph['edges']}
+
+    for keyword in initial_keyword:
+        if keyword.lower() in all_keyword_alias:
+            original_keyword_name = all_keyword_alias[keyword.lower()].lower()
+            original_keyword_id = keyword_name_to_property[original_keyword_name]['id']
+
+            if (original_keyword_id, paper_id) not in edge_pairs:
+                subgraph['edges'].append({
+                    'start': original_keyword_id,
+                    'end': paper_id,
+                    'type': "IN",
+                    'reason': "",
+                    'strength': ""
+                })
+                edge_pairs.add((original_keyword_id, paper_id))
         else:
-            nodes.remove(node)
+            subgraph['nodes'].append({
+                "keyword_id": None,
+                "keyword": keyword,
+                "resources": []
+            })
 
-    return {
-        "paper_id": target_paper_id,
-        "nodes": nodes,
-        "edges": edges
-    }
\ No newline at end of file
+    return subgraph
+
+
+def postprocess_agent_output(raw_subgraph, agent_output, initial_keyword, paper_id):
+    """
+    Keyword Graph Agent 출력(agent_output)을 2차 Subgraph로 변환하는 전체 후처리
+
+    1) agent 노드/target paper에 없는 이름을 참조하는 edge 제거
+    2) 최종 출력 형식 변환 (transform_graph_data)
+    3) Initial Keyword 처리 (attach_initial_keywords)
+    4) Subgraph Keyword 이름 정리
+    5) 없는 Node를 참조하는 Edge 제거
+    """
+    target_paper = raw_subgraph.get('graph', {}).get('target_paper', {})
+    tp_name = target_paper.get('name', '')
+    tp_id = target_paper.get('id', '')
+
+    # 1. 삭제된 Node를 참고하고 있는 Edge 존재시 삭제
+    valid_keywords = set(agent_output.get('nodes', []))
+    valid_keywords.update((tp_name, tp_id))
+    agent_output['edges'] = [
+        edge for edge in agent_output['edges']
+        if edge['start'] in valid_keywords and edge['end'] in valid_keywords
+    ]
+
+    # 2. 최종 출력 형식 변환
+    keyword_name_to_property = build_keyword_name_to_property(raw_subgraph)
+    subgraph = transform_graph_data(raw_subgraph, agent_output, keyword_name_to_property, paper_id)
+
+    # 3. Initial Keyword 처리
+    subgraph = attach_initial_keywords(subgraph, raw_subgraph, initial_keyword, keyword_name_to_property, paper_id)
+
+    # 4. Subgraph Keyword 이름 수정
+    for node in subgraph['nodes']:
+        node['keyword'] = node['keyword'].split("(")[0].strip().title()
+
+    # 5. 없는 Node를 참조하고 있는 모든 Edge 삭제
+    valid_ids = {subgraph['paper_id']}
+    valid_ids.update(keyword['keyword_id'] for keyword in subgraph['nodes'] if keyword['keyword_id'])
+    subgraph['edges'] = filter_edges_by_node_ids(subgraph['edges'], valid_ids)
+
+    return subgraph
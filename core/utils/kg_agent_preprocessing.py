@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from collections import defaultdict, deque
 
+from core.utils.kg_subgraph_index import SubgraphIndex
+
 
 def extract_target_paper(raw_subgraph):
     """
@@ -319,7 +321,29 @@ def build_agent_input(keyword_keyword_edges, keyword_id_to_name, target_paper_id
 
 
 ## 전체 preprocess
-def preprocess_graph(raw_subgraph):
+def preprocess_graph(raw_subgraph, index: SubgraphIndex | None = None):
+    """
+    입력:
+      - raw_subgraph: 1차 subgraph raw JSON
+      - index: raw_subgraph로 이미 만들어 둔 SubgraphIndex (없으면 새로 생성)
+    출력:
+      - subgraph (LLM 입력용):
+        { "target_paper_id": "...", "nodes": [...], "edges": [...] }
+
+    정수 인덱스(SubgraphIndex) 위에서 아래 단계를 수행한다.
+      1) target 제외 paper 및 paper 관련 edge 제거 (keyword-keyword + target ABOUT/IN만 유지)
+      2) target과의 거리 계산 (seed: target paper와 직접 연결된 keyword)
+      3) A<->B 양방향 엣지 제거(규칙 기반)
+      4) agent 입력(subgraph) 생성
+    결과는 preprocess_graph_reference와 동일하다.
+    """
+    if index is None:
+        index = SubgraphIndex.from_raw(raw_subgraph)
+    return index.preprocess()
+
+
+## dict 기반 참조 구현 (인덱스 구현 검증/벤치마크용)
+def preprocess_graph_reference(raw_subgraph):
     """
     입력:
       - raw_subgraph: 1차 subgraph raw JSON
@@ -0,0 +1,222 @@
+# core/utils/kg_agent_pruning.py
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict, deque
+
+from dotenv import load_dotenv
+
+from core.utils.serialization import to_prompt_json
+
+load_dotenv()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_limit(name: str, default: int) -> int | None:
+    """정수 제한값, 0 이하면 None(제한 없음)"""
+    try:
+        value = int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        value = default
+    return value if value > 0 else None
+
+
+# KG_PRUNE=0이면 가지치기 없이 preprocess 결과를 그대로 프롬프트에 넣음
+KG_PRUNE_ENABLED = os.getenv("KG_PRUNE", "1").strip().lower() in ("1", "true", "yes", "on")
+# 기본 가지치기 설정 (gdb_search의 min_prereq_strength와 맞춤), 제한값은 0이면 제한 없음
+PRUNE_MIN_STRENGTH = _env_float("KG_PRUNE_MIN_STRENGTH", 0.9)
+PRUNE_MAX_HOPS = _env_limit("KG_PRUNE_MAX_HOPS", 3)
+PRUNE_MAX_DEGREE = _env_limit("KG_PRUNE_MAX_DEGREE", 12)
+PRUNE_MAX_REASON_CHARS = _env_limit("KG_PRUNE_MAX_REASON_CHARS", 160)
+PRUNE_TOKEN_BUDGET = _env_limit("KG_PRUNE_TOKEN_BUDGET", 6000)
+
+TARGET_LINK_TYPES = ("ABOUT", "IN")
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(agent_input) -> int:
+    """프롬프트에 들어갈 graph_json(to_prompt_json) 크기로 토큰 수를 대략 추정 (문자 수 / 4)"""
+    return len(to_prompt_json(agent_input)) // CHARS_PER_TOKEN
+
+
+def _edge_chars(edge) -> int:
+    # edges 리스트 안에서의 구분자(",")까지 포함
+    return len(to_prompt_json(edge)) + 1
+
+
+def _hops_from_target(edges, target_node):
+    """
+    edge를 무방향으로 보고 target 노드로부터의 hop 수 계산 (도달 불가 노드는 없음)
+    target이 어떤 edge에도 없으면(GraphDB에 논문이 없는 경우) 모든 노드를 0으로 둔다.
+    """
+    adj = defaultdict(list)
+    for e in edges:
+        adj[e["start"]].append(e["end"])
+        adj[e["end"]].append(e["start"])
+
+    if target_node not in adj:
+        return {node: 0 for node in adj}
+
+    hops = {target_node: 0}
+    q: deque[str] = deque([target_node])
+    while q:
+        u = q.popleft()
+        for v in adj.get(u, []):
+            if v not in hops:
+                hops[v] = hops[u] + 1
+                q.append(v)
+    return hops
+
+
+def _keep_target_connected(edges, target_node):
+    """target과 연결된 컴포넌트에 속한 edge만 유지 (target이 없으면 전부 유지)"""
+    hops = _hops_from_target(edges, target_node)
+    return [e for e in edges if e["start"] in hops and e["end"] in hops]
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return text[: max(0, max_chars - 1)].rstrip() + "…"
+
+
+def _rebuild_nodes(edges, target_node):
+    """build_agent_input과 동일하게 edges에 등장한 노드만, target을 맨 앞에"""
+    node_name_set = set()
+    for e in edges:
+        node_name_set.add(e["start"])
+        node_name_set.add(e["end"])
+
+    nodes = sorted(n for n in node_name_set if n != target_node)
+    if target_node in node_name_set:
+        nodes = [target_node] + nodes
+    return nodes
+
+
+def prune_agent_input(
+    agent_input,
+    target_node: str,
+    min_strength: float = PRUNE_MIN_STRENGTH,
+    max_hops: int | None = PRUNE_MAX_HOPS,
+    max_degree: int | None = PRUNE_MAX_DEGREE,
+    max_reason_chars: int | None = PRUNE_MAX_REASON_CHARS,
+    token_budget: int | None = PRUNE_TOKEN_BUDGET,
+):
+    """
+    preprocess_graph 결과(agent 입력)를 프롬프트에 넣기 전에 가지치기
+
+    입력:
+      - agent_input: { "target_paper_id": "...", "nodes": [...], "edges": [...] }
+      - target_node: agent 입력에서 target paper를 가리키는 노드 이름
+    출력:
+      - 같은 형태의 새 dict (입력은 수정하지 않음)
+
+    단계:
+      1) target과 직접 연결된 ABOUT/IN은 항상 유지, 그 외 strength < min_strength 제거
+      2) target으로부터 max_hops 보다 먼 노드의 edge 제거
+      3) target이 아닌 노드마다 최대 max_degree개 edge만 유지 (strength 높은 순, 가까운 순)
+      4) reason을 max_reason_chars로 자르기
+      5) token_budget 초과 시 reason 제거 -> 먼/약한 edge부터 제거
+    모든 단계 후 target과 연결되지 않았거나 max_hops를 넘게 된 edge는 제거한다.
+    """
+    edges = [dict(e) for e in agent_input.get("edges", [])]
+
+    def is_target_link(e) -> bool:
+        return e["type"] in TARGET_LINK_TYPES and target_node in (e["start"], e["end"])
+
+    # 1. strength 기준
+    edges = [
+        e for e in edges
+        if is_target_link(e) or float(e.get("strength", 0.0) or 0.0) >= min_strength
+    ]
+    edges = _keep_target_connected(edges, target_node)
+
+    # 2. k-hop 제한
+    hops = _hops_from_target(edges, target_node)
+    if max_hops is not None:
+        edges = [e for e in edges if max(hops[e["start"]], hops[e["end"]]) <= max_hops]
+
+    # 우선순위: target 링크 > strength 높음 > target에 가까움 > 기존 순서
+    def priority(item):
+        i, e = item
+        return (
+            0 if is_target_link(e) else 1,
+            -float(e.get("strength", 0.0) or 0.0),
+            max(hops.get(e["start"], 0), hops.get(e["end"], 0)),
+            i,
+        )
+
+    ranked = [e for _, e in sorted(enumerate(edges), key=priority)]
+
+    # 3. 노드별 degree 제한 (target 노드는 제한하지 않음)
+    if max_degree is not None:
+        degree = defaultdict(int)
+        capped = []
+        for e in ranked:
+            ends = [n for n in (e["start"], e["end"]) if n != target_node]
+            if is_target_link(e) or all(degree[n] < max_degree for n in ends):
+                for n in ends:
+                    degree[n] += 1
+                capped.append(e)
+        ranked = capped
+
+    # 4. reason 자르기
+    if max_reason_chars is not None:
+        for e in ranked:
+            e["reason"] = _truncate(e.get("reason", "") or "", max_reason_chars)
+
+    def build(ranked_edges):
+        # edge가 빠지면 hop 수가 늘어날 수 있으므로 연결성/hop 제한을 다시 적용
+        cur_hops = _hops_from_target(ranked_edges, target_node)
+        limit = max_hops if max_hops is not None else float("inf")
+        kept_ids = {
+            id(e) for e in ranked_edges
+            if e["start"] in cur_hops and e["end"] in cur_hops
+            and max(cur_hops[e["start"]], cur_hops[e["end"]]) <= limit
+        }
+        out_edges = [e for e in edges if id(e) in kept_ids]  # 원래 순서 유지
+        return {
+            "target_paper_id": agent_input.get("target_paper_id", ""),
+            "nodes": _rebuild_nodes(out_edges, target_node),
+            "edges": out_edges,
+        }
+
+    pruned = build(ranked)
+
+    # 5. token budget
+    if token_budget is None or estimate_tokens(pruned) <= token_budget:
+        return pruned
+
+    ## 5-1. reason 제거 (구조는 start/end/type/strength로 유지)
+    for e in ranked:
+        e["reason"] = ""
+    pruned = build(ranked)
+    if estimate_tokens(pruned) <= token_budget:
+        return pruned
+
+    ## 5-2. 우선순위 낮은(먼/약한) edge부터 제거
+    budget_chars = token_budget * CHARS_PER_TOKEN
+    total_chars = len(to_prompt_json(pruned))
+    in_pruned = {id(e) for e in pruned["edges"]}
+    while ranked and total_chars > budget_chars and not is_target_link(ranked[-1]):
+        dropped = ranked.pop()
+        if id(dropped) in in_pruned:
+            total_chars -= _edge_chars(dropped)
+
+    return build(ranked)
+
+
+def prune_stats(before, after) -> dict:
+    """가지치기 전/후 노드/엣지/추정 토큰 수"""
+    return {
+        "nodes": (len(before.get("nodes", [])), len(after.get("nodes", []))),
+        "edges": (len(before.get("edges", [])), len(after.get("edges", []))),
+        "tokens": (estimate_tokens(before), estimate_tokens(after)),
+    }
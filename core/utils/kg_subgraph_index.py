@@ -0,0 +1,289 @@
+# core/utils/kg_subgraph_index.py
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+
+
+TARGET_LINK_TYPES = ("ABOUT", "IN")
+
+
+class SubgraphIndex:
+    """
+    raw_subgraph(Neo4j 결과)를 정수 인덱스 기반으로 한 번만 변환해 두는 구조
+
+    - node id(str) -> int 로 interning
+    - edge는 typed array(src/dst/type/strength)로 보관
+    - 필터링, BFS 거리 계산, 양방향 엣지 제거를 모두 이 인덱스 위에서 수행
+
+    flatten_edges / build_keyword_maps / get_paper_id_set 등 dict 기반 함수와
+    동일한 결과를 내도록 규칙을 맞춘다.
+    """
+
+    __slots__ = (
+        "node_ids", "node_index", "is_keyword", "is_paper", "keyword_names",
+        "target_idx", "target_title",
+        "type_names", "edge_src", "edge_dst", "edge_type", "edge_strength", "edge_reason",
+    )
+
+    def __init__(self):
+        self.node_ids: list[str] = []
+        self.node_index: dict[str, int] = {}
+        self.is_keyword = bytearray()
+        self.is_paper = bytearray()
+        self.keyword_names: list[str | None] = []
+
+        self.target_idx = -1
+        self.target_title = ""
+
+        self.type_names: list[str] = []
+        self.edge_src = array("i")
+        self.edge_dst = array("i")
+        self.edge_type = array("H")
+        self.edge_strength = array("d")
+        self.edge_reason: list[str] = []
+
+    # ---- 구성 ----
+    def _intern(self, node_id: str) -> int:
+        idx = self.node_index.get(node_id)
+        if idx is None:
+            idx = len(self.node_ids)
+            self.node_index[node_id] = idx
+            self.node_ids.append(node_id)
+            self.is_keyword.append(0)
+            self.is_paper.append(0)
+            self.keyword_names.append(None)
+        return idx
+
+    @classmethod
+    def from_raw(cls, raw_subgraph) -> "SubgraphIndex":
+        index = cls()
+        graph = raw_subgraph.get("graph", raw_subgraph)
+
+        tp = graph.get("target_paper", {}) or {}
+        target_id = tp.get("id", "") or ""
+        index.target_title = tp.get("name", "") or ""
+        if target_id:
+            index.target_idx = index._intern(target_id)
+
+        nodes = graph.get("nodes", {}) or {}
+        for kw in nodes.get("keywords", []) or []:
+            kid = kw.get("id")
+            name = kw.get("name")
+            if isinstance(kid, str) and kid and isinstance(name, str) and name:
+                idx = index._intern(kid)
+                index.is_keyword[idx] = 1
+                index.keyword_names[idx] = name
+
+        for p in nodes.get("papers", []) or []:
+            pid = p.get("id")
+            if isinstance(pid, str) and pid:
+                index.is_paper[index._intern(pid)] = 1
+
+        type_codes: dict[str, int] = {}
+        edges_obj = graph.get("edges", {}) or {}
+        for etype, elist in edges_obj.items():
+            if not isinstance(elist, list):
+                continue
+            etype = str(etype)
+            code = type_codes.get(etype)
+            if code is None:
+                code = type_codes[etype] = len(index.type_names)
+                index.type_names.append(etype)
+
+            for e in elist:
+                if not isinstance(e, dict):
+                    continue
+                source = e.get("source")
+                target = e.get("target")
+                if not (isinstance(source, str) and isinstance(target, str) and source and target):
+                    continue
+
+                try:
+                    strength = float(e.get("strength", 0))
+                except Exception:
+                    strength = 0.0
+
+                reason = e.get("reason", "")
+                if not isinstance(reason, str):
+                    reason = ""
+
+                index.edge_src.append(index._intern(source))
+                index.edge_dst.append(index._intern(target))
+                index.edge_type.append(code)
+                index.edge_strength.append(strength)
+                index.edge_reason.append(reason)
+
+        return index
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edge_src)
+
+    # ---- 필터링 ----
+    def keyword_edge_ids(self) -> list[int]:
+        """
+        remove_non_target_papers_and_edges와 동일한 규칙으로 남길 edge 번호 목록
+        - keyword<->keyword
+        - target paper <-> keyword 의 ABOUT/IN
+        """
+        target = self.target_idx
+        is_kw = self.is_keyword
+        is_paper = self.is_paper
+        link_codes = {i for i, t in enumerate(self.type_names) if t in TARGET_LINK_TYPES}
+
+        kept = []
+        for i, (s, t, code) in enumerate(zip(self.edge_src, self.edge_dst, self.edge_type)):
+            # target 제외 paper와 연결된 edge 제거
+            if (is_paper[s] and s != target) or (is_paper[t] and t != target):
+                continue
+
+            # target paper <-> keyword 의 ABOUT/IN 은 유지
+            if code in link_codes and ((s == target and is_kw[t]) or (t == target and is_kw[s])):
+                kept.append(i)
+                continue
+
+            # 그 외 paper가 끼면 제거 (target 포함)
+            if is_paper[s] or is_paper[t]:
+                continue
+
+            # keyword id가 아닌 노드는 제거
+            if not (is_kw[s] and is_kw[t]):
+                continue
+
+            kept.append(i)
+        return kept
+
+    # ---- 거리 계산 ----
+    def distance_to_target(self, edge_ids: list[int]) -> array:
+        """
+        target paper와 직접 연결된 keyword를 seed(거리 0)로 두고
+        edge_ids를 무방향 그래프로 보아 BFS
+        거리 정보가 없는 노드는 0 (dict 구현의 dist.get(x, 0)과 동일)
+        """
+        n = self.num_nodes
+        dist = array("i", [-1]) * n
+        target = self.target_idx
+        is_kw = self.is_keyword
+
+        queue: deque[int] = deque()
+        if target >= 0:
+            for s, t in zip(self.edge_src, self.edge_dst):
+                if s == target and is_kw[t] and dist[t] < 0:
+                    dist[t] = 0
+                    queue.append(t)
+                elif t == target and is_kw[s] and dist[s] < 0:
+                    dist[s] = 0
+                    queue.append(s)
+
+        if queue:
+            # 무방향 인접 리스트 (정수 노드 번호)
+            adj: list[list[int]] = [[] for _ in range(n)]
+            src, dst = self.edge_src, self.edge_dst
+            for i in edge_ids:
+                s, t = src[i], dst[i]
+                adj[s].append(t)
+                adj[t].append(s)
+
+            while queue:
+                u = queue.popleft()
+                du = dist[u] + 1
+                for v in adj[u]:
+                    if dist[v] < 0:
+                        dist[v] = du
+                        queue.append(v)
+
+        for v in range(n):
+            if dist[v] < 0:
+                dist[v] = 0
+        return dist
+
+    # ---- 양방향 엣지 제거 ----
+    def break_bidirectional(self, edge_ids: list[int], dist: array) -> list[int]:
+        """
+        break_bidirectional_edges와 동일 규칙
+        1) strength 큰 쪽 유지
+        2) 동률이면 dist(source) - dist(target)가 큰 방향(멀->가까움) 유지
+        3) 그래도 동률이면 (source, target) 사전순
+        결과 순서는 (unordered pair, type) 그룹의 첫 등장 순서
+        """
+        src, dst, etype, strength = self.edge_src, self.edge_dst, self.edge_type, self.edge_strength
+        node_ids = self.node_ids
+
+        best: dict[tuple[int, int, int], int] = {}
+        for i in edge_ids:
+            s, t = src[i], dst[i]
+            key = (s, t, etype[i]) if s < t else (t, s, etype[i])
+            cur = best.get(key)
+            if cur is None:
+                best[key] = i
+                continue
+
+            if strength[i] != strength[cur]:
+                if strength[i] > strength[cur]:
+                    best[key] = i
+                continue
+
+            score_i = dist[s] - dist[t]
+            score_cur = dist[src[cur]] - dist[dst[cur]]
+            if score_i != score_cur:
+                if score_i > score_cur:
+                    best[key] = i
+                continue
+
+            if (node_ids[s], node_ids[t]) < (node_ids[src[cur]], node_ids[dst[cur]]):
+                best[key] = i
+
+        return list(best.values())
+
+    # ---- agent 입력 변환 ----
+    def to_agent_input(self, edge_ids: list[int]) -> dict:
+        """build_agent_input과 동일한 형태로 변환"""
+        target = self.target_idx
+        target_node = self.target_title or "__TARGET_PAPER__"
+        target_id = self.node_ids[target] if target >= 0 else ""
+        names = list(self.keyword_names)
+        if target >= 0:
+            names[target] = target_node
+
+        src, dst, etype = self.edge_src, self.edge_dst, self.edge_type
+        type_names, reasons, strength = self.type_names, self.edge_reason, self.edge_strength
+
+        node_name_set = set()
+        out_edges = []
+        for i in edge_ids:
+            s_name = names[src[i]]
+            t_name = names[dst[i]]
+            if not s_name or not t_name:
+                continue
+
+            node_name_set.add(s_name)
+            node_name_set.add(t_name)
+            out_edges.append(
+                {
+                    "start": s_name,
+                    "end": t_name,
+                    "type": type_names[etype[i]],
+                    "reason": reasons[i],
+                    "strength": strength[i],
+                }
+            )
+
+        # 타겟 논문 노드를 앞에 오게
+        nodes = sorted(n for n in node_name_set if n != target_node)
+        if target_node in node_name_set:
+            nodes = [target_node] + nodes
+
+        return {"target_paper_id": target_id, "nodes": nodes, "edges": out_edges}
+
+    def preprocess(self) -> dict:
+        """filter -> BFS -> 양방향 제거 -> agent 입력 (preprocess_graph와 동일 결과)"""
+        edge_ids = self.keyword_edge_ids()
+        dist = self.distance_to_target(edge_ids)
+        edge_ids = self.break_bidirectional(edge_ids, dist)
+        return self.to_agent_input(edge_ids)
@@ -0,0 +1,129 @@
+# core/utils/query_builder.py
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 웹/영상 검색 쿼리 생성 방식
+# - rule: 규칙 기반으로 만들고, 모호한 키워드만 LLM (기본)
+# - llm : 항상 LLM (기존 방식)
+QUERY_MODE_RULE = "rule"
+QUERY_MODE_LLM = "llm"
+
+# 키워드 뒤에 붙이는 한국어 의도어 (QUERY_GEN_PROMPT_V6과 같이 "키워드는 영어, 의도어는 한국어")
+LEVEL_INTENTS = {
+    "novice": "개념 쉬운 설명",
+    "intermediate": "개념 원리",
+    "expert": "원리 심화",
+}
+DEFAULT_INTENT = "개념 설명"
+
+# resource_reason(검색 방향)에 나오는 표현 -> 의도어 (위에서부터 먼저 맞는 것 하나만 사용)
+DIRECTION_INTENTS = [
+    (("example", "tutorial", "hands-on", "implementation", "code", "practice", "예제", "예시", "튜토리얼", "구현", "코드", "실습"), "예제 코드"),
+    (("math", "formula", "equation", "derivation", "proof", "수식", "유도", "증명", "수학"), "수식 유도"),
+    (("visual", "intuition", "intuitive", "diagram", "그림", "시각화", "직관"), "직관적 설명"),
+    # "course"는 "of course"와 구분할 수 없어 복수형만 사용
+    (("video", "lecture", "courses", "영상", "강의"), "강의"),
+    (("compare", "comparison", "difference", "vs", "비교", "차이"), "비교"),
+    (("application", "use case", "usage", "활용", "응용", "사례"), "활용 사례"),
+    (("beginner", "basic", "introduction", "overview", "입문", "기초", "개요"), "입문"),
+]
+
+# 분야에 따라 뜻이 갈리는 단어 (단독 키워드면 LLM으로 문맥 판단)
+AMBIGUOUS_TERMS = {
+    "attention", "transformer", "kernel", "bias", "memory", "graph", "tree", "token", "field",
+    "norm", "entropy", "transfer", "agent", "policy", "reward", "bottleneck", "bridge",
+    "diffusion", "flow", "energy", "temperature", "capsule", "cell", "gate", "head", "map",
+}
+
+MAX_RULE_KEYWORD_WORDS = 6
+_ACRONYM = re.compile(r"^[A-Z]{1,3}s?$")
+_SENTENCE = re.compile(r"[.?!]\s|[,;:]")
+
+
+def get_query_mode() -> str:
+    mode = os.getenv("QUERY_GEN_MODE", QUERY_MODE_RULE).strip().lower()
+    return mode if mode in (QUERY_MODE_RULE, QUERY_MODE_LLM) else QUERY_MODE_RULE
+
+
+def is_ambiguous_keyword(keyword: str) -> bool:
+    """
+    규칙으로 쿼리를 만들기 어려운 키워드
+    - 비어 있음 / 문장형 / 너무 김
+    - 3글자 이하 대문자 약어(RL, CV 등)는 분야마다 뜻이 다름
+    - 단어 하나짜리 다의어 (AMBIGUOUS_TERMS)
+    """
+    kw = (keyword or "").strip()
+    if not kw:
+        return True
+    words = kw.split()
+    if len(words) > MAX_RULE_KEYWORD_WORDS or _SENTENCE.search(kw):
+        return True
+    if len(words) == 1 and _ACRONYM.match(kw):
+        return True
+    if len(words) == 1 and kw.lower() in AMBIGUOUS_TERMS:
+        return True
+    return False
+
+
+def _needle_pattern(needles) -> "re.Pattern":
+    # 영어 표현은 단어 시작에서만 매칭 ("code"가 encoder/decoder에 걸리지 않게, "intuitively"/"examples"는 허용)
+    # 한국어는 조사가 붙으므로("예제를") 부분 문자열 매칭
+    parts = [rf"\b{re.escape(n)}\w*" if n.isascii() else re.escape(n) for n in needles]
+    return re.compile("|".join(parts))
+
+
+_DIRECTION_PATTERNS = [(_needle_pattern(needles), intent) for needles, intent in DIRECTION_INTENTS]
+
+
+def direction_intent(search_direction: str) -> Optional[str]:
+    """검색 방향 문장에서 의도어 하나 (못 찾으면 None)"""
+    text = (search_direction or "").lower()
+    for pattern, intent in _DIRECTION_PATTERNS:
+        if pattern.search(text):
+            return intent
+    return None
+
+
+def _is_paper_method(keyword: str, paper_name: str) -> bool:
+    """키워드가 논문 제목의 모델/방법 이름(제목의 ':' 앞부분)인지"""
+    head, sep, _ = (paper_name or "").partition(":")
+    return bool(sep) and head.strip().lower() == keyword.strip().lower()
+
+
+def build_search_query(
+    keyword: str,
+    paper_name: str = "",
+    search_direction: str = "",
+    user_level: str = "",
+) -> Optional[str]:
+    """
+    규칙 기반 웹/영상 검색 쿼리 (None이면 LLM으로 생성해야 하는 경우)
+
+    - "<keyword> <의도어>" 형태, 키워드는 원문 유지
+    - 의도어: 검색 방향에서 찾은 의도 > 논문 자체 방법이면 "논문 설명" > 사용자 수준별 기본값
+    - 검색 방향이 있는데 아는 의도를 못 찾으면 규칙으로 반영할 수 없으므로 None
+    - 논문 제목은 쿼리에 넣지 않음 (QUERY_GEN_PROMPT_V6과 동일)
+    """
+    keyword = " ".join((keyword or "").split())
+    if is_ambiguous_keyword(keyword):
+        return None
+
+    direction = (search_direction or "").strip()
+    if direction:
+        intent = direction_intent(direction)
+        if intent is None:
+            return None
+    elif _is_paper_method(keyword, paper_name):
+        intent = "논문 설명"
+    else:
+        intent = LEVEL_INTENTS.get((user_level or "").strip().lower(), DEFAULT_INTENT)
+
+    return f"{keyword} {intent}"
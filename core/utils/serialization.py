@@ -0,0 +1,56 @@
+# core/utils/serialization.py
+"""
+JSON 직렬화 공통 모듈
+
+- orjson(pyproject 의존성)이 설치되어 있으면 사용하고, 없으면 표준 json으로 동작 (출력 형식은 동일)
+- 출력은 항상 compact(공백 없는 구분자) + 비ASCII 문자 그대로 (프롬프트 토큰 절약)
+- 키 순서는 dict 삽입 순서 유지 (프롬프트에서 keyword_id 등이 앞에 오도록 만든 순서를 보존)
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 설치 환경에 따라 다름
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+_COMPACT_SEPARATORS = (",", ":")
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if HAS_ORJSON else 0
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=_COMPACT_SEPARATORS)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """UTF-8 JSON bytes (HTTP body, 파일 저장용)"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # 64bit 초과 정수 등 orjson이 거부하는 값은 표준 json으로 처리
+            pass
+    return _stdlib_dumps(obj).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """compact JSON 문자열 (프롬프트 삽입, aiohttp json_serialize용)"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj)
+
+
+def loads(data: Any) -> Any:
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# 프롬프트에 넣는 JSON은 이 함수로 통일
+to_prompt_json = dumps
@@ -0,0 +1,200 @@
+# core/utils/structured_output.py
+"""
+LLM 응답 파싱/검증 공통 처리 + 파싱 실패 지표
+
+- 기본(legacy) 모드: 기존처럼 프롬프트 | llm 호출 후 extract_json으로 파싱
+  스키마 검증은 지표로만 기록하고 결과는 그대로 반환 (기존 동작 유지)
+- structured 모드 (opt-in, STRUCTURED_OUTPUT_AGENTS):
+  response_format=json_schema로 호출하고 core/contracts 스키마로 검증
+  파싱/검증 실패 시 오류 내용을 알려주는 repair 호출 1회 후 그래도 실패하면 None
+- 에이전트 / 프롬프트 버전 / 모드별 파싱 실패율 집계 (parse_metrics)
+"""
+
+import os
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+from langchain_core.messages import AIMessage, HumanMessage
+from pydantic import TypeAdapter, ValidationError
+
+from core.utils.json_extract import extract_json
+from core.utils.serialization import to_prompt_json
+
+load_dotenv()
+
+MODE_LEGACY = "legacy"
+MODE_STRUCTURED = "structured"
+
+# json_schema response_format은 최상위가 object여야 하므로 list 스키마는 감싸서 요청
+_WRAP_KEY = "items"
+
+_REPAIR_TEMPLATE = """The previous response could not be used: {error}
+Return ONLY the corrected JSON (no explanations, no code fences) that matches this JSON schema:
+{schema}"""
+
+_ADAPTERS: Dict[Any, TypeAdapter] = {}
+
+
+def structured_output_enabled(agent: str) -> bool:
+    """STRUCTURED_OUTPUT_AGENTS: 비어 있으면 off, "all" 또는 에이전트 이름 목록(쉼표 구분)"""
+    raw = os.getenv("STRUCTURED_OUTPUT_AGENTS", "").strip()
+    if not raw:
+        return False
+    names = {n.strip() for n in raw.split(",") if n.strip()}
+    return "all" in names or agent in names
+
+
+def _adapter(schema: Any) -> TypeAdapter:
+    adapter = _ADAPTERS.get(schema)
+    if adapter is None:
+        adapter = _ADAPTERS[schema] = TypeAdapter(schema)
+    return adapter
+
+
+def _response_format(name: str, json_schema: dict, wrapped: bool) -> dict:
+    if wrapped:
+        json_schema = {
+            "type": "object",
+            "properties": {_WRAP_KEY: json_schema},
+            "required": [_WRAP_KEY],
+            "$defs": json_schema.pop("$defs", {}),
+        }
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": False, "schema": json_schema},
+    }
+
+
+class ParseMetrics:
+    """(agent, prompt_version, mode)별 LLM 응답 파싱 결과 집계"""
+
+    _FIELDS = ("calls", "parse_failures", "validation_failures", "repair_calls", "repaired", "failed")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[Tuple[str, str, str], Dict[str, int]] = defaultdict(
+            lambda: dict.fromkeys(self._FIELDS, 0)
+        )
+
+    def record(self, agent: str, prompt_version: str, mode: str, **increments: int) -> None:
+        with self._lock:
+            counts = self._counts[(agent, prompt_version, mode)]
+            for field, n in increments.items():
+                counts[field] += n
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            out = {}
+            for (agent, version, mode), counts in sorted(self._counts.items()):
+                row = dict(counts)
+                row["failure_rate"] = round(row["failed"] / row["calls"], 4) if row["calls"] else 0.0
+                out[f"{agent}:{version}:{mode}"] = row
+            return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def summary(self) -> str:
+        lines = []
+        for key, row in self.snapshot().items():
+            lines.append(
+                f"{key} calls={row['calls']} parse_fail={row['parse_failures']} "
+                f"invalid={row['validation_failures']} repaired={row['repaired']} "
+                f"failed={row['failed']} ({row['failure_rate'] * 100:.1f}%)"
+            )
+        return "\n".join(lines)
+
+
+parse_metrics = ParseMetrics()
+
+
+def _parse_and_validate(
+    text: str,
+    adapter: TypeAdapter,
+    expect: type,
+    wrapped: bool,
+    validate: Optional[Callable[[Any], bool]],
+) -> Tuple[Any, Optional[str], Optional[str]]:
+    """(파싱 결과, 파싱 오류, 검증 오류) - 검증 실패 시에도 파싱 결과는 반환"""
+    if wrapped:
+        outer = extract_json(text, expect=dict)
+        value = outer.get(_WRAP_KEY) if isinstance(outer, dict) and _WRAP_KEY in outer else None
+        if value is None:
+            # 감싸지 않은 원래 형식으로 답한 경우도 허용
+            value = extract_json(text, expect=expect, validate=validate)
+    else:
+        value = extract_json(text, expect=expect, validate=validate)
+    if value is None:
+        return None, "response is not valid JSON", None
+
+    try:
+        return adapter.validate_python(value), None, None
+    except ValidationError as e:
+        return value, None, str(e)
+
+
+async def invoke_structured(
+    *,
+    agent: str,
+    prompt_version: str,
+    prompt,
+    llm,
+    inputs: Dict[str, Any],
+    schema: Any,
+    expect: type = dict,
+    validate: Optional[Callable[[Any], bool]] = None,
+    config: Optional[dict] = None,
+) -> Any:
+    """
+    prompt | llm 호출 후 schema(core/contracts의 TypedDict 등)에 맞는 값을 반환
+    - legacy 모드: 파싱 실패 시 None, 검증 실패는 지표만 기록하고 파싱 결과 반환
+    - structured 모드: 검증된 값 또는 (repair 1회 후에도 실패 시) None
+    """
+    structured = structured_output_enabled(agent)
+    mode = MODE_STRUCTURED if structured else MODE_LEGACY
+    adapter = _adapter(schema)
+    wrapped = expect is list
+
+    messages = prompt.format_messages(**inputs)
+    response_format = _response_format(agent, adapter.json_schema(), wrapped)
+    model = llm.bind(response_format=response_format) if structured else llm
+
+    response = await model.ainvoke(messages, config=config)
+    value, parse_error, validation_error = _parse_and_validate(
+        response.content, adapter, expect, wrapped and structured, validate
+    )
+    parse_metrics.record(
+        agent, prompt_version, mode,
+        calls=1, parse_failures=int(parse_error is not None), validation_failures=int(validation_error is not None),
+    )
+
+    if not structured:
+        if parse_error is not None:
+            parse_metrics.record(agent, prompt_version, mode, failed=1)
+        return value
+
+    error = parse_error or validation_error
+    if error is None:
+        return value
+
+    # 오류 내용을 알려주고 한 번만 다시 요청
+    print(f"⚠️ [{agent}] structured output 실패, repair 호출: {error[:300]}")
+    repair_messages = list(messages) + [
+        AIMessage(content=response.content or ""),
+        HumanMessage(content=_REPAIR_TEMPLATE.format(
+            error=error, schema=to_prompt_json(response_format["json_schema"]["schema"])
+        )),
+    ]
+    response = await model.ainvoke(repair_messages, config=config)
+    value, parse_error, validation_error = _parse_and_validate(
+        response.content, adapter, expect, wrapped, validate
+    )
+    ok = parse_error is None and validation_error is None
+    parse_metrics.record(agent, prompt_version, mode, repair_calls=1, repaired=int(ok), failed=int(not ok))
+    if not ok:
+        print(f"❌ [{agent}] repair 후에도 실패: {(parse_error or validation_error)[:300]}")
+        return None
+    return value
@@ -1,14 +1,18 @@
 import asyncio
 from functools import wraps
 
+from core.utils.budget import clamp_timeout
+
 def async_timeout(seconds):
+    """seconds와 요청 예산의 남은 시간 중 작은 값으로 timeout (예산이 없으면 seconds 그대로)"""
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
+            timeout = clamp_timeout(seconds)
             try:
-                return await asyncio.wait_for(func(*args, **kwargs), timeout=seconds)
+                return await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
             except asyncio.TimeoutError:
-                raise TimeoutError(f"TimeoutError: {func.__name__} timed out after {seconds} seconds")
+                raise TimeoutError(f"TimeoutError: {func.__name__} timed out after {timeout:.1f} seconds")
         return wrapper
     return decorator
 
@@ -0,0 +1,57 @@
+import asyncio
+
+from core.agents.agent_pool import AgentPool
+from core.llm.solar_pro_2_llm import assigned_key_slot_context
+
+
+class _Agent:
+    def __init__(self, tag):
+        self.tag = tag
+
+
+def _builder(built, tag="a"):
+    def build():
+        built.append(tag)
+        return _Agent(tag)
+    return build
+
+
+async def test_reuses_agent_per_name_and_key_slot():
+    pool = AgentPool()
+    built = []
+
+    first = pool.get("orchestrator", _builder(built))
+    again = pool.get("orchestrator", _builder(built))
+    other = pool.get("compose", _builder(built, "b"))
+    with assigned_key_slot_context(2):
+        slot_2 = pool.get("orchestrator", _builder(built))
+        assert pool.get("orchestrator", _builder(built)) is slot_2
+
+    assert first is again
+    assert other is not first and slot_2 is not first
+    assert built == ["a", "b", "a"]
+    assert pool.stats()["builds"] == 3 and pool.stats()["hits"] == 2
+
+
+def test_agents_are_not_shared_across_event_loops():
+    pool = AgentPool()
+    built = []
+
+    async def get():
+        return pool.get("orchestrator", _builder(built))
+
+    first = asyncio.run(get())
+    second = asyncio.run(get())
+
+    assert first is not second
+    assert len(built) == 2
+
+
+def test_builds_without_caching_outside_event_loop():
+    pool = AgentPool()
+    built = []
+
+    pool.get("orchestrator", _builder(built))
+    pool.get("orchestrator", _builder(built))
+
+    assert len(built) == 2 and len(pool) == 0
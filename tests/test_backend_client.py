@@ -0,0 +1,138 @@
+import asyncio
+import base64
+import json
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.backend_client import BackendClient, _jwt_exp
+from core.utils.circuit_breaker import CircuitBreaker
+
+
+class FakeBackend:
+    def __init__(self):
+        self.logins = 0
+        self.imports = []
+        self.fail_next = []  # 다음 import 요청들에 돌려줄 status
+        self.fail_login = []  # 다음 로그인 요청들에 돌려줄 status
+        self.valid_tokens = set()
+
+    async def login(self, request):
+        if self.fail_login:
+            return web.Response(status=self.fail_login.pop(0), text="error")
+        self.logins += 1
+        token = f"token-{self.logins}"
+        self.valid_tokens.add(token)
+        return web.json_response({"data": {"access_token": token, "expires_in": 600}})
+
+    async def import_(self, request):
+        if self.fail_next:
+            return web.Response(status=self.fail_next.pop(0), text="error")
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if token not in self.valid_tokens:
+            return web.Response(status=401, text="expired")
+        self.imports.append(await request.json())
+        return web.Response(status=201, text="ok")
+
+
+@pytest.fixture
+async def backend():
+    fake = FakeBackend()
+    app = web.Application()
+    app.router.add_post("/api/auth/login", fake.login)
+    app.router.add_post("/api/curriculums/import", fake.import_)
+    server = TestServer(app)
+    await server.start_server()
+    fake.url = str(server.make_url("")).rstrip("/")
+    yield fake
+    await server.close()
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _client(backend, **kwargs):
+    client = BackendClient(backend.url, "a@b.c", "pw", backoff_sec=0.01, batch_window_sec=0.02, **kwargs)
+    client.breaker = CircuitBreaker("backend-test", enabled=True)
+    return client
+
+
+async def test_reuses_token_and_session_until_expiry(backend):
+    clock = _Clock()
+    client = _client(backend, clock=clock)
+
+    for i in range(3):
+        assert await client.post("/api/curriculums/import", {"id": i}) == (201, "ok")
+    session = client._session
+    assert backend.logins == 1
+
+    clock.now = 600
+    assert (await client.post("/api/curriculums/import", {"id": 3}))[0] == 201
+    assert backend.logins == 2
+    assert client._session is session
+
+    await client.close()
+    assert session.closed
+
+
+async def test_relogins_once_on_401_and_retries_login_5xx(backend):
+    client = _client(backend)
+    backend.fail_login = [503, 502]
+    await client.post("/api/curriculums/import", {"id": 0})
+    assert client.stats()["retries"] == 2
+
+    backend.valid_tokens.clear()
+    assert (await client.post("/api/curriculums/import", {"id": 1}))[0] == 201
+    assert backend.logins == 2
+
+    backend.fail_login = [500] * 10
+    client._token = None
+    assert await client._get_token() is None
+    await client.close()
+
+
+async def test_import_is_not_retried_after_reaching_the_server(backend):
+    client = _client(backend)
+    await client.post("/api/curriculums/import", {"id": 0})
+
+    backend.fail_next = [503]
+    assert (await client.post("/api/curriculums/import", {"id": 1}))[0] == 503
+    assert client.stats()["retries"] == 0
+    await client.close()
+
+
+async def test_import_retries_connection_errors():
+    client = BackendClient("http://127.0.0.1:1", max_retries=2, backoff_sec=0.01)
+    client.breaker = CircuitBreaker("backend-test", enabled=True)
+
+    with pytest.raises(aiohttp.ClientConnectorError):
+        await client._request("/api/curriculums/import", {"id": 0}, token="t")
+    assert client.stats()["retries"] == 2
+    await client.close()
+
+
+async def test_batches_concurrent_submissions_with_single_login(backend):
+    client = _client(backend)
+
+    results = await asyncio.gather(
+        *(client.submit("/api/curriculums/import", {"id": i}) for i in range(5))
+    )
+
+    assert results == [(201, "ok")] * 5
+    assert backend.logins == 1
+    assert sorted(p["id"] for p in backend.imports) == list(range(5))
+    assert client.stats()["batches"] == 1 and client.stats()["max_batch_size"] == 5
+    await client.close()
+
+
+def test_token_expiry_from_jwt_exp():
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": 1700000000}).encode()).decode().rstrip("=")
+    assert _jwt_exp(f"header.{payload}.sig") == 1700000000
+    assert _jwt_exp("opaque-token") is None
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from core.graphs.parallel.graph_parallel import orchestrator_router
+from core.utils.budget import (
+    DEFAULT_MAX_ITERATIONS,
+    LEVEL_EXHAUSTED,
+    LEVEL_NORMAL,
+    LEVEL_TIGHT,
+    RequestBudget,
+    bind_request_budget,
+    budget_callback,
+    clamp_timeout,
+    get_max_iterations,
+    record_search_call,
+    reset_request_budget,
+    search_allowed,
+)
+from core.utils.timeout import async_timeout
+
+
+@pytest.fixture
+def bound():
+    tokens = []
+
+    def _bind(budget):
+        tokens.append(bind_request_budget(budget))
+        return budget
+
+    yield _bind
+    for token in reversed(tokens):
+        reset_request_budget(token)
+
+
+def _llm_result(total_tokens: int) -> LLMResult:
+    message = AIMessage(
+        content="ok",
+        usage_metadata={"input_tokens": total_tokens - 1, "output_tokens": 1, "total_tokens": total_tokens},
+    )
+    return LLMResult(generations=[[ChatGeneration(message=message)]])
+
+
+def test_level_follows_most_used_limit():
+    budget = RequestBudget(max_llm_calls=10, max_search_calls=4)
+    assert budget.level() == LEVEL_NORMAL
+
+    for _ in range(3):
+        budget.record_search_call()
+    assert budget.level() == LEVEL_TIGHT
+    assert budget.search_allowed()
+
+    budget.record_search_call()
+    assert budget.level() == LEVEL_EXHAUSTED
+    assert not budget.search_allowed()
+
+
+def test_from_env_with_request_overrides(monkeypatch):
+    monkeypatch.setenv("BUDGET_MAX_LLM_CALLS", "40")
+    monkeypatch.setenv("MAX_ITERATIONS", "4")
+    monkeypatch.delenv("BUDGET_MAX_TOKENS", raising=False)
+
+    budget = RequestBudget.from_env(max_iterations=2, max_tokens=None)
+
+    assert budget.max_llm_calls == 40
+    assert budget.max_tokens is None
+    assert budget.max_iterations == 2
+
+
+def test_unbound_context_keeps_defaults():
+    assert get_max_iterations() == DEFAULT_MAX_ITERATIONS
+    assert clamp_timeout(120) == 120
+    assert search_allowed()
+    record_search_call()  # 예산이 없으면 무시
+
+
+def test_clamp_timeout_uses_remaining_time_with_floor(bound, monkeypatch):
+    monkeypatch.setenv("BUDGET_MIN_STAGE_TIMEOUT_SEC", "5")
+    budget = bound(RequestBudget(max_wall_time_sec=100))
+
+    assert 90 < clamp_timeout(300) <= 100
+    assert clamp_timeout(30) == 30
+
+    budget.started_at -= 99
+    assert clamp_timeout(300) == 5
+
+
+async def test_async_timeout_is_clamped_by_budget(monkeypatch):
+    monkeypatch.setenv("BUDGET_MIN_STAGE_TIMEOUT_SEC", "0.05")
+    budget = RequestBudget(max_wall_time_sec=10)
+    budget.started_at -= 10
+
+    @async_timeout(60)
+    async def slow():
+        await asyncio.sleep(1)
+
+    token = bind_request_budget(budget)
+    try:
+        with pytest.raises(TimeoutError):
+            await slow()
+    finally:
+        reset_request_budget(token)
+
+
+def test_callback_counts_calls_and_tokens(bound):
+    budget = bound(RequestBudget(max_tokens=1000))
+
+    budget_callback.on_chat_model_start({}, [[]])
+    budget_callback.on_llm_end(_llm_result(120))
+    budget_callback.on_llm_start({}, ["prompt"])
+    budget_callback.on_llm_end(LLMResult(generations=[], llm_output={"token_usage": {"total_tokens": 30}}))
+
+    assert budget.llm_calls == 2
+    assert budget.tokens == 150
+
+
+def test_router_degrades_with_budget(bound):
+    state = {
+        "tasks": ["generate_description", "resource_search", "keyword_expansion"],
+        "current_iteration_count": 1,
+    }
+    assert set(orchestrator_router(state)) == {
+        "paper_concept_alignment", "resource_discovery", "concept_expansion"
+    }
+
+    budget = bound(RequestBudget(max_llm_calls=10))
+    for _ in range(8):
+        budget.record_llm_call()
+    assert set(orchestrator_router(state)) == {"paper_concept_alignment", "resource_discovery"}
+
+    for _ in range(2):
+        budget.record_llm_call()
+    assert orchestrator_router(state) == ["curriculum_compose"]
+
+
+def test_router_uses_budget_max_iterations(bound):
+    bound(RequestBudget(max_iterations=2))
+    state = {"tasks": ["keyword_expansion"], "current_iteration_count": 2}
+    assert orchestrator_router(state) == ["curriculum_compose"]
@@ -0,0 +1,127 @@
+import httpx
+import pytest
+
+from core.utils.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    counts_as_failure,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(**kwargs):
+    clock = _Clock()
+    return CircuitBreaker("test", failure_threshold=3, recovery_sec=10, enabled=True, clock=clock, **kwargs), clock
+
+
+def _status_error(status):
+    request = httpx.Request("GET", "https://example.com")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status, request=request))
+
+
+def test_opens_after_consecutive_failures_and_rejects_calls():
+    breaker, _ = _breaker()
+
+    breaker.record_failure()
+    breaker.record_success()
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.allow() and breaker.state == STATE_CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot()["rejected"] == 1
+    assert breaker.snapshot()["retry_in_sec"] == 10
+
+
+def test_half_open_allows_single_probe_and_recovers():
+    breaker, clock = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.snapshot()["state"] == STATE_HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN and not breaker.allow()
+
+    clock.now = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED and breaker.allow()
+
+
+def test_stuck_probe_is_retried_after_recovery_time():
+    breaker, clock = _breaker()
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.allow()
+    clock.now = 15
+    assert not breaker.allow()
+    clock.now = 20
+    assert breaker.allow()
+
+
+def test_retry_after_opens_immediately():
+    breaker, clock = _breaker()
+
+    breaker.record_status(429, retry_after=60)
+
+    assert breaker.state == STATE_OPEN
+    clock.now = 30
+    assert not breaker.allow()
+    clock.now = 60
+    assert breaker.allow()
+
+
+def test_only_outages_count_as_failures():
+    assert counts_as_failure(_status_error(429))
+    assert counts_as_failure(_status_error(503))
+    assert counts_as_failure(httpx.ConnectTimeout("timeout"))
+    assert not counts_as_failure(_status_error(404))
+
+    breaker, _ = _breaker()
+    for _ in range(5):
+        breaker.record_status(401)
+    assert breaker.state == STATE_CLOSED
+
+
+async def test_call_raises_without_calling_when_open():
+    breaker, _ = _breaker()
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        raise _status_error(500)
+
+    for _ in range(3):
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.call(failing)
+    with pytest.raises(CircuitOpenError):
+        await breaker.call(failing)
+    with pytest.raises(CircuitOpenError):
+        breaker.call_sync(lambda: calls.append(2))
+
+    assert calls == [1, 1, 1]
+
+
+def test_disabled_breaker_never_opens():
+    breaker = CircuitBreaker("off", failure_threshold=1, enabled=False)
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.allow() and breaker.state == STATE_CLOSED
@@ -0,0 +1,181 @@
+import asyncio
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from core.agents.concept_expansion_agent import FINAL_ANSWER_NUDGE, ConceptExpansionAgent
+from core.tools.search_cache import SearchCache, make_search_cache_key
+from core.utils.budget import RequestBudget, bind_request_budget, reset_request_budget
+
+FINAL = json.dumps({"expanded_graph": {"nodes": [], "edges": []}})
+
+
+def _search_step(*queries):
+    return AIMessage(
+        content="",
+        tool_calls=[{"name": "web_search", "args": {"query": q}, "id": f"call-{q}"} for q in queries],
+    )
+
+
+class FakeLLM:
+    """미리 정한 응답을 순서대로 반환 (응답이 떨어지면 계속 검색 요청)"""
+
+    def __init__(self, replies, delay=0.0):
+        self.replies = list(replies)
+        self.delay = delay
+        self.calls = []
+        self.bound_tools = None
+
+    def bind_tools(self, tools):
+        self.bound_tools = [t.name for t in tools]
+        return self
+
+    async def ainvoke(self, messages, config=None):
+        self.calls.append(list(messages))
+        await asyncio.sleep(self.delay)
+        if self.replies:
+            return self.replies.pop(0)
+        return _search_step(f"more-{len(self.calls)}")
+
+
+class FakeSearch:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.queries = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, query, max_results):
+        self.queries.append(query)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return [{"title": query, "url": f"https://x/{query}"}]
+
+
+async def test_tool_calls_in_one_step_run_in_parallel():
+    llm = FakeLLM([_search_step("a", "b", "c"), AIMessage(content=FINAL)])
+    search = FakeSearch(delay=0.05)
+    agent = ConceptExpansionAgent(llm, max_tool_calls=5, search=search)
+
+    response = await agent._run_tool_loop([HumanMessage(content="q")], config={})
+
+    assert llm.bound_tools == ["web_search"]
+    assert search.max_active == 3
+    tool_messages = [m for m in response["messages"] if isinstance(m, ToolMessage)]
+    assert [m.tool_call_id for m in tool_messages] == ["call-a", "call-b", "call-c"]
+    assert response["messages"][-1].content == FINAL
+    assert agent.last_stats["steps"] == 2 and agent.last_stats["tool_calls"] == 3
+
+
+async def test_tool_call_budget_skips_extra_searches_then_asks_for_answer():
+    llm = FakeLLM([_search_step("a", "b"), _search_step("c", "d"), AIMessage(content=FINAL)])
+    search = FakeSearch(delay=0)
+    agent = ConceptExpansionAgent(llm, max_tool_calls=3, max_steps=2, search=search)
+
+    response = await agent._run_tool_loop([HumanMessage(content="q")], config={})
+
+    assert search.queries == ["a", "b", "c"]
+    skipped = [m for m in response["messages"] if isinstance(m, ToolMessage) and "budget" in m.content]
+    assert [m.tool_call_id for m in skipped] == ["call-d"]
+    # max_steps 이후에는 tool 없이 최종 답변 요청
+    assert llm.calls[-1][-1].content == FINAL_ANSWER_NUDGE
+    assert response["messages"][-1].content == FINAL
+    assert agent.last_stats["skipped_tool_calls"] == 1
+
+
+async def test_wall_clock_cap_cuts_slow_searches():
+    llm = FakeLLM([_search_step("slow"), AIMessage(content=FINAL)])
+    search = FakeSearch(delay=5)
+    agent = ConceptExpansionAgent(llm, timeout_sec=0.1, search=search)
+
+    started = asyncio.get_running_loop().time()
+    response = await agent._run_tool_loop([HumanMessage(content="q")], config={})
+
+    assert asyncio.get_running_loop().time() - started < 1
+    assert agent.last_stats["timed_out"]
+    assert response["messages"][-1].content == FINAL
+
+
+async def test_request_search_budget_is_respected():
+    budget = RequestBudget(max_search_calls=1)
+    token = bind_request_budget(budget)
+    try:
+        llm = FakeLLM([_search_step("a", "b"), AIMessage(content=FINAL)])
+        search = FakeSearch(delay=0)
+        agent = ConceptExpansionAgent(llm, max_tool_calls=5, search=search)
+
+        await agent._run_tool_loop([HumanMessage(content="q")], config={})
+    finally:
+        reset_request_budget(token)
+
+    assert search.queries == ["a"]
+    assert budget.search_calls == 1
+
+
+async def test_search_cache_reuses_results_and_dedups_inflight():
+    cache = SearchCache(ttl_sec=60, max_entries=10)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return [{"url": "https://x"}]
+
+    key = make_search_cache_key("tavily", "  Attention   Is All ", max_results=3)
+    same = make_search_cache_key("tavily", "attention is all", max_results=3)
+    assert key == same
+
+    first, second = await asyncio.gather(cache.get_or_fetch(key, fetch), cache.get_or_fetch(same, fetch))
+    third = await cache.get_or_fetch(key, fetch)
+
+    assert len(calls) == 1
+    assert first == second == third == [{"url": "https://x"}]
+    assert cache.stats()["shared"] == 1 and cache.stats()["hits"] == 1
+
+
+async def test_search_cache_leader_cancel_does_not_cancel_waiters():
+    cache = SearchCache()
+    fetch_cancelled = asyncio.Event()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return [{"url": "https://x"}]
+
+    key = make_search_cache_key("tavily", "q")
+    leader = asyncio.create_task(cache.get_or_fetch(key, fetch))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_fetch(key, fetch))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    assert await waiter == [{"url": "https://x"}]
+    assert leader.cancelled()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            fetch_cancelled.set()
+            raise
+
+    other = make_search_cache_key("tavily", "other")
+    only = asyncio.create_task(cache.get_or_fetch(other, slow))
+    await asyncio.sleep(0.01)
+    only.cancel()
+    await asyncio.wait_for(fetch_cancelled.wait(), 1)
+
+
+async def test_search_cache_skips_empty_results():
+    cache = SearchCache()
+
+    async def empty():
+        return []
+
+    key = make_search_cache_key("tavily", "q")
+    await cache.get_or_fetch(key, empty)
+
+    assert len(cache) == 0
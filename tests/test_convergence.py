@@ -0,0 +1,70 @@
+from core.graphs.parallel.convergence import initial_convergence_state, update_convergence
+from core.graphs.parallel.graph_parallel import orchestrator_router
+
+
+def _curriculum(n_resources: int, described: int = 2) -> dict:
+    nodes = [
+        {"keyword_id": f"key-{i:03d}", "description": "d" if i < described else None,
+         "resources": [{"resource_id": f"res-{i}-{j}"} for j in range(n_resources)]}
+        for i in range(3)
+    ]
+    return {"nodes": nodes, "edges": [{"start": "key-000", "end": "key-001"}]}
+
+
+def _result(insufficient, missing=(), tasks=("resource_search",)) -> dict:
+    return {"insufficient_resource_ids": list(insufficient), "missing_concepts": list(missing), "tasks": list(tasks)}
+
+
+def _round(state: dict, curriculum: dict, result: dict, max_iterations: int = 6) -> dict:
+    state = {**state, "curriculum": curriculum}
+    update = update_convergence(state, result, max_iterations=max_iterations)
+    return {**state, **update, "current_iteration_count": state["current_iteration_count"] + 1}
+
+
+def _initial() -> dict:
+    return {"current_iteration_count": 0, **initial_convergence_state()}
+
+
+def test_repeated_round_without_progress_converges():
+    state = _round(_initial(), _curriculum(1), _result(["key-001", "key-000"]))
+    assert not state["converged"]
+
+    # 리소스 검색을 했지만 아무것도 늘지 않았고 같은 노드가 다시 부족 판정 (순서만 다름)
+    state = _round(state, _curriculum(1), _result(["key-000", "key-001"]))
+
+    assert state["converged"]
+    assert state["stalled_rounds"] == 1
+    assert state["rounds_saved"] == 6 - 2
+
+
+def test_progress_resets_stall_counter():
+    state = _round(_initial(), _curriculum(1), _result(["key-001"]))
+    state = _round(state, _curriculum(2), _result(["key-001"]))
+    assert not state["converged"] and state["stalled_rounds"] == 0
+
+    state = _round(state, _curriculum(2), _result(["key-002"]))
+    assert not state["converged"]
+
+
+def test_patience_requires_consecutive_stalls():
+    state = {"current_iteration_count": 0, **initial_convergence_state()}
+    for expected in (0, 1, 2):
+        state = {**state, "curriculum": _curriculum(1)}
+        update = update_convergence(state, _result(["key-001"]), max_iterations=6, patience=2)
+        state = {**state, **update, "current_iteration_count": state["current_iteration_count"] + 1}
+        assert state["stalled_rounds"] == expected
+    assert state["converged"] and state["rounds_saved"] == 3
+
+
+def test_finishing_round_is_not_counted_as_stall():
+    state = _round(_initial(), _curriculum(1), _result([], tasks=["curriculum_compose"]))
+    state = _round(state, _curriculum(1), _result([], tasks=["curriculum_compose"]))
+
+    assert not state["converged"]
+
+
+def test_router_sends_converged_state_to_compose():
+    state = {"tasks": ["resource_search", "keyword_expansion"], "current_iteration_count": 2, "converged": True}
+
+    assert orchestrator_router(state) == ["curriculum_compose"]
+    assert orchestrator_router({**state, "converged": False}) == ["resource_discovery", "concept_expansion"]
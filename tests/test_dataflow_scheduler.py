@@ -0,0 +1,156 @@
+import asyncio
+
+from core.graphs.parallel.dataflow import DataflowScheduler
+from core.graphs.parallel.graph_parallel import run_langgraph_workflow
+
+
+def _node(kid, description=None, resources=None, sufficient=False):
+    return {
+        "keyword_id": kid,
+        "keyword": kid,
+        "description": description,
+        "resources": resources or [],
+        "is_resource_sufficient": sufficient,
+    }
+
+
+def _curriculum(*nodes):
+    return {
+        "graph_meta": {"paper_id": "paper-1", "title": "T"},
+        "first_node_order": None,
+        "nodes": list(nodes),
+        "edges": [],
+    }
+
+
+class FakeOps:
+    """작업마다 지연시간을 주고 실행 순서를 기록"""
+
+    def __init__(self, delays=None, sufficient_after=1, missing=(), fail_describe=()):
+        self.delays = delays or {}
+        self.sufficient_after = sufficient_after
+        self.missing = list(missing)
+        self.fail_describe = set(fail_describe)
+        self.events = []
+        self.searches = {}
+
+    async def _run(self, kind, key):
+        self.events.append(("start", kind, key))
+        await asyncio.sleep(self.delays.get(kind, 0.001))
+        self.events.append(("end", kind, key))
+
+    async def describe(self, curriculum, keyword_ids):
+        await self._run("describe", tuple(keyword_ids))
+        return [
+            {"keyword_id": kid, "description": f"desc {kid}"}
+            for kid in keyword_ids if kid not in self.fail_describe
+        ]
+
+    async def search(self, curriculum, node):
+        kid = node["keyword_id"]
+        await self._run("search", kid)
+        self.searches[kid] = self.searches.get(kid, 0) + 1
+        return [{"keyword_id": kid, "url": f"https://x/{kid}/{self.searches[kid]}", "difficulty": 3}]
+
+    async def check_resource(self, node):
+        await self._run("check_resource", node["keyword_id"])
+        return {
+            "is_resource_sufficient": len(node["resources"]) >= self.sufficient_after,
+            "reasoning": "need more",
+        }
+
+    async def check_keywords(self, curriculum):
+        await self._run("check_keywords", len(curriculum["nodes"]))
+        missing, self.missing = self.missing, []
+        return missing, "gap"
+
+    async def expand(self, curriculum, missing_concepts, reason):
+        await self._run("expand", tuple(missing_concepts))
+        return {
+            "nodes": [_node("key-new")],
+            "edges": [{"start": missing_concepts[0], "end": "key-new"}],
+        }
+
+    async def estimate(self, curriculum):
+        await self._run("estimate", None)
+        return None
+
+
+def _index(events, event):
+    return events.index(event)
+
+
+async def test_search_starts_without_waiting_for_other_descriptions():
+    ops = FakeOps(delays={"describe": 0.05, "search": 0.001})
+    scheduler = DataflowScheduler(_curriculum(_node("key-a", "has desc"), _node("key-b")), ops)
+
+    curriculum = await scheduler.run()
+
+    # key-a 자료 검색과 판단이 key-b 설명 생성이 끝나기 전에 완료
+    describe_end = _index(ops.events, ("end", "describe", ("key-b",)))
+    assert _index(ops.events, ("end", "check_resource", "key-a")) < describe_end
+    # key-b 검색은 자기 설명이 생긴 뒤에 시작
+    assert _index(ops.events, ("start", "search", "key-b")) > describe_end
+
+    nodes = {n["keyword_id"]: n for n in curriculum["nodes"]}
+    assert nodes["key-b"]["description"] == "desc key-b"
+    assert all(n["resources"] and n["is_resource_sufficient"] for n in nodes.values())
+
+
+async def test_expanded_node_flows_through_describe_and_search_in_same_run():
+    ops = FakeOps(missing=["key-a"])
+    scheduler = DataflowScheduler(_curriculum(_node("key-a", "d")), ops)
+
+    curriculum = await scheduler.run()
+
+    nodes = {n["keyword_id"]: n for n in curriculum["nodes"]}
+    assert nodes["key-new"]["description"] == "desc key-new"
+    assert nodes["key-new"]["resources"]
+    assert curriculum["edges"] == [{"start": "key-a", "end": "key-new"}]
+    # 확장 후 노드 구성이 바뀌어 한 번 더 키워드 체크 -> 충분
+    assert scheduler.keyword_checks == 2
+    assert scheduler.state_update()["is_keyword_sufficient"]
+
+
+async def test_insufficient_resources_are_searched_again_up_to_limit():
+    ops = FakeOps(sufficient_after=10)
+    scheduler = DataflowScheduler(_curriculum(_node("key-a", "d")), ops, max_attempts=2)
+
+    curriculum = await scheduler.run()
+
+    assert ops.searches["key-a"] == 2
+    node = curriculum["nodes"][0]
+    assert [r["resource_id"] for r in node["resources"]] == ["res-001", "res-002"]
+    assert node["resource_reason"] == "need more"
+    assert scheduler.state_update()["insufficient_resource_ids"] == ["key-a"]
+
+
+async def test_failed_descriptions_are_bounded_and_node_still_gets_resources():
+    ops = FakeOps(fail_describe={"key-b"})
+    scheduler = DataflowScheduler(_curriculum(_node("key-b")), ops, max_attempts=2)
+
+    curriculum = await scheduler.run()
+
+    assert scheduler.stats["dispatched"]["describe"] == 2
+    assert curriculum["nodes"][0]["resources"]
+    assert scheduler.state_update()["needs_description_ids"] == ["key-b"]
+
+
+async def test_sufficient_nodes_are_left_alone():
+    ops = FakeOps()
+    resources = [{"resource_id": "res-001", "difficulty": 1, "importance": 1, "study_load": 1}]
+    scheduler = DataflowScheduler(_curriculum(_node("key-a", "d", resources, sufficient=True)), ops)
+
+    await scheduler.run()
+
+    assert [e for e in ops.events if e[1] != "check_keywords"] == []
+
+
+def test_dataflow_mode_builds_graph_without_join_barrier(monkeypatch):
+    monkeypatch.setenv("CURRICULUM_SCHEDULER_MODE", "dataflow")
+    nodes = set(run_langgraph_workflow().get_graph().nodes)
+    assert "dataflow_scheduler" in nodes
+    assert "join_results" not in nodes
+
+    monkeypatch.setenv("CURRICULUM_SCHEDULER_MODE", "rounds")
+    assert "join_results" in set(run_langgraph_workflow().get_graph().nodes)
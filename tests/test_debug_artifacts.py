@@ -0,0 +1,41 @@
+import gzip
+import json
+import os
+import time
+
+from core.utils.debug_artifacts import (
+    bind_debug_artifacts,
+    debug_artifacts_enabled,
+    reset_debug_artifacts,
+    save_debug_artifact,
+)
+
+
+async def test_save_is_noop_without_opt_in(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("DEBUG_ARTIFACT_DIR", str(tmp_path))
+
+    assert not debug_artifacts_enabled()
+    assert await save_debug_artifact("subgraph_1", {"a": 1}) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_save_writes_gzip_per_job_and_applies_retention(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("DEBUG_ARTIFACT_DIR", str(tmp_path))
+    monkeypatch.setenv("DEBUG_ARTIFACT_MAX_JOBS", "2")
+
+    for i, job_id in enumerate(["job-a", "job-b", "job-c"]):
+        token = bind_debug_artifacts(job_id)
+        try:
+            path = await save_debug_artifact("subgraph_1", {"job": job_id, "이름": "키워드"})
+        finally:
+            reset_debug_artifacts(token)
+
+        assert path == tmp_path / job_id / "subgraph_1.json.gz"
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert json.load(f) == {"job": job_id, "이름": "키워드"}
+
+        # mtime 순서가 확실히 구분되도록 조정
+        os.utime(tmp_path / job_id, (time.time() - 100 + i, time.time() - 100 + i))
+
+    assert sorted(d.name for d in tmp_path.iterdir()) == ["job-b", "job-c"]
+    assert not debug_artifacts_enabled()
@@ -0,0 +1,82 @@
+import subprocess
+import sys
+
+import pytest
+
+from core.tools.graph_store import GraphStore, SQLiteGraphStore, create_graph_store
+from core.utils.kg_agent_preprocessing import preprocess_graph
+
+
+def _build_store(path) -> SQLiteGraphStore:
+    papers = [
+        {"id": "p-target", "name": "Attention Is All You Need", "description": "d", "url": "u0", "abstract": "a", "citationCount": 10},
+        {"id": "p-ref", "name": "Ref Paper", "description": "", "url": "u1"},
+        {"id": "p-about", "name": "About Paper", "description": "", "url": "u2"},
+    ]
+    keywords = [
+        {"id": "k-attn", "name": "Attention", "alias": ["attn"]},
+        {"id": "k-softmax", "name": "Softmax", "alias": []},
+        {"id": "k-exp", "name": "Exponential", "alias": []},
+        {"id": "k-log", "name": "Logarithm", "alias": []},
+        {"id": "k-rnn", "name": "RNN", "alias": ["recurrent neural network"]},
+        {"id": "k-far", "name": "Far Away", "alias": []},
+    ]
+    prereq = [
+        {"source": "k-softmax", "target": "k-attn", "strength": 0.95, "reason": "softmax"},
+        {"source": "k-exp", "target": "k-softmax", "strength": 0.9, "reason": "exp"},
+        {"source": "k-log", "target": "k-exp", "strength": 1.0, "reason": "too far (3 hops)"},
+        {"source": "k-far", "target": "k-attn", "strength": 0.5, "reason": "weak"},
+    ]
+    links = [
+        {"type": "ABOUT", "source": "p-target", "target": "k-attn", "strength": 1.0, "reason": ""},
+        {"type": "IN", "source": "k-rnn", "target": "p-target", "strength": 0.8, "reason": ""},
+        {"type": "ABOUT", "source": "p-about", "target": "k-rnn", "strength": 0.7, "reason": ""},
+        {"type": "REF_BY", "source": "p-ref", "target": "p-target", "strength": 0.9, "intents": ["background"], "isInfluential": True},
+        {"type": "REF_BY", "source": "p-about", "target": "p-target", "strength": 0.1},
+    ]
+    return SQLiteGraphStore.build(str(path), papers, keywords, prereq, links)
+
+
+def test_sqlite_store_follows_subgraph_contract(tmp_path) -> None:
+    store = _build_store(tmp_path / "graph.sqlite")
+    graph = store.get_subgraph_1("  attention is all you need ", ["Recurrent Neural Network"])["graph"]
+
+    assert graph["target_paper"]["id"] == "p-target"
+    assert graph["target_paper"]["citationCount"] == 10
+    assert {k["id"] for k in graph["nodes"]["keywords"]} == {"k-attn", "k-softmax", "k-exp", "k-rnn"}
+    assert [p["id"] for p in graph["nodes"]["papers"]] == ["p-about", "p-ref"]
+    assert {(e["source"], e["target"]) for e in graph["edges"]["PREREQ"]} == {
+        ("k-softmax", "k-attn"), ("k-exp", "k-softmax"),
+    }
+    assert {(e["source"], e["target"]) for e in graph["edges"]["ABOUT"]} == {("p-target", "k-attn"), ("p-about", "k-rnn")}
+    assert {(e["source"], e["target"]) for e in graph["edges"]["IN"]} == {("k-rnn", "p-target")}
+    assert graph["edges"]["REF_BY"] == [{
+        "source": "p-ref", "target": "p-target", "intents": ["background"], "isInfluential": True, "strength": 0.9,
+    }]
+
+    # 기존 전처리가 그대로 동작
+    agent_input = preprocess_graph({"graph": graph})
+    assert agent_input["nodes"][0] == "Attention Is All You Need"
+    store.close()
+
+
+def test_sqlite_store_unknown_paper_returns_empty_target(tmp_path) -> None:
+    store = create_graph_store("sqlite", path=str(_build_store(tmp_path / "graph.sqlite").path))
+    graph = store.get_subgraph_1("Unknown Paper", ["attn"])["graph"]
+
+    assert graph["target_paper"] is None
+    assert {k["id"] for k in graph["nodes"]["keywords"]} == {"k-attn", "k-softmax", "k-exp"}
+    assert graph["edges"]["REF_BY"] == []
+
+
+def test_graph_store_module_does_not_import_neo4j_driver() -> None:
+    code = (
+        "import sys; import core.tools.graph_store as g; g.create_graph_store('neo4j'); "
+        "assert 'core.tools.gdb_search' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_graph_store_requires_get_subgraph_1():
+    with pytest.raises(TypeError):
+        GraphStore()
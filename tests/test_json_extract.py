@@ -0,0 +1,124 @@
+import json
+import random
+
+import pytest
+
+from core.utils.json_extract import extract_json
+
+_STRING_CHARS = list("abcxyz 가나다{}[]:,'\"\\/\n\t`") + ["🚀", "\\u", "```"]
+_PROSE = [
+    "", "Sure! Here is the result:", "it's done.", "[1] see reference", "{note}",
+    "Explanation: the graph {roughly} covers it.", "Output (json):", "```", "{ unfinished",
+]
+
+
+def _rand_string(rng: random.Random) -> str:
+    return "".join(rng.choice(_STRING_CHARS) for _ in range(rng.randint(0, 12)))
+
+
+def _rand_value(rng: random.Random, depth: int = 0):
+    kind = rng.random()
+    if depth >= 3 or kind < 0.4:
+        return rng.choice([None, True, False, rng.randint(-1000, 1000), rng.random() * 100, _rand_string(rng)])
+    if kind < 0.7:
+        return [_rand_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return _rand_dict(rng, depth + 1)
+
+
+def _rand_dict(rng: random.Random, depth: int = 0) -> dict:
+    return {_rand_string(rng) + str(i): _rand_value(rng, depth) for i in range(rng.randint(0, 5))}
+
+
+def _dump(value, rng: random.Random) -> str:
+    return json.dumps(value, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 2]))
+
+
+def _wrap(body: str, rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        body = f"```{rng.choice(['json', ''])}\n{body}\n```"
+    return f"{rng.choice(_PROSE)}\n{body}\n{rng.choice(_PROSE)}"
+
+
+def _is_prefix(partial, full) -> bool:
+    """잘린 출력에서 복구한 값이 원래 값의 앞부분인지"""
+    if isinstance(full, dict):
+        if not isinstance(partial, dict) or list(partial) != list(full)[:len(partial)]:
+            return False
+        return all(_is_prefix(partial[k], full[k]) for k in partial)
+    if isinstance(full, list):
+        if not isinstance(partial, list) or len(partial) > len(full):
+            return False
+        return all(_is_prefix(p, f) for p, f in zip(partial, full))
+    return partial == full
+
+
+def test_fuzz_extracts_dict_from_wrapped_output():
+    rng = random.Random(0)
+    for _ in range(500):
+        value = _rand_dict(rng)
+        text = _wrap(_dump(value, rng), rng)
+
+        assert extract_json(text, expect=dict) == value, text
+
+
+def test_fuzz_extracts_list_of_dicts():
+    rng = random.Random(1)
+    for _ in range(300):
+        value = [_rand_dict(rng) for _ in range(rng.randint(1, 4))]
+        value[0]["url"] = "https://example.com"
+        text = _wrap(_dump(value, rng), rng)
+
+        result = extract_json(text, expect=list, validate=lambda v: any(isinstance(x, dict) for x in v))
+        assert result == value, text
+
+
+def test_fuzz_truncated_output_recovers_prefix():
+    rng = random.Random(2)
+    for _ in range(300):
+        value = {"nodes": [_rand_dict(rng) for _ in range(rng.randint(1, 5))], "edges": []}
+        full = _dump(value, rng)
+        cut = rng.randint(1, len(full))
+
+        result = extract_json(full[:cut], expect=dict, allow_partial=True)
+        assert result is None or _is_prefix(result, value), full[:cut]
+        if cut == len(full):
+            assert result == value
+
+
+def test_fuzz_garbage_never_raises():
+    rng = random.Random(3)
+    alphabet = list("{}[]\"':,\\ abc123TrueNone`\n")
+    for _ in range(1000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        result = extract_json(text)
+        assert result is None or isinstance(result, (dict, list))
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('```json\n{"query": "a"}\n```\nExplanation: {not json}', {"query": "a"}),
+        ('{"query": "a"} Explanation: it\'s {fine}', {"query": "a"}),
+        ("{'a': True, 'b': None}", {"a": True, "b": None}),
+        ("{it's a note} Here: {\"a\": 1}", {"a": 1}),
+        ('```{"a": 1}```', {"a": 1}),
+        ("no json here", None),
+        ("", None),
+    ],
+)
+def test_examples(text, expected):
+    assert extract_json(text, expect=dict) == expected
+
+
+def test_expect_list_skips_values_inside_other_json():
+    text = '{"a": [1, 2]} then [{"b": 1}]'
+
+    assert extract_json(text, expect=list) == [{"b": 1}]
+
+
+def test_truncated_output_only_recovered_with_allow_partial():
+    assert extract_json('{"a": 1, "b": [', expect=dict) is None
+    assert extract_json('{"a": 1, "b": [', expect=dict, allow_partial=True) == {"a": 1, "b": []}
+    assert extract_json('{"nodes": [{"id": 1}, {"id": 2, "na', expect=dict, allow_partial=True) == {
+        "nodes": [{"id": 1}, {"id": 2}]
+    }
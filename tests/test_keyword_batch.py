@@ -0,0 +1,87 @@
+import asyncio
+from collections import defaultdict
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.models.keyword import (
+    KeywordBatchExtractRequest,
+    KeywordBatchItemResult,
+    KeywordBatchSummary,
+    KeywordExtractResponse,
+)
+from app.main import app
+from app.services import extract_paper_concept_service as service
+
+
+def _paper(paper_id: str, assigned_key_slot=None) -> dict:
+    return {
+        "paper_id": paper_id,
+        "paper_content": {"title": paper_id, "abstract": "abstract", "body": []},
+        "assigned_key_slot": assigned_key_slot,
+    }
+
+
+def test_assign_key_slots_round_robin_keeps_explicit_slot() -> None:
+    request = KeywordBatchExtractRequest(
+        papers=[_paper("p0"), _paper("p1", assigned_key_slot=4), _paper("p2"), _paper("p3", assigned_key_slot=9)]
+    )
+
+    assert service.assign_key_slots(request.papers) == [1, 4, 2, 3]
+
+
+async def test_batch_streams_results_and_bounds_slot_concurrency(monkeypatch) -> None:
+    running = defaultdict(int)
+    peak = defaultdict(int)
+
+    async def fake_extraction(request):
+        slot = request.assigned_key_slot
+        running[slot] += 1
+        peak[slot] = max(peak[slot], running[slot])
+        await asyncio.sleep(0.01)
+        running[slot] -= 1
+        if request.paper_id == "p3":
+            raise RuntimeError("boom")
+        return KeywordExtractResponse(
+            paper_id=request.paper_id,
+            keywords=["kw"],
+            summary="summary",
+            extracted_at="now",
+            extracted_by="Solar_2_pro",
+        )
+
+    monkeypatch.setattr(service, "_run_keyword_extraction", fake_extraction)
+
+    request = KeywordBatchExtractRequest(
+        papers=[_paper(f"p{i}") for i in range(12)],
+        max_concurrency_per_slot=1,
+    )
+    events = [event async for event in service.extract_keywords_batch(request)]
+
+    items = [e for e in events if isinstance(e, KeywordBatchItemResult)]
+    summary = events[-1]
+
+    assert len(items) == 12
+    assert {item.paper_id for item in items} == {f"p{i}" for i in range(12)}
+    assert max(peak.values()) == 1
+    assert isinstance(summary, KeywordBatchSummary)
+    assert summary.succeeded == 11
+    assert summary.failed == 1
+    assert summary.slots_used == [1, 2, 3, 4, 5]
+    failed = next(item for item in items if item.status == "failed")
+    assert failed.paper_id == "p3"
+    assert failed.error == "boom"
+
+
+def test_batch_endpoint_rejects_too_many_papers(monkeypatch) -> None:
+    monkeypatch.setenv("AUTHORIZATION_TOKEN", "test-token")
+    monkeypatch.setattr(service, "KEYWORD_BATCH_MAX_PAPERS", 2)
+
+    response = TestClient(app).post(
+        "/api/curr/keywords/extract/batch",
+        json={"papers": [_paper(f"p{i}") for i in range(3)]},
+        headers={"Authorization": "Bearer test-token"},
+    )
+
+    assert response.status_code == 413
+    assert response.json()["error_code"] == "BATCH_TOO_LARGE"
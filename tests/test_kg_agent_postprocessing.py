@@ -0,0 +1,136 @@
+import copy
+import random
+
+from core.utils.kg_agent_postprocessing import postprocess_agent_output
+
+PAPER_ID = "paper-0"
+PAPER_TITLE = "Target Paper"
+
+
+def _oracle_postprocess(raw, agent_output, initial_keyword, paper_id):
+    """리스트 순회 기반의 단순 구현 (삭제는 복사본을 순회하며 수행)"""
+    keywords = raw["graph"]["nodes"]["keywords"]
+    name_to_prop = {}
+    for kw in keywords:
+        name_to_prop.setdefault(kw["name"].lower(), kw)
+
+    valid = list(agent_output["nodes"]) + [PAPER_TITLE, paper_id]
+    agent_edges = [e for e in agent_output["edges"] if e["start"] in valid and e["end"] in valid]
+
+    incoming = {}
+    for e in agent_edges:
+        if e["type"] == "PREREQ":
+            incoming.setdefault(e["end"].lower(), []).append(e)
+
+    edges, about = [], []
+    for e in agent_edges:
+        if e["type"] == "PREREQ":
+            end = e["end"].lower()
+            edges.append({"start": name_to_prop[e["start"].lower()]["id"],
+                          "end": name_to_prop[end]["id"] if end in name_to_prop else e["end"]})
+        elif e["type"] == "ABOUT":
+            about.append(e["end"].lower())
+            for inc in incoming.get(e["end"].lower(), []):
+                edges.append({"start": name_to_prop[inc["start"].lower()]["id"], "end": paper_id})
+        else:
+            edges.append({"start": name_to_prop[e["start"].lower()]["id"], "end": paper_id})
+
+    nodes = [{"keyword_id": name_to_prop[n.lower()]["id"], "keyword": n}
+             for n in set(agent_output["nodes"]) if n.lower() not in about]
+
+    ids = [paper_id] + [n["keyword_id"] for n in nodes]
+    for e in list(edges):
+        if not (e["start"] in ids and e["end"] in ids):
+            edges.remove(e)
+
+    starts = [e["start"] for e in edges]
+    ends = [e["end"] for e in edges]
+    for n in list(nodes):
+        if n["keyword_id"] in starts:
+            continue
+        if n["keyword_id"] in ends:
+            edges.append({"start": n["keyword_id"], "end": paper_id})
+        else:
+            nodes.remove(n)
+
+    alias = {}
+    node_names = [n["keyword"] for n in nodes]
+    for kw in keywords:
+        if kw["name"] in node_names:
+            alias[kw["name"].lower()] = kw["name"]
+            for a in kw["alias"]:
+                alias[a.lower()] = kw["name"]
+
+    for kw in initial_keyword:
+        if kw.lower() in alias:
+            kid = name_to_prop[alias[kw.lower()].lower()]["id"]
+            if not any(e["start"] == kid and e["end"] == paper_id for e in edges):
+                edges.append({"start": kid, "end": paper_id})
+        else:
+            nodes.append({"keyword_id": None, "keyword": kw})
+
+    for n in nodes:
+        n["keyword"] = n["keyword"].split("(")[0].strip().title()
+
+    ids = [paper_id] + [n["keyword_id"] for n in nodes if n["keyword_id"]]
+    edges = [e for e in edges if e["start"] in ids and e["end"] in ids]
+    return nodes, edges
+
+
+def _random_case(rng: random.Random):
+    n_keywords = rng.randint(2, 30)
+    keywords = [
+        {"id": f"kw-{i}", "name": f"Concept {i}", "alias": [f"C{i}"] if rng.random() < 0.3 else []}
+        for i in range(n_keywords)
+    ]
+    raw = {"graph": {
+        "target_paper": {"id": PAPER_ID, "name": PAPER_TITLE},
+        "nodes": {"papers": [], "keywords": keywords},
+        "edges": {"PREREQ": [], "ABOUT": [], "IN": [], "REF_BY": []},
+    }}
+
+    names = [kw["name"] for kw in keywords]
+    agent_nodes = rng.sample(names, rng.randint(1, n_keywords))
+    endpoints = names  # agent가 노드 목록에 없는 이름을 참조하는 경우도 포함
+
+    agent_edges = []
+    for _ in range(rng.randint(0, 3 * n_keywords)):
+        r = rng.random()
+        if r < 0.75:
+            agent_edges.append({"start": rng.choice(endpoints), "end": rng.choice(endpoints + [PAPER_TITLE]),
+                                "type": "PREREQ", "reason": "r", "strength": 0.9})
+        elif r < 0.95:
+            agent_edges.append({"start": rng.choice(endpoints), "end": PAPER_TITLE,
+                                "type": "IN", "reason": "", "strength": 1.0})
+        else:
+            agent_edges.append({"start": PAPER_TITLE, "end": rng.choice(endpoints),
+                                "type": "ABOUT", "reason": "", "strength": 1.0})
+
+    initial_keyword = rng.sample(names + ["Unknown Concept", "c1"], rng.randint(0, 4))
+    return raw, {"nodes": agent_nodes, "edges": agent_edges}, initial_keyword
+
+
+def _edge_pairs(edges):
+    return sorted((e["start"], e["end"]) for e in edges)
+
+
+def test_postprocess_matches_oracle_and_invariants() -> None:
+    rng = random.Random(2024)
+    for _ in range(300):
+        raw, agent_output, initial_keyword = _random_case(rng)
+
+        subgraph = postprocess_agent_output(copy.deepcopy(raw), copy.deepcopy(agent_output), initial_keyword, PAPER_ID)
+        oracle_nodes, oracle_edges = _oracle_postprocess(raw, agent_output, initial_keyword, PAPER_ID)
+
+        assert sorted((n["keyword_id"] or "", n["keyword"]) for n in subgraph["nodes"]) == \
+            sorted((n["keyword_id"] or "", n["keyword"]) for n in oracle_nodes)
+        assert _edge_pairs(subgraph["edges"]) == _edge_pairs(oracle_edges)
+
+        node_ids = {n["keyword_id"] for n in subgraph["nodes"] if n["keyword_id"]}
+        # 모든 edge는 존재하는 노드(또는 paper)만 참조
+        for e in subgraph["edges"]:
+            assert e["start"] in node_ids | {PAPER_ID}
+            assert e["end"] in node_ids | {PAPER_ID}
+        # id가 있는 노드는 모두 start로 한 번 이상 등장 (고립 노드 없음)
+        starts = {e["start"] for e in subgraph["edges"]}
+        assert node_ids <= starts
@@ -0,0 +1,122 @@
+import copy
+import random
+
+from core.utils import kg_agent_pruning
+from core.utils.kg_agent_pruning import estimate_tokens, prune_agent_input
+from core.utils.serialization import to_prompt_json
+
+TARGET = "Target Paper"
+
+
+def _random_agent_input(rng: random.Random, n_nodes: int, n_edges: int) -> dict:
+    names = [f"Keyword {i}" for i in range(n_nodes)]
+    edges = []
+    for name in rng.sample(names, max(1, n_nodes // 10)):
+        edges.append({"start": TARGET, "end": name, "type": "ABOUT", "reason": "", "strength": 1.0})
+    for _ in range(n_edges):
+        s, t = rng.sample(names, 2)
+        edges.append({
+            "start": s, "end": t, "type": "PREREQ",
+            "reason": "because " * rng.randint(0, 60),
+            "strength": rng.choice([0.5, 0.9, 0.95, 1.0]),
+        })
+    nodes = [TARGET] + sorted({e["start"] for e in edges} | {e["end"] for e in edges} - {TARGET})
+    return {"target_paper_id": "paper-0", "nodes": nodes, "edges": edges}
+
+
+def _hops(edges):
+    adj = {}
+    for e in edges:
+        adj.setdefault(e["start"], []).append(e["end"])
+        adj.setdefault(e["end"], []).append(e["start"])
+    hops, frontier = {TARGET: 0}, [TARGET]
+    while frontier:
+        nxt = []
+        for u in frontier:
+            for v in adj.get(u, []):
+                if v not in hops:
+                    hops[v] = hops[u] + 1
+                    nxt.append(v)
+        frontier = nxt
+    return hops
+
+
+def test_prune_respects_limits_and_keeps_target_structure() -> None:
+    rng = random.Random(7)
+    for _ in range(50):
+        agent_input = _random_agent_input(rng, n_nodes=rng.randint(5, 120), n_edges=rng.randint(5, 600))
+        original = copy.deepcopy(agent_input)
+
+        pruned = prune_agent_input(
+            agent_input, target_node=TARGET,
+            min_strength=0.9, max_hops=3, max_degree=6, max_reason_chars=40, token_budget=1500,
+        )
+
+        assert agent_input == original  # 입력은 그대로
+        edges = pruned["edges"]
+
+        # target ABOUT/IN 링크는 모두 유지
+        kept_pairs = {(e["start"], e["end"]) for e in edges}
+        assert all((e["start"], e["end"]) in kept_pairs for e in original["edges"] if e["type"] == "ABOUT")
+
+        hops = _hops(edges)
+        degree = {}
+        for e in edges:
+            assert e["type"] == "ABOUT" or e["strength"] >= 0.9
+            assert len(e["reason"]) <= 40
+            # 모든 edge는 target과 연결되어 있고 max_hops 이내
+            assert e["start"] in hops and e["end"] in hops
+            assert max(hops[e["start"]], hops[e["end"]]) <= 3
+            for n in (e["start"], e["end"]):
+                if n != TARGET:
+                    degree[n] = degree.get(n, 0) + 1
+        assert all(d <= 6 for d in degree.values())
+
+        # nodes는 edges에 등장한 노드, target이 맨 앞
+        names = {e["start"] for e in edges} | {e["end"] for e in edges}
+        assert set(pruned["nodes"]) == names
+        if names:
+            assert pruned["nodes"][0] == TARGET
+
+        # budget을 넘는 경우는 target 링크만 남았을 때뿐
+        if estimate_tokens(pruned) > 1500:
+            assert all(e["type"] == "ABOUT" for e in edges)
+
+
+def test_prune_without_target_link_keeps_graph() -> None:
+    agent_input = {
+        "target_paper_id": "paper-0",
+        "nodes": ["A", "B", "C"],
+        "edges": [
+            {"start": "A", "end": "B", "type": "PREREQ", "reason": "r", "strength": 0.9},
+            {"start": "B", "end": "C", "type": "PREREQ", "reason": "r", "strength": 1.0},
+        ],
+    }
+    pruned = prune_agent_input(agent_input, target_node=TARGET)
+    assert pruned["edges"] == agent_input["edges"]
+    assert pruned["nodes"] == ["A", "B", "C"]
+
+
+def test_token_budget_is_measured_on_prompt_json() -> None:
+    edges = [
+        {"start": TARGET, "end": f"K{i}", "type": "ABOUT", "reason": "", "strength": 1.0} for i in range(3)
+    ] + [
+        {"start": f"K{i}", "end": f"K{i + 1}", "type": "PREREQ", "reason": "r" * 20, "strength": 1.0}
+        for i in range(2)
+    ]
+    agent_input = {"target_paper_id": "paper-0", "nodes": [TARGET, "K0", "K1", "K2"], "edges": edges}
+    budget = len(to_prompt_json(agent_input)) // 4
+
+    assert estimate_tokens(agent_input) == budget
+    pruned = prune_agent_input(agent_input, target_node=TARGET, token_budget=budget)
+    assert pruned["edges"] == edges
+
+
+def test_env_limits(monkeypatch) -> None:
+    monkeypatch.setenv("KG_PRUNE_MAX_HOPS", "0")
+    monkeypatch.setenv("KG_PRUNE_MAX_DEGREE", "5")
+    monkeypatch.setenv("KG_PRUNE_TOKEN_BUDGET", "x")
+
+    assert kg_agent_pruning._env_limit("KG_PRUNE_MAX_HOPS", 3) is None
+    assert kg_agent_pruning._env_limit("KG_PRUNE_MAX_DEGREE", 12) == 5
+    assert kg_agent_pruning._env_limit("KG_PRUNE_TOKEN_BUDGET", 6000) == 6000
@@ -0,0 +1,63 @@
+import random
+
+from core.utils.kg_agent_preprocessing import preprocess_graph, preprocess_graph_reference
+from core.utils.kg_subgraph_index import SubgraphIndex
+
+
+def _random_raw_subgraph(rng: random.Random, n_keywords: int, n_papers: int, n_edges: int) -> dict:
+    keywords = [{"id": f"k{i}", "name": f"Keyword {i % (n_keywords - 2)}", "alias": []} for i in range(n_keywords)]
+    papers = [{"id": f"p{i}", "name": f"Paper {i}"} for i in range(n_papers)]
+    target = {"id": "p0", "name": "Target Paper"} if rng.random() < 0.8 else {"id": "tp", "name": "Target"}
+    node_ids = [k["id"] for k in keywords] + [p["id"] for p in papers] + [target["id"], "ghost"]
+
+    edges = {"PREREQ": [], "ABOUT": [], "IN": [], "REF_BY": []}
+    strengths = [0.5, 0.9, 0.9, 1.0, None, "0.7", "bad"]
+    for _ in range(n_edges):
+        etype = rng.choice(list(edges))
+        edges[etype].append({
+            "source": rng.choice(node_ids),
+            "target": rng.choice(node_ids),
+            "strength": rng.choice(strengths),
+            "reason": rng.choice(["", "because", None]),
+        })
+    # 양방향 엣지가 자주 생기도록 일부를 뒤집어서 추가
+    for e in list(edges["PREREQ"][: n_edges // 4]):
+        edges["PREREQ"].append({**e, "source": e["target"], "target": e["source"]})
+
+    return {"graph": {
+        "target_paper": target,
+        "nodes": {"papers": papers, "keywords": keywords},
+        "edges": edges,
+    }}
+
+
+def test_indexed_preprocess_matches_reference_on_random_graphs() -> None:
+    rng = random.Random(1234)
+    for _ in range(200):
+        raw = _random_raw_subgraph(
+            rng,
+            n_keywords=rng.randint(3, 25),
+            n_papers=rng.randint(1, 5),
+            n_edges=rng.randint(0, 80),
+        )
+        assert preprocess_graph(raw) == preprocess_graph_reference(raw)
+
+
+def test_index_interns_nodes_once() -> None:
+    raw = _random_raw_subgraph(random.Random(7), n_keywords=10, n_papers=3, n_edges=40)
+    index = SubgraphIndex.from_raw(raw)
+
+    assert len(index.node_ids) == len(set(index.node_ids)) == index.num_nodes
+    assert all(index.node_index[node_id] == i for i, node_id in enumerate(index.node_ids))
+    assert preprocess_graph(raw, index=index) == preprocess_graph_reference(raw)
+
+
+def test_empty_subgraph() -> None:
+    raw = {"graph": {
+        "target_paper": None,
+        "nodes": {"papers": [], "keywords": []},
+        "edges": {"PREREQ": [], "ABOUT": [], "IN": [], "REF_BY": []},
+    }}
+    assert preprocess_graph(raw) == preprocess_graph_reference(raw) == {
+        "target_paper_id": "", "nodes": [], "edges": []
+    }
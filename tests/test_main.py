@@ -18,3 +18,4 @@ def test_health_check(client: TestClient):
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
+    assert isinstance(data["circuit_breakers"], dict)
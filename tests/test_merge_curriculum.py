@@ -0,0 +1,124 @@
+import copy
+import json
+import random
+
+from core.graphs.parallel.state_parallel import (
+    IndexedCurriculum,
+    merge_curriculum,
+    merge_curriculum_reference,
+)
+
+
+def _resource(rid: str, rng: random.Random) -> dict:
+    return {"resource_id": rid, "resource_name": f"name {rng.randrange(3)}", "difficulty": rng.choice([None, 3, 5])}
+
+
+def _random_curriculum(rng: random.Random, n_nodes: int) -> dict:
+    nodes = []
+    counter = 1
+    for i in range(n_nodes):
+        resources = []
+        for _ in range(rng.randint(0, 4)):
+            resources.append(_resource(f"res-{counter:03d}", rng))
+            counter += 1
+        nodes.append({
+            "keyword_id": f"key-{i:03d}", "keyword": f"Keyword {i}", "description": None,
+            "is_resource_sufficient": False, "resources": resources,
+        })
+    edges = [{"start": f"key-{rng.randrange(n_nodes):03d}", "end": f"key-{rng.randrange(n_nodes):03d}"}
+             for _ in range(n_nodes)]
+    # 기존 엣지는 중복 없이
+    edges = list({(e["start"], e["end"]): e for e in edges}.values())
+    return {"graph_meta": {"title": "T"}, "first_node_order": [], "nodes": nodes, "edges": edges}
+
+
+def _random_delta(rng: random.Random, curriculum: dict, counter: list) -> dict:
+    nodes = curriculum["nodes"]
+    delta_nodes = []
+    for node in rng.sample(nodes, rng.randint(0, min(5, len(nodes)))):
+        d = {"keyword_id": node["keyword_id"]}
+        r = rng.random()
+        if r < 0.3:
+            d["is_resource_sufficient"] = rng.choice([True, False])
+            d["resource_reason"] = rng.choice([None, "", "reason"])
+        elif r < 0.6:
+            d["description"] = rng.choice(["", "desc", None])
+        else:
+            new = []
+            for _ in range(rng.randint(0, 3)):
+                counter[0] += 1
+                new.append(_resource(f"res-{counter[0]:03d}", rng))
+            existing = node.get("resources", [])
+            if existing and rng.random() < 0.5:
+                new.append(dict(rng.choice(existing), difficulty=7))  # 같은 id 덮어쓰기
+            if rng.random() < 0.2:
+                new.append({"resource_name": "no id"})
+            d["resources"] = (list(existing) if rng.random() < 0.5 else []) + new
+        delta_nodes.append(d)
+
+    for _ in range(rng.randint(0, 2)):
+        counter[0] += 1
+        delta_nodes.append({"keyword_id": f"key-new-{counter[0]}", "keyword": "New", "resources": []})
+
+    ids = [n["keyword_id"] for n in nodes] + [n["keyword_id"] for n in delta_nodes]
+    edge_keys = set()
+    delta_edges = []
+    for _ in range(rng.randint(0, 4)):
+        key = (rng.choice(ids), rng.choice(ids))
+        if key not in edge_keys:  # delta 내부 중복은 참조 구현과 동작이 다르므로 제외
+            edge_keys.add(key)
+            delta_edges.append({"start": key[0], "end": key[1]})
+
+    delta = {"nodes": delta_nodes, "edges": delta_edges}
+    if rng.random() < 0.2:
+        delta["first_node_order"] = [nodes[0]["keyword_id"]] if nodes else []
+    return delta
+
+
+def _as_json(curriculum) -> str:
+    return json.dumps(curriculum, sort_keys=True)
+
+
+def test_delta_reducer_matches_reference_over_many_rounds() -> None:
+    rng = random.Random(3)
+    for _ in range(30):
+        start = _random_curriculum(rng, rng.randint(1, 40))
+        new_state, ref_state = copy.deepcopy(start), copy.deepcopy(start)
+        counter = [10_000]
+
+        for _ in range(15):
+            delta = _random_delta(rng, ref_state, counter)
+            prev_state, prev_json = new_state, _as_json(new_state)
+
+            new_state = merge_curriculum(new_state, copy.deepcopy(delta))
+            ref_state = merge_curriculum_reference(ref_state, copy.deepcopy(delta))
+
+            assert _as_json(new_state) == _as_json(ref_state)
+            # 이전 상태 객체는 리듀서에 의해 변경되지 않음 (구조 공유만)
+            assert _as_json(prev_state) == prev_json
+        assert isinstance(new_state, IndexedCurriculum)
+
+
+def test_delta_reducer_shares_unchanged_nodes() -> None:
+    rng = random.Random(0)
+    existing = merge_curriculum({}, _random_curriculum(rng, 200))
+    before_nodes = list(existing["nodes"])
+
+    merged = merge_curriculum(existing, {"nodes": [{"keyword_id": "key-010", "description": "new"}]})
+
+    assert merged["nodes"][10]["description"] == "new"
+    assert before_nodes[10]["description"] is None
+    assert all(a is b for i, (a, b) in enumerate(zip(before_nodes, merged["nodes"])) if i != 10)
+    assert merged["edges"] is existing["edges"]
+
+    # 변경이 없는 delta는 노드 리스트도 그대로 공유
+    same = merge_curriculum(merged, {"nodes": [{"keyword_id": "key-010", "description": "new"}]})
+    assert same["nodes"] is merged["nodes"]
+
+
+def test_delta_reducer_dedupes_edges_within_delta() -> None:
+    merged = merge_curriculum(
+        {"nodes": [], "edges": [{"start": "a", "end": "b"}]},
+        {"edges": [{"start": "b", "end": "c"}, {"start": "b", "end": "c"}, {"start": "a", "end": "b"}]},
+    )
+    assert merged["edges"] == [{"start": "a", "end": "b"}, {"start": "b", "end": "c"}]
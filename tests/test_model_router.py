@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+from core.llm.model_router import RoutedChatModel, load_routes, routing_metrics
+
+PROMPT = ChatPromptTemplate.from_messages([("human", "{q}")])
+
+
+class FakeModel:
+    def __init__(self, reply=None, error=None):
+        self.reply = reply
+        self.error = error
+        self.calls = []
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return AIMessage(content=self.reply)
+
+
+def _router(light, strong, **kwargs):
+    return RoutedChatModel(strong=strong, light_factory=lambda: light, enabled=True, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    routing_metrics.reset()
+    yield
+    routing_metrics.reset()
+
+
+async def test_light_tag_uses_light_model_when_response_is_usable():
+    light = FakeModel(json.dumps({"is_resource_sufficient": True, "reasoning": "ok"}))
+    strong = FakeModel("unused")
+
+    response = await (PROMPT | _router(light, strong)).ainvoke({"q": "x"}, config={"tags": ["orch-res-check"]})
+
+    assert json.loads(response.content)["is_resource_sufficient"] is True
+    assert len(light.calls) == 1 and strong.calls == []
+    assert routing_metrics.snapshot()["orch-res-check"]["light_calls"] == 1
+
+
+async def test_escalates_on_invalid_light_response_and_on_error():
+    strong = FakeModel(json.dumps([{"keyword_id": "k", "is_resource_sufficient": False}]))
+
+    # 판단 값이 bool이 아님 -> strong
+    light = FakeModel(json.dumps([{"keyword_id": "k", "is_resource_sufficient": "maybe"}]))
+    response = await _router(light, strong).ainvoke("x", config={"tags": ["orch-res-batch-check"]})
+    assert json.loads(response.content)[0]["is_resource_sufficient"] is False
+
+    # light 호출 예외 -> strong
+    await _router(FakeModel(error=RuntimeError("boom")), strong).ainvoke(
+        "x", config={"tags": ["orch-res-batch-check"]}
+    )
+
+    row = routing_metrics.snapshot()["orch-res-batch-check"]
+    assert row["escalations"] == 2 and row["light_errors"] == 1 and row["strong_calls"] == 2
+
+
+async def test_unrouted_tags_and_disabled_routing_use_strong_with_bound_kwargs():
+    light, strong = FakeModel("{}"), FakeModel("{}")
+
+    await _router(light, strong).bind(response_format={"type": "json_object"}).ainvoke(
+        "x", config={"tags": ["curriculum-compose"]}
+    )
+    disabled = RoutedChatModel(strong=strong, light_factory=lambda: light, enabled=False)
+    await disabled.ainvoke("x", config={"tags": ["orch-res-check"]})
+
+    assert light.calls == []
+    assert strong.calls == [{"response_format": {"type": "json_object"}}, {}]
+
+
+def test_routes_can_be_overridden_from_env_string():
+    routes = load_routes("orch-res-check=strong, orch-kw-check=light, bad-entry, x=medium")
+
+    assert routes["orch-res-check"] == "strong"
+    assert routes["orch-kw-check"] == "light"
+    assert "x" not in routes and routes["load-estimation-batch"] == "light"
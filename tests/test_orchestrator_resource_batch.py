@@ -0,0 +1,121 @@
+import json
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from core.agents.curriculum_orchestrator import CurriculumOrchestrator
+from core.utils.structured_output import parse_metrics
+
+
+class FakeLLM:
+    """batch 프롬프트면 drop_ids를 뺀 노드만 판단, 단일 프롬프트면 항상 부족으로 응답"""
+
+    def __init__(self, drop_ids=(), batch_reply=None):
+        self.drop_ids = set(drop_ids)
+        self.batch_reply = batch_reply
+        self.batch_calls = []
+        self.single_calls = []
+
+    def bind(self, **kwargs):
+        return self
+
+    async def ainvoke(self, messages, config=None):
+        system, human = messages[0].content, messages[-1].content
+        if "For EACH keyword" in system:
+            payload = json.loads(human.split("(JSON)]\n", 1)[1].split("\n\n[Instructions]", 1)[0])
+            ids = [p["keyword_id"] for p in payload]
+            self.batch_calls.append(ids)
+            if self.batch_reply is not None:
+                return AIMessage(content=self.batch_reply)
+            items = [
+                {"keyword_id": kid, "is_resource_sufficient": kid.endswith("0"), "reasoning": f"batch {kid}"}
+                for kid in ids if kid not in self.drop_ids
+            ]
+            return AIMessage(content=json.dumps(items))
+        kid = human.split("- ID: ", 1)[1].split("\n", 1)[0]
+        self.single_calls.append(kid)
+        return AIMessage(content=json.dumps({"is_resource_sufficient": False, "reasoning": f"single {kid}"}))
+
+
+def _nodes(n, resource_text="r"):
+    return [
+        {
+            "keyword_id": f"key-{i:03d}",
+            "keyword": f"kw {i}",
+            "description": "desc",
+            "resources": [{"resource_id": f"res-{i}", "resource_description": resource_text}],
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics(monkeypatch):
+    monkeypatch.delenv("STRUCTURED_OUTPUT_AGENTS", raising=False)
+    parse_metrics.reset()
+    yield
+    parse_metrics.reset()
+
+
+async def test_batches_nodes_and_maps_results_back_in_order():
+    llm = FakeLLM()
+    orch = CurriculumOrchestrator(llm, resource_check_mode="batch", batch_max_nodes=4)
+    nodes = _nodes(10)
+
+    decisions, stats = await orch.check_resources(nodes, level="novice", purpose="study")
+
+    assert [len(ids) for ids in llm.batch_calls] == [4, 4, 2]
+    assert llm.single_calls == []
+    assert [d["reasoning"] for d in decisions] == [f"batch key-{i:03d}" for i in range(10)]
+    assert [d["is_resource_sufficient"] for d in decisions] == [i % 10 == 0 for i in range(10)]
+    assert stats["batch_calls"] == 3 and stats["calls_saved"] == 7
+    assert stats["prompt_tokens_saved_est"] > 0
+
+
+async def test_token_budget_splits_batches_and_large_node_goes_alone():
+    llm = FakeLLM()
+    orch = CurriculumOrchestrator(llm, resource_check_mode="batch", batch_token_budget=200, batch_max_nodes=10)
+    nodes = _nodes(3, resource_text="x" * 50)
+    nodes.insert(1, _nodes(1, resource_text="y" * 2000)[0] | {"keyword_id": "key-big"})
+
+    decisions, stats = await orch.check_resources(nodes, level="novice", purpose="study")
+
+    # key-big은 예산 초과 -> 단독 (단일 프롬프트), 나머지는 예산 안에서 묶임
+    assert llm.single_calls == ["key-big"]
+    assert sum(len(ids) for ids in llm.batch_calls) == 3
+    assert decisions[1]["reasoning"] == "single key-big"
+    assert stats["single_calls"] == 1 and stats["fallback_nodes"] == 0
+
+
+async def test_missing_items_fall_back_to_single_calls():
+    llm = FakeLLM(drop_ids={"key-001", "key-002"})
+    orch = CurriculumOrchestrator(llm, resource_check_mode="batch")
+
+    decisions, stats = await orch.check_resources(_nodes(4), level="novice", purpose="study")
+
+    assert sorted(llm.single_calls) == ["key-001", "key-002"]
+    assert [d["reasoning"] for d in decisions] == [
+        "batch key-000", "single key-001", "single key-002", "batch key-003"
+    ]
+    assert stats["fallback_nodes"] == 2 and stats["calls_saved"] == 1
+
+
+async def test_unparseable_batch_falls_back_for_every_node():
+    llm = FakeLLM(batch_reply="sorry, I can't")
+    orch = CurriculumOrchestrator(llm, resource_check_mode="batch")
+
+    decisions, stats = await orch.check_resources(_nodes(3), level="novice", purpose="study")
+
+    assert sorted(llm.single_calls) == ["key-000", "key-001", "key-002"]
+    assert all(d["reasoning"].startswith("single") for d in decisions)
+    assert stats["calls_saved"] == -1
+
+
+async def test_single_mode_keeps_per_node_calls():
+    llm = FakeLLM()
+    orch = CurriculumOrchestrator(llm, resource_check_mode="single")
+
+    decisions, stats = await orch.check_resources(_nodes(3), level="novice", purpose="study")
+
+    assert llm.batch_calls == [] and len(llm.single_calls) == 3
+    assert stats["single_calls"] == 3 and stats["calls_saved"] == 0
@@ -0,0 +1,88 @@
+import random
+
+from core.tools.prereq_closure import PrereqClosureStore, build_prereq_closure
+
+
+def _random_graph(rng: random.Random, n_keywords: int, n_edges: int):
+    keywords = [{"id": f"k{i}", "name": f"Keyword {i}", "alias": [f"KW{i}"] if i % 3 == 0 else []}
+                for i in range(n_keywords)]
+    edges = [
+        {"source": f"k{rng.randrange(n_keywords)}", "target": f"k{rng.randrange(n_keywords)}",
+         "strength": rng.choice([0.5, 0.9, 0.95, 1.0, None]), "reason": "r"}
+        for _ in range(n_edges)
+    ]
+    return keywords, edges
+
+
+def _walks_into(edges, target, max_depth, min_strength):
+    """길이 max_depth 이하 walk 전수 열거: [(nodes, edge_list)]"""
+    ok = [e for e in edges if e["strength"] is None or e["strength"] >= min_strength]
+    walks, frontier = [], [([target], [])]
+    for _ in range(max_depth):
+        nxt = []
+        for nodes, path in frontier:
+            for e in ok:
+                if e["target"] == nodes[0]:
+                    nxt.append(([e["source"]] + nodes, [e] + path))
+        walks.extend(nxt)
+        frontier = nxt
+    return walks
+
+
+def test_closure_matches_walk_enumeration() -> None:
+    rng = random.Random(11)
+    for _ in range(40):
+        _, edges = _random_graph(rng, n_keywords=rng.randint(2, 12), n_edges=rng.randint(0, 30))
+        closure = build_prereq_closure(edges, max_depth=3, min_strength=0.9)
+
+        targets = {e["target"] for e in edges}
+        for t in targets:
+            expected = {}
+            for nodes, path in _walks_into(edges, t, 3, 0.9):
+                a = nodes[0]
+                if a == t:
+                    continue
+                b = min(1.0 if e["strength"] is None else e["strength"] for e in path)
+                d = len(path)
+                if a not in expected:
+                    expected[a] = (d, b)
+                else:
+                    expected[a] = (min(expected[a][0], d), max(expected[a][1], b))
+            assert closure.get(t, {}) == expected
+
+
+def test_store_expand_matches_walk_enumeration(tmp_path) -> None:
+    rng = random.Random(5)
+    for i in range(15):
+        keywords, edges = _random_graph(rng, n_keywords=rng.randint(2, 15), n_edges=rng.randint(0, 40))
+        store = PrereqClosureStore.build(str(tmp_path / f"closure_{i}.sqlite"), keywords, edges,
+                                         max_depth=2, min_strength=0.9)
+        seeds = rng.sample([k["id"] for k in keywords], rng.randint(1, 3))
+
+        expected_edges, expected_nodes = set(), set(seeds)
+        for t in seeds:
+            for nodes, path in _walks_into(edges, t, 2, 0.9):
+                expected_nodes.update(nodes)
+                expected_edges.update((e["source"], e["target"], e["strength"]) for e in path)
+
+        result = store.expand(seeds)
+        assert {(e["source"], e["target"], e["strength"]) for e in result["edges"]} == expected_edges
+        assert {k["id"] for k in result["keywords"]} == expected_nodes
+        store.close()
+
+
+def test_store_name_lookup_and_prerequisites(tmp_path) -> None:
+    keywords = [{"id": "a", "name": "Linear Algebra", "alias": ["LA"]},
+                {"id": "b", "name": "Matrix", "alias": []},
+                {"id": "c", "name": "Transformer", "alias": []}]
+    edges = [{"source": "a", "target": "b", "strength": 0.95, "reason": ""},
+             {"source": "b", "target": "c", "strength": 0.9, "reason": ""},
+             {"source": "a", "target": "c", "strength": 0.5, "reason": ""}]
+    store = PrereqClosureStore.build(str(tmp_path / "closure.sqlite"), keywords, edges)
+
+    assert sorted(store.keyword_ids_by_names(["la", "TRANSFORMER", "unknown"])) == ["a", "c"]
+    assert store.prerequisites("c") == [
+        {"id": "b", "name": "Matrix", "distance": 1, "strength": 0.9},
+        {"id": "a", "name": "Linear Algebra", "distance": 2, "strength": 0.9},
+    ]
+    store.close()
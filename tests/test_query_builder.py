@@ -0,0 +1,75 @@
+import json
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from core.agents.resource_discovery_agent import ResourceDiscoveryAgent
+from core.tests.query_builder_ab import DEFAULT_FIXTURE, compare
+from core.utils.query_builder import build_search_query, direction_intent, is_ambiguous_keyword
+
+
+def test_builds_query_from_level_direction_and_paper_title():
+    assert build_search_query("Layer  Normalization", user_level="novice") == "Layer Normalization 개념 쉬운 설명"
+    assert build_search_query("Layer Normalization", user_level="unknown") == "Layer Normalization 개념 설명"
+    assert (
+        build_search_query("Residual Connection", search_direction="Needs a hands-on code example")
+        == "Residual Connection 예제 코드"
+    )
+    assert build_search_query("BERT", paper_name="BERT: Pre-training of Deep Bidirectional Transformers") == "BERT 논문 설명"
+
+
+def test_direction_hints_match_whole_words_only():
+    assert (
+        build_search_query(
+            "Multi-Head Attention",
+            search_direction="Explain how encoder-decoder attention works intuitively",
+        )
+        == "Multi-Head Attention 직관적 설명"
+    )
+    assert direction_intent("of course more material is needed") is None
+    assert direction_intent("more code examples") == "예제 코드"
+    assert direction_intent("예제를 더 보여주기") == "예제 코드"
+
+
+def test_ambiguous_keywords_and_unknown_directions_go_to_llm():
+    assert is_ambiguous_keyword("attention")
+    assert is_ambiguous_keyword("RL")
+    assert is_ambiguous_keyword("")
+    assert is_ambiguous_keyword("how does the model handle long sequences, in practice")
+    assert not is_ambiguous_keyword("Scaled Dot-Product Attention")
+
+    assert build_search_query("attention") is None
+    assert build_search_query("Layer Normalization", search_direction="more resources are needed") is None
+
+
+def _fake_llm(calls):
+    async def reply(messages):
+        calls.append(messages)
+        return AIMessage(content=json.dumps({"query": "llm query"}))
+    return RunnableLambda(reply)
+
+
+async def test_agent_skips_llm_for_rule_queries():
+    calls = []
+    llm = _fake_llm(calls)
+    agent = ResourceDiscoveryAgent(llm_discovery=llm, llm_estimation=llm, query_mode="rule")
+
+    rule = await agent._generate_web_query("P", "Layer Normalization", "", "", user_level="expert")
+    ambiguous = await agent._generate_web_query("P", "attention", "", "", user_level="expert")
+
+    assert rule == "Layer Normalization 원리 심화"
+    assert ambiguous == "llm query"
+    assert len(calls) == 1
+
+    llm_agent = ResourceDiscoveryAgent(llm_discovery=llm, llm_estimation=llm, query_mode="llm")
+    assert await llm_agent._generate_web_query("P", "Layer Normalization", "", "") == "llm query"
+
+
+def test_ab_harness_replays_sample_fixture():
+    cases = json.loads(DEFAULT_FIXTURE.read_text(encoding="utf-8"))["cases"]
+
+    summary = compare(cases)
+
+    assert summary["rule"]["stale"] == 0
+    assert summary["llm"]["cases"] == summary["rule"]["cases"] == len(cases)
+    assert summary["llm"]["llm_rate"] == 1.0 and summary["rule"]["llm_rate"] < 1.0
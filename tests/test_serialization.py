@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from core.utils import serialization
+
+SAMPLES = [
+    {"keyword_id": "key-001", "keyword": "트랜스포머", "description": None, "score": 0.5, "ok": True},
+    [{"url": "https://example.com/a?b=c", "title": "Attention \"is\" all\nyou need"}],
+    {"nested": {"list": [1, 2.25, -3, None], "emoji": "🚀"}},
+]
+
+
+def _compact(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+@pytest.mark.parametrize("obj", SAMPLES)
+def test_dumps_matches_compact_stdlib(obj):
+    assert serialization.dumps(obj) == _compact(obj)
+    assert serialization.dumps_bytes(obj) == _compact(obj).encode("utf-8")
+    assert serialization.loads(serialization.dumps(obj)) == obj
+
+
+@pytest.mark.parametrize("obj", SAMPLES)
+def test_stdlib_fallback_has_same_output(monkeypatch, obj):
+    expected = serialization.dumps(obj)
+    monkeypatch.setattr(serialization, "HAS_ORJSON", False)
+
+    assert serialization.dumps(obj) == expected
+    assert serialization.loads(expected) == obj
+
+
+def test_values_rejected_by_orjson_fall_back():
+    obj = {"big": 2 ** 70}
+
+    assert serialization.dumps(obj) == '{"big":1180591620717411303424}'
+
+
+def test_key_order_is_preserved():
+    assert serialization.to_prompt_json({"b": 1, "a": 2}) == '{"b":1,"a":2}'
@@ -0,0 +1,145 @@
+import asyncio
+
+from core.graphs.parallel import nodes_parallel, speculation
+from core.graphs.parallel.speculation import (
+    STATUS_ADOPTED,
+    STATUS_CANCELLED,
+    STATUS_EMPTY,
+    STATUS_MISMATCH,
+    is_pending,
+    resolve_speculation,
+    start_speculation,
+)
+
+
+def _state():
+    return {
+        "paper_content": {"title": "T"},
+        "user_info": {"level": "novice", "purpose": "study"},
+        "curriculum": {
+            "graph_meta": {"paper_id": "paper-1", "title": "T"},
+            "nodes": [{"keyword_id": "key-001", "keyword": "a", "description": "d", "resources": []}],
+            "edges": [],
+        },
+        "current_iteration_count": 0,
+    }
+
+
+def _check(missing):
+    async def check(state):
+        return list(missing), "gap"
+    return check
+
+
+async def _expand(view):
+    return {
+        "curriculum": {
+            "nodes": [{"keyword_id": "key-002", "keyword": "b"}],
+            "edges": [{"start": "key-002", "end": view["missing_concepts"][0]}],
+        }
+    }
+
+
+async def test_adopts_expansion_when_orchestrator_agrees():
+    spec_id = start_speculation(_state(), expand=_expand, check=_check(["key-001"]))
+    assert is_pending(spec_id)
+
+    delta, status = await resolve_speculation(spec_id, ["key-001", "paper-1"])
+
+    assert status == STATUS_ADOPTED
+    assert [n["keyword_id"] for n in delta["nodes"]] == ["key-002"]
+    assert not is_pending(spec_id)
+
+
+async def test_cancels_running_expansion_when_keywords_sufficient():
+    started = asyncio.Event()
+
+    async def slow_expand(view):
+        started.set()
+        await asyncio.sleep(10)
+
+    spec_id = start_speculation(_state(), expand=slow_expand, check=_check(["key-001"]))
+    task = speculation._SPECULATIONS[spec_id]
+    await started.wait()
+
+    delta, status = await resolve_speculation(spec_id, [])
+    await asyncio.sleep(0)
+
+    assert (delta, status) == (None, STATUS_CANCELLED)
+    assert task.cancelled()
+
+
+async def test_empty_and_mismatched_speculation_are_discarded():
+    spec_id = start_speculation(_state(), expand=_expand, check=_check([]))
+    assert await resolve_speculation(spec_id, ["key-001"]) == (None, STATUS_EMPTY)
+
+    spec_id = start_speculation(_state(), expand=_expand, check=_check(["key-001"]))
+    assert await resolve_speculation(spec_id, ["paper-1"]) == (None, STATUS_MISMATCH)
+
+
+class _FakeOrchestrator:
+    """첫 호출은 rule-based(설명/자료 부족), 두 번째는 LLM 판단(키워드 부족)"""
+
+    results = []
+
+    def __init__(self, llm):
+        pass
+
+    async def run(self, input_data):
+        return self.results.pop(0)
+
+
+async def test_orchestrator_node_starts_then_adopts_speculation(monkeypatch):
+    monkeypatch.setenv("SPECULATIVE_EXPANSION", "1")
+    monkeypatch.setattr(nodes_parallel, "get_routed_model", lambda **kwargs: None)
+    monkeypatch.setattr(nodes_parallel, "CurriculumOrchestrator", _FakeOrchestrator)
+    monkeypatch.setattr(nodes_parallel, "concept_expansion_node", _expand)
+    monkeypatch.setattr(speculation, "cheap_keyword_check", _check(["key-001"]))
+    _FakeOrchestrator.results = [
+        {"tasks": ["resource_search"], "keyword_checked": False, "insufficient_resource_ids": ["key-001"]},
+        {"tasks": ["keyword_expansion"], "keyword_checked": True, "missing_concepts": ["key-001"]},
+    ]
+
+    state = _state()
+    first = await nodes_parallel.curriculum_orchestrator_node(state)
+    assert first["speculation"] == {"status": "running"}
+    assert first["tasks"] == ["resource_search"]
+
+    second = await nodes_parallel.curriculum_orchestrator_node(
+        {**state, "speculation_id": first["speculation_id"], "current_iteration_count": 1}
+    )
+
+    assert second["speculation"] == {"status": STATUS_ADOPTED, "new_nodes": 1}
+    assert "keyword_expansion" not in second["tasks"]
+    assert {"generate_description", "resource_search"} <= set(second["tasks"])
+    assert "key-002" in [n["keyword_id"] for n in second["curriculum"]["nodes"]]
+    assert second["curriculum"]["edges"] == [{"start": "key-002", "end": "key-001"}]
+
+
+async def test_speculation_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("SPECULATIVE_EXPANSION", raising=False)
+    monkeypatch.setattr(nodes_parallel, "get_routed_model", lambda **kwargs: None)
+    monkeypatch.setattr(nodes_parallel, "CurriculumOrchestrator", _FakeOrchestrator)
+    _FakeOrchestrator.results = [{"tasks": ["resource_search"], "keyword_checked": False}]
+
+    update = await nodes_parallel.curriculum_orchestrator_node(_state())
+
+    assert "speculation_id" not in update
+
+
+async def test_scope_cancels_speculation_left_by_failed_workflow():
+    started = asyncio.Event()
+
+    async def hanging_expand(view):
+        started.set()
+        await asyncio.sleep(10)
+
+    token = speculation.bind_speculation_scope()
+    spec_id = start_speculation(_state(), expand=hanging_expand, check=_check(["key-001"]))
+    task = speculation._SPECULATIONS[spec_id]
+    await started.wait()
+
+    assert speculation.reset_speculation_scope(token) == 1
+    await asyncio.sleep(0)
+    assert task.cancelled()
+    assert not is_pending(spec_id)
@@ -0,0 +1,108 @@
+from typing import List
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+from core.contracts.curriculum_orchestrator import ResourceCheckResult
+from core.contracts.study_load_estimation import ResourceEstimate
+from core.utils.structured_output import invoke_structured, parse_metrics
+
+PROMPT = ChatPromptTemplate.from_messages([("human", "check {keyword}")])
+
+
+class FakeLLM:
+    """응답을 순서대로 돌려주고 호출 내용을 기록"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.bound = None
+
+    def bind(self, **kwargs):
+        self.bound = kwargs
+        return self
+
+    async def ainvoke(self, messages, config=None):
+        self.calls.append(messages)
+        return AIMessage(content=self.responses.pop(0))
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics(monkeypatch):
+    monkeypatch.delenv("STRUCTURED_OUTPUT_AGENTS", raising=False)
+    parse_metrics.reset()
+    yield
+    parse_metrics.reset()
+
+
+async def _invoke(llm, schema=ResourceCheckResult, **kwargs):
+    return await invoke_structured(
+        agent="res_check", prompt_version="v4", prompt=PROMPT, llm=llm,
+        inputs={"keyword": "attention"}, schema=schema, **kwargs,
+    )
+
+
+async def test_legacy_mode_keeps_unvalidated_value_and_records_metrics():
+    llm = FakeLLM(['Result: {"is_resource_sufficient": true}'])
+
+    result = await _invoke(llm)
+
+    assert result == {"is_resource_sufficient": True}
+    assert llm.bound is None and len(llm.calls) == 1
+    row = parse_metrics.snapshot()["res_check:v4:legacy"]
+    assert row["calls"] == 1 and row["validation_failures"] == 1 and row["failed"] == 0
+
+
+async def test_legacy_mode_parse_failure_returns_none():
+    llm = FakeLLM(["I cannot answer that."])
+
+    assert await _invoke(llm) is None
+    row = parse_metrics.snapshot()["res_check:v4:legacy"]
+    assert row["parse_failures"] == 1 and row["failed"] == 1 and row["failure_rate"] == 1.0
+
+
+async def test_structured_mode_validates_and_coerces(monkeypatch):
+    monkeypatch.setenv("STRUCTURED_OUTPUT_AGENTS", "res_check")
+    llm = FakeLLM(['{"is_resource_sufficient": "true", "reasoning": "ok"}'])
+
+    result = await _invoke(llm)
+
+    assert result == {"is_resource_sufficient": True, "reasoning": "ok"}
+    assert llm.bound["response_format"]["type"] == "json_schema"
+    assert len(llm.calls) == 1
+
+
+async def test_structured_mode_repairs_once(monkeypatch):
+    monkeypatch.setenv("STRUCTURED_OUTPUT_AGENTS", "all")
+    llm = FakeLLM(['{"is_resource_sufficient": true}', '{"is_resource_sufficient": false, "reasoning": "fixed"}'])
+
+    result = await _invoke(llm)
+
+    assert result == {"is_resource_sufficient": False, "reasoning": "fixed"}
+    assert len(llm.calls) == 2
+    # repair 요청에는 이전 응답과 오류 내용이 포함됨
+    repair_prompt = llm.calls[1][-1].content
+    assert "reasoning" in repair_prompt and "Field required" in repair_prompt
+    row = parse_metrics.snapshot()["res_check:v4:structured"]
+    assert row["repair_calls"] == 1 and row["repaired"] == 1 and row["failed"] == 0
+
+
+async def test_structured_mode_gives_up_after_one_repair(monkeypatch):
+    monkeypatch.setenv("STRUCTURED_OUTPUT_AGENTS", "res_check")
+    llm = FakeLLM(["not json", "still not json", "never used"])
+
+    assert await _invoke(llm) is None
+    assert len(llm.calls) == 2
+    assert parse_metrics.snapshot()["res_check:v4:structured"]["failed"] == 1
+
+
+async def test_structured_mode_wraps_list_schema(monkeypatch):
+    monkeypatch.setenv("STRUCTURED_OUTPUT_AGENTS", "res_check")
+    llm = FakeLLM(['{"items": [{"url": "u", "difficulty": "4"}]}'])
+
+    result = await _invoke(llm, schema=List[ResourceEstimate], expect=list)
+
+    assert result == [{"url": "u", "difficulty": 4.0}]
+    schema = llm.bound["response_format"]["json_schema"]["schema"]
+    assert schema["type"] == "object" and "items" in schema["properties"]
@@ -0,0 +1,69 @@
+from core.tools.subgraph_cache import GraphVersionProbe, SubgraphCache, make_subgraph_cache_key
+
+
+def _graph(name: str) -> dict:
+    return {"graph": {"target_paper": {"id": "p0", "name": name}, "nodes": {"papers": [], "keywords": []}}}
+
+
+def test_cache_key_normalizes_paper_and_keywords() -> None:
+    assert make_subgraph_cache_key("  Attention Is All You Need ", ["Transformer", "attention", "ATTENTION"]) == \
+        make_subgraph_cache_key("attention is all you need", ["attention", "transformer"])
+    assert make_subgraph_cache_key("A", ["x"]) != make_subgraph_cache_key("A", ["x", "y"])
+
+
+def test_cache_returns_copies_and_expires(monkeypatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("core.tools.subgraph_cache.time.monotonic", lambda: now[0])
+
+    cache = SubgraphCache(ttl_sec=10, max_entries=4)
+    key = make_subgraph_cache_key("Paper", ["k"])
+    cache.set(key, _graph("Paper"))
+
+    hit = cache.get(key)
+    hit["graph"]["target_paper"] = None  # 호출자가 수정해도
+    assert cache.get(key) == _graph("Paper")  # 캐시는 그대로
+
+    now[0] += 11
+    assert cache.get(key) is None
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_cache_lru_eviction_and_version_invalidation() -> None:
+    cache = SubgraphCache(ttl_sec=60, max_entries=2, graph_db_version="v1")
+    keys = [make_subgraph_cache_key(f"Paper {i}", []) for i in range(3)]
+
+    cache.set(keys[0], _graph("0"), graph_db_version="v1")
+    cache.set(keys[1], _graph("1"), graph_db_version="v1")
+    assert cache.get(keys[0], graph_db_version="v1") is not None  # 0을 최근 사용으로
+    cache.set(keys[2], _graph("2"), graph_db_version="v1")
+
+    assert cache.get(keys[1], graph_db_version="v1") is None  # LRU 제거
+    assert cache.get(keys[0], graph_db_version="v1") is not None
+
+    # 그래프 DB 버전이 바뀌면 전체 무효화
+    assert cache.get(keys[0], graph_db_version="v2") is None
+    assert len(cache) == 0
+
+
+def test_version_probe_rechecks_periodically_and_keeps_last_on_error(monkeypatch) -> None:
+    now = [0.0]
+    monkeypatch.setattr("core.tools.subgraph_cache.time.monotonic", lambda: now[0])
+    versions = ["v1", "v2", RuntimeError("db down")]
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        value = versions.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    probe = GraphVersionProbe(fetch, interval_sec=60)
+    assert probe.get() == "v1"
+    now[0] = 30
+    assert probe.get() == "v1" and len(calls) == 1
+
+    now[0] = 61
+    assert probe.get() == "v2"  # 재적재 감지 -> SubgraphCache가 전체 무효화
+    now[0] = 122
+    assert probe.get() == "v2"  # 조회 실패 시 마지막 값 유지
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from core.tools import web_search_failover as wsf
+from core.tools.search_cache import SearchCache
+from core.tools.web_search_failover import WebSearchFailover
+from core.utils.budget import RequestBudget, bind_request_budget, reset_request_budget
+
+
+@pytest.fixture(autouse=True)
+def short_hedge_delay(monkeypatch):
+    monkeypatch.setattr(wsf, "HEDGE_DEFAULT_DELAY_SEC", 0.05)
+    monkeypatch.setattr(wsf, "HEDGE_MIN_DELAY_SEC", 0.01)
+
+
+def _provider(name, calls, delay=0.0, results=None, error=None):
+    async def search(query, max_results):
+        calls.append(name)
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return [{"url": f"https://{name}/{query}"}] if results is None else results
+    return search
+
+
+async def test_hedges_to_second_provider_when_primary_is_slow():
+    calls = []
+    failover = WebSearchFailover({
+        "slow": _provider("slow", calls, delay=1.0),
+        "fast": _provider("fast", calls, delay=0.01),
+    })
+
+    results = await failover.search("q", primary="slow")
+
+    assert results == [{"url": "https://fast/q"}]
+    assert calls == ["slow", "fast"]
+    snap = failover.snapshot()
+    assert snap["hedges"] == 1 and snap["failovers"] == 0
+    assert snap["providers"]["fast"]["wins"] == 1
+
+
+async def test_no_hedge_when_primary_answers_in_time():
+    calls = []
+    failover = WebSearchFailover({
+        "a": _provider("a", calls, delay=0.0),
+        "b": _provider("b", calls),
+    })
+
+    assert await failover.search("q", primary="a") == [{"url": "https://a/q"}]
+    assert calls == ["a"]
+
+
+async def test_fails_over_immediately_on_error_or_empty_result():
+    calls = []
+    failover = WebSearchFailover({
+        "down": _provider("down", calls, error=RuntimeError("503")),
+        "empty": _provider("empty", calls, results=[]),
+        "ok": _provider("ok", calls),
+    }, hedge=False)
+
+    results = await failover.search("q", primary="down")
+
+    assert results == [{"url": "https://ok/q"}]
+    assert calls[0] == "down" and set(calls) == {"down", "empty", "ok"}
+    assert failover.snapshot()["failovers"] == 2
+    assert failover.stats["down"].errors == 1
+
+
+async def test_orders_by_health_and_demotes_failing_primary():
+    calls = []
+    failover = WebSearchFailover({
+        "down": _provider("down", calls, error=RuntimeError("503")),
+        "ok": _provider("ok", calls),
+    }, hedge=False)
+
+    for _ in range(4):
+        await failover.search("q", primary="down")
+
+    assert failover.order() == ["ok", "down"]
+    assert failover.order(primary="down") == ["ok", "down"]
+
+
+async def test_budget_blocks_hedge_and_counts_extra_calls():
+    calls = []
+    failover = WebSearchFailover({
+        "slow": _provider("slow", calls, delay=0.2),
+        "fast": _provider("fast", calls),
+    })
+
+    budget = RequestBudget(max_search_calls=1)
+    budget.record_search_call()
+    token = bind_request_budget(budget)
+    try:
+        assert await failover.search("q", primary="slow") == [{"url": "https://slow/q"}]
+    finally:
+        reset_request_budget(token)
+    assert calls == ["slow"]
+
+    calls.clear()
+    budget = RequestBudget(max_search_calls=5)
+    token = bind_request_budget(budget)
+    try:
+        await failover.search("q", primary="slow")
+    finally:
+        reset_request_budget(token)
+    assert calls == ["slow", "fast"]
+    assert budget.search_calls == 1
+
+
+async def test_timeout_returns_empty_and_cancels_pending():
+    calls = []
+    failover = WebSearchFailover({
+        "a": _provider("a", calls, delay=1.0),
+        "b": _provider("b", calls, delay=1.0),
+    })
+
+    assert await failover.search("q", timeout_sec=0.1) == []
+    assert sorted(calls) == ["a", "b"]
+
+
+def _numbered_provider(name, calls):
+    async def search(query, max_results):
+        calls.append(name)
+        return [{"url": f"https://{name}/{i}"} for i in range(max_results)]
+    return search
+
+
+async def test_plan_steps_keep_each_providers_results(monkeypatch):
+    calls = []
+    failover = WebSearchFailover({
+        wsf.PROVIDER_TAVILY: _numbered_provider(wsf.PROVIDER_TAVILY, calls),
+        wsf.PROVIDER_SERPER: _numbered_provider(wsf.PROVIDER_SERPER, calls),
+    }, hedge=False)
+    monkeypatch.setattr(wsf, "web_search_failover", failover)
+    monkeypatch.setattr(wsf, "search_cache", SearchCache())
+
+    # web_doc 선호 plan: tavily 2 + serper_web 2
+    urls = set()
+    for primary in (wsf.PROVIDER_TAVILY, wsf.PROVIDER_SERPER):
+        results = await wsf.search_web_with_failover("same query", max_results=2, primary=primary)
+        urls.update(r["url"] for r in results)
+
+    assert urls == {"https://tavily/0", "https://tavily/1", "https://serper/0", "https://serper/1"}
+
+
+async def test_cache_is_shared_between_calls_without_primary(monkeypatch):
+    calls = []
+    failover = WebSearchFailover({"a": _provider("a", calls), "b": _provider("b", calls)})
+    monkeypatch.setattr(wsf, "web_search_failover", failover)
+    monkeypatch.setattr(wsf, "search_cache", SearchCache())
+
+    first = await wsf.search_web_with_failover("shared query")
+    second = await wsf.search_web_with_failover("Shared  Query")
+
+    assert first == second
+    assert len(calls) == 1